@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from injector import inject
+
+from arbeitszeit.entities import Plan
+from arbeitszeit.price_calculator import calculate_price
+from arbeitszeit.repositories import PlanCooperationRepository
+
+
+class CooperationPriceCache:
+    """Prices per unit of cooperations by cooperation id.
+
+    Repositories have to forget the price of a cooperation whenever a
+    plan joins or leaves it.
+    """
+
+    def __init__(self) -> None:
+        self._prices: Dict[UUID, Decimal] = dict()
+
+    def get(self, cooperation: UUID) -> Optional[Decimal]:
+        return self._prices.get(cooperation)
+
+    def set(self, cooperation: UUID, price: Decimal) -> None:
+        self._prices[cooperation] = price
+
+    def forget(self, cooperation: UUID) -> None:
+        self._prices.pop(cooperation, None)
+
+    def clear(self) -> None:
+        self._prices.clear()
+
+
+@inject
+@dataclass
+class CooperationPriceService:
+    plan_cooperation_repository: PlanCooperationRepository
+    price_cache: CooperationPriceCache
+
+    def get_price_per_unit(self, plan: Plan) -> Decimal:
+        return self.get_prices_per_unit([plan])[plan.id]
+
+    def get_prices_per_unit(self, plans: Iterable[Plan]) -> Dict[UUID, Decimal]:
+        """Return the price per unit of every plan by plan id. The plans
+        of all cooperations that are not cached yet are loaded at once.
+        """
+        plans = list(plans)
+        self._cache_cooperation_prices(
+            {
+                plan.cooperation
+                for plan in plans
+                if plan.cooperation is not None
+                and self.price_cache.get(plan.cooperation) is None
+            }
+        )
+        prices: Dict[UUID, Decimal] = dict()
+        for plan in plans:
+            if plan.cooperation is None:
+                prices[plan.id] = calculate_price([plan])
+            else:
+                price = self.price_cache.get(plan.cooperation)
+                assert price is not None
+                prices[plan.id] = price
+        return prices
+
+    def _cache_cooperation_prices(self, cooperations: Iterable[UUID]) -> None:
+        plans_by_cooperation: Dict[UUID, List[Plan]] = {
+            cooperation: [] for cooperation in cooperations
+        }
+        if not plans_by_cooperation:
+            return
+        for plan in self.plan_cooperation_repository.get_plans_in_cooperations(
+            plans_by_cooperation
+        ):
+            assert plan.cooperation is not None
+            plans_by_cooperation[plan.cooperation].append(plan)
+        for cooperation, cooperating_plans in plans_by_cooperation.items():
+            self.price_cache.set(cooperation, calculate_price(cooperating_plans))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional, Union
+from typing import ClassVar, List, Optional, Union
 from uuid import UUID
 
 
@@ -13,8 +13,10 @@ class SocialAccounting:
     id: UUID
     account: Account
 
+    name: ClassVar[str] = "Social Accounting"
+
     def get_name(self) -> str:
-        return "Social Accounting"
+        return self.name
 
 
 @dataclass
@@ -151,7 +153,6 @@ class Plan:
     expired: bool
     activation_date: Optional[datetime]
     expiration_date: Optional[datetime]
-    active_days: Optional[int]
     payout_count: int
     requested_cooperation: Optional[UUID]
     cooperation: Optional[UUID]
@@ -175,6 +176,15 @@ class Plan:
     def is_approved(self) -> bool:
         return self.approval_date is not None
 
+    def active_days(self, now: datetime) -> int:
+        """
+        The full days the plan has been active until now, not
+        considering days exceeding its timeframe.
+        """
+        if self.activation_date is None:
+            return 0
+        return max(min(self.timeframe, (now - self.activation_date).days), 0)
+
 
 class PurposesOfPurchases(Enum):
     means_of_prod = "means_of_prod"
@@ -209,6 +219,7 @@ class Transaction:
     amount_sent: Decimal
     amount_received: Decimal
     purpose: str
+    plan: Optional[UUID] = None
 
     def __hash__(self) -> int:
         return hash(self.id)
@@ -231,3 +242,30 @@ class Accountant:
 class PayoutFactor:
     calculation_date: datetime
     value: Decimal
+
+
+@dataclass
+class DailyPayoutFactor:
+    """Summary of the payout factors calculated on one day."""
+
+    day: date
+    minimum: Decimal
+    maximum: Decimal
+    average: Decimal
+    last: Decimal
+
+
+@dataclass
+class Statistics:
+    calculation_date: datetime
+    registered_companies_count: int
+    registered_members_count: int
+    cooperations_count: int
+    certificates_count: Decimal
+    available_product: Decimal
+    active_plans_count: int
+    active_plans_public_count: int
+    avg_timeframe: Decimal
+    planned_work: Decimal
+    planned_resources: Decimal
+    planned_means: Decimal
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+PageLoader = Callable[[int, Optional[UUID], Optional[UUID]], List[T]]
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Points at the first or last row of a page. Listings continue
+    after or before the row's position in their ordering, so a page is
+    read with a range condition instead of skipping all rows before it.
+    """
+
+    boundary: UUID
+    is_backward: bool
+
+    def encode(self) -> str:
+        direction = "b" if self.is_backward else "a"
+        return urlsafe_b64encode((direction + self.boundary.hex).encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> Optional[PageCursor]:
+        try:
+            decoded = urlsafe_b64decode(cursor.encode()).decode()
+            boundary = UUID(decoded[1:])
+        except ValueError:
+            return None
+        if decoded[:1] not in ("a", "b"):
+            return None
+        return cls(boundary=boundary, is_backward=decoded[0] == "b")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
+    previous_cursor: Optional[str]
+
+
+def load_page(
+    loader: PageLoader[T],
+    get_id: Callable[[T], UUID],
+    page_size: int,
+    cursor: Optional[str],
+) -> Page[T]:
+    """Load one page with loader(limit, after, before). The loader must
+    return the rows in listing order, up to limit rows directly after
+    the row "after" or directly before the row "before".
+    """
+    assert page_size > 0
+    page_cursor = PageCursor.decode(cursor) if cursor else None
+    if page_cursor is None:
+        items = loader(page_size + 1, None, None)
+        has_next = len(items) > page_size
+        has_previous = False
+        items = items[:page_size]
+    elif page_cursor.is_backward:
+        items = loader(page_size + 1, None, page_cursor.boundary)
+        has_next = True
+        has_previous = len(items) > page_size
+        items = items[-page_size:]
+    else:
+        items = loader(page_size + 1, page_cursor.boundary, None)
+        has_next = len(items) > page_size
+        has_previous = True
+        items = items[:page_size]
+    if not items:
+        return Page(items=items, next_cursor=None, previous_cursor=None)
+    return Page(
+        items=items,
+        next_cursor=(
+            PageCursor(get_id(items[-1]), is_backward=False).encode()
+            if has_next
+            else None
+        ),
+        previous_cursor=(
+            PageCursor(get_id(items[0]), is_backward=True).encode()
+            if has_previous
+            else None
+        ),
+    )
@@ -4,8 +4,6 @@ from decimal import Decimal
 from injector import inject
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.decimal import decimal_sum
-from arbeitszeit.entities import ProductionCosts
 from arbeitszeit.repositories import PayoutFactorRepository, PlanRepository
 
 
@@ -18,21 +16,11 @@ class PayoutFactorService:
 
     def calculate_payout_factor(self) -> Decimal:
         # payout factor = (A − ( P o + R o )) / (A + A o)
-        productive_plans = (
-            self.plan_repository.all_productive_plans_approved_active_and_not_expired()
-        )
-        public_plans = (
-            self.plan_repository.all_public_plans_approved_active_and_not_expired()
-        )
+        costs_per_day = self.plan_repository.get_costs_per_day_of_active_plans()
         # A o, P o, R o
-        public_costs_per_day: ProductionCosts = sum(
-            (p.production_costs / p.timeframe for p in public_plans),
-            start=ProductionCosts(Decimal(0), Decimal(0), Decimal(0)),
-        )
+        public_costs_per_day = costs_per_day.public
         # A
-        sum_of_productive_work_per_day = decimal_sum(
-            p.production_costs.labour_cost / p.timeframe for p in productive_plans
-        )
+        sum_of_productive_work_per_day = costs_per_day.productive.labour_cost
         numerator = sum_of_productive_work_per_day - (
             public_costs_per_day.means_cost + public_costs_per_day.resource_cost
         )
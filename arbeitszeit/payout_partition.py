@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from uuid import UUID
+
+_PREFIX_LENGTH = 8
+_PREFIX_VALUES = 16**_PREFIX_LENGTH
+
+
+@dataclass(frozen=True)
+class PayoutPartition:
+    """One of `count` parts of the active plans that are paid out
+    separately. Plans belong to the partition of their planner, so all
+    plans of a company are paid out together. Company ids are random,
+    therefore splitting the range of ids into equal parts spreads the
+    companies evenly over the partitions.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.index < self.count:
+            raise ValueError(
+                f"Partition index {self.index} is not in range of {self.count} partitions"
+            )
+
+    @classmethod
+    def all_plans(cls) -> PayoutPartition:
+        return cls(index=0, count=1)
+
+    @classmethod
+    def split(cls, count: int) -> Tuple[PayoutPartition, ...]:
+        return tuple(cls(index=index, count=count) for index in range(count))
+
+    def planner_id_range(self) -> Tuple[str, Optional[str]]:
+        """Return the lower and the exclusive upper bound of the planner
+        ids in this partition. The ids are compared as strings. The last
+        partition has no upper bound.
+        """
+        upper = None if self.index + 1 == self.count else self._bound(self.index + 1)
+        return self._bound(self.index), upper
+
+    def contains(self, planner: UUID) -> bool:
+        lower, upper = self.planner_id_range()
+        planner_id = str(planner)
+        return lower <= planner_id and (upper is None or planner_id < upper)
+
+    def _bound(self, index: int) -> str:
+        return format(index * _PREFIX_VALUES // self.count, f"0{_PREFIX_LENGTH}x")
@@ -6,9 +6,9 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.cooperation_price import CooperationPriceService
+from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Plan
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import PlanCooperationRepository
 
 
 @dataclass
@@ -39,12 +39,11 @@ class PlanSummary:
 @inject
 @dataclass
 class PlanSummaryService:
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
+    datetime_service: DatetimeService
 
     def get_summary_from_plan(self, plan: Plan) -> PlanSummary:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-        )
+        price_per_unit = self.price_service.get_price_per_unit(plan)
         return PlanSummary(
             plan_id=plan.id,
             is_active=plan.is_active,
@@ -53,7 +52,7 @@ class PlanSummaryService:
             product_name=plan.prd_name,
             description=plan.description,
             timeframe=plan.timeframe,
-            active_days=plan.active_days or 0,
+            active_days=plan.active_days(self.datetime_service.now()),
             production_unit=plan.prd_unit,
             amount=plan.prd_amount,
             means_cost=plan.production_costs.means_cost,
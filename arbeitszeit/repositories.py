@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Protocol, Union
+from enum import Enum, auto
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, Union
 from uuid import UUID
 
 from arbeitszeit.entities import (
@@ -12,6 +13,7 @@ from arbeitszeit.entities import (
     Company,
     CompanyWorkInvite,
     Cooperation,
+    DailyPayoutFactor,
     Member,
     PayoutFactor,
     Plan,
@@ -20,8 +22,10 @@ from arbeitszeit.entities import (
     Purchase,
     PurposesOfPurchases,
     SocialAccounting,
+    Statistics,
     Transaction,
 )
+from arbeitszeit.payout_partition import PayoutPartition
 
 
 class CompanyWorkerRepository(ABC):
@@ -82,6 +86,9 @@ class PlanRepository(ABC):
 
     @abstractmethod
     def activate_plan(self, plan: Plan, activation_date: datetime) -> None:
+        """Activate the plan. It expires after its timeframe and its
+        first payout is due immediately.
+        """
         pass
 
     @abstractmethod
@@ -89,15 +96,23 @@ class PlanRepository(ABC):
         pass
 
     @abstractmethod
-    def set_expiration_date(self, plan: Plan, expiration_date: datetime) -> None:
+    def increase_payout_count_by_one(self, plan: Plan) -> None:
         pass
 
-    @abstractmethod
-    def set_active_days(self, plan: Plan, full_active_days: int) -> None:
-        pass
+    @dataclass
+    class PayoutUpdate:
+        plan: UUID
+        payout_count: int
+        next_payout_date: datetime
+        is_expired: bool
 
     @abstractmethod
-    def increase_payout_count_by_one(self, plan: Plan) -> None:
+    def apply_payout_updates(self, updates: List[PayoutUpdate]) -> None:
+        """Write the results of a payout run for many plans at once.
+        Plans are not returned by get_plans_due_for_payout again before
+        their next payout date. Plans marked as expired are deactivated
+        and lose their cooperation and their cooperation request.
+        """
         pass
 
     @abstractmethod
@@ -108,6 +123,15 @@ class PlanRepository(ABC):
     def get_active_plans(self) -> Iterator[Plan]:
         pass
 
+    @abstractmethod
+    def get_plans_due_for_payout(
+        self, partition: PayoutPartition, now: datetime
+    ) -> Iterator[Plan]:
+        """Return the active plans of the partition that expired before
+        now or whose next payout is due.
+        """
+        pass
+
     @abstractmethod
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
@@ -146,12 +170,17 @@ class PlanRepository(ABC):
     def all_plans_approved_active_and_not_expired(self) -> Iterator[Plan]:
         pass
 
-    @abstractmethod
-    def all_productive_plans_approved_active_and_not_expired(self) -> Iterator[Plan]:
-        pass
+    @dataclass
+    class CostsPerDay:
+        productive: ProductionCosts
+        public: ProductionCosts
 
     @abstractmethod
-    def all_public_plans_approved_active_and_not_expired(self) -> Iterator[Plan]:
+    def get_costs_per_day_of_active_plans(self) -> CostsPerDay:
+        """Sum the production costs divided by the timeframe of all
+        approved, active and not expired plans, separately for
+        productive and public plans.
+        """
         pass
 
     @abstractmethod
@@ -166,6 +195,33 @@ class PlanRepository(ABC):
     def query_active_plans_by_plan_id(self, query: str) -> Iterator[Plan]:
         pass
 
+    class Ordering(Enum):
+        newest_first = auto()
+        company_name = auto()
+        price = auto()
+        relevance = auto()
+
+    @abstractmethod
+    def get_page_of_active_plans(
+        self,
+        ordering: Ordering,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        search_text: Optional[str] = None,
+        plan_id: Optional[str] = None,
+    ) -> List[Plan]:
+        """Return up to limit active plans in the given ordering that
+        directly follow the plan "after" or directly precede the plan
+        "before". Ties are broken by plan id. Plans can be filtered by
+        search text, in which case every word of the text must be the
+        beginning of a word in their product name or description, or by
+        a part of their id. Ordering by relevance puts the best matches
+        for the search text first and falls back to the newest plans
+        first without search text.
+        """
+        pass
+
     @abstractmethod
     def get_all_plans_for_company_descending(self, company_id: UUID) -> Iterator[Plan]:
         pass
@@ -202,9 +258,29 @@ class TransactionRepository(ABC):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan: Optional[UUID] = None,
     ) -> Transaction:
         pass
 
+    @dataclass
+    class NewTransaction:
+        date: datetime
+        sending_account: Account
+        receiving_account: Account
+        amount_sent: Decimal
+        amount_received: Decimal
+        purpose: str
+        plan: Optional[UUID] = None
+        payout_day: Optional[int] = None
+
+    @abstractmethod
+    def create_transactions(self, transactions: List[NewTransaction]) -> None:
+        """Store many transactions at once. Wage payouts carry the
+        number of the day they pay for. There is at most one payout per
+        plan and day.
+        """
+        pass
+
     @abstractmethod
     def all_transactions_sent_by_account(self, account: Account) -> List[Transaction]:
         pass
@@ -216,7 +292,58 @@ class TransactionRepository(ABC):
         pass
 
     @abstractmethod
-    def get_sales_balance_of_plan(self, plan: Plan) -> Decimal:
+    def get_sales_balances_of_plans_of_company(
+        self, company: Company
+    ) -> Dict[UUID, Decimal]:
+        """Return the sales balance of every plan of the company that
+        has transactions to the product account of the company.
+        """
+        pass
+
+    @dataclass
+    class AccountHistoryEntry:
+        transaction: Transaction
+        balance: Decimal
+
+    @abstractmethod
+    def get_page_of_account_history(
+        self,
+        account: Account,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+    ) -> List[AccountHistoryEntry]:
+        """Return up to limit transactions sent or received by the
+        account, newest first, that directly follow the transaction
+        "after" or directly precede the transaction "before". Ties in
+        the date are broken by transaction id. Every transaction comes
+        with the balance of the account right after it.
+        """
+        pass
+
+    @abstractmethod
+    def get_account_balance_history(
+        self, account: Account
+    ) -> List[Tuple[datetime, Decimal]]:
+        """Return the date of every transaction of the account, oldest
+        first, together with the balance of the account right after it.
+        """
+        pass
+
+    @abstractmethod
+    def get_transactions_of_accounts(
+        self,
+        accounts: Iterable[Account],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        """Iterate over all transactions sent or received by any of the
+        accounts, oldest first and ties broken by transaction id. Only
+        transactions at or after "since" and before "until" are
+        included. Transactions are read in batches while iterating, so
+        histories of any length can be processed without holding all of
+        them in memory.
+        """
         pass
 
 
@@ -229,6 +356,10 @@ class AccountRepository(ABC):
     def get_account_balance(self, account: Account) -> Decimal:
         pass
 
+    @abstractmethod
+    def get_sum_of_balances(self, account_type: AccountTypes) -> Decimal:
+        pass
+
 
 class MemberRepository(ABC):
     @abstractmethod
@@ -282,6 +413,18 @@ class AccountOwnerRepository(ABC):
     ) -> Union[Member, Company, SocialAccounting]:
         pass
 
+    @dataclass
+    class OwnerName:
+        owner_id: UUID
+        name: str
+
+    @abstractmethod
+    def get_owner_names(self, accounts: Iterable[UUID]) -> Dict[UUID, OwnerName]:
+        """Return the id and display name of the owner of every given
+        account by account id, without loading the owners themselves.
+        """
+        pass
+
 
 class CompanyRepository(ABC):
     @abstractmethod
@@ -326,6 +469,22 @@ class CompanyRepository(ABC):
     def get_all_companies(self) -> Iterator[Company]:
         pass
 
+    @abstractmethod
+    def get_page_of_companies(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> List[Company]:
+        """Return up to limit companies ordered case insensitively by
+        name that directly follow the company "after" or directly precede
+        the company "before". Ties are broken by company id. Companies
+        can be filtered by a case insensitive part of their name or email.
+        """
+        pass
+
     @abstractmethod
     def validate_credentials(self, email_address: str, password: str) -> Optional[UUID]:
         pass
@@ -446,12 +605,33 @@ class PlanCooperationRepository(ABC):
     def get_cooperating_plans(self, plan_id: UUID) -> List[Plan]:
         pass
 
+    @dataclass
+    class InboundRequest:
+        coop_id: UUID
+        coop_name: str
+        plan_id: UUID
+        plan_name: str
+        planner_name: str
+
     @abstractmethod
-    def get_inbound_requests(self, coordinator_id: UUID) -> Iterator[Plan]:
+    def get_inbound_requests(self, coordinator_id: UUID) -> List[InboundRequest]:
+        """Return the requests of active plans to join a cooperation
+        coordinated by the company, newest plans first.
+        """
         pass
 
+    @dataclass
+    class OutboundRequest:
+        plan_id: UUID
+        plan_name: str
+        coop_id: UUID
+        coop_name: str
+
     @abstractmethod
-    def get_outbound_requests(self, requester_id: UUID) -> Iterator[Plan]:
+    def get_outbound_requests(self, requester_id: UUID) -> List[OutboundRequest]:
+        """Return the requests of the company's plans to join a
+        cooperation, newest plans first.
+        """
         pass
 
     @abstractmethod
@@ -478,6 +658,12 @@ class PlanCooperationRepository(ABC):
     def get_plans_in_cooperation(self, cooperation_id: UUID) -> Iterable[Plan]:
         pass
 
+    @abstractmethod
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Iterable[Plan]:
+        pass
+
 
 class AccountantRepository(Protocol):
     def create_accountant(self, email: str, name: str, password: str) -> UUID:
@@ -500,7 +686,36 @@ class LanguageRepository(Protocol):
 
 class PayoutFactorRepository(Protocol):
     def store_payout_factor(self, timestamp: datetime, payout_factor: Decimal) -> None:
+        """Store the payout factor and update the summary of its day."""
         ...
 
     def get_latest_payout_factor(self) -> Optional[PayoutFactor]:
         ...
+
+    def get_daily_payout_factors(self, since: date) -> List[DailyPayoutFactor]:
+        """Return the summaries of all days from since on, oldest first.
+        The summaries are kept when old payout factors are deleted.
+        """
+        ...
+
+    def delete_payout_factors_before(self, timestamp: datetime) -> int:
+        """Delete the payout factors calculated before timestamp except
+        the latest one. Return the number of deleted payout factors.
+        """
+        ...
+
+
+class PayoutLockRepository(Protocol):
+    def try_to_lock_partition(self, partition: PayoutPartition) -> bool:
+        """Lock the partition until the current transaction ends.
+        Return False if another payout run holds the lock.
+        """
+        ...
+
+
+class StatisticsRepository(Protocol):
+    def store_statistics(self, statistics: Statistics) -> None:
+        ...
+
+    def get_latest_statistics(self) -> Optional[Statistics]:
+        ...
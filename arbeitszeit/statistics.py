@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+from injector import inject
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.entities import AccountTypes, Statistics
+from arbeitszeit.repositories import (
+    AccountRepository,
+    CompanyRepository,
+    CooperationRepository,
+    MemberRepository,
+    PlanRepository,
+    StatisticsRepository,
+)
+
+
+@inject
+@dataclass
+class StatisticsService:
+    company_repository: CompanyRepository
+    member_repository: MemberRepository
+    plan_repository: PlanRepository
+    cooperation_repository: CooperationRepository
+    account_repository: AccountRepository
+    statistics_repository: StatisticsRepository
+    datetime_service: DatetimeService
+
+    def calculate_statistics(self) -> Statistics:
+        # Certificates are held in the work accounts of companies and
+        # in member accounts. Available product is the negated sum of
+        # all product accounts.
+        certificates_count = self.account_repository.get_sum_of_balances(
+            AccountTypes.a
+        ) + self.account_repository.get_sum_of_balances(AccountTypes.member)
+        available_product = -self.account_repository.get_sum_of_balances(
+            AccountTypes.prd
+        )
+        return Statistics(
+            calculation_date=self.datetime_service.now(),
+            registered_companies_count=self.company_repository.count_registered_companies(),
+            registered_members_count=self.member_repository.count_registered_members(),
+            cooperations_count=self.cooperation_repository.count_cooperations(),
+            certificates_count=certificates_count,
+            available_product=available_product,
+            active_plans_count=self.plan_repository.count_active_plans(),
+            active_plans_public_count=self.plan_repository.count_active_public_plans(),
+            avg_timeframe=self.plan_repository.avg_timeframe_of_active_plans(),
+            planned_work=self.plan_repository.sum_of_active_planned_work(),
+            planned_resources=self.plan_repository.sum_of_active_planned_resources(),
+            planned_means=self.plan_repository.sum_of_active_planned_means(),
+        )
+
+    def store_statistics(self, statistics: Statistics) -> None:
+        self.statistics_repository.store_statistics(statistics)
+
+    def get_latest_statistics(self) -> Statistics:
+        """Return the statistics that were stored last, usually by the
+        payout job. They are calculated on the spot if none were stored
+        yet.
+        """
+        return (
+            self.statistics_repository.get_latest_statistics()
+            or self.calculate_statistics()
+        )
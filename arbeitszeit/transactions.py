@@ -1,13 +1,17 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum, auto
-from typing import List, Union
+from typing import Dict, Iterable, List, Optional, Union
+from uuid import UUID
 
 from injector import inject
 
-from .entities import AccountTypes, Company, Member, SocialAccounting, Transaction
+from .entities import Account, AccountTypes, Company, Member, Transaction
+from .pagination import Page, load_page
 from .repositories import AccountOwnerRepository, TransactionRepository
 
+ACCOUNT_HISTORY_PAGE_SIZE = 50
+
 
 class TransactionTypes(Enum):
     """
@@ -52,25 +56,21 @@ class UserAccountingService:
         )
         return all_transactions_sorted
 
-    def get_account_transactions_sorted(
-        self, user: Union[Member, Company], queried_account_type: AccountTypes
-    ) -> List[Transaction]:
-        for acc in user.accounts():
-            if acc.account_type == queried_account_type:
-                queried_account = acc
-        transactions = set()
-        transactions.update(
-            self.transaction_repository.all_transactions_sent_by_account(
-                queried_account
-            )
-        )
-        transactions.update(
-            self.transaction_repository.all_transactions_received_by_account(
-                queried_account
-            )
+    def get_page_of_account_history(
+        self, account: Account, page_cursor: Optional[str]
+    ) -> Page[TransactionRepository.AccountHistoryEntry]:
+        """
+        Return one page of the transactions of the account, newest first,
+        each with the balance of the account right after it.
+        """
+        return load_page(
+            lambda limit, after, before: self.transaction_repository.get_page_of_account_history(
+                account, limit, after=after, before=before
+            ),
+            get_id=lambda entry: entry.transaction.id,
+            page_size=ACCOUNT_HISTORY_PAGE_SIZE,
+            cursor=page_cursor,
         )
-        transactions_sorted = sorted(transactions, key=lambda x: x.date, reverse=True)
-        return transactions_sorted
 
     def user_is_sender(
         self, transaction: Transaction, user: Union[Member, Company]
@@ -110,6 +110,8 @@ class UserAccountingService:
                 elif receiving_account == AccountTypes.member:
                     transaction_type = TransactionTypes.incoming_wages
 
+            elif sending_account == AccountTypes.a:
+                transaction_type = TransactionTypes.incoming_wages
             elif sending_account == AccountTypes.p:
                 transaction_type = TransactionTypes.sale_of_fixed_means
             elif sending_account == AccountTypes.r:
@@ -133,20 +135,27 @@ class UserAccountingService:
             return -1 * transaction.amount_sent
         return transaction.amount_received
 
+    def get_account_owner_names(
+        self, accounts: Iterable[Account]
+    ) -> Dict[UUID, AccountOwnerRepository.OwnerName]:
+        """
+        Resolve the owners of many accounts at once, e.g. the peers of
+        all transactions in a listing.
+        """
+        return self.account_owner_repository.get_owner_names(
+            {account.id for account in accounts}
+        )
+
     def get_buyer(
         self,
         transaction_type: TransactionTypes,
         transaction: Transaction,
-    ) -> Union[Member, Company, None]:
+        owner_names: Dict[UUID, AccountOwnerRepository.OwnerName],
+    ) -> Optional[AccountOwnerRepository.OwnerName]:
         if transaction_type not in (
             TransactionTypes.sale_of_consumer_product,
             TransactionTypes.sale_of_fixed_means,
             TransactionTypes.sale_of_liquid_means,
         ):
             return None
-        buyer_account = transaction.sending_account
-        buyer = self.account_owner_repository.get_account_owner(buyer_account)
-        assert not isinstance(
-            buyer, SocialAccounting
-        )  # from the transactiontype we know: buyer can't be social accounting
-        return buyer
+        return owner_names[transaction.sending_account.id]
@@ -32,6 +32,12 @@ from .end_cooperation import (
     EndCooperationRequest,
     EndCooperationResponse,
 )
+from .export_transactions import (
+    ExportedTransaction,
+    ExportTransactions,
+    ExportTransactionsRequest,
+    ExportTransactionsResponse,
+)
 from .get_company_summary import (
     GetCompanySummary,
     GetCompanySummaryResponse,
@@ -159,6 +165,10 @@ __all__ = [
     "EndCooperation",
     "EndCooperationRequest",
     "EndCooperationResponse",
+    "ExportedTransaction",
+    "ExportTransactions",
+    "ExportTransactionsRequest",
+    "ExportTransactionsResponse",
     "GetCompanySummary",
     "GetCompanySummaryResponse",
     "GetCompanySummarySuccess",
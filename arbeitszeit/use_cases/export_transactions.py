@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum, auto
+from typing import FrozenSet, Iterator, List, Optional, Union
+from uuid import UUID
+
+from injector import inject
+
+from arbeitszeit.entities import Account, AccountTypes, Company, Member, Transaction
+from arbeitszeit.repositories import (
+    CompanyRepository,
+    MemberRepository,
+    TransactionRepository,
+)
+from arbeitszeit.transactions import TransactionTypes, UserAccountingService
+
+
+@dataclass
+class ExportTransactionsRequest:
+    user: UUID
+    account_types: Optional[FrozenSet[AccountTypes]] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+
+@dataclass
+class ExportedTransaction:
+    date: datetime
+    transaction_type: TransactionTypes
+    account_type: AccountTypes
+    transaction_volume: Decimal
+    purpose: str
+
+
+@dataclass
+class ExportTransactionsResponse:
+    class RejectionReason(Exception, Enum):
+        user_not_found = auto()
+
+    rejection_reason: Optional[RejectionReason]
+    transactions: Iterator[ExportedTransaction]
+
+    @property
+    def is_rejected(self) -> bool:
+        return self.rejection_reason is not None
+
+
+@inject
+@dataclass
+class ExportTransactions:
+    """Export the transactions of a company or a member, oldest first.
+    The transactions are produced lazily while the response is consumed.
+    """
+
+    company_repository: CompanyRepository
+    member_repository: MemberRepository
+    transaction_repository: TransactionRepository
+    accounting_service: UserAccountingService
+
+    def __call__(
+        self, request: ExportTransactionsRequest
+    ) -> ExportTransactionsResponse:
+        user: Union[Company, Member, None] = self.company_repository.get_by_id(
+            request.user
+        ) or self.member_repository.get_by_id(request.user)
+        if user is None:
+            return ExportTransactionsResponse(
+                rejection_reason=ExportTransactionsResponse.RejectionReason.user_not_found,
+                transactions=iter([]),
+            )
+        accounts = [
+            account
+            for account in user.accounts()
+            if request.account_types is None
+            or account.account_type in request.account_types
+        ]
+        transactions = self.transaction_repository.get_transactions_of_accounts(
+            accounts, since=request.since, until=request.until
+        )
+        return ExportTransactionsResponse(
+            rejection_reason=None,
+            transactions=(
+                self._export_transaction(accounts, transaction)
+                for transaction in transactions
+            ),
+        )
+
+    def _export_transaction(
+        self, accounts: List[Account], transaction: Transaction
+    ) -> ExportedTransaction:
+        user_is_sender = transaction.sending_account in accounts
+        return ExportedTransaction(
+            date=transaction.date,
+            transaction_type=self.accounting_service.get_transaction_type(
+                transaction, user_is_sender
+            ),
+            account_type=(
+                transaction.sending_account.account_type
+                if user_is_sender
+                else transaction.receiving_account.account_type
+            ),
+            transaction_volume=self.accounting_service.get_transaction_volume(
+                transaction, user_is_sender
+            ),
+            purpose=transaction.purpose,
+        )
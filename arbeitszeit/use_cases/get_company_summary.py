@@ -2,7 +2,7 @@ from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from decimal import Decimal, DivisionByZero, InvalidOperation
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from arbeitszeit.decimal import decimal_sum
@@ -96,15 +96,25 @@ class GetCompanySummary:
                 )
                 for account_name in ["means", "raw_material", "work", "product"]
             ],
-            plan_details=[self._get_plan_details(plan) for plan in plans],
+            plan_details=self._get_plan_details(company, plans),
             suppliers_ordered_by_volume=self._get_suppliers(purchases),
         )
 
-    def _get_plan_details(self, plan: Plan) -> PlanDetails:
-        expected_sales_volume = plan.expected_sales_value
-        sales_balance_of_plan = self.transaction_repository.get_sales_balance_of_plan(
-            plan
+    def _get_plan_details(
+        self, company: Company, plans: Iterable[Plan]
+    ) -> List[PlanDetails]:
+        sales_balances = (
+            self.transaction_repository.get_sales_balances_of_plans_of_company(company)
         )
+        return [
+            self._get_details_of_plan(plan, sales_balances.get(plan.id, Decimal(0)))
+            for plan in plans
+        ]
+
+    def _get_details_of_plan(
+        self, plan: Plan, sales_balance_of_plan: Decimal
+    ) -> PlanDetails:
+        expected_sales_volume = plan.expected_sales_value
         return PlanDetails(
             id=plan.id,
             name=plan.prd_name,
@@ -5,7 +5,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.price_calculator import calculate_price
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.repositories import CooperationRepository, PlanCooperationRepository
 
 
@@ -43,11 +43,16 @@ GetCoopSummaryResponse = Optional[GetCoopSummarySuccess]
 class GetCoopSummary:
     cooperation_repository: CooperationRepository
     plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
 
     def __call__(self, request: GetCoopSummaryRequest) -> GetCoopSummaryResponse:
         coop = self.cooperation_repository.get_by_id(request.coop_id)
         if coop is None:
             return None
+        plans_in_cooperation = list(
+            self.plan_cooperation_repository.get_plans_in_cooperation(request.coop_id)
+        )
+        prices = self.price_service.get_prices_per_unit(plans_in_cooperation)
         plans = [
             AssociatedPlan(
                 plan_id=plan.id,
@@ -56,13 +61,9 @@ class GetCoopSummary:
                 / plan.prd_amount
                 if not plan.is_public_service
                 else Decimal(0),
-                plan_coop_price=calculate_price(
-                    self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-                ),
-            )
-            for plan in self.plan_cooperation_repository.get_plans_in_cooperation(
-                request.coop_id
+                plan_coop_price=prices[plan.id],
             )
+            for plan in plans_in_cooperation
         ]
         return GetCoopSummarySuccess(
             requester_is_coordinator=bool(coop.coordinator.id == request.requester_id),
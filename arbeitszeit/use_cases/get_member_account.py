@@ -1,18 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Union
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import (
-    AccountTypes,
-    Company,
-    Member,
-    SocialAccounting,
-    Transaction,
-)
+from arbeitszeit.entities import Account, Member, Transaction
 from arbeitszeit.repositories import (
     AccountOwnerRepository,
     AccountRepository,
@@ -20,9 +14,6 @@ from arbeitszeit.repositories import (
 )
 from arbeitszeit.transactions import UserAccountingService
 
-User = Union[Member, Company]
-UserOrSocialAccounting = Union[User, SocialAccounting]
-
 
 @dataclass
 class TransactionInfo:
@@ -30,12 +21,15 @@ class TransactionInfo:
     peer_name: str
     transaction_volume: Decimal
     purpose: str
+    balance: Decimal
 
 
 @dataclass
 class GetMemberAccountResponse:
     transactions: List[TransactionInfo]
     balance: Decimal
+    next_page: Optional[str] = None
+    previous_page: Optional[str] = None
 
 
 @inject
@@ -43,34 +37,40 @@ class GetMemberAccountResponse:
 class GetMemberAccount:
     accounting_service: UserAccountingService
     member_repository: MemberRepository
-    acount_owner_repository: AccountOwnerRepository
     account_repository: AccountRepository
 
-    def __call__(self, member_id: UUID) -> GetMemberAccountResponse:
+    def __call__(
+        self, member_id: UUID, page_cursor: Optional[str] = None
+    ) -> GetMemberAccountResponse:
         member = self.member_repository.get_by_id(member_id)
         assert member
+        history = self.accounting_service.get_page_of_account_history(
+            member.account, page_cursor
+        )
+        owner_names = self.accounting_service.get_account_owner_names(
+            self._get_peer_account(member, entry.transaction) for entry in history.items
+        )
         transaction_info = [
-            self._create_info(member, transaction)
-            for transaction in self.accounting_service.get_account_transactions_sorted(
-                member, AccountTypes.member
-            )
+            self._create_info(member, entry.transaction, entry.balance, owner_names)
+            for entry in history.items
         ]
         balance = self.account_repository.get_account_balance(member.account)
-        return GetMemberAccountResponse(transaction_info, balance)
+        return GetMemberAccountResponse(
+            transaction_info,
+            balance,
+            next_page=history.next_cursor,
+            previous_page=history.previous_cursor,
+        )
 
     def _create_info(
         self,
         user: Member,
         transaction: Transaction,
+        balance: Decimal,
+        owner_names: Dict[UUID, AccountOwnerRepository.OwnerName],
     ) -> TransactionInfo:
-        sender = self.acount_owner_repository.get_account_owner(
-            transaction.sending_account
-        )
-        receiver = self.acount_owner_repository.get_account_owner(
-            transaction.receiving_account
-        )
         user_is_sender = self.accounting_service.user_is_sender(transaction, user)
-        peer_name = self._get_peer_name(user_is_sender, sender, receiver)
+        peer_name = owner_names[self._get_peer_account(user, transaction).id].name
         transaction_volume = self.accounting_service.get_transaction_volume(
             transaction, user_is_sender
         )
@@ -79,15 +79,11 @@ class GetMemberAccount:
             peer_name,
             transaction_volume,
             transaction.purpose,
+            balance,
         )
 
-    def _get_peer_name(
-        self,
-        user_is_sender: bool,
-        sender: UserOrSocialAccounting,
-        receiver: UserOrSocialAccounting,
-    ) -> str:
-        if user_is_sender:
-            return receiver.get_name()
+    def _get_peer_account(self, user: Member, transaction: Transaction) -> Account:
+        if self.accounting_service.user_is_sender(transaction, user):
+            return transaction.receiving_account
         else:
-            return sender.get_name()
+            return transaction.sending_account
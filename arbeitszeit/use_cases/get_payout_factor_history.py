@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import List
+
+from injector import inject
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.entities import DailyPayoutFactor
+from arbeitszeit.repositories import PayoutFactorRepository
+
+
+@inject
+@dataclass
+class GetPayoutFactorHistory:
+    @dataclass
+    class Request:
+        days: int
+
+    @dataclass
+    class Response:
+        days: List[DailyPayoutFactor]
+
+    payout_factor_repository: PayoutFactorRepository
+    datetime_service: DatetimeService
+
+    def __call__(self, request: Request) -> Response:
+        """Return the daily summaries of the payout factor for the last
+        days up to today, oldest first. Days without payout factors are
+        left out.
+        """
+        since = self.datetime_service.now().date() - timedelta(days=request.days - 1)
+        return self.Response(
+            days=self.payout_factor_repository.get_daily_payout_factors(since)
+        )
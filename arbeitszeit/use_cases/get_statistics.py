@@ -1,18 +1,13 @@
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import Optional
 
 from injector import inject
 
 from arbeitszeit.entities import PayoutFactor
-from arbeitszeit.repositories import (
-    AccountRepository,
-    CompanyRepository,
-    CooperationRepository,
-    MemberRepository,
-    PayoutFactorRepository,
-    PlanRepository,
-)
+from arbeitszeit.repositories import PayoutFactorRepository
+from arbeitszeit.statistics import StatisticsService
 
 
 @dataclass
@@ -29,70 +24,29 @@ class StatisticsResponse:
     planned_resources: Decimal
     planned_means: Decimal
     payout_factor: Optional[PayoutFactor]
+    calculation_date: datetime
 
 
 @inject
 @dataclass
 class GetStatistics:
-    company_repository: CompanyRepository
-    member_repository: MemberRepository
-    plan_repository: PlanRepository
-    cooperation_respository: CooperationRepository
-    account_respository: AccountRepository
+    statistics_service: StatisticsService
     payout_factor_repository: PayoutFactorRepository
 
     def __call__(self) -> StatisticsResponse:
-        (
-            certs_total,
-            available_product,
-        ) = self._count_certificates_and_available_product()
+        statistics = self.statistics_service.get_latest_statistics()
         return StatisticsResponse(
-            registered_companies_count=self.company_repository.count_registered_companies(),
-            registered_members_count=self.member_repository.count_registered_members(),
-            cooperations_count=self.cooperation_respository.count_cooperations(),
-            certificates_count=certs_total,
-            available_product=available_product,
-            active_plans_count=self.plan_repository.count_active_plans(),
-            active_plans_public_count=self.plan_repository.count_active_public_plans(),
-            avg_timeframe=self.plan_repository.avg_timeframe_of_active_plans(),
-            planned_work=self.plan_repository.sum_of_active_planned_work(),
-            planned_resources=self.plan_repository.sum_of_active_planned_resources(),
-            planned_means=self.plan_repository.sum_of_active_planned_means(),
+            registered_companies_count=statistics.registered_companies_count,
+            registered_members_count=statistics.registered_members_count,
+            cooperations_count=statistics.cooperations_count,
+            certificates_count=statistics.certificates_count,
+            available_product=statistics.available_product,
+            active_plans_count=statistics.active_plans_count,
+            active_plans_public_count=statistics.active_plans_public_count,
+            avg_timeframe=statistics.avg_timeframe,
+            planned_work=statistics.planned_work,
+            planned_resources=statistics.planned_resources,
+            planned_means=statistics.planned_means,
             payout_factor=self.payout_factor_repository.get_latest_payout_factor(),
+            calculation_date=statistics.calculation_date,
         )
-
-    def _count_certificates_and_available_product(self) -> Tuple[Decimal, Decimal]:
-        """
-        available certificates is sum of company work account balances and sum of member account balances
-        """
-        (
-            certs_in_company_accounts,
-            available_product,
-        ) = self._count_certs_and_products_from_companies()
-
-        certs_in_member_accounts = self._count_certs_in_member_accounts()
-        certs_total = certs_in_company_accounts + certs_in_member_accounts
-        return certs_total, available_product
-
-    def _count_certs_and_products_from_companies(self) -> Tuple[Decimal, Decimal]:
-        """available product is sum of prd account balances *(-1)"""
-        certs_in_company_accounts = Decimal(0)
-        available_product = Decimal(0)
-        all_companies = self.company_repository.get_all_companies()
-        for company in all_companies:
-            available_product += self.account_respository.get_account_balance(
-                company.product_account
-            )
-            certs_in_company_accounts += self.account_respository.get_account_balance(
-                company.work_account
-            )
-        return certs_in_company_accounts, available_product * -1
-
-    def _count_certs_in_member_accounts(self) -> Decimal:
-        certs_in_member_accounts = Decimal(0)
-        all_members = self.member_repository.get_all_members()
-        for member in all_members:
-            certs_in_member_accounts += self.account_respository.get_account_balance(
-                member.account
-            )
-        return certs_in_member_accounts
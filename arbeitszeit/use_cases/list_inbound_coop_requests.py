@@ -4,12 +4,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import Plan
-from arbeitszeit.repositories import (
-    CompanyRepository,
-    CooperationRepository,
-    PlanCooperationRepository,
-)
+from arbeitszeit.repositories import CompanyRepository, PlanCooperationRepository
 
 
 @dataclass
@@ -36,18 +31,18 @@ class ListInboundCoopRequestsResponse:
 class ListInboundCoopRequests:
     company_repository: CompanyRepository
     plan_cooperation_repository: PlanCooperationRepository
-    cooperation_repository: CooperationRepository
 
     def __call__(
         self, request: ListInboundCoopRequestsRequest
     ) -> ListInboundCoopRequestsResponse:
         if not self._coordinator_exists(request):
             return ListInboundCoopRequestsResponse(cooperation_requests=[])
+        inbound_requests = self.plan_cooperation_repository.get_inbound_requests(
+            request.coordinator_id
+        )
         cooperation_requests = [
-            self._plan_to_response_model(plan)
-            for plan in self.plan_cooperation_repository.get_inbound_requests(
-                request.coordinator_id
-            )
+            self._request_to_response_model(inbound_request)
+            for inbound_request in inbound_requests
         ]
         return ListInboundCoopRequestsResponse(
             cooperation_requests=cooperation_requests
@@ -57,16 +52,13 @@ class ListInboundCoopRequests:
         coordinator = self.company_repository.get_by_id(request.coordinator_id)
         return bool(coordinator)
 
-    def _plan_to_response_model(self, plan: Plan) -> ListedInboundCoopRequest:
-        assert plan.requested_cooperation
-        requested_cooperation_name = self.cooperation_repository.get_cooperation_name(
-            plan.requested_cooperation
-        )
-        assert requested_cooperation_name
+    def _request_to_response_model(
+        self, inbound_request: PlanCooperationRepository.InboundRequest
+    ) -> ListedInboundCoopRequest:
         return ListedInboundCoopRequest(
-            coop_id=plan.requested_cooperation,
-            coop_name=requested_cooperation_name,
-            plan_id=plan.id,
-            plan_name=plan.prd_name,
-            planner_name=plan.planner.name,
+            coop_id=inbound_request.coop_id,
+            coop_name=inbound_request.coop_name,
+            plan_id=inbound_request.plan_id,
+            plan_name=inbound_request.plan_name,
+            planner_name=inbound_request.planner_name,
         )
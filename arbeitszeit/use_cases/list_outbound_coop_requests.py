@@ -4,12 +4,7 @@ from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import Plan
-from arbeitszeit.repositories import (
-    CompanyRepository,
-    CooperationRepository,
-    PlanCooperationRepository,
-)
+from arbeitszeit.repositories import CompanyRepository, PlanCooperationRepository
 
 
 @dataclass
@@ -35,18 +30,18 @@ class ListOutboundCoopRequestsResponse:
 class ListOutboundCoopRequests:
     company_repository: CompanyRepository
     plan_cooperation_repository: PlanCooperationRepository
-    cooperation_repository: CooperationRepository
 
     def __call__(
         self, request: ListOutboundCoopRequestsRequest
     ) -> ListOutboundCoopRequestsResponse:
         if not self._requester_exists(request):
             return ListOutboundCoopRequestsResponse(cooperation_requests=[])
+        outbound_requests = self.plan_cooperation_repository.get_outbound_requests(
+            request.requester_id
+        )
         cooperation_requests = [
-            self._plan_to_response_model(plan)
-            for plan in self.plan_cooperation_repository.get_outbound_requests(
-                request.requester_id
-            )
+            self._request_to_response_model(outbound_request)
+            for outbound_request in outbound_requests
         ]
         return ListOutboundCoopRequestsResponse(
             cooperation_requests=cooperation_requests
@@ -56,15 +51,12 @@ class ListOutboundCoopRequests:
         requester = self.company_repository.get_by_id(request.requester_id)
         return bool(requester)
 
-    def _plan_to_response_model(self, plan: Plan) -> ListedOutboundCoopRequest:
-        assert plan.requested_cooperation
-        requested_cooperation_name = self.cooperation_repository.get_cooperation_name(
-            plan.requested_cooperation
-        )
-        assert requested_cooperation_name
+    def _request_to_response_model(
+        self, outbound_request: PlanCooperationRepository.OutboundRequest
+    ) -> ListedOutboundCoopRequest:
         return ListedOutboundCoopRequest(
-            plan_id=plan.id,
-            plan_name=plan.prd_name,
-            coop_id=plan.requested_cooperation,
-            coop_name=requested_cooperation_name,
+            plan_id=outbound_request.plan_id,
+            plan_name=outbound_request.plan_name,
+            coop_id=outbound_request.coop_id,
+            coop_name=outbound_request.coop_name,
         )
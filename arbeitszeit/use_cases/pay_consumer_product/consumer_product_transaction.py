@@ -5,12 +5,12 @@ from dataclasses import dataclass
 from injector import inject
 
 from arbeitszeit.control_thresholds import ControlThresholds
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Member, Plan
 from arbeitszeit.price_calculator import calculate_price
 from arbeitszeit.repositories import (
     AccountRepository,
-    PlanCooperationRepository,
     PurchaseRepository,
     TransactionRepository,
 )
@@ -22,7 +22,7 @@ class ConsumerProductTransactionFactory:
     datetime_service: DatetimeService
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
     account_repository: AccountRepository
     control_thresholds: ControlThresholds
 
@@ -39,7 +39,7 @@ class ConsumerProductTransactionFactory:
             self.datetime_service,
             self.purchase_repository,
             self.transaction_repository,
-            self.plan_cooperation_repository,
+            self.price_service,
             self.account_repository,
             self.control_thresholds,
         )
@@ -53,7 +53,7 @@ class ConsumerProductTransaction:
     datetime_service: DatetimeService
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
     account_repository: AccountRepository
     control_thresholds: ControlThresholds
 
@@ -64,9 +64,7 @@ class ConsumerProductTransaction:
         account_balance = self.account_repository.get_account_balance(
             self.buyer.account
         )
-        price = self.amount * calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
+        price = self.amount * self.price_service.get_price_per_unit(self.plan)
         if price == 0:
             return True
         if (account_balance - price + allowed_overdraw) < 0:
@@ -74,9 +72,7 @@ class ConsumerProductTransaction:
         return True
 
     def record_purchase(self) -> None:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
+        price_per_unit = self.price_service.get_price_per_unit(self.plan)
         self.purchase_repository.create_purchase_by_member(
             purchase_date=self.datetime_service.now(),
             plan=self.plan.id,
@@ -86,9 +82,7 @@ class ConsumerProductTransaction:
         )
 
     def exchange_currency(self) -> None:
-        coop_price = self.amount * calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
+        coop_price = self.amount * self.price_service.get_price_per_unit(self.plan)
         individual_price = self.amount * calculate_price([self.plan])
         sending_account = self.buyer.account
         self.transaction_repository.create_transaction(
@@ -98,4 +92,5 @@ class ConsumerProductTransaction:
             amount_sent=coop_price,
             amount_received=individual_price,
             purpose=f"Plan-Id: {self.plan.id}",
+            plan=self.plan.id,
         )
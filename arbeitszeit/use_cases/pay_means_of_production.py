@@ -7,12 +7,12 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Company, Plan, PurposesOfPurchases
 from arbeitszeit.price_calculator import calculate_price
 from arbeitszeit.repositories import (
     CompanyRepository,
-    PlanCooperationRepository,
     PlanRepository,
     PurchaseRepository,
     TransactionRepository,
@@ -107,16 +107,14 @@ class Payment:
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
     datetime_service: DatetimeService
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
     plan: Plan
     buyer: Company
     amount: int
     purpose: PurposesOfPurchases
 
     def record_purchase(self) -> None:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
+        price_per_unit = self.price_service.get_price_per_unit(self.plan)
         self.purchase_repository.create_purchase_by_company(
             purchase_date=self.datetime_service.now(),
             plan=self.plan.id,
@@ -127,9 +125,7 @@ class Payment:
         )
 
     def create_transaction(self) -> None:
-        coop_price = self.amount * calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(self.plan.id)
-        )
+        coop_price = self.amount * self.price_service.get_price_per_unit(self.plan)
         individual_price = self.amount * calculate_price([self.plan])
         if self.purpose == PurposesOfPurchases.means_of_prod:
             sending_account = self.buyer.means_account
@@ -143,6 +139,7 @@ class Payment:
             amount_sent=coop_price,
             amount_received=individual_price,
             purpose=f"Plan-Id: {self.plan.id}",
+            plan=self.plan.id,
         )
 
 
@@ -152,7 +149,7 @@ class PaymentFactory:
     purchase_repository: PurchaseRepository
     transaction_repository: TransactionRepository
     datetime_service: DatetimeService
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
 
     def get_payment(
         self, plan: Plan, buyer: Company, amount: int, purpose: PurposesOfPurchases
@@ -161,7 +158,7 @@ class PaymentFactory:
             self.purchase_repository,
             self.transaction_repository,
             self.datetime_service,
-            self.plan_cooperation_repository,
+            self.price_service,
             plan,
             buyer,
             amount,
@@ -3,12 +3,14 @@ from __future__ import annotations
 import enum
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import partial
 from typing import List, Optional
 from uuid import UUID
 
 from injector import inject
 
 from arbeitszeit.entities import Company
+from arbeitszeit.pagination import load_page
 from arbeitszeit.repositories import CompanyRepository
 
 
@@ -20,6 +22,8 @@ class CompanyFilter(enum.Enum):
 @dataclass
 class CompanyQueryResponse:
     results: List[QueriedCompany]
+    next_page: Optional[str] = None
+    previous_page: Optional[str] = None
 
 
 @dataclass
@@ -38,6 +42,14 @@ class QueryCompaniesRequest(ABC):
     def get_filter_category(self) -> CompanyFilter:
         pass
 
+    @abstractmethod
+    def get_page_size(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_page_cursor(self) -> Optional[str]:
+        pass
+
 
 @inject
 @dataclass
@@ -47,19 +59,40 @@ class QueryCompanies:
     def __call__(self, request: QueryCompaniesRequest) -> CompanyQueryResponse:
         query = request.get_query_string()
         filter_by = request.get_filter_category()
-        if query is None:
-            found_companies = self.company_repository.get_all_companies()
-        elif filter_by == CompanyFilter.by_name:
-            found_companies = self.company_repository.query_companies_by_name(query)
-        else:
-            found_companies = self.company_repository.query_companies_by_email(query)
-        results = [
-            self._company_to_response_model(company) for company in found_companies
-        ]
+        page = load_page(
+            partial(
+                self._load_page,
+                query if filter_by == CompanyFilter.by_name else None,
+                query if filter_by == CompanyFilter.by_email else None,
+            ),
+            get_id=self._get_id,
+            page_size=request.get_page_size(),
+            cursor=request.get_page_cursor(),
+        )
         return CompanyQueryResponse(
-            results=results,
+            results=[
+                self._company_to_response_model(company) for company in page.items
+            ],
+            next_page=page.next_cursor,
+            previous_page=page.previous_cursor,
         )
 
+    def _load_page(
+        self,
+        name: Optional[str],
+        email: Optional[str],
+        limit: int,
+        after: Optional[UUID],
+        before: Optional[UUID],
+    ) -> List[Company]:
+        return self.company_repository.get_page_of_companies(
+            limit, after=after, before=before, name=name, email=email
+        )
+
+    @staticmethod
+    def _get_id(company: Company) -> UUID:
+        return company.id
+
     def _company_to_response_model(self, company: Company) -> QueriedCompany:
         return QueriedCompany(
             company_id=company.id,
@@ -5,14 +5,16 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import partial
 from typing import List, Optional
 from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.entities import Plan
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import PlanCooperationRepository, PlanRepository
+from arbeitszeit.pagination import load_page
+from arbeitszeit.repositories import PlanRepository
 
 
 class PlanFilter(enum.Enum):
@@ -24,11 +26,14 @@ class PlanSorting(enum.Enum):
     by_activation = enum.auto()
     by_company_name = enum.auto()
     by_price = enum.auto()
+    by_relevance = enum.auto()
 
 
 @dataclass
 class PlanQueryResponse:
     results: List[QueriedPlan]
+    next_page: Optional[str] = None
+    previous_page: Optional[str] = None
 
 
 @dataclass
@@ -58,33 +63,71 @@ class QueryPlansRequest(ABC):
     def get_sorting_category(self) -> PlanSorting:
         pass
 
+    @abstractmethod
+    def get_page_size(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_page_cursor(self) -> Optional[str]:
+        pass
+
 
 @inject
 @dataclass
 class QueryPlans:
     plan_repository: PlanRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
 
     def __call__(self, request: QueryPlansRequest) -> PlanQueryResponse:
         query = request.get_query_string()
         filter_by = request.get_filter_category()
-        sort_by = request.get_sorting_category()
-        if query is None:
-            found_plans = self.plan_repository.get_active_plans()
-        elif filter_by == PlanFilter.by_plan_id:
-            found_plans = self.plan_repository.query_active_plans_by_plan_id(query)
-        else:
-            found_plans = self.plan_repository.query_active_plans_by_product_name(query)
-        results = [self._plan_to_response_model(plan) for plan in found_plans]
-        results_sorted = self._sort_plans(results, sort_by)
+        ordering = self._get_ordering(request.get_sorting_category())
+        page = load_page(
+            partial(
+                self._load_page,
+                ordering,
+                query if filter_by == PlanFilter.by_product_name else None,
+                query if filter_by == PlanFilter.by_plan_id else None,
+            ),
+            get_id=self._get_id,
+            page_size=request.get_page_size(),
+            cursor=request.get_page_cursor(),
+        )
+        prices = self.price_service.get_prices_per_unit(page.items)
         return PlanQueryResponse(
-            results=results_sorted,
+            results=[
+                self._plan_to_response_model(plan, prices[plan.id])
+                for plan in page.items
+            ],
+            next_page=page.next_cursor,
+            previous_page=page.previous_cursor,
         )
 
-    def _plan_to_response_model(self, plan: Plan) -> QueriedPlan:
-        price_per_unit = calculate_price(
-            self.plan_cooperation_repository.get_cooperating_plans(plan.id)
+    def _load_page(
+        self,
+        ordering: PlanRepository.Ordering,
+        search_text: Optional[str],
+        plan_id: Optional[str],
+        limit: int,
+        after: Optional[UUID],
+        before: Optional[UUID],
+    ) -> List[Plan]:
+        return self.plan_repository.get_page_of_active_plans(
+            ordering,
+            limit,
+            after=after,
+            before=before,
+            search_text=search_text,
+            plan_id=plan_id,
         )
+
+    @staticmethod
+    def _get_id(plan: Plan) -> UUID:
+        return plan.id
+
+    def _plan_to_response_model(
+        self, plan: Plan, price_per_unit: Decimal
+    ) -> QueriedPlan:
         assert plan.activation_date
         return QueriedPlan(
             plan_id=plan.id,
@@ -99,13 +142,12 @@ class QueryPlans:
             activation_date=plan.activation_date,
         )
 
-    def _sort_plans(
-        self, plans: List[QueriedPlan], sort_by: PlanSorting
-    ) -> List[QueriedPlan]:
+    def _get_ordering(self, sort_by: PlanSorting) -> PlanRepository.Ordering:
         if sort_by == PlanSorting.by_activation:
-            plans = sorted(plans, key=lambda x: x.activation_date, reverse=True)
+            return PlanRepository.Ordering.newest_first
         elif sort_by == PlanSorting.by_price:
-            plans = sorted(plans, key=lambda x: x.price_per_unit)
+            return PlanRepository.Ordering.price
+        elif sort_by == PlanSorting.by_relevance:
+            return PlanRepository.Ordering.relevance
         else:
-            plans = sorted(plans, key=lambda x: x.company_name.casefold())
-        return plans
+            return PlanRepository.Ordering.company_name
@@ -76,4 +76,5 @@ class SelfApprovePlan:
             amount_sent=round(amount, 2),
             amount_received=round(amount, 2),
             purpose=f"Plan-Id: {plan.id}",
+            plan=plan.id,
         )
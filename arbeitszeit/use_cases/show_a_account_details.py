@@ -3,14 +3,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import AccountTypes, Company, Transaction
-from arbeitszeit.repositories import AccountRepository, CompanyRepository
+from arbeitszeit.entities import Account, Company, Transaction
+from arbeitszeit.repositories import (
+    AccountRepository,
+    CompanyRepository,
+    TransactionRepository,
+)
 from arbeitszeit.transactions import TransactionTypes, UserAccountingService
 
 
@@ -23,6 +26,7 @@ class ShowAAccountDetailsUseCase:
         date: datetime
         transaction_volume: Decimal
         purpose: str
+        balance: Decimal
 
     @dataclass
     class PlotDetails:
@@ -35,38 +39,41 @@ class ShowAAccountDetailsUseCase:
         transactions: List[ShowAAccountDetailsUseCase.TransactionInfo]
         account_balance: Decimal
         plot: ShowAAccountDetailsUseCase.PlotDetails
+        next_page: Optional[str] = None
+        previous_page: Optional[str] = None
 
     accounting_service: UserAccountingService
     company_repository: CompanyRepository
     account_repository: AccountRepository
+    transaction_repository: TransactionRepository
 
-    def __call__(self, company_id: UUID) -> Response:
+    def __call__(self, company_id: UUID, page_cursor: Optional[str] = None) -> Response:
         company = self.company_repository.get_by_id(company_id)
         assert company
+        history = self.accounting_service.get_page_of_account_history(
+            company.work_account, page_cursor
+        )
         transactions = [
-            self._create_info(company, transaction)
-            for transaction in self.accounting_service.get_account_transactions_sorted(
-                company, AccountTypes.a
-            )
+            self._create_info(company, entry.transaction, entry.balance)
+            for entry in history.items
         ]
         account_balance = self.account_repository.get_account_balance(
             company.work_account
         )
-        plot = self.PlotDetails(
-            timestamps=self._get_plot_dates(transactions),
-            accumulated_volumes=self._get_plot_volumes(transactions),
-        )
         return self.Response(
             company_id=company_id,
             transactions=transactions,
             account_balance=account_balance,
-            plot=plot,
+            plot=self._get_plot_details(company.work_account),
+            next_page=history.next_cursor,
+            previous_page=history.previous_cursor,
         )
 
     def _create_info(
         self,
         company: Company,
         transaction: Transaction,
+        balance: Decimal,
     ) -> TransactionInfo:
         user_is_sender = self.accounting_service.user_is_sender(transaction, company)
         transaction_type = self.accounting_service.get_transaction_type(
@@ -81,15 +88,14 @@ class ShowAAccountDetailsUseCase:
             transaction.date,
             transaction_volume,
             transaction.purpose,
+            balance,
         )
 
-    def _get_plot_dates(self, transactions: List[TransactionInfo]) -> List[datetime]:
-        timestamps = [t.date for t in transactions]
-        timestamps.reverse()
-        return timestamps
-
-    def _get_plot_volumes(self, transactions: List[TransactionInfo]) -> List[Decimal]:
-        volumes = [t.transaction_volume for t in transactions]
-        volumes.reverse()
-        volumes_cumsum = list(accumulate(volumes))
-        return volumes_cumsum
+    def _get_plot_details(self, account: Account) -> PlotDetails:
+        balance_history = self.transaction_repository.get_account_balance_history(
+            account
+        )
+        return self.PlotDetails(
+            timestamps=[date for date, _ in balance_history],
+            accumulated_volumes=[balance for _, balance in balance_history],
+        )
@@ -6,13 +6,9 @@ from uuid import UUID
 
 from injector import inject
 
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.entities import Plan, PlanDraft
-from arbeitszeit.price_calculator import calculate_price
-from arbeitszeit.repositories import (
-    PlanCooperationRepository,
-    PlanDraftRepository,
-    PlanRepository,
-)
+from arbeitszeit.repositories import PlanDraftRepository, PlanRepository
 
 
 @dataclass
@@ -47,7 +43,7 @@ class ShowMyPlansResponse:
 @dataclass
 class ShowMyPlansUseCase:
     plan_repository: PlanRepository
-    plan_cooperation_repository: PlanCooperationRepository
+    price_service: CooperationPriceService
     draft_repository: PlanDraftRepository
 
     def show_company_plans(self, request: ShowMyPlansRequest) -> ShowMyPlansResponse:
@@ -63,18 +59,19 @@ class ShowMyPlansUseCase:
             )
         )
         count_all_plans = len(all_plans_of_company) + len(drafts)
+        prices = self.price_service.get_prices_per_unit(all_plans_of_company)
         non_active_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if (plan.is_approved and not plan.is_active and not plan.expired)
         ]
         active_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if (plan.is_approved and plan.is_active and not plan.expired)
         ]
         expired_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if plan.expired and (not plan.hidden_by_user)
         ]
@@ -86,13 +83,13 @@ class ShowMyPlansUseCase:
             drafts=drafts,
         )
 
-    def _create_plan_info_from_plan(self, plan: Plan) -> PlanInfo:
+    def _create_plan_info_from_plan(
+        self, plan: Plan, price_per_unit: Decimal
+    ) -> PlanInfo:
         return PlanInfo(
             id=plan.id,
             prd_name=plan.prd_name,
-            price_per_unit=calculate_price(
-                self.plan_cooperation_repository.get_cooperating_plans(plan.id)
-            ),
+            price_per_unit=price_per_unit,
             is_public_service=plan.is_public_service,
             plan_creation_date=plan.plan_creation_date,
             activation_date=plan.activation_date,
@@ -3,14 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
-from typing import List, Optional, Union
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from injector import inject
 
-from arbeitszeit.entities import AccountTypes, Company, Member, Transaction
-from arbeitszeit.repositories import AccountRepository, CompanyRepository
+from arbeitszeit.entities import Account, AccountTypes, Company, Transaction
+from arbeitszeit.repositories import (
+    AccountOwnerRepository,
+    AccountRepository,
+    CompanyRepository,
+    TransactionRepository,
+)
 from arbeitszeit.transactions import TransactionTypes, UserAccountingService
 
 
@@ -30,6 +34,7 @@ class ShowPRDAccountDetailsUseCase:
         transaction_volume: Decimal
         purpose: str
         buyer: Optional[ShowPRDAccountDetailsUseCase.Buyer]
+        balance: Decimal
 
     @dataclass
     class PlotDetails:
@@ -42,38 +47,45 @@ class ShowPRDAccountDetailsUseCase:
         transactions: List[ShowPRDAccountDetailsUseCase.TransactionInfo]
         account_balance: Decimal
         plot: ShowPRDAccountDetailsUseCase.PlotDetails
+        next_page: Optional[str] = None
+        previous_page: Optional[str] = None
 
     accounting_service: UserAccountingService
     company_repository: CompanyRepository
     account_repository: AccountRepository
+    transaction_repository: TransactionRepository
 
-    def __call__(self, company_id: UUID) -> Response:
+    def __call__(self, company_id: UUID, page_cursor: Optional[str] = None) -> Response:
         company = self.company_repository.get_by_id(company_id)
         assert company
+        history = self.accounting_service.get_page_of_account_history(
+            company.product_account, page_cursor
+        )
+        owner_names = self.accounting_service.get_account_owner_names(
+            entry.transaction.sending_account for entry in history.items
+        )
         transactions = [
-            self._create_info(company, transaction)
-            for transaction in self.accounting_service.get_account_transactions_sorted(
-                company, AccountTypes.prd
-            )
+            self._create_info(company, entry.transaction, entry.balance, owner_names)
+            for entry in history.items
         ]
         account_balance = self.account_repository.get_account_balance(
             company.product_account
         )
-        plot = self.PlotDetails(
-            timestamps=self._get_plot_dates(transactions),
-            accumulated_volumes=self._get_plot_volumes(transactions),
-        )
         return self.Response(
             company_id=company_id,
             transactions=transactions,
             account_balance=account_balance,
-            plot=plot,
+            plot=self._get_plot_details(company.product_account),
+            next_page=history.next_cursor,
+            previous_page=history.previous_cursor,
         )
 
     def _create_info(
         self,
         company: Company,
         transaction: Transaction,
+        balance: Decimal,
+        owner_names: Dict[UUID, AccountOwnerRepository.OwnerName],
     ) -> TransactionInfo:
         user_is_sender = self.accounting_service.user_is_sender(transaction, company)
         transaction_type = self.accounting_service.get_transaction_type(
@@ -83,33 +95,37 @@ class ShowPRDAccountDetailsUseCase:
             transaction,
             user_is_sender,
         )
-        buyer = self.accounting_service.get_buyer(transaction_type, transaction)
+        buyer = self.accounting_service.get_buyer(
+            transaction_type, transaction, owner_names
+        )
         return self.TransactionInfo(
             transaction_type=transaction_type,
             date=transaction.date,
             transaction_volume=transaction_volume,
             purpose=transaction.purpose,
-            buyer=self._create_buyer_info(buyer),
+            buyer=self._create_buyer_info(transaction, buyer),
+            balance=balance,
         )
 
-    def _get_plot_dates(self, transactions: List[TransactionInfo]) -> List[datetime]:
-        timestamps = [t.date for t in transactions]
-        timestamps.reverse()
-        return timestamps
-
-    def _get_plot_volumes(self, transactions: List[TransactionInfo]) -> List[Decimal]:
-        volumes = [t.transaction_volume for t in transactions]
-        volumes.reverse()
-        volumes_cumsum = list(accumulate(volumes))
-        return volumes_cumsum
+    def _get_plot_details(self, account: Account) -> PlotDetails:
+        balance_history = self.transaction_repository.get_account_balance_history(
+            account
+        )
+        return self.PlotDetails(
+            timestamps=[date for date, _ in balance_history],
+            accumulated_volumes=[balance for _, balance in balance_history],
+        )
 
     def _create_buyer_info(
-        self, buyer: Union[Company, Member, None]
+        self,
+        transaction: Transaction,
+        buyer: Optional[AccountOwnerRepository.OwnerName],
     ) -> Optional[ShowPRDAccountDetailsUseCase.Buyer]:
         if not buyer:
             return None
         return self.Buyer(
-            buyer_is_member=True if isinstance(buyer, Member) else False,
-            buyer_id=buyer.id,
-            buyer_name=buyer.get_name(),
+            buyer_is_member=transaction.sending_account.account_type
+            == AccountTypes.member,
+            buyer_id=buyer.owner_id,
+            buyer_name=buyer.name,
         )
@@ -1,17 +1,20 @@
 import datetime
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import List
 
 from injector import inject
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.entities import Plan, SocialAccounting
 from arbeitszeit.payout_factor import PayoutFactorService
+from arbeitszeit.payout_partition import PayoutPartition
 from arbeitszeit.repositories import (
-    PlanCooperationRepository,
+    PayoutLockRepository,
     PlanRepository,
     TransactionRepository,
 )
+from arbeitszeit.statistics import StatisticsService
 
 
 @inject
@@ -21,40 +24,85 @@ class UpdatePlansAndPayout:
     datetime_service: DatetimeService
     transaction_repository: TransactionRepository
     social_accounting: SocialAccounting
-    plan_cooperation_repository: PlanCooperationRepository
     payout_factor_service: PayoutFactorService
+    statistics_service: StatisticsService
+    payout_lock_repository: PayoutLockRepository
 
     def __call__(self) -> None:
         """
         This function should be called at least once per day,
         preferably more often (e.g. every hour).
+
+        Only the active plans that expired or are due for a payout are
+        processed. The resulting payouts and plan updates are written in
+        bulk afterwards. Finally the global statistics are calculated and
+        stored.
         """
+        payout_factor = self.start_payout_run()
+        self.pay_out_partition(PayoutPartition.all_plans(), payout_factor)
+        self.finish_payout_run()
+
+    def start_payout_run(self) -> Decimal:
         payout_factor = self.payout_factor_service.calculate_payout_factor()
         self.payout_factor_service.store_payout_factor(payout_factor)
-        self._calculate_plan_expiration(payout_factor)
-        for plan in self.plan_repository.all_plans_approved_active_and_not_expired():
-            self._payout_work_certificates(plan, payout_factor)
-
-    def _calculate_plan_expiration(self, payout_factor: Decimal) -> None:
-        for plan in self.plan_repository.get_active_plans():
-            assert plan.is_active, "Plan is not active!"
-            assert plan.activation_date, "Plan has no activation date!"
-
-            expiration_time = plan.activation_date + datetime.timedelta(
-                days=int(plan.timeframe)
-            )
+        return payout_factor
 
-            self.plan_repository.set_active_days(
-                plan, self._calculate_active_days(plan)
+    def pay_out_partition(
+        self, partition: PayoutPartition, payout_factor: Decimal
+    ) -> bool:
+        """
+        Update and pay out the active plans of the partition. Returns
+        False without changing anything if another payout run holds the
+        lock of the partition. The lock is released when the current
+        transaction ends, so every partition should be paid out in its
+        own transaction.
+        """
+        if not self.payout_lock_repository.try_to_lock_partition(partition):
+            return False
+        now = self.datetime_service.now()
+        plan_updates: List[PlanRepository.PayoutUpdate] = []
+        payouts: List[TransactionRepository.NewTransaction] = []
+        for plan in self.plan_repository.get_plans_due_for_payout(partition, now):
+            update = self._calculate_plan_update(plan, now)
+            payouts += self._create_payouts(
+                plan,
+                range(plan.payout_count, update.payout_count),
+                payout_factor,
+                now,
             )
-            self.plan_repository.set_expiration_date(plan, expiration_time)
+            plan_updates.append(update)
+        self.transaction_repository.create_transactions(payouts)
+        self.plan_repository.apply_payout_updates(plan_updates)
+        return True
+
+    def finish_payout_run(self) -> None:
+        self.statistics_service.store_statistics(
+            self.statistics_service.calculate_statistics()
+        )
 
-            assert plan.expiration_date
-            assert plan.active_days is not None
-            if self._plan_is_expired(plan):
-                self._handle_expired_plan(plan, payout_factor)
+    def _calculate_plan_update(
+        self, plan: Plan, now: datetime.datetime
+    ) -> PlanRepository.PayoutUpdate:
+        assert plan.is_active, "Plan is not active!"
+        assert plan.activation_date, "Plan has no activation date!"
+        assert plan.expiration_date, "Plan has no expiration date!"
+        active_days = plan.active_days(now)
+        is_expired = now > plan.expiration_date
+        payout_count = max(
+            plan.payout_count,
+            self._calculate_due_payout_count(plan, active_days, is_expired),
+        )
+        return PlanRepository.PayoutUpdate(
+            plan=plan.id,
+            payout_count=payout_count,
+            next_payout_date=plan.activation_date
+            + datetime.timedelta(days=payout_count),
+            is_expired=is_expired,
+        )
 
-    def _payout_work_certificates(self, plan: Plan, payout_factor: Decimal) -> None:
+    def _calculate_due_payout_count(
+        self, plan: Plan, active_days: int, is_expired: bool
+    ) -> int:
         """
         Plans have an attribute "timeframe", that describe the length of the
         planning cycle in days.
@@ -70,59 +118,36 @@ class UpdatePlansAndPayout:
         than the number of full days the plan has been active.
         (Only after expiration both numbers are equal.)
 
-        If this requirement is not met, a payout is triggered to increase the number of payouts by one.
+        Overdue wages of expired plans are paid out before the plan
+        gets deactivated.
         """
-        assert plan.active_days is not None
-        while plan.payout_count <= plan.active_days:
-            self._payout(plan, payout_factor)
-
-    def _payout(self, plan: Plan, payout_factor: Decimal) -> None:
-        amount = payout_factor * plan.production_costs.labour_cost / plan.timeframe
-        self.transaction_repository.create_transaction(
-            date=self.datetime_service.now(),
-            sending_account=self.social_accounting.account,
-            receiving_account=plan.planner.work_account,
-            amount_sent=round(amount, 2),
-            amount_received=round(amount, 2),
-            purpose=f"Plan-Id: {plan.id}",
+        if is_expired:
+            return active_days
+        elif plan.is_approved and not plan.expired:
+            return active_days + 1
+        else:
+            return plan.payout_count
+
+    def _create_payouts(
+        self,
+        plan: Plan,
+        payout_days: range,
+        payout_factor: Decimal,
+        now: datetime.datetime,
+    ) -> List[TransactionRepository.NewTransaction]:
+        amount = round(
+            payout_factor * plan.production_costs.labour_cost / plan.timeframe, 2
         )
-        self.plan_repository.increase_payout_count_by_one(plan)
-
-    def _plan_is_expired(self, plan: Plan) -> bool:
-        assert plan.expiration_date
-        return self.datetime_service.now() > plan.expiration_date
-
-    def _handle_expired_plan(self, plan: Plan, payout_factor: Decimal) -> None:
-        """
-        payout overdue wages, if there are any
-        delete plan's cooperation and coop request, if there is any
-        set plan as expired
-        """
-        assert plan.active_days
-        while plan.payout_count < plan.active_days:
-            self._payout(plan, payout_factor)
-        self._delete_cooperation_and_coop_request_from_plan(plan)
-        self.plan_repository.set_plan_as_expired(plan)
-
-    def _calculate_active_days(self, plan: Plan) -> int:
-        """
-        returns the full days a plan has been active,
-        not considering days exceeding it's timeframe
-        """
-        assert plan.activation_date
-        days_passed_since_activation = (
-            self.datetime_service.now() - plan.activation_date
-        ).days
-
-        active_days = (
-            plan.timeframe
-            if (plan.timeframe < days_passed_since_activation)
-            else days_passed_since_activation
-        )
-        return active_days
-
-    def _delete_cooperation_and_coop_request_from_plan(self, plan: Plan) -> None:
-        if plan.requested_cooperation:
-            self.plan_cooperation_repository.set_requested_cooperation_to_none(plan.id)
-        if plan.cooperation:
-            self.plan_cooperation_repository.remove_plan_from_cooperation(plan.id)
+        return [
+            TransactionRepository.NewTransaction(
+                date=now,
+                sending_account=self.social_accounting.account,
+                receiving_account=plan.planner.work_account,
+                amount_sent=amount,
+                amount_received=amount,
+                purpose=f"Plan-Id: {plan.id}",
+                plan=plan.id,
+                payout_day=payout_day,
+            )
+            for payout_day in payout_days
+        ]
@@ -1,14 +1,12 @@
 import os
 
 from flask import Flask, current_app, request, session
-from flask_migrate import upgrade
 from flask_talisman import Talisman
 from flask_wtf.csrf import CSRFProtect
 
 import arbeitszeit_flask.extensions
 from arbeitszeit_flask.datetime import RealtimeDatetimeService
 from arbeitszeit_flask.extensions import babel, login_manager, mail
-from arbeitszeit_flask.profiling import show_profile_info, show_sql_queries
 
 
 def load_configuration(app, configuration=None):
@@ -30,9 +28,12 @@ def load_configuration(app, configuration=None):
 
 
 def initialize_migrations(app, db):
-    migrate = arbeitszeit_flask.extensions.migrate
+    # Flask-Migrate pulls in alembic, which takes longer to import than
+    # the rest of the application.
+    from flask_migrate import Migrate, upgrade
+
     migrations_directory = os.path.join(os.path.dirname(__file__), "migrations")
-    migrate.init_app(app, db, directory=migrations_directory)
+    Migrate(app, db, directory=migrations_directory)
     if app.config["AUTO_MIGRATE"]:
         with app.app_context():
             upgrade(migrations_directory)
@@ -75,10 +76,31 @@ def create_app(config=None, db=None, template_folder=None):
 
     with app.app_context():
 
-        from arbeitszeit_flask.commands import invite_accountant, update_and_payout
+        from arbeitszeit_flask.dependency_injection import initialize_injector
+        from arbeitszeit_flask.metrics import initialize_metrics
+
+        initialize_injector(app)
+        initialize_metrics(app)
+
+        from arbeitszeit_flask.commands import (
+            benchmark,
+            compact_payout_factors,
+            export_transactions,
+            invite_accountant,
+            reconcile_account_balances,
+            seed_synthetic,
+            startup_profile,
+            update_and_payout,
+        )
 
         app.cli.command("payout")(update_and_payout)
         app.cli.command("invite-accountant")(invite_accountant)
+        app.cli.command("reconcile-account-balances")(reconcile_account_balances)
+        app.cli.command("compact-payout-factors")(compact_payout_factors)
+        app.cli.command("export-transactions")(export_transactions)
+        app.cli.command("startup-profile")(startup_profile)
+        app.cli.command("seed-synthetic")(seed_synthetic)
+        app.cli.command("benchmark")(benchmark)
 
         from .models import Accountant, Company, Member
 
@@ -108,12 +130,6 @@ def create_app(config=None, db=None, template_folder=None):
         app.register_blueprint(member.blueprint.main_member)
         app.register_blueprint(accountant.blueprint.main_accountant)
 
-        if app.config["ENV"] == "development":
-            if app.config["DEBUG_DETAILS"] == True:
-                # print profiling info to sys.stout
-                show_profile_info(app)
-                show_sql_queries(app)
-
         return app
 
 
@@ -0,0 +1,292 @@
+"""Time the hot use cases and routes against the configured database,
+which is meant to be filled with `flask seed-synthetic`.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from injector import Injector
+from sqlalchemy import event, func
+
+from arbeitszeit.entities import PurposesOfPurchases
+from arbeitszeit.use_cases import (
+    GetCompanySummary,
+    GetStatistics,
+    PayMeansOfProduction,
+    PayMeansOfProductionRequest,
+    UpdatePlansAndPayout,
+)
+from arbeitszeit.use_cases.get_member_account import GetMemberAccount
+from arbeitszeit.use_cases.pay_consumer_product import PayConsumerProduct
+from arbeitszeit.use_cases.query_plans import PlanFilter, PlanSorting, QueryPlans
+from arbeitszeit_flask import models
+from arbeitszeit_web.pay_consumer_product import PayConsumerProductRequestImpl
+from arbeitszeit_web.query_plans import QueryPlansRequestImpl
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    seconds: float
+    sql_statements: int
+    peak_memory_bytes: int
+
+
+class BenchmarkFailed(Exception):
+    def __init__(self, name: str, error: Exception) -> None:
+        super().__init__(f"{name}: {error!r}")
+        self.name = name
+        self.error = error
+
+
+@dataclass
+class Regression:
+    name: str
+    metric: str
+    previous: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.metric} went from {self.previous} to {self.current}"
+
+
+@dataclass
+class BenchmarkSubjects:
+    """The rows that the benchmarks work on. The busiest company and the
+    richest member are chosen, so that the benchmarks see the largest
+    histories of the dataset.
+    """
+
+    company: UUID
+    member: UUID
+    consumer_plan: UUID
+    means_plan: UUID
+
+    @classmethod
+    def find(cls, db: SQLAlchemy) -> Optional[BenchmarkSubjects]:
+        company = (
+            db.session.query(models.Plan.planner)
+            .group_by(models.Plan.planner)
+            .order_by(func.count().desc(), models.Plan.planner)
+            .limit(1)
+            .scalar()
+        )
+        member = (
+            db.session.query(models.Account.account_owner_member)
+            .filter(models.Account.account_owner_member.isnot(None))
+            .order_by(models.Account.balance.desc(), models.Account.id)
+            .limit(1)
+            .scalar()
+        )
+        if company is None or member is None:
+            return None
+        productive_plans = (
+            db.session.query(models.Plan.id)
+            .filter(
+                models.Plan.is_active == True,
+                models.Plan.is_public_service == False,
+                models.Plan.is_available == True,
+            )
+            .order_by(models.Plan.id)
+        )
+        consumer_plan = productive_plans.limit(1).scalar()
+        means_plan = (
+            productive_plans.filter(models.Plan.planner != company).limit(1).scalar()
+        )
+        if consumer_plan is None or means_plan is None:
+            return None
+        return cls(
+            company=UUID(company),
+            member=UUID(member),
+            consumer_plan=UUID(consumer_plan),
+            means_plan=UUID(means_plan),
+        )
+
+
+def collect_benchmarks(
+    app: Flask, injector: Injector, subjects: BenchmarkSubjects
+) -> Dict[str, Callable[[], Any]]:
+    benchmarks: Dict[str, Callable[[], Any]] = {
+        "UpdatePlansAndPayout": lambda: injector.get(UpdatePlansAndPayout)(),
+        "GetStatistics": lambda: injector.get(GetStatistics)(),
+        "GetCompanySummary": lambda: injector.get(GetCompanySummary)(subjects.company),
+        "GetMemberAccount": lambda: injector.get(GetMemberAccount)(subjects.member),
+        "PayConsumerProduct": lambda: injector.get(PayConsumerProduct)(
+            PayConsumerProductRequestImpl(
+                user=subjects.member, plan=subjects.consumer_plan, amount=1
+            )
+        ),
+        "PayMeansOfProduction": lambda: injector.get(PayMeansOfProduction)(
+            PayMeansOfProductionRequest(
+                buyer=subjects.company,
+                plan=subjects.means_plan,
+                amount=1,
+                purpose=PurposesOfPurchases.means_of_prod,
+            )
+        ),
+    }
+    for plan_filter in PlanFilter:
+        query = (
+            str(subjects.consumer_plan)
+            if plan_filter == PlanFilter.by_plan_id
+            else "bread"
+        )
+        for sorting in PlanSorting:
+            name = f"QueryPlans[{plan_filter.name},{sorting.name}]"
+            benchmarks[name] = partial(
+                _query_plans,
+                injector,
+                QueryPlansRequestImpl(
+                    query=query, filter_category=plan_filter, sorting_category=sorting
+                ),
+            )
+    plot_urls = [
+        "/plots/global_barplot_for_certificates"
+        "?certificates_count=100&available_product=50",
+        "/plots/global_barplot_for_means_of_production"
+        "?planned_means=10&planned_resources=20&planned_work=30",
+        "/plots/global_barplot_for_plans?productive_plans=10&public_plans=5",
+        "/plots/line_plot_of_payout_factor_history",
+    ] + [
+        f"/plots/line_plot_of_company_{account}_account?company_id={subjects.company}"
+        for account in ["p", "r", "a", "prd"]
+    ]
+    for url in plot_urls:
+        name = f"GET {url.split('?')[0]}"
+        benchmarks[name] = partial(_get_plot, app, subjects.company, url)
+    return benchmarks
+
+
+def _query_plans(injector: Injector, request: QueryPlansRequestImpl) -> None:
+    injector.get(QueryPlans)(request)
+
+
+def _get_plot(app: Flask, company: UUID, url: str) -> None:
+    # Rendering is what we want to measure, not the plot cache.
+    app.extensions.pop("plot_cache", None)
+    # https, so that the request is not redirected if FORCE_HTTPS is set.
+    base_url = f"https://{app.config.get('SERVER_NAME') or 'localhost'}"
+    client = app.test_client()
+    with client.session_transaction(base_url=base_url) as session:
+        session["_user_id"] = str(company)
+        session["_fresh"] = True
+        session["user_type"] = "company"
+    response = client.get(url, base_url=base_url)
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {url} returned {response.status_code}")
+
+
+def run_benchmark(
+    db: SQLAlchemy, name: str, function: Callable[[], Any], repeat: int
+) -> BenchmarkResult:
+    """Run the function repeat times and report the fastest run. Peak
+    memory is measured in one additional run, since tracing every
+    allocation slows the function down. Changes to the database are
+    rolled back after every run. Errors of the function are raised as
+    BenchmarkFailed with the name of the benchmark.
+    """
+    timings = []
+    try:
+        for _ in range(repeat):
+            with _count_sql_statements(db) as statements:
+                start = time.perf_counter()
+                function()
+                timings.append(time.perf_counter() - start)
+            db.session.rollback()
+        tracemalloc.start()
+        try:
+            function()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as error:
+        raise BenchmarkFailed(name, error) from error
+    finally:
+        db.session.rollback()
+    return BenchmarkResult(
+        name=name,
+        seconds=round(min(timings), 6),
+        sql_statements=len(statements),
+        peak_memory_bytes=peak_memory,
+    )
+
+
+@contextmanager
+def _count_sql_statements(db: SQLAlchemy) -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def record_statement(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record_statement)
+
+
+def find_regressions(
+    previous: List[BenchmarkResult],
+    current: List[BenchmarkResult],
+    threshold: float,
+) -> List[Regression]:
+    """Compare two runs. Wall time and peak memory regress when they
+    grew by more than the relative threshold, the number of SQL
+    statements regresses when it grew at all.
+    """
+    previous_by_name = {result.name: result for result in previous}
+    regressions: List[Regression] = []
+    for result in current:
+        before = previous_by_name.get(result.name)
+        if before is None:
+            continue
+        if result.seconds > before.seconds * (1 + threshold):
+            regressions.append(
+                Regression(result.name, "seconds", before.seconds, result.seconds)
+            )
+        if result.peak_memory_bytes > before.peak_memory_bytes * (1 + threshold):
+            regressions.append(
+                Regression(
+                    result.name,
+                    "peak_memory_bytes",
+                    before.peak_memory_bytes,
+                    result.peak_memory_bytes,
+                )
+            )
+        if result.sql_statements > before.sql_statements:
+            regressions.append(
+                Regression(
+                    result.name,
+                    "sql_statements",
+                    before.sql_statements,
+                    result.sql_statements,
+                )
+            )
+    return regressions
+
+
+def dump_results(results: List[BenchmarkResult], created: datetime) -> str:
+    return json.dumps(
+        dict(
+            created=created.isoformat(),
+            results=[asdict(result) for result in results],
+        ),
+        indent=2,
+    )
+
+
+def load_results(serialized: str) -> List[BenchmarkResult]:
+    return [BenchmarkResult(**result) for result in json.loads(serialized)["results"]]
@@ -1,23 +1,92 @@
+from datetime import datetime, timedelta
+from typing import Optional, TextIO
+from uuid import UUID
+
 import click
+from flask import current_app
 from flask_babel import force_locale
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import IntegrityError
 
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.payout_partition import PayoutPartition
 from arbeitszeit.use_cases import UpdatePlansAndPayout
+from arbeitszeit.use_cases.export_transactions import (
+    ExportTransactions,
+    ExportTransactionsRequest,
+)
 from arbeitszeit.use_cases.send_accountant_registration_token import (
     SendAccountantRegistrationTokenUseCase,
 )
+from arbeitszeit_flask.benchmarks import (
+    BenchmarkFailed,
+    BenchmarkSubjects,
+    collect_benchmarks,
+    dump_results,
+    find_regressions,
+    load_results,
+    run_benchmark,
+)
 from arbeitszeit_flask.database import commit_changes
-from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_flask.database.repositories import (
+    AccountingRepository,
+    AccountRepository,
+    PayoutFactorRepository,
+)
+from arbeitszeit_flask.dependency_injection import get_injector, with_injection
+from arbeitszeit_flask.startup_profile import (
+    get_total_import_time,
+    measure_import_times,
+)
+from arbeitszeit_flask.synthetic_data import SyntheticDataSeeder, SyntheticWorld
+from arbeitszeit_web.export_transactions import (
+    ExportFormat,
+    ExportTransactionsPresenter,
+    end_of_day,
+    parse_account_types,
+    start_of_day,
+)
 
 
-@commit_changes
+@click.option(
+    "--partitions",
+    default=1,
+    show_default=True,
+    help="Number of parts the plans are split into. Every part is paid "
+    "out in its own transaction.",
+)
 @with_injection()
 def update_and_payout(
+    partitions: int,
     payout: UpdatePlansAndPayout,
+    db: SQLAlchemy,
 ) -> None:
     """
     Run every hour on production server or call manually from CLI `flask payout`.
+    Several processes can run `flask payout --partitions N` with the same N
+    at the same time. Each partition is paid out by the first process
+    that locks it, the others skip it. A partition with plans that were
+    paid out concurrently by a run with a different N is rolled back and
+    skipped as well.
     """
-    payout()
+    if partitions < 1:
+        raise click.BadParameter(str(partitions), param_hint="--partitions")
+    payout_factor = payout.start_payout_run()
+    db.session.commit()
+    for partition in PayoutPartition.split(partitions):
+        try:
+            if payout.pay_out_partition(partition, payout_factor):
+                db.session.commit()
+                continue
+            reason = "it is paid out by another process."
+        except IntegrityError as error:
+            reason = f"some of its plans were paid out concurrently: {error.orig}"
+        db.session.rollback()
+        click.echo(
+            f"Skipped partition {partition.index + 1} of {partition.count}, {reason}"
+        )
+    payout.finish_payout_run()
+    db.session.commit()
 
 
 @click.argument("email_address")
@@ -30,3 +99,244 @@ def invite_accountant(
         use_case.send_accountant_registration_token(
             SendAccountantRegistrationTokenUseCase.Request(email=email_address)
         )
+
+
+@commit_changes
+@with_injection()
+def reconcile_account_balances(account_repository: AccountRepository) -> None:
+    """
+    Recalculate the stored account balances from the transaction table.
+    Call from CLI `flask reconcile-account-balances`.
+    """
+    corrected_accounts = account_repository.reconcile_account_balances()
+    click.echo(f"Corrected the balance of {corrected_accounts} account(s).")
+
+
+@click.option(
+    "--keep-days",
+    default=90,
+    show_default=True,
+    help="Number of days for which the hourly payout factors are kept.",
+)
+@commit_changes
+@with_injection()
+def compact_payout_factors(
+    keep_days: int,
+    payout_factor_repository: PayoutFactorRepository,
+    datetime_service: DatetimeService,
+) -> None:
+    """
+    Delete hourly payout factors that are older than --keep-days days.
+    Their daily summaries and the latest payout factor are kept. Call
+    from CLI `flask compact-payout-factors`.
+    """
+    if keep_days < 0:
+        raise click.BadParameter(str(keep_days), param_hint="--keep-days")
+    deleted = payout_factor_repository.delete_payout_factors_before(
+        datetime_service.now() - timedelta(days=keep_days)
+    )
+    click.echo(f"Deleted {deleted} payout factor(s).")
+
+
+@click.argument("user_id", type=click.UUID)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice([export_format.value for export_format in ExportFormat]),
+    default=ExportFormat.csv.value,
+    show_default=True,
+)
+@click.option(
+    "--account-types",
+    default="",
+    help="Comma separated account types to export, e.g. a,p. Default: all.",
+)
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d"]))
+@click.option("--until", type=click.DateTime(formats=["%Y-%m-%d"]))
+@click.option("--output", type=click.File("w"), default="-")
+@with_injection()
+def export_transactions(
+    user_id: UUID,
+    export_format: str,
+    account_types: str,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    output: TextIO,
+    use_case: ExportTransactions,
+    presenter: ExportTransactionsPresenter,
+) -> None:
+    """
+    Write the transactions of a company or member as CSV or NDJSON.
+    Call from CLI `flask export-transactions USER_ID`. Both --since and
+    --until are inclusive days.
+    """
+    try:
+        account_type_filter = parse_account_types(account_types)
+    except ValueError:
+        raise click.BadParameter(account_types, param_hint="--account-types")
+    response = use_case(
+        ExportTransactionsRequest(
+            user=user_id,
+            account_types=account_type_filter,
+            since=start_of_day(since.date()) if since else None,
+            until=end_of_day(until.date()) if until else None,
+        )
+    )
+    if response.is_rejected:
+        raise click.ClickException(f"There is no company or member with id {user_id}.")
+    view_model = presenter.present(response, ExportFormat(export_format))
+    for line in view_model.lines:
+        output.write(line)
+
+
+@click.option(
+    "--limit", default=20, show_default=True, help="Number of modules to list."
+)
+def startup_profile(limit: int) -> None:
+    """
+    Import the application in a fresh interpreter and list the modules
+    that took longest to import. Fails if the total import time is over
+    STARTUP_IMPORT_BUDGET_SECONDS. Call from CLI `flask startup-profile`.
+    """
+    import_times = measure_import_times()
+    click.echo(f"{'self ms':>9} {'total ms':>9}  module")
+    for import_time in sorted(
+        import_times, key=lambda import_time: -import_time.cumulative_seconds
+    )[:limit]:
+        click.echo(
+            f"{import_time.self_seconds * 1000:9.1f} "
+            f"{import_time.cumulative_seconds * 1000:9.1f}  "
+            f"{'  ' * import_time.depth}{import_time.module}"
+        )
+    total = get_total_import_time(import_times)
+    budget = current_app.config["STARTUP_IMPORT_BUDGET_SECONDS"]
+    click.echo(
+        f"Importing the application took {total * 1000:.1f} ms "
+        f"(budget {budget * 1000:.0f} ms)."
+    )
+    if total > budget:
+        raise click.ClickException("The import time is over budget.")
+
+
+@click.option("--companies", default=5_000, show_default=True)
+@click.option("--members", default=100_000, show_default=True)
+@click.option("--plans", default=50_000, show_default=True)
+@click.option("--cooperations", default=500, show_default=True)
+@click.option(
+    "--transactions",
+    default=10_000_000,
+    show_default=True,
+    help="Total number of transactions. Plan approvals and payouts come "
+    "first, the rest are purchases and wages.",
+)
+@click.option("--days", default=365, show_default=True, help="Length of the history.")
+@click.option("--seed", default=0, show_default=True)
+@click.option("--batch-size", default=10_000, show_default=True)
+@with_injection()
+def seed_synthetic(
+    companies: int,
+    members: int,
+    plans: int,
+    cooperations: int,
+    transactions: int,
+    days: int,
+    seed: int,
+    batch_size: int,
+    db: SQLAlchemy,
+    accounting_repository: AccountingRepository,
+    datetime_service: DatetimeService,
+) -> None:
+    """
+    Fill the database with a repeatable synthetic dataset for load tests
+    and benchmarks. Call from CLI `flask seed-synthetic` on an empty
+    database. Every synthetic user has the password "synthetic".
+    """
+    social_accounting_account = accounting_repository.get_social_accounting_account_id()
+    db.session.commit()
+    SyntheticDataSeeder(
+        db=db,
+        social_accounting_account=social_accounting_account,
+        now=datetime_service.now(),
+        world=SyntheticWorld(
+            companies=companies,
+            members=members,
+            plans=plans,
+            cooperations=cooperations,
+            transactions=transactions,
+            days=days,
+        ),
+        seed=seed,
+        batch_size=batch_size,
+        echo=click.echo,
+    ).seed_database()
+    click.echo("Done.")
+
+
+@click.option("--repeat", default=3, show_default=True, help="Runs per benchmark.")
+@click.option(
+    "--output", type=click.File("w"), help="Write the results as JSON to this file."
+)
+@click.option(
+    "--compare",
+    type=click.File("r"),
+    help="Compare against the JSON results of a previous run.",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    show_default=True,
+    help="Relative growth of wall time or peak memory that counts as a regression.",
+)
+@click.option("--only", help="Run only benchmarks whose name contains this text.")
+@with_injection()
+def benchmark(
+    repeat: int,
+    output: Optional[TextIO],
+    compare: Optional[TextIO],
+    threshold: float,
+    only: Optional[str],
+    db: SQLAlchemy,
+    datetime_service: DatetimeService,
+) -> None:
+    """
+    Time the hot use cases, queries and plot routes against the current
+    database and report wall time, number of SQL statements and peak
+    memory. Fill the database with `flask seed-synthetic` first. All
+    changes are rolled back. Call from CLI `flask benchmark`.
+    """
+    if repeat < 1:
+        raise click.BadParameter(str(repeat), param_hint="--repeat")
+    subjects = BenchmarkSubjects.find(db)
+    if subjects is None:
+        raise click.ClickException(
+            "The database holds no data to benchmark. Run `flask seed-synthetic`."
+        )
+    benchmarks = collect_benchmarks(current_app, get_injector(), subjects)
+    results = []
+    failures = []
+    click.echo(f"{'ms':>10} {'sql':>6} {'peak KiB':>10}  benchmark")
+    for name, function in benchmarks.items():
+        if only and only not in name:
+            continue
+        try:
+            result = run_benchmark(db, name, function, repeat)
+        except BenchmarkFailed as failure:
+            click.echo(f"Failed: {failure}")
+            failures.append(failure)
+            continue
+        click.echo(
+            f"{result.seconds * 1000:10.1f} {result.sql_statements:6} "
+            f"{result.peak_memory_bytes / 1024:10.0f}  {result.name}"
+        )
+        results.append(result)
+    if output is not None:
+        output.write(dump_results(results, created=datetime_service.now()))
+    if failures:
+        raise click.ClickException(f"{len(failures)} benchmark(s) failed.")
+    if compare is not None:
+        regressions = find_regressions(load_results(compare.read()), results, threshold)
+        for regression in regressions:
+            click.echo(f"Regression: {regression}")
+        if regressions:
+            raise click.ClickException(f"{len(regressions)} regression(s) found.")
+        click.echo("No regressions found.")
@@ -56,6 +56,7 @@ from arbeitszeit_flask.views import (
 from arbeitszeit_flask.views.company_dashboard_view import CompanyDashboardView
 from arbeitszeit_flask.views.create_cooperation_view import CreateCooperationView
 from arbeitszeit_flask.views.create_draft_view import CreateDraftView
+from arbeitszeit_flask.views.export_transactions_view import ExportTransactionsView
 from arbeitszeit_flask.views.pay_means_of_production import PayMeansOfProductionView
 from arbeitszeit_flask.views.show_my_accounts_view import ShowMyAccountsView
 from arbeitszeit_flask.views.transfer_to_worker_view import TransferToWorkerView
@@ -116,7 +117,7 @@ def query_plans(
     presenter: QueryPlansPresenter,
 ):
     template_name = "company/query_plans.html"
-    search_form = PlanSearchForm(request.form)
+    search_form = PlanSearchForm(request.values)
     view = QueryPlansView(
         search_form,
         query_plans,
@@ -139,7 +140,7 @@ def query_companies(
     presenter: QueryCompaniesPresenter,
 ):
     template_name = "company/query_companies.html"
-    search_form = CompanySearchForm(request.form)
+    search_form = CompanySearchForm(request.values)
     view = QueryCompaniesView(
         search_form,
         query_companies,
@@ -340,13 +341,20 @@ def list_all_transactions(
     )
 
 
+@CompanyRoute("/company/my_accounts/export")
+def export_transactions(view: ExportTransactionsView):
+    return view.respond_to_get()
+
+
 @CompanyRoute("/company/my_accounts/account_p")
 def account_p(
     show_p_account_details: use_cases.ShowPAccountDetailsUseCase,
     template_renderer: UserTemplateRenderer,
     presenter: ShowPAccountDetailsPresenter,
 ):
-    response = show_p_account_details(UUID(current_user.id))
+    response = show_p_account_details(
+        UUID(current_user.id), page_cursor=request.args.get("cursor")
+    )
     view_model = presenter.present(response)
 
     return template_renderer.render_template(
@@ -361,7 +369,9 @@ def account_r(
     template_renderer: UserTemplateRenderer,
     presenter: ShowRAccountDetailsPresenter,
 ):
-    response = show_r_account_details(UUID(current_user.id))
+    response = show_r_account_details(
+        UUID(current_user.id), page_cursor=request.args.get("cursor")
+    )
     view_model = presenter.present(response)
 
     return template_renderer.render_template(
@@ -376,7 +386,9 @@ def account_a(
     template_renderer: UserTemplateRenderer,
     presenter: ShowAAccountDetailsPresenter,
 ):
-    response = show_a_account_details(UUID(current_user.id))
+    response = show_a_account_details(
+        UUID(current_user.id), page_cursor=request.args.get("cursor")
+    )
     view_model = presenter.present(response)
 
     return template_renderer.render_template(
@@ -391,7 +403,9 @@ def account_prd(
     template_renderer: UserTemplateRenderer,
     presenter: ShowPRDAccountDetailsPresenter,
 ):
-    response = show_prd_account_details(UUID(current_user.id))
+    response = show_prd_account_details(
+        UUID(current_user.id), page_cursor=request.args.get("cursor")
+    )
     view_model = presenter.present(response)
 
     return template_renderer.render_template(
@@ -1,7 +1,6 @@
 from os import environ
 
 DEBUG = False
-DEBUG_DETAILS = False
 TESTING = False
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 SQLALCHEMY_DATABASE_URI = "sqlite:////tmp/arbeitszeitapp.db"
@@ -11,6 +10,22 @@ MAIL_PORT = "25"
 FORCE_HTTPS = True
 AUTO_MIGRATE = False
 
+# rendered plots are cached in memory up to this many bytes and, if a
+# directory is set, on disk up to PLOT_CACHE_MAX_DISK_BYTES
+PLOT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+PLOT_CACHE_DIRECTORY = None
+PLOT_CACHE_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+# importing arbeitszeit_flask and its commands in a fresh interpreter
+# must not take longer, see `flask startup-profile`
+STARTUP_IMPORT_BUDGET_SECONDS = 1.5
+
+# /metrics is only served to clients that send this token as
+# "Authorization: Bearer <token>"
+METRICS_TOKEN = None
+# log one JSON line with the metrics of every request
+METRICS_LOG_REQUESTS = False
+
 # control thresholds
 ALLOWED_OVERDRAW_MEMBER = "0"
 ACCEPTABLE_RELATIVE_ACCOUNT_DEVIATION = "33"
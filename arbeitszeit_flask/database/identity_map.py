@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+from uuid import UUID
+
+from flask import g, has_app_context
+from sqlalchemy import event
+
+from arbeitszeit.cooperation_price import CooperationPriceCache
+from arbeitszeit_flask.extensions import db
+
+T = TypeVar("T")
+
+
+class EntityIdentityMap:
+    """Remembers the entities that were built from the database so that
+    repositories hand out the same object for the same id instead of
+    querying and constructing it again.
+
+    Repositories must call forget or forget_all for every entity that
+    they change. The whole map is cleared when the database session is
+    committed or rolled back.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[Tuple[type, UUID], Any] = dict()
+
+    def get(self, entity_type: Type[T], id: UUID) -> Optional[T]:
+        return self._entities.get((entity_type, id))
+
+    def add(self, entity: T) -> T:
+        self._entities[(type(entity), getattr(entity, "id"))] = entity
+        return entity
+
+    def forget(self, entity_type: type, id: UUID) -> None:
+        self._entities.pop((entity_type, id), None)
+
+    def forget_all(self, entity_type: type) -> None:
+        for key in [key for key in self._entities if key[0] is entity_type]:
+            del self._entities[key]
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+
+def get_entity_identity_map() -> EntityIdentityMap:
+    """Return the identity map of the current request. Outside of an
+    application context every call returns a new, empty map.
+    """
+    if not has_app_context():
+        return EntityIdentityMap()
+    if "entity_identity_map" not in g:
+        g.entity_identity_map = EntityIdentityMap()
+    return g.entity_identity_map
+
+
+def get_cooperation_price_cache() -> CooperationPriceCache:
+    """Return the cooperation price cache of the current request. It is
+    cleared together with the identity map.
+    """
+    if not has_app_context():
+        return CooperationPriceCache()
+    if "cooperation_price_cache" not in g:
+        g.cooperation_price_cache = CooperationPriceCache()
+    return g.cooperation_price_cache
+
+
+@event.listens_for(db.session, "after_commit")
+@event.listens_for(db.session, "after_rollback")
+def _clear_entity_identity_map(session: Any) -> None:
+    # Other transactions may have changed rows since we read them.
+    if not has_app_context():
+        return
+    if "entity_identity_map" in g:
+        g.entity_identity_map.clear()
+    if "cooperation_price_cache" in g:
+        g.cooperation_price_cache.clear()
@@ -0,0 +1,33 @@
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import tuple_
+
+
+def get_keyset_page(
+    query: Any,
+    keys: Sequence[Any],
+    boundary: Optional[Sequence[Any]],
+    limit: int,
+    is_backward: bool,
+    descending: bool = False,
+) -> List[Any]:
+    """Return up to limit rows of query ordered by keys. Without a
+    boundary the page starts at the beginning of the ordering. Otherwise
+    it starts directly after the boundary values of keys or, if
+    is_backward is set, ends directly before them. The last key must be
+    unique so that every row has a distinct position.
+    """
+    ascending = descending == is_backward
+    if boundary is not None:
+        if ascending:
+            query = query.filter(tuple_(*keys) > tuple(boundary))
+        else:
+            query = query.filter(tuple_(*keys) < tuple(boundary))
+    rows = (
+        query.order_by(*(key.asc() if ascending else key.desc() for key in keys))
+        .limit(limit)
+        .all()
+    )
+    if is_backward:
+        rows.reverse()
+    return rows
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
 from flask_sqlalchemy import SQLAlchemy
 from injector import inject
-from sqlalchemy import and_, desc, func
+from sqlalchemy import (
+    Float,
+    Numeric,
+    and_,
+    bindparam,
+    case,
+    cast,
+    desc,
+    func,
+    or_,
+    type_coerce,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import joinedload, selectinload
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from arbeitszeit import entities, repositories
-from arbeitszeit.decimal import decimal_sum
+from arbeitszeit.cooperation_price import CooperationPriceCache
+from arbeitszeit.payout_partition import PayoutPartition
 from arbeitszeit_flask import models
+from arbeitszeit_flask.database.identity_map import EntityIdentityMap
+from arbeitszeit_flask.database.keyset import get_keyset_page
+from arbeitszeit_flask.database.search import PlanSearch
+from arbeitszeit_flask.database.social_accounting_cache import (
+    SocialAccountingCache,
+    get_pending_social_accounting,
+    set_pending_social_accounting,
+)
 from arbeitszeit_flask.models import (
     Account,
     AccountTypes,
@@ -204,31 +227,54 @@ class MemberRepository(repositories.MemberRepository):
 class CompanyRepository(repositories.CompanyRepository):
     account_repository: AccountRepository
     db: SQLAlchemy
+    identity_map: EntityIdentityMap
 
     def object_to_orm(self, company: entities.Company) -> Company:
         return Company.query.get(str(company.id))
 
     def object_from_orm(self, company_orm: Company) -> entities.Company:
-        return entities.Company(
-            id=UUID(company_orm.id),
-            email=company_orm.user.email,
-            name=company_orm.name,
-            means_account=self.account_repository.object_from_orm(
-                self._get_means_account(company_orm)
-            ),
-            raw_material_account=self.account_repository.object_from_orm(
-                self._get_resources_account(company_orm)
-            ),
-            work_account=self.account_repository.object_from_orm(
-                self._get_labour_account(company_orm)
-            ),
-            product_account=self.account_repository.object_from_orm(
-                self._get_products_account(company_orm)
-            ),
-            registered_on=company_orm.registered_on,
-            confirmed_on=company_orm.confirmed_on,
+        company = self.identity_map.get(entities.Company, UUID(company_orm.id))
+        if company is not None:
+            return company
+        accounts = {account.account_type: account for account in company_orm.accounts}
+        return self.identity_map.add(
+            entities.Company(
+                id=UUID(company_orm.id),
+                email=company_orm.user.email,
+                name=company_orm.name,
+                means_account=self.account_repository.object_from_orm(
+                    accounts[AccountTypes.p]
+                ),
+                raw_material_account=self.account_repository.object_from_orm(
+                    accounts[AccountTypes.r]
+                ),
+                work_account=self.account_repository.object_from_orm(
+                    accounts[AccountTypes.a]
+                ),
+                product_account=self.account_repository.object_from_orm(
+                    accounts[AccountTypes.prd]
+                ),
+                registered_on=company_orm.registered_on,
+                confirmed_on=company_orm.confirmed_on,
+            )
         )
 
+    def loader_options(self, relationship: Optional[Any] = None) -> List[Any]:
+        """Loader options that fetch everything object_from_orm needs
+        along with the companies themselves. When ``relationship`` is
+        given the options apply to the companies reached through it,
+        e.g. ``Plan.company``.
+        """
+        if relationship is None:
+            return [joinedload(Company.user), selectinload(Company.accounts)]
+        return [
+            joinedload(relationship).joinedload(Company.user),
+            joinedload(relationship).selectinload(Company.accounts),
+        ]
+
+    def _company_query(self) -> Any:
+        return Company.query.options(*self.loader_options())
+
     def get_company_orm_by_mail(self, email: str) -> Company:
         company_orm = (
             self.db.session.query(models.Company)
@@ -240,7 +286,10 @@ class CompanyRepository(repositories.CompanyRepository):
         return company_orm
 
     def get_by_id(self, id: UUID) -> Optional[entities.Company]:
-        company_orm = Company.query.filter_by(id=str(id)).first()
+        company = self.identity_map.get(entities.Company, id)
+        if company is not None:
+            return company
+        company_orm = self._company_query().get(str(id))
         if company_orm is None:
             return None
         else:
@@ -248,7 +297,7 @@ class CompanyRepository(repositories.CompanyRepository):
 
     def get_by_email(self, email: str) -> Optional[entities.Company]:
         company_orm = (
-            self.db.session.query(models.Company)
+            self._company_query()
             .join(models.User)
             .filter(models.User.email == email)
             .first()
@@ -275,14 +324,15 @@ class CompanyRepository(repositories.CompanyRepository):
             user=user_orm,
         )
         self.db.session.add(company)
-        for account in [
-            means_account,
-            labour_account,
-            resource_account,
-            products_account,
-        ]:
-            account_orm = self.account_repository.object_to_orm(account)
-            account_orm.account_owner_company = company.id
+        company.accounts = [
+            self.account_repository.object_to_orm(account)
+            for account in [
+                means_account,
+                labour_account,
+                resource_account,
+                products_account,
+            ]
+        ]
         return self.object_from_orm(company)
 
     def has_company_with_email(self, email: str) -> bool:
@@ -299,21 +349,54 @@ class CompanyRepository(repositories.CompanyRepository):
     def query_companies_by_name(self, query: str) -> Iterator[entities.Company]:
         return (
             self.object_from_orm(company)
-            for company in Company.query.filter(
-                Company.name.ilike("%" + query + "%")
-            ).all()
+            for company in self._company_query()
+            .filter(Company.name.ilike("%" + query + "%"))
+            .all()
         )
 
     def query_companies_by_email(self, query: str) -> Iterator[entities.Company]:
         companies = (
-            self.db.session.query(models.Company)
+            self._company_query()
             .join(models.User)
             .filter(models.User.email.ilike("%" + query + "%"))
         )
         return (self.object_from_orm(company) for company in companies)
 
     def get_all_companies(self) -> Iterator[entities.Company]:
-        return (self.object_from_orm(company) for company in Company.query.all())
+        return (
+            self.object_from_orm(company) for company in self._company_query().all()
+        )
+
+    def get_page_of_companies(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> List[entities.Company]:
+        keys = [func.lower(Company.name), Company.id]
+        query = self._company_query()
+        if name is not None:
+            query = query.filter(Company.name.ilike(f"%{name}%"))
+        if email is not None:
+            query = query.join(models.User).filter(
+                models.User.email.ilike(f"%{email}%")
+            )
+        boundary_id = before or after
+        boundary = (
+            self.db.session.query(*keys)
+            .filter(Company.id == str(boundary_id))
+            .one_or_none()
+            if boundary_id
+            else None
+        )
+        return [
+            self.object_from_orm(company)
+            for company in get_keyset_page(
+                query, keys, boundary, limit, is_backward=before is not None
+            )
+        ]
 
     def validate_credentials(self, email_address: str, password: str) -> Optional[UUID]:
         if (
@@ -327,6 +410,7 @@ class CompanyRepository(repositories.CompanyRepository):
         return None
 
     def confirm_company(self, company: UUID, confirmed_on: datetime) -> None:
+        self.identity_map.forget(entities.Company, company)
         self.db.session.query(models.Company).filter(
             models.Company.id == str(company)
         ).update({models.Company.confirmed_on: confirmed_on})
@@ -353,26 +437,6 @@ class CompanyRepository(repositories.CompanyRepository):
             password=generate_password_hash(password, method="sha256"),
         )
 
-    def _get_means_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="p").first()
-        assert account
-        return account
-
-    def _get_resources_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="r").first()
-        assert account
-        return account
-
-    def _get_labour_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="a").first()
-        assert account
-        return account
-
-    def _get_products_account(self, company: Company) -> Account:
-        account = company.accounts.filter_by(account_type="prd").first()
-        assert account
-        return account
-
 
 @inject
 @dataclass
@@ -408,20 +472,84 @@ class AccountRepository(repositories.AccountRepository):
         return account_orm
 
     def create_account(self, account_type: entities.AccountTypes) -> entities.Account:
-        account = Account(id=str(uuid4()), account_type=account_type.value)
+        account = Account(
+            id=str(uuid4()), account_type=AccountTypes(account_type.value)
+        )
         self.db.session.add(account)
         return self.object_from_orm(account)
 
     def get_account_balance(self, account: entities.Account) -> Decimal:
-        account_orm = self.object_to_orm(account)
-        received = set(account_orm.transactions_received)
-        sent = set(account_orm.transactions_sent)
-        intersection = received & sent
-        received -= intersection
-        sent -= intersection
-        return decimal_sum(t.amount_received for t in received) - decimal_sum(
-            t.amount_sent for t in sent
+        balance = (
+            self.db.session.query(Account.balance)
+            .filter(Account.id == str(account.id))
+            .scalar()
+        )
+        assert balance is not None
+        return Decimal(balance)
+
+    def get_sum_of_balances(self, account_type: entities.AccountTypes) -> Decimal:
+        return Decimal(
+            self.db.session.query(func.coalesce(func.sum(Account.balance), 0))
+            .filter(Account.account_type == AccountTypes(account_type.value))
+            .scalar()
+        )
+
+    def add_to_balance(self, account: entities.Account, amount: Decimal) -> None:
+        self.db.session.query(Account).filter(Account.id == str(account.id)).update(
+            {Account.balance: Account.balance + amount},
+            synchronize_session=False,
+        )
+
+    def add_to_balances(self, amounts: Dict[UUID, Decimal]) -> None:
+        if not amounts:
+            return
+        account_table = Account.__table__
+        self.db.session.execute(
+            account_table.update()
+            .where(account_table.c.id == bindparam("account_id"))
+            .values(balance=account_table.c.balance + bindparam("amount")),
+            [
+                dict(account_id=str(account_id), amount=amount)
+                for account_id, amount in amounts.items()
+            ],
+        )
+
+    def reconcile_account_balances(self) -> int:
+        """Recalculate the stored balance of every account from the
+        transaction table. Returns the number of accounts whose stored
+        balance was out of step and got corrected.
+        """
+        is_not_self_transfer = (
+            Transaction.sending_account != Transaction.receiving_account
+        )
+        received = dict(
+            self.db.session.query(
+                Transaction.receiving_account, func.sum(Transaction.amount_received)
+            )
+            .filter(is_not_self_transfer)
+            .group_by(Transaction.receiving_account)
+        )
+        sent = dict(
+            self.db.session.query(
+                Transaction.sending_account, func.sum(Transaction.amount_sent)
+            )
+            .filter(is_not_self_transfer)
+            .group_by(Transaction.sending_account)
         )
+        corrected_accounts = 0
+        for account_id, stored_balance in self.db.session.query(
+            Account.id, Account.balance
+        ):
+            expected_balance = Decimal(received.get(account_id) or 0) - Decimal(
+                sent.get(account_id) or 0
+            )
+            if stored_balance != expected_balance:
+                self.db.session.query(Account).filter(Account.id == account_id).update(
+                    {Account.balance: expected_balance},
+                    synchronize_session=False,
+                )
+                corrected_accounts += 1
+        return corrected_accounts
 
     def get_by_id(self, id: UUID) -> entities.Account:
         return self.object_from_orm(Account.query.get(str(id)))
@@ -454,12 +582,54 @@ class AccountOwnerRepository(repositories.AccountOwnerRepository):
         assert account_owner
         return account_owner
 
+    def get_owner_names(
+        self, accounts: Iterable[UUID]
+    ) -> Dict[UUID, repositories.AccountOwnerRepository.OwnerName]:
+        account_ids = {str(account) for account in accounts}
+        if not account_ids:
+            return dict()
+        rows = (
+            self.account_repository.db.session.query(
+                Account.id,
+                Member.id,
+                Member.name,
+                Company.id,
+                Company.name,
+                Account.account_owner_social_accounting,
+            )
+            .outerjoin(Member, Member.id == Account.account_owner_member)
+            .outerjoin(Company, Company.id == Account.account_owner_company)
+            .filter(Account.id.in_(account_ids))
+        )
+        owner_names: Dict[UUID, repositories.AccountOwnerRepository.OwnerName] = dict()
+        for (
+            account_id,
+            member_id,
+            member_name,
+            company_id,
+            company_name,
+            social_accounting_id,
+        ) in rows:
+            if member_id:
+                owner_name = self.OwnerName(UUID(member_id), member_name)
+            elif company_id:
+                owner_name = self.OwnerName(UUID(company_id), company_name)
+            elif social_accounting_id:
+                owner_name = self.OwnerName(
+                    UUID(social_accounting_id), entities.SocialAccounting.name
+                )
+            else:
+                continue
+            owner_names[UUID(account_id)] = owner_name
+        return owner_names
+
 
 @inject
 @dataclass
 class AccountingRepository:
     account_repository: AccountRepository
     db: SQLAlchemy
+    social_accounting_cache: SocialAccountingCache
 
     def object_from_orm(
         self, accounting_orm: SocialAccounting
@@ -474,22 +644,42 @@ class AccountingRepository:
         )
 
     def get_or_create_social_accounting(self) -> entities.SocialAccounting:
-        return self.object_from_orm(self.get_or_create_social_accounting_orm())
+        social_accounting = self.social_accounting_cache.get()
+        if social_accounting is None:
+            social_accounting = get_pending_social_accounting(self.db.session)
+        if social_accounting is None:
+            social_accounting_orm = SocialAccounting.query.first()
+            if social_accounting_orm is None:
+                social_accounting = self.object_from_orm(
+                    self._create_social_accounting_orm()
+                )
+                set_pending_social_accounting(self.db.session, social_accounting)
+            else:
+                social_accounting = self.object_from_orm(social_accounting_orm)
+                self.social_accounting_cache.set(social_accounting)
+        return social_accounting
 
-    def get_or_create_social_accounting_orm(self) -> SocialAccounting:
-        social_accounting = SocialAccounting.query.first()
-        if not social_accounting:
-            social_accounting = SocialAccounting(
-                id=str(uuid4()),
-            )
-            account = self.account_repository.create_account(
-                entities.AccountTypes.accounting
-            )
-            social_accounting.account = self.account_repository.object_to_orm(account)
-            self.db.session.add(social_accounting, account)
+    def get_social_accounting_account_id(self) -> UUID:
+        """The id of the social accounting account, for queries that
+        need to tell transactions from the social accounting apart.
+        """
+        return self.get_or_create_social_accounting().account.id
+
+    def _create_social_accounting_orm(self) -> SocialAccounting:
+        social_accounting = SocialAccounting(
+            id=str(uuid4()),
+        )
+        account = self.account_repository.create_account(
+            entities.AccountTypes.accounting
+        )
+        social_accounting.account = self.account_repository.object_to_orm(account)
+        self.db.session.add(social_accounting, account)
         return social_accounting
 
     def get_by_id(self, id: UUID) -> Optional[entities.SocialAccounting]:
+        cached = self.social_accounting_cache.get()
+        if cached is not None and cached.id == id:
+            return cached
         accounting_orm = SocialAccounting.query.filter_by(id=str(id)).first()
         if accounting_orm is None:
             return None
@@ -596,47 +786,63 @@ class PurchaseRepository(repositories.PurchaseRepository):
 class PlanRepository(repositories.PlanRepository):
     company_repository: CompanyRepository
     db: SQLAlchemy
+    identity_map: EntityIdentityMap
+    price_cache: CooperationPriceCache
 
     def object_from_orm(self, plan: Plan) -> entities.Plan:
+        cached_plan = self.identity_map.get(entities.Plan, UUID(plan.id))
+        if cached_plan is not None:
+            return cached_plan
+        planner = self.identity_map.get(
+            entities.Company, UUID(plan.planner)
+        ) or self.company_repository.object_from_orm(plan.company)
         production_costs = entities.ProductionCosts(
             labour_cost=plan.costs_a,
             resource_cost=plan.costs_r,
             means_cost=plan.costs_p,
         )
-        planner = self.company_repository.get_by_id(UUID(plan.planner))
-        assert planner is not None
-        return entities.Plan(
-            id=UUID(plan.id),
-            plan_creation_date=plan.plan_creation_date,
-            planner=planner,
-            production_costs=production_costs,
-            prd_name=plan.prd_name,
-            prd_unit=plan.prd_unit,
-            prd_amount=plan.prd_amount,
-            description=plan.description,
-            timeframe=int(plan.timeframe),
-            is_public_service=plan.is_public_service,
-            approval_date=plan.approval_date,
-            approval_reason=plan.approval_reason,
-            is_active=plan.is_active,
-            expired=plan.expired,
-            expiration_date=plan.expiration_date,
-            activation_date=plan.activation_date,
-            active_days=plan.active_days,
-            payout_count=plan.payout_count,
-            requested_cooperation=UUID(plan.requested_cooperation)
-            if plan.requested_cooperation
-            else None,
-            cooperation=UUID(plan.cooperation) if plan.cooperation else None,
-            is_available=plan.is_available,
-            hidden_by_user=plan.hidden_by_user,
+        return self.identity_map.add(
+            entities.Plan(
+                id=UUID(plan.id),
+                plan_creation_date=plan.plan_creation_date,
+                planner=planner,
+                production_costs=production_costs,
+                prd_name=plan.prd_name,
+                prd_unit=plan.prd_unit,
+                prd_amount=plan.prd_amount,
+                description=plan.description,
+                timeframe=int(plan.timeframe),
+                is_public_service=plan.is_public_service,
+                approval_date=plan.approval_date,
+                approval_reason=plan.approval_reason,
+                is_active=plan.is_active,
+                expired=plan.expired,
+                expiration_date=plan.expiration_date,
+                activation_date=plan.activation_date,
+                payout_count=plan.payout_count,
+                requested_cooperation=UUID(plan.requested_cooperation)
+                if plan.requested_cooperation
+                else None,
+                cooperation=UUID(plan.cooperation) if plan.cooperation else None,
+                is_available=plan.is_available,
+                hidden_by_user=plan.hidden_by_user,
+            )
         )
 
     def object_to_orm(self, plan: entities.Plan) -> Plan:
         return Plan.query.get(str(plan.id))
 
+    def plan_query(self) -> Any:
+        """Query plans together with their planners so that mapping them
+        to entities does not issue further queries.
+        """
+        return Plan.query.options(*self.company_repository.loader_options(Plan.company))
+
     def get_plan_by_id(self, id: UUID) -> Optional[entities.Plan]:
-        plan_orm = Plan.query.filter_by(id=str(id)).first()
+        plan = self.identity_map.get(entities.Plan, id)
+        if plan is not None:
+            return plan
+        plan_orm = self.plan_query().get(str(id))
         if plan_orm is None:
             return None
         else:
@@ -647,10 +853,12 @@ class PlanRepository(repositories.PlanRepository):
         plan: entities.PlanDraft,
     ) -> Plan:
         costs = plan.production_costs
+        planner = self.company_repository.object_to_orm(plan.planner)
         plan = Plan(
             id=plan.id,
             plan_creation_date=plan.creation_date,
-            planner=self.company_repository.object_to_orm(plan.planner).id,
+            planner=planner.id,
+            company=planner,
             costs_p=costs.means_cost,
             costs_r=costs.resource_cost,
             costs_a=costs.labour_cost,
@@ -663,7 +871,6 @@ class PlanRepository(repositories.PlanRepository):
             is_active=False,
             activation_date=None,
             expiration_date=None,
-            active_days=None,
             payout_count=0,
             is_available=True,
         )
@@ -679,14 +886,24 @@ class PlanRepository(repositories.PlanRepository):
         return self.object_from_orm(plan_orm)
 
     def activate_plan(self, plan: entities.Plan, activation_date: datetime) -> None:
+        self.identity_map.forget(entities.Plan, plan.id)
+        expiration_date = activation_date + timedelta(days=plan.timeframe)
         plan.is_active = True
         plan.activation_date = activation_date
+        plan.expiration_date = expiration_date
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.is_active = True
         plan_orm.activation_date = activation_date
+        plan_orm.expiration_date = expiration_date
+        plan_orm.next_payout_date = activation_date + timedelta(
+            days=plan_orm.payout_count
+        )
 
     def set_plan_as_expired(self, plan: entities.Plan) -> None:
+        self.identity_map.forget(entities.Plan, plan.id)
+        if plan.cooperation:
+            self.price_cache.forget(plan.cooperation)
         plan.expired = True
         plan.is_active = False
 
@@ -694,38 +911,87 @@ class PlanRepository(repositories.PlanRepository):
         plan_orm.expired = True
         plan_orm.is_active = False
 
-    def set_expiration_date(
-        self, plan: entities.Plan, expiration_date: datetime
-    ) -> None:
-        plan.expiration_date = expiration_date
-
-        plan_orm = self.object_to_orm(plan)
-        plan_orm.expiration_date = expiration_date
-
-    def set_active_days(self, plan: entities.Plan, full_active_days: int) -> None:
-        plan.active_days = full_active_days
-
-        plan_orm = self.object_to_orm(plan)
-        plan_orm.active_days = full_active_days
-
     def increase_payout_count_by_one(self, plan: entities.Plan) -> None:
+        self.identity_map.forget(entities.Plan, plan.id)
         plan.payout_count += 1
 
         plan_orm = self.object_to_orm(plan)
         plan_orm.payout_count += 1
+        if plan_orm.next_payout_date is not None:
+            plan_orm.next_payout_date += timedelta(days=1)
+
+    def apply_payout_updates(
+        self, updates: List[repositories.PlanRepository.PayoutUpdate]
+    ) -> None:
+        if not updates:
+            return
+        self.identity_map.forget_all(entities.Plan)
+        self.db.session.flush()
+        plan_table = Plan.__table__
+        self.db.session.execute(
+            plan_table.update()
+            .where(plan_table.c.id == bindparam("plan_id"))
+            .values(
+                payout_count=bindparam("new_payout_count"),
+                next_payout_date=bindparam("new_next_payout_date"),
+            ),
+            [
+                dict(
+                    plan_id=str(update.plan),
+                    new_payout_count=update.payout_count,
+                    new_next_payout_date=update.next_payout_date,
+                )
+                for update in updates
+            ],
+        )
+        expired_plans = [str(update.plan) for update in updates if update.is_expired]
+        if expired_plans:
+            self.price_cache.clear()
+            self.db.session.execute(
+                plan_table.update()
+                .where(plan_table.c.id.in_(expired_plans))
+                .values(
+                    expired=True,
+                    is_active=False,
+                    cooperation=None,
+                    requested_cooperation=None,
+                )
+            )
+        self._expire_loaded_plans()
+
+    def _expire_loaded_plans(self) -> None:
+        # Bulk updates bypass the session. Plans that were already
+        # loaded need to be refreshed on their next access.
+        for instance in self.db.session.identity_map.values():
+            if isinstance(instance, Plan):
+                self.db.session.expire(instance)
 
     def get_active_plans(self) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(is_active=True).all()
+            for plan_orm in self.plan_query().filter_by(is_active=True)
         )
 
+    def get_plans_due_for_payout(
+        self, partition: PayoutPartition, now: datetime
+    ) -> Iterator[entities.Plan]:
+        lower, upper = partition.planner_id_range()
+        query = self.plan_query().filter(
+            Plan.is_active == True,
+            or_(Plan.expiration_date < now, Plan.next_payout_date <= now),
+            Plan.planner >= lower,
+        )
+        if upper is not None:
+            query = query.filter(Plan.planner < upper)
+        return (self.object_from_orm(plan_orm) for plan_orm in query)
+
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
     ) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(is_active=True)
+            for plan_orm in self.plan_query()
+            .filter_by(is_active=True)
             .order_by(Plan.activation_date.desc())
             .limit(3)
         )
@@ -779,59 +1045,178 @@ class PlanRepository(repositories.PlanRepository):
     def all_plans_approved_and_not_expired(self) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(approved=True, expired=False).all()
-        )
-
-    def all_productive_plans_approved_active_and_not_expired(
-        self,
-    ) -> Iterator[entities.Plan]:
-        return (
-            self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(
-                is_active=True, expired=False, is_public_service=False
-            ).filter(Plan.approval_date != None)
+            for plan_orm in self.plan_query()
+            .filter_by(approved=True, expired=False)
+            .all()
         )
 
-    def all_public_plans_approved_active_and_not_expired(
+    def get_costs_per_day_of_active_plans(
         self,
-    ) -> Iterator[entities.Plan]:
-        return (
-            self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(
-                is_active=True,
-                expired=False,
-                is_public_service=True,
-            ).filter(Plan.approval_date != None)
-        )
+    ) -> repositories.PlanRepository.CostsPerDay:
+        rows = (
+            self.db.session.query(
+                Plan.is_public_service,
+                self._sum_per_day(Plan.costs_p),
+                self._sum_per_day(Plan.costs_r),
+                self._sum_per_day(Plan.costs_a),
+            )
+            .filter_by(is_active=True, expired=False)
+            .filter(Plan.approval_date != None)
+            .group_by(Plan.is_public_service)
+        )
+        costs = {
+            is_public_service: entities.ProductionCosts(
+                labour_cost=Decimal(labour or 0),
+                resource_cost=Decimal(resources or 0),
+                means_cost=Decimal(means or 0),
+            )
+            for is_public_service, means, resources, labour in rows
+        }
+        zero = entities.ProductionCosts(Decimal(0), Decimal(0), Decimal(0))
+        return repositories.PlanRepository.CostsPerDay(
+            productive=costs.get(False, zero),
+            public=costs.get(True, zero),
+        )
+
+    def _sum_per_day(self, costs: Any) -> Any:
+        if self.db.engine.dialect.name == "sqlite":
+            # SQLite has no decimal type and stores integral amounts as
+            # integers, whose quotient would be truncated. The sum is
+            # therefore only as precise as a floating point number.
+            costs = cast(costs, Float)
+        return type_coerce(func.sum(costs / Plan.timeframe), Numeric())
 
     def all_plans_approved_active_and_not_expired(self) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter_by(
+            for plan_orm in self.plan_query()
+            .filter_by(
                 is_active=True,
                 expired=False,
-            ).filter(Plan.approval_date != None)
+            )
+            .filter(Plan.approval_date != None)
         )
 
     def hide_plan(self, plan_id: UUID) -> None:
+        self.identity_map.forget(entities.Plan, plan_id)
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.hidden_by_user = True
 
     def query_active_plans_by_product_name(self, query: str) -> Iterator[entities.Plan]:
+        plans = self.plan_query().filter(Plan.is_active == True)
+        search = PlanSearch.from_query(plans, query)
         return (
             self.object_from_orm(plan)
-            for plan in Plan.query.filter(
-                Plan.is_active == True, Plan.prd_name.ilike(f"%{query}%")
-            ).all()
+            for plan in search.apply(plans).order_by(search.rank, Plan.id).all()
         )
 
     def query_active_plans_by_plan_id(self, query: str) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan)
-            for plan in Plan.query.filter(
-                Plan.is_active == True, Plan.id.contains(query)
-            ).all()
+            for plan in self.plan_query()
+            .filter(Plan.is_active == True, self._plan_id_matches(query))
+            .all()
+        )
+
+    def get_page_of_active_plans(
+        self,
+        ordering: repositories.PlanRepository.Ordering,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        search_text: Optional[str] = None,
+        plan_id: Optional[str] = None,
+    ) -> List[entities.Plan]:
+        search = (
+            PlanSearch.from_query(self.plan_query(), search_text)
+            if search_text is not None
+            else None
+        )
+        if ordering == self.Ordering.relevance and search is None:
+            ordering = self.Ordering.newest_first
+        keys, join_keys = self._ordering_keys(ordering, search)
+        query = join_keys(self.plan_query()).filter(Plan.is_active == True)
+        boundary_query = join_keys(self.db.session.query(*keys).select_from(Plan))
+        if search is not None:
+            query = search.apply(query)
+            boundary_query = search.apply(boundary_query)
+        if plan_id is not None:
+            query = query.filter(self._plan_id_matches(plan_id))
+        boundary_id = before or after
+        boundary = (
+            boundary_query.filter(Plan.id == str(boundary_id)).one_or_none()
+            if boundary_id
+            else None
+        )
+        return [
+            self.object_from_orm(plan)
+            for plan in get_keyset_page(
+                query,
+                keys,
+                boundary,
+                limit,
+                is_backward=before is not None,
+                descending=ordering == self.Ordering.newest_first,
+            )
+        ]
+
+    def _plan_id_matches(self, query: str) -> Any:
+        # Complete ids are looked up by primary key instead of scanning
+        # all plans for a part of their id.
+        try:
+            return Plan.id == str(UUID(query))
+        except ValueError:
+            return Plan.id.contains(query)
+
+    def _ordering_keys(
+        self,
+        ordering: repositories.PlanRepository.Ordering,
+        search: Optional[PlanSearch],
+    ) -> Tuple[List[Any], Callable[[Any], Any]]:
+        if ordering == self.Ordering.newest_first:
+            return [Plan.activation_date, Plan.id], lambda query: query
+        if ordering == self.Ordering.relevance:
+            assert search is not None
+            return [search.rank, Plan.id], lambda query: query
+        if ordering == self.Ordering.company_name:
+            return [func.lower(Company.name), Plan.id], lambda query: query.join(
+                Company, Company.id == Plan.planner
+            )
+        cooperation_prices = self._cooperation_prices()
+        # Plans without amount are divided by one like cooperations, as
+        # a NULL key would drop rows from the keyset comparison.
+        individual_price = case(
+            (Plan.is_public_service == True, 0.0),
+            else_=cast(Plan.costs_p + Plan.costs_r + Plan.costs_a, Float)
+            / func.coalesce(func.nullif(cast(Plan.prd_amount, Float), 0), 1),
+        )
+        price = cast(func.coalesce(cooperation_prices.c.price, individual_price), Float)
+        return [price, Plan.id], lambda query: query.outerjoin(
+            cooperation_prices, cooperation_prices.c.cooperation == Plan.cooperation
+        )
+
+    def _cooperation_prices(self) -> Any:
+        # Mirrors arbeitszeit.price_calculator, with floats that are
+        # good enough for ordering plans by price.
+        total_cost = cast(Plan.costs_p + Plan.costs_r + Plan.costs_a, Float)
+        return (
+            self.db.session.query(
+                Plan.cooperation.label("cooperation"),
+                (
+                    func.sum(total_cost / Plan.timeframe)
+                    / func.coalesce(
+                        func.nullif(
+                            func.sum(cast(Plan.prd_amount, Float) / Plan.timeframe),
+                            0,
+                        ),
+                        1,
+                    )
+                ).label("price"),
+            )
+            .filter(Plan.cooperation != None)
+            .group_by(Plan.cooperation)
+            .subquery()
         )
 
     def get_all_plans_for_company_descending(
@@ -839,9 +1224,9 @@ class PlanRepository(repositories.PlanRepository):
     ) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter(Plan.planner == str(company_id)).order_by(
-                Plan.plan_creation_date.desc()
-            )
+            for plan_orm in self.plan_query()
+            .filter(Plan.planner == str(company_id))
+            .order_by(Plan.plan_creation_date.desc())
         )
 
     def get_all_active_plans_for_company(
@@ -849,12 +1234,13 @@ class PlanRepository(repositories.PlanRepository):
     ) -> Iterator[entities.Plan]:
         return (
             self.object_from_orm(plan_orm)
-            for plan_orm in Plan.query.filter(
+            for plan_orm in self.plan_query().filter(
                 Plan.planner == str(company_id), Plan.is_active == True
             )
         )
 
     def toggle_product_availability(self, plan: entities.Plan) -> None:
+        self.identity_map.forget(entities.Plan, plan.id)
         plan.is_available = True if (plan.is_available == False) else False
 
         plan_orm = self.object_to_orm(plan)
@@ -883,6 +1269,10 @@ class TransactionRepository(repositories.TransactionRepository):
     account_repository: AccountRepository
     db: SQLAlchemy
 
+    # Rows fetched per round trip from a server side cursor when
+    # iterating over long transaction histories.
+    EXPORT_BATCH_SIZE = 1000
+
     def object_to_orm(self, transaction: entities.Transaction) -> Transaction:
         return Transaction.query.get(str(transaction.id))
 
@@ -890,15 +1280,16 @@ class TransactionRepository(repositories.TransactionRepository):
         return entities.Transaction(
             id=UUID(transaction.id),
             date=transaction.date,
-            sending_account=self.account_repository.get_by_id(
-                transaction.sending_account
+            sending_account=self.account_repository.object_from_orm(
+                transaction.account_from
             ),
-            receiving_account=self.account_repository.get_by_id(
-                transaction.receiving_account
+            receiving_account=self.account_repository.object_from_orm(
+                transaction.account_to
             ),
             amount_sent=Decimal(transaction.amount_sent),
             amount_received=Decimal(transaction.amount_received),
             purpose=transaction.purpose,
+            plan=UUID(transaction.plan_id) if transaction.plan_id else None,
         )
 
     def create_transaction(
@@ -909,6 +1300,7 @@ class TransactionRepository(repositories.TransactionRepository):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan: Optional[UUID] = None,
     ) -> entities.Transaction:
         transaction = Transaction(
             id=str(uuid4()),
@@ -918,37 +1310,196 @@ class TransactionRepository(repositories.TransactionRepository):
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan_id=str(plan) if plan else None,
         )
         self.db.session.add(transaction)
-        return self.object_from_orm(transaction)
+        if sending_account.id != receiving_account.id:
+            self.account_repository.add_to_balance(sending_account, -amount_sent)
+            self.account_repository.add_to_balance(receiving_account, amount_received)
+        return entities.Transaction(
+            id=UUID(transaction.id),
+            date=date,
+            sending_account=sending_account,
+            receiving_account=receiving_account,
+            amount_sent=Decimal(amount_sent),
+            amount_received=Decimal(amount_received),
+            purpose=purpose,
+            plan=plan,
+        )
+
+    def create_transactions(
+        self, transactions: List[repositories.TransactionRepository.NewTransaction]
+    ) -> None:
+        if not transactions:
+            return
+        balance_changes: Dict[UUID, Decimal] = defaultdict(Decimal)
+        for transaction in transactions:
+            if transaction.sending_account.id != transaction.receiving_account.id:
+                balance_changes[transaction.sending_account.id] -= Decimal(
+                    transaction.amount_sent
+                )
+                balance_changes[transaction.receiving_account.id] += Decimal(
+                    transaction.amount_received
+                )
+        self.db.session.flush()
+        self.db.session.execute(
+            Transaction.__table__.insert(),
+            [
+                dict(
+                    id=str(uuid4()),
+                    date=transaction.date,
+                    sending_account=str(transaction.sending_account.id),
+                    receiving_account=str(transaction.receiving_account.id),
+                    amount_sent=transaction.amount_sent,
+                    amount_received=transaction.amount_received,
+                    purpose=transaction.purpose,
+                    plan_id=str(transaction.plan) if transaction.plan else None,
+                    payout_day=transaction.payout_day,
+                )
+                for transaction in transactions
+            ],
+        )
+        self.account_repository.add_to_balances(balance_changes)
 
     def all_transactions_sent_by_account(
         self, account: entities.Account
     ) -> List[entities.Transaction]:
-        account_orm = self.account_repository.object_to_orm(account)
         return [
             self.object_from_orm(transaction)
-            for transaction in account_orm.transactions_sent.all()
+            for transaction in Transaction.query.filter(
+                Transaction.sending_account == str(account.id)
+            ).options(*self._account_loader_options())
         ]
 
     def all_transactions_received_by_account(
         self, account: entities.Account
     ) -> List[entities.Transaction]:
-        account_orm = self.account_repository.object_to_orm(account)
         return [
             self.object_from_orm(transaction)
-            for transaction in account_orm.transactions_received.all()
+            for transaction in Transaction.query.filter(
+                Transaction.receiving_account == str(account.id)
+            ).options(*self._account_loader_options())
         ]
 
-    def get_sales_balance_of_plan(self, plan: entities.Plan) -> Decimal:
-        return Decimal(
-            self.db.session.query(func.sum(Transaction.amount_received))
+    def _account_loader_options(self) -> List[Any]:
+        return [
+            joinedload(Transaction.account_from),
+            joinedload(Transaction.account_to),
+        ]
+
+    def get_sales_balances_of_plans_of_company(
+        self, company: entities.Company
+    ) -> Dict[UUID, Decimal]:
+        return {
+            UUID(plan_id): Decimal(sales_balance)
+            for plan_id, sales_balance in self.db.session.query(
+                Transaction.plan_id, func.sum(Transaction.amount_received)
+            )
             .filter(
-                Transaction.receiving_account == str(plan.planner.product_account.id),
-                Transaction.purpose.contains(f"{plan.id}"),
+                Transaction.receiving_account == str(company.product_account.id),
+                Transaction.plan_id != None,
             )
-            .one()[0]
-            or 0
+            .group_by(Transaction.plan_id)
+        }
+
+    def get_page_of_account_history(
+        self,
+        account: entities.Account,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+    ) -> List[repositories.TransactionRepository.AccountHistoryEntry]:
+        history = self._account_history(account)
+        query = (
+            self.db.session.query(Transaction, history.c.balance)
+            .join(history, history.c.id == Transaction.id)
+            .options(*self._account_loader_options())
+        )
+        boundary_id = before or after
+        boundary = (
+            self.db.session.query(Transaction.date, Transaction.id)
+            .filter(Transaction.id == str(boundary_id))
+            .one_or_none()
+            if boundary_id
+            else None
+        )
+        return [
+            self.AccountHistoryEntry(
+                transaction=self.object_from_orm(transaction),
+                balance=Decimal(balance),
+            )
+            for transaction, balance in get_keyset_page(
+                query,
+                [history.c.date, history.c.id],
+                boundary,
+                limit,
+                is_backward=before is not None,
+                descending=True,
+            )
+        ]
+
+    def get_account_balance_history(
+        self, account: entities.Account
+    ) -> List[Tuple[datetime, Decimal]]:
+        history = self._account_history(account)
+        return [
+            (date, Decimal(balance))
+            for date, balance in self.db.session.query(
+                history.c.date, history.c.balance
+            ).order_by(history.c.date, history.c.id)
+        ]
+
+    def get_transactions_of_accounts(
+        self,
+        accounts: Iterable[entities.Account],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[entities.Transaction]:
+        account_ids = [str(account.id) for account in accounts]
+        if not account_ids:
+            return
+        query = Transaction.query.filter(
+            or_(
+                Transaction.sending_account.in_(account_ids),
+                Transaction.receiving_account.in_(account_ids),
+            )
+        )
+        if since is not None:
+            query = query.filter(Transaction.date >= since)
+        if until is not None:
+            query = query.filter(Transaction.date < until)
+        for transaction in (
+            query.options(*self._account_loader_options())
+            .order_by(Transaction.date, Transaction.id)
+            .yield_per(self.EXPORT_BATCH_SIZE)
+        ):
+            yield self.object_from_orm(transaction)
+
+    def _account_history(self, account: entities.Account) -> Any:
+        """The transactions of the account with the running balance of
+        the account, summed up by the database in date order.
+        """
+        account_id = str(account.id)
+        balance_change = case(
+            (Transaction.sending_account == Transaction.receiving_account, 0),
+            (Transaction.receiving_account == account_id, Transaction.amount_received),
+            else_=-Transaction.amount_sent,
+        )
+        return (
+            self.db.session.query(
+                Transaction.id.label("id"),
+                Transaction.date.label("date"),
+                func.sum(balance_change)
+                .over(order_by=(Transaction.date, Transaction.id))
+                .label("balance"),
+            )
+            .filter(
+                or_(
+                    Transaction.sending_account == account_id,
+                    Transaction.receiving_account == account_id,
+                )
+            )
+            .subquery()
         )
 
 
@@ -985,7 +1536,7 @@ class PlanDraftRepository(repositories.PlanDraftRepository):
             is_public_service=is_public_service,
         )
         self.db.session.add(orm)
-        return self._object_from_orm(orm)
+        return self._object_from_orm(orm, self._get_planner(planner))
 
     def update_draft(
         self, update: repositories.PlanDraftRepository.UpdateDraft
@@ -1032,14 +1583,19 @@ class PlanDraftRepository(repositories.PlanDraftRepository):
         if orm is None:
             return None
         else:
-            return self._object_from_orm(orm)
+            return self._object_from_orm(orm, self._get_planner(orm.planner))
 
     def delete_draft(self, id: UUID) -> None:
         PlanDraft.query.filter_by(id=str(id)).delete()
 
-    def _object_from_orm(self, orm: PlanDraft) -> entities.PlanDraft:
-        planner = self.company_repository.get_by_id(orm.planner)
-        assert planner is not None
+    def _get_planner(self, planner: Union[str, UUID]) -> entities.Company:
+        company = self.company_repository.get_by_id(UUID(str(planner)))
+        assert company is not None
+        return company
+
+    def _object_from_orm(
+        self, orm: PlanDraft, planner: entities.Company
+    ) -> entities.PlanDraft:
         return entities.PlanDraft(
             id=orm.id,
             creation_date=orm.plan_creation_date,
@@ -1058,10 +1614,9 @@ class PlanDraftRepository(repositories.PlanDraftRepository):
         )
 
     def all_drafts_of_company(self, id: UUID) -> Iterable[entities.PlanDraft]:
-        draft_owner = Company.query.filter_by(id=str(id)).first()
-        assert draft_owner is not None
-        drafts = draft_owner.drafts.all()
-        return (self._object_from_orm(draft) for draft in drafts)
+        planner = self._get_planner(id)
+        drafts = PlanDraft.query.filter_by(planner=str(id)).all()
+        return (self._object_from_orm(draft, planner) for draft in drafts)
 
 
 @inject
@@ -1199,61 +1754,94 @@ class CooperationRepository(repositories.CooperationRepository):
 @inject
 @dataclass
 class PlanCooperationRepository(repositories.PlanCooperationRepository):
+    db: SQLAlchemy
     plan_repository: PlanRepository
-    cooperation_repository: CooperationRepository
-
-    def get_inbound_requests(self, coordinator_id: UUID) -> Iterator[entities.Plan]:
-        for plan in self.plan_repository.get_active_plans():
-            if plan.requested_cooperation:
-                if plan.requested_cooperation in [
-                    coop.id
-                    for coop in self.cooperation_repository.get_cooperations_coordinated_by_company(
-                        coordinator_id
-                    )
-                ]:
-                    yield plan
+    identity_map: EntityIdentityMap
+    price_cache: CooperationPriceCache
+
+    def get_inbound_requests(
+        self, coordinator_id: UUID
+    ) -> List[repositories.PlanCooperationRepository.InboundRequest]:
+        rows = (
+            self.db.session.query(
+                Cooperation.id, Cooperation.name, Plan.id, Plan.prd_name, Company.name
+            )
+            .select_from(Plan)
+            .join(Cooperation, Cooperation.id == Plan.requested_cooperation)
+            .join(Company, Company.id == Plan.planner)
+            .filter(
+                Cooperation.coordinator == str(coordinator_id),
+                Plan.is_active == True,
+            )
+            .order_by(Plan.plan_creation_date.desc())
+        )
+        return [
+            repositories.PlanCooperationRepository.InboundRequest(
+                coop_id=UUID(coop_id),
+                coop_name=coop_name,
+                plan_id=UUID(plan_id),
+                plan_name=plan_name,
+                planner_name=planner_name,
+            )
+            for coop_id, coop_name, plan_id, plan_name, planner_name in rows
+        ]
 
-    def get_outbound_requests(self, requester_id: UUID) -> Iterator[entities.Plan]:
-        plans_of_company = self.plan_repository.get_all_plans_for_company_descending(
-            requester_id
+    def get_outbound_requests(
+        self, requester_id: UUID
+    ) -> List[repositories.PlanCooperationRepository.OutboundRequest]:
+        rows = (
+            self.db.session.query(
+                Plan.id, Plan.prd_name, Cooperation.id, Cooperation.name
+            )
+            .select_from(Plan)
+            .join(Cooperation, Cooperation.id == Plan.requested_cooperation)
+            .filter(Plan.planner == str(requester_id))
+            .order_by(Plan.plan_creation_date.desc())
         )
-        for plan in plans_of_company:
-            if plan.requested_cooperation:
-                yield plan
+        return [
+            repositories.PlanCooperationRepository.OutboundRequest(
+                plan_id=UUID(plan_id),
+                plan_name=plan_name,
+                coop_id=UUID(coop_id),
+                coop_name=coop_name,
+            )
+            for plan_id, plan_name, coop_id, coop_name in rows
+        ]
 
     def get_cooperating_plans(self, plan_id: UUID) -> List[entities.Plan]:
-        plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
-        if plan_orm is None:
+        plan = self.plan_repository.get_plan_by_id(plan_id)
+        if plan is None:
             return []
-        coop_orm = plan_orm.coop
-        if coop_orm is None:
-            plan = self.plan_repository.get_plan_by_id(plan_id)
-            if plan is None:
-                return []
+        if plan.cooperation is None:
             return [plan]
-
         else:
-            return [
-                self.plan_repository.object_from_orm(plan)
-                for plan in coop_orm.plans.all()
-            ]
+            return list(self.get_plans_in_cooperation(plan.cooperation))
 
     def add_plan_to_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
+        self.identity_map.forget(entities.Plan, plan_id)
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
+        if plan_orm.cooperation:
+            self.price_cache.forget(UUID(plan_orm.cooperation))
+        self.price_cache.forget(cooperation_id)
         plan_orm.cooperation = str(cooperation_id)
 
     def remove_plan_from_cooperation(self, plan_id: UUID) -> None:
+        self.identity_map.forget(entities.Plan, plan_id)
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
+        if plan_orm.cooperation:
+            self.price_cache.forget(UUID(plan_orm.cooperation))
         plan_orm.cooperation = None
 
     def set_requested_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
+        self.identity_map.forget(entities.Plan, plan_id)
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.requested_cooperation = str(cooperation_id)
 
     def set_requested_cooperation_to_none(self, plan_id: UUID) -> None:
+        self.identity_map.forget(entities.Plan, plan_id)
         plan_orm = Plan.query.filter_by(id=str(plan_id)).first()
         assert plan_orm
         plan_orm.requested_cooperation = None
@@ -1263,10 +1851,27 @@ class PlanCooperationRepository(repositories.PlanCooperationRepository):
         return count
 
     def get_plans_in_cooperation(self, cooperation_id: UUID) -> Iterable[entities.Plan]:
-        plans = Plan.query.filter_by(cooperation=str(cooperation_id)).all()
+        plans = (
+            self.plan_repository.plan_query()
+            .filter_by(cooperation=str(cooperation_id))
+            .all()
+        )
         for plan in plans:
             yield self.plan_repository.object_from_orm(plan)
 
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Iterable[entities.Plan]:
+        cooperations = [str(cooperation_id) for cooperation_id in cooperation_ids]
+        if not cooperations:
+            return []
+        return [
+            self.plan_repository.object_from_orm(plan)
+            for plan in self.plan_repository.plan_query().filter(
+                Plan.cooperation.in_(cooperations)
+            )
+        ]
+
 
 @inject
 @dataclass
@@ -1334,10 +1939,59 @@ class PayoutFactorRepository:
     db: SQLAlchemy
 
     def store_payout_factor(self, timestamp: datetime, payout_factor: Decimal) -> None:
-        payout_factor = models.PayoutFactor(
-            timestamp=timestamp, payout_factor=payout_factor
+        self.db.session.add(
+            models.PayoutFactor(timestamp=timestamp, payout_factor=payout_factor)
+        )
+        self._add_to_daily_payout_factor(timestamp, payout_factor)
+
+    def _add_to_daily_payout_factor(
+        self, timestamp: datetime, payout_factor: Decimal
+    ) -> None:
+        # A single upsert, so that payout runs storing their factors at
+        # the same time cannot overwrite each other's rollup.
+        rollup = models.DailyPayoutFactor.__table__
+        statement = self._insert(rollup).values(
+            day=timestamp.date(),
+            count=1,
+            total=payout_factor,
+            minimum=payout_factor,
+            maximum=payout_factor,
+            last=payout_factor,
+            last_timestamp=timestamp,
+        )
+        new = statement.excluded
+        is_later = new.last_timestamp >= rollup.c.last_timestamp
+        self.db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[rollup.c.day],
+                set_=dict(
+                    count=rollup.c.count + 1,
+                    total=rollup.c.total + new.total,
+                    minimum=case(
+                        (new.minimum < rollup.c.minimum, new.minimum),
+                        else_=rollup.c.minimum,
+                    ),
+                    maximum=case(
+                        (new.maximum > rollup.c.maximum, new.maximum),
+                        else_=rollup.c.maximum,
+                    ),
+                    last=case((is_later, new.last), else_=rollup.c.last),
+                    last_timestamp=case(
+                        (is_later, new.last_timestamp), else_=rollup.c.last_timestamp
+                    ),
+                ),
+            )
+        )
+
+    def _insert(self, table: Any) -> Any:
+        dialect = self.db.engine.dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(table)
+        if dialect == "sqlite":
+            return sqlite.insert(table)
+        raise NotImplementedError(
+            f"Daily payout factors cannot be updated on {dialect} databases"
         )
-        self.db.session.add(payout_factor)
 
     def get_latest_payout_factor(
         self,
@@ -1353,3 +2007,119 @@ class PayoutFactorRepository:
             calculation_date=payout_factor_orm.timestamp,
             value=Decimal(payout_factor_orm.payout_factor),
         )
+
+    def get_daily_payout_factors(self, since: date) -> List[entities.DailyPayoutFactor]:
+        rollup = models.DailyPayoutFactor
+        rows = (
+            self.db.session.query(
+                rollup.day,
+                rollup.count,
+                rollup.total,
+                rollup.minimum,
+                rollup.maximum,
+                rollup.last,
+            )
+            .filter(rollup.day >= since)
+            .order_by(rollup.day)
+        )
+        return [
+            entities.DailyPayoutFactor(
+                day=row.day,
+                minimum=Decimal(row.minimum),
+                maximum=Decimal(row.maximum),
+                average=Decimal(row.total) / row.count,
+                last=Decimal(row.last),
+            )
+            for row in rows
+        ]
+
+    def delete_payout_factors_before(self, timestamp: datetime) -> int:
+        latest = self.db.session.query(func.max(models.PayoutFactor.timestamp)).scalar()
+        if latest is None:
+            return 0
+        return (
+            self.db.session.query(models.PayoutFactor)
+            .filter(models.PayoutFactor.timestamp < min(timestamp, latest))
+            .delete(synchronize_session=False)
+        )
+
+
+@inject
+@dataclass
+class PayoutLockRepository:
+    db: SQLAlchemy
+
+    # First key of the PostgreSQL advisory locks of payout partitions.
+    # The second key identifies the partition, see _advisory_lock_key.
+    ADVISORY_LOCK_NAMESPACE = 0x70617900
+
+    def try_to_lock_partition(self, partition: PayoutPartition) -> bool:
+        if self.db.engine.dialect.name != "postgresql":
+            # SQLite lets only one transaction write at a time. Payout
+            # runs that overlap anyway cannot pay a plan twice for the
+            # same day because of uq_transaction_plan_id_payout_day.
+            return True
+        return bool(
+            self.db.session.execute(
+                func.pg_try_advisory_xact_lock(
+                    self.ADVISORY_LOCK_NAMESPACE, self._advisory_lock_key(partition)
+                ).select()
+            ).scalar()
+        )
+
+    @staticmethod
+    def _advisory_lock_key(partition: PayoutPartition) -> int:
+        """Number the partitions of all counts one after another: 0 for
+        the only partition of one, 1 and 2 for the partitions of two
+        and so on. Runs with a different number of partitions therefore
+        never take each other's locks, as their partitions hold
+        different plans.
+        """
+        return partition.count * (partition.count - 1) // 2 + partition.index
+
+
+@inject
+@dataclass
+class StatisticsRepository:
+    db: SQLAlchemy
+
+    def store_statistics(self, statistics: entities.Statistics) -> None:
+        self.db.session.add(
+            models.Statistics(
+                timestamp=statistics.calculation_date,
+                registered_companies_count=statistics.registered_companies_count,
+                registered_members_count=statistics.registered_members_count,
+                cooperations_count=statistics.cooperations_count,
+                certificates_count=statistics.certificates_count,
+                available_product=statistics.available_product,
+                active_plans_count=statistics.active_plans_count,
+                active_plans_public_count=statistics.active_plans_public_count,
+                avg_timeframe=statistics.avg_timeframe,
+                planned_work=statistics.planned_work,
+                planned_resources=statistics.planned_resources,
+                planned_means=statistics.planned_means,
+            )
+        )
+
+    def get_latest_statistics(self) -> Optional[entities.Statistics]:
+        statistics_orm = (
+            self.db.session.query(models.Statistics)
+            .order_by(models.Statistics.timestamp.desc())
+            .first()
+        )
+        if not statistics_orm:
+            return None
+        return entities.Statistics(
+            calculation_date=statistics_orm.timestamp,
+            registered_companies_count=statistics_orm.registered_companies_count,
+            registered_members_count=statistics_orm.registered_members_count,
+            cooperations_count=statistics_orm.cooperations_count,
+            certificates_count=Decimal(statistics_orm.certificates_count),
+            available_product=Decimal(statistics_orm.available_product),
+            active_plans_count=statistics_orm.active_plans_count,
+            active_plans_public_count=statistics_orm.active_plans_public_count,
+            avg_timeframe=Decimal(statistics_orm.avg_timeframe),
+            planned_work=Decimal(statistics_orm.planned_work),
+            planned_resources=Decimal(statistics_orm.planned_resources),
+            planned_means=Decimal(statistics_orm.planned_means),
+        )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, List
+
+from sqlalchemy import Float, cast, func, literal_column, table
+
+from arbeitszeit_flask.models import Plan
+
+# The FTS5 table that arbeitszeit_flask.models creates for SQLite.
+plan_search_table = table("plan_search")
+
+
+def get_search_words(search_text: str) -> List[str]:
+    return re.findall(r"[^\W_]+", search_text.lower())
+
+
+@dataclass
+class PlanSearch:
+    """Restricts queries for plans to those whose product name or
+    description contain a word starting with every word of the search
+    text. The rank of a plan is lower the better it matches.
+    """
+
+    words: List[str]
+    dialect: str
+
+    @classmethod
+    def from_query(cls, query: Any, search_text: str) -> PlanSearch:
+        return cls(
+            words=get_search_words(search_text),
+            dialect=query.session.get_bind().dialect.name,
+        )
+
+    def apply(self, query: Any) -> Any:
+        if not self.words:
+            return query
+        if self.dialect == "postgresql":
+            return query.filter(self._document().op("@@")(self._tsquery()))
+        if self.dialect == "sqlite":
+            return query.join(
+                plan_search_table,
+                literal_column("plan_search.rowid") == literal_column("plan.rowid"),
+            ).filter(
+                literal_column("plan_search").op("MATCH")(
+                    " ".join(f'"{word}"*' for word in self.words)
+                )
+            )
+        return query.filter(
+            *(
+                (Plan.prd_name + " " + Plan.description).ilike(f"%{word}%")
+                for word in self.words
+            )
+        )
+
+    @property
+    def rank(self) -> Any:
+        if not self.words:
+            return cast(0.0, Float)
+        if self.dialect == "postgresql":
+            return cast(-func.ts_rank(self._document(), self._tsquery()), Float)
+        if self.dialect == "sqlite":
+            return cast(func.bm25(literal_column("plan_search")), Float)
+        return cast(0.0, Float)
+
+    def _document(self) -> Any:
+        # Must match the expression of the index ix_plan_search_document.
+        return literal_column(
+            "to_tsvector('simple', plan.prd_name || ' ' || plan.description)"
+        )
+
+    def _tsquery(self) -> Any:
+        return func.to_tsquery(
+            literal_column("'simple'"),
+            " & ".join(f"{word}:*" for word in self.words),
+        )
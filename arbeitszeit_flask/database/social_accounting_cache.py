@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+
+from arbeitszeit import entities
+from arbeitszeit_flask.extensions import db
+
+_PENDING_SOCIAL_ACCOUNTING = "pending_social_accounting"
+
+
+class SocialAccountingCache:
+    """The committed social accounting of the application. Its row
+    never changes after it was created, so it is read from the database
+    only once.
+    """
+
+    def __init__(self) -> None:
+        self._social_accounting: Optional[entities.SocialAccounting] = None
+        self._lock = Lock()
+
+    def get(self) -> Optional[entities.SocialAccounting]:
+        return self._social_accounting
+
+    def set(self, social_accounting: entities.SocialAccounting) -> None:
+        with self._lock:
+            self._social_accounting = social_accounting
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._social_accounting = None
+
+
+def get_social_accounting_cache() -> SocialAccountingCache:
+    """Return the social accounting cache of the current application.
+    Outside of an application context every call returns a new, empty
+    cache.
+    """
+    if not has_app_context():
+        return SocialAccountingCache()
+    return current_app.extensions.setdefault(
+        "social_accounting_cache", SocialAccountingCache()
+    )
+
+
+def invalidate_social_accounting_cache() -> None:
+    get_social_accounting_cache().invalidate()
+
+
+def get_pending_social_accounting(
+    session: Any,
+) -> Optional[entities.SocialAccounting]:
+    return session.info.get(_PENDING_SOCIAL_ACCOUNTING)
+
+
+def set_pending_social_accounting(
+    session: Any, social_accounting: entities.SocialAccounting
+) -> None:
+    """Remember a social accounting that was created in the current
+    transaction of the session. Other sessions cannot see it yet, so it
+    is added to the cache of the application only when the transaction
+    is committed and forgotten if the transaction ends otherwise.
+    """
+    session.info[_PENDING_SOCIAL_ACCOUNTING] = social_accounting
+
+
+@event.listens_for(db.session, "after_commit")
+def _publish_pending_social_accounting(session: Any) -> None:
+    social_accounting = session.info.pop(_PENDING_SOCIAL_ACCOUNTING, None)
+    if social_accounting is not None and has_app_context():
+        get_social_accounting_cache().set(social_accounting)
+
+
+@event.listens_for(db.session, "after_transaction_end")
+def _discard_pending_social_accounting(session: Any, transaction: Any) -> None:
+    # Runs after after_commit, so only a pending social accounting of a
+    # transaction that was rolled back or closed is still there.
+    if transaction.parent is None:
+        session.info.pop(_PENDING_SOCIAL_ACCOUNTING, None)
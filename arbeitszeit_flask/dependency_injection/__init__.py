@@ -1,6 +1,7 @@
 from functools import wraps
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
+from flask import Flask, current_app
 from flask_sqlalchemy import SQLAlchemy
 from injector import (
     Binder,
@@ -17,6 +18,7 @@ from injector import (
 from arbeitszeit import entities
 from arbeitszeit import repositories as interfaces
 from arbeitszeit.control_thresholds import ControlThresholds
+from arbeitszeit.cooperation_price import CooperationPriceCache
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.token import InvitationTokenValidator, TokenDeliverer, TokenService
 from arbeitszeit.use_cases import GetCompanySummary
@@ -27,6 +29,11 @@ from arbeitszeit.use_cases.log_in_member import LogInMemberUseCase
 from arbeitszeit.use_cases.show_my_accounts import ShowMyAccounts
 from arbeitszeit_flask.control_thresholds import ControlThresholdsFlask
 from arbeitszeit_flask.database import get_social_accounting
+from arbeitszeit_flask.database.identity_map import (
+    EntityIdentityMap,
+    get_cooperation_price_cache,
+    get_entity_identity_map,
+)
 from arbeitszeit_flask.database.repositories import (
     AccountantRepository,
     AccountOwnerRepository,
@@ -36,14 +43,20 @@ from arbeitszeit_flask.database.repositories import (
     CooperationRepository,
     MemberRepository,
     PayoutFactorRepository,
+    PayoutLockRepository,
     PlanCooperationRepository,
     PlanDraftRepository,
     PlanRepository,
     PurchaseRepository,
+    StatisticsRepository,
     TransactionRepository,
     UserAddressBookImpl,
     WorkerInviteRepository,
 )
+from arbeitszeit_flask.database.social_accounting_cache import (
+    SocialAccountingCache,
+    get_social_accounting_cache,
+)
 from arbeitszeit_flask.datetime import RealtimeDatetimeService
 from arbeitszeit_flask.extensions import db
 from arbeitszeit_flask.flask_colors import FlaskColors
@@ -58,6 +71,7 @@ from arbeitszeit_flask.mail_service import (
     get_mail_service,
 )
 from arbeitszeit_flask.notifications import FlaskFlashNotifier
+from arbeitszeit_flask.plots.cache import CachingPlotter, get_plot_cache
 from arbeitszeit_flask.template import (
     AnonymousUserTemplateRenderer,
     CompanyTemplateIndex,
@@ -89,6 +103,7 @@ from arbeitszeit_web.controllers.show_my_accounts_controller import (
 )
 from arbeitszeit_web.create_draft import CreateDraftController
 from arbeitszeit_web.email import EmailConfiguration, UserAddressBook
+from arbeitszeit_web.export_transactions import ExportTransactionsController
 from arbeitszeit_web.invite_worker_to_company import InviteWorkerToCompanyController
 from arbeitszeit_web.language_service import LanguageService
 from arbeitszeit_web.notification import Notifier
@@ -114,6 +129,7 @@ from arbeitszeit_web.url_index import (
 )
 
 from .presenters import CompanyPresenterModule, PresenterModule
+from .scopes import clear_request_scope, request_scope
 from .views import ViewsModule
 
 __all__ = [
@@ -176,6 +192,7 @@ class CompanyModule(CompanyPresenterModule):
 
 
 class FlaskModule(PresenterModule):
+    @request_scope
     @provider
     def provide_request(self, request: FlaskRequest) -> Request:
         return request
@@ -184,12 +201,17 @@ class FlaskModule(PresenterModule):
     def provide_url_index(self, index: GeneralUrlIndex) -> UrlIndex:
         return index
 
+    @provider
+    def provide_token_service(self, service: FlaskTokenService) -> TokenService:
+        return service
+
     @provider
     def provide_invitation_token_validator(
         self, validator: FlaskTokenService
     ) -> InvitationTokenValidator:
         return validator
 
+    @request_scope
     @provider
     def provide_flask_session(
         self,
@@ -290,6 +312,18 @@ class FlaskModule(PresenterModule):
             template_index=template_index, template_renderer=template_renderer
         )
 
+    @provider
+    def provide_entity_identity_map(self) -> EntityIdentityMap:
+        return get_entity_identity_map()
+
+    @provider
+    def provide_cooperation_price_cache(self) -> CooperationPriceCache:
+        return get_cooperation_price_cache()
+
+    @provider
+    def provide_social_accounting_cache(self) -> SocialAccountingCache:
+        return get_social_accounting_cache()
+
     @provider
     def provide_transaction_repository(
         self, instance: TransactionRepository
@@ -337,10 +371,17 @@ class FlaskModule(PresenterModule):
     ) -> RequestCooperationController:
         return RequestCooperationController(session, translator)
 
+    @provider
+    def provide_export_transactions_controller(
+        self, session: Session, request: Request, translator: Translator
+    ) -> ExportTransactionsController:
+        return ExportTransactionsController(session, request, translator)
+
     @provider
     def provide_session(self, flask_session: FlaskSession) -> Session:
         return flask_session
 
+    @request_scope
     @provider
     def provide_notifier(self) -> Notifier:
         return FlaskFlashNotifier()
@@ -350,13 +391,14 @@ class FlaskModule(PresenterModule):
     def provide_mail_service(self) -> MailService:
         return get_mail_service()
 
+    @request_scope
     @provider
     def provide_translator(self) -> Translator:
         return FlaskTranslator()
 
     @provider
     def provide_plotter(self) -> Plotter:
-        return FlaskPlotter()
+        return CachingPlotter(plotter=FlaskPlotter(), cache=get_plot_cache())
 
     @provider
     def provide_colors(self) -> Colors:
@@ -465,37 +507,74 @@ class FlaskModule(PresenterModule):
             interfaces.PlanCooperationRepository,  # type: ignore
             to=ClassProvider(PlanCooperationRepository),
         )
-        binder.bind(TokenService, to=ClassProvider(FlaskTokenService))  # type: ignore
+        binder.bind(FlaskTokenService, scope=singleton)
         binder.bind(UserAddressBook, to=ClassProvider(inject(UserAddressBookImpl)))  # type: ignore
         binder.bind(
             interfaces.PayoutFactorRepository,  # type: ignore
             to=ClassProvider(PayoutFactorRepository),
         )
+        binder.bind(
+            interfaces.PayoutLockRepository,  # type: ignore
+            to=ClassProvider(PayoutLockRepository),
+        )
+        binder.bind(
+            interfaces.StatisticsRepository,  # type: ignore
+            to=ClassProvider(StatisticsRepository),
+        )
+
+
+def create_injector() -> Injector:
+    return Injector([FlaskModule(), ViewsModule()])
+
+
+def initialize_injector(app: Flask) -> None:
+    """Create the injector of the application. Routes and commands
+    resolve their dependencies from it, and from child injectors for
+    additional modules.
+    """
+    app.extensions["injector"] = create_injector()
+    app.extensions["child_injectors"] = dict()
+    app.teardown_request(clear_request_scope)
+
+
+def get_injector(modules: Sequence[Module] = ()) -> Injector:
+    """Return the injector of the current application. If modules are
+    given, return a child injector with these modules. There is one
+    child injector per combination of module types.
+    """
+    injector: Injector = current_app.extensions["injector"]
+    if not modules:
+        return injector
+    children: Dict[Tuple[Type[Module], ...], Injector] = current_app.extensions[
+        "child_injectors"
+    ]
+    key = tuple(type(module) for module in modules)
+    child = children.get(key)
+    if child is None:
+        child = injector.create_child_injector(list(modules))
+        children[key] = child
+    return child
 
 
 class with_injection:
     def __init__(self, modules: Optional[List[Module]] = None) -> None:
         self._modules = modules if modules is not None else []
-        all_modules: List[Module] = []
-        all_modules.append(FlaskModule())
-        all_modules.append(ViewsModule())
-        all_modules += self._modules
-        self._injector = Injector(all_modules)
 
     def __call__(self, original_function):
         """When you wrap a function, make sure that the parameters to be
         injected come after the the parameters that the caller should
         provide.
         """
+        injected_function = inject(original_function)
 
         @wraps(original_function)
         def wrapped_function(*args, **kwargs):
-            return self._injector.call_with_injection(
-                inject(original_function), args=args, kwargs=kwargs
+            return self.injector.call_with_injection(
+                injected_function, args=args, kwargs=kwargs
             )
 
         return wrapped_function
 
     @property
     def injector(self) -> Injector:
-        return self._injector
+        return get_injector(self._modules)
@@ -0,0 +1,35 @@
+from typing import Any, Dict, Type, TypeVar
+
+from flask import g, has_app_context
+from injector import InstanceProvider, Provider, Scope, ScopeDecorator
+
+T = TypeVar("T")
+
+
+class RequestScope(Scope):
+    """Provide one instance per request. Instances are kept in the
+    application context and dropped when the request is torn down.
+    Every injector keeps its own instances. Outside of an application
+    context every lookup creates a new instance.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        if not has_app_context():
+            return provider
+        scopes: Dict[RequestScope, Dict[Any, Provider]] = g.setdefault(
+            "request_scope", dict()
+        )
+        instances = scopes.setdefault(self, dict())
+        try:
+            return instances[key]
+        except KeyError:
+            instance_provider = InstanceProvider(provider.get(self.injector))
+            instances[key] = instance_provider
+            return instance_provider
+
+
+def clear_request_scope(exception: Any = None) -> None:
+    g.pop("request_scope", None)
+
+
+request_scope = ScopeDecorator(RequestScope)
@@ -1,7 +1,8 @@
 from os import environ, path
 
 DEBUG = True
-DEBUG_DETAILS = environ.get("DEBUG_DETAILS") in ("true", "True", "1", "t")
+METRICS_LOG_REQUESTS = environ.get("DEBUG_DETAILS") in ("true", "True", "1", "t")
+METRICS_TOKEN = environ.get("METRICS_TOKEN")
 TESTING = True
 SQLALCHEMY_DATABASE_URI = environ.get("DEV_DATABASE_URI")
 SQLALCHEMY_ECHO = False
@@ -1,17 +1,24 @@
+from __future__ import annotations
+
 import io
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-from matplotlib.figure import Figure
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class FlaskPlotter:
+    """Render plots with matplotlib. Importing matplotlib takes longer
+    than importing the rest of the application, so it is imported when
+    the first plot is rendered.
+    """
+
     def create_line_plot(
         self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
     ) -> bytes:
-        fig = Figure()
+        fig = self._create_figure()
         ax = fig.subplots()
         ax.axhline(linestyle="--", color="black")
         ax.plot(x, y)
@@ -26,7 +33,7 @@ class FlaskPlotter:
         fig_size: Tuple[int, int],
         y_label: Optional[str],
     ) -> bytes:
-        fig = Figure()
+        fig = self._create_figure()
         ax = fig.subplots()
         ax.bar(x_coordinates, height_of_bars, color=colors_of_bars)
         ax.spines["top"].set_visible(False)
@@ -36,7 +43,14 @@ class FlaskPlotter:
         fig.set_size_inches(fig_size[0], fig_size[1])
         return self._figure_to_bytes(fig)
 
+    def _create_figure(self) -> Figure:
+        from matplotlib.figure import Figure
+
+        return Figure()
+
     def _figure_to_bytes(self, fig: Figure) -> bytes:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+
         output = io.BytesIO()
         FigureCanvas(fig).print_png(output)
         return output.getvalue()
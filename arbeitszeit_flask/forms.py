@@ -5,6 +5,7 @@ from wtforms import (
     BooleanField,
     DecimalField,
     Form,
+    HiddenField,
     IntegerField,
     PasswordField,
     RadioField,
@@ -72,6 +73,7 @@ class PlanSearchForm(Form):
     select = SelectField(
         trans.lazy_gettext("Search Plans"),
         choices=choices,
+        default="Produktname",
         validators=[validators.DataRequired()],
     )
     search = StringField(
@@ -85,12 +87,14 @@ class PlanSearchForm(Form):
         ("activation", trans.lazy_gettext("Newest")),
         ("company_name", trans.lazy_gettext("Company name")),
         ("price", trans.lazy_gettext("Lowest cost")),
+        ("relevance", trans.lazy_gettext("Best match")),
     ]
     radio = RadioField(
         choices=choices_radio,
         default="activation",
         validators=[FieldMustExist(message=trans.lazy_gettext("Required"))],
     )
+    cursor = HiddenField()
 
     def get_query_string(self) -> str:
         return self.data["search"]
@@ -101,6 +105,9 @@ class PlanSearchForm(Form):
     def get_radio_string(self) -> str:
         return self.data["radio"]
 
+    def get_cursor_string(self) -> str:
+        return self.data["cursor"] or ""
+
 
 class RegisterForm(Form):
     email = StringField(
@@ -236,6 +243,7 @@ class CompanySearchForm(Form):
     select = SelectField(
         trans.lazy_gettext("Search for company"),
         choices=choices,
+        default="Name",
         validators=[validators.DataRequired()],
     )
     search = StringField(
@@ -244,6 +252,7 @@ class CompanySearchForm(Form):
             FieldMustExist(message=trans.lazy_gettext("Required")),
         ],
     )
+    cursor = HiddenField()
 
     def get_query_string(self) -> str:
         return self.data["search"]
@@ -251,6 +260,9 @@ class CompanySearchForm(Form):
     def get_category_string(self) -> str:
         return self.data["select"]
 
+    def get_cursor_string(self) -> str:
+        return self.data["cursor"] or ""
+
 
 class CreateDraftForm(Form):
     prd_name = StringField(
@@ -24,6 +24,7 @@ from arbeitszeit_flask.views import (
     QueryCompaniesView,
     QueryPlansView,
 )
+from arbeitszeit_flask.views.export_transactions_view import ExportTransactionsView
 from arbeitszeit_web.get_company_summary import GetCompanySummarySuccessPresenter
 from arbeitszeit_web.get_coop_summary import GetCoopSummarySuccessPresenter
 from arbeitszeit_web.get_plan_summary_member import GetPlanSummarySuccessPresenter
@@ -68,7 +69,7 @@ def query_plans(
     presenter: QueryPlansPresenter,
 ) -> Response:
     template_name = "member/query_plans.html"
-    search_form = PlanSearchForm(request.form)
+    search_form = PlanSearchForm(request.values)
     view = QueryPlansView(
         search_form,
         query_plans,
@@ -91,7 +92,7 @@ def query_companies(
     presenter: QueryCompaniesPresenter,
 ):
     template_name = "member/query_companies.html"
-    search_form = CompanySearchForm(request.form)
+    search_form = CompanySearchForm(request.values)
     view = QueryCompaniesView(
         search_form,
         query_companies,
@@ -137,18 +138,27 @@ def my_account(
     get_member_account: use_cases.GetMemberAccount,
     template_renderer: UserTemplateRenderer,
 ) -> Response:
-    response = get_member_account(UUID(current_user.id))
+    response = get_member_account(
+        UUID(current_user.id), page_cursor=request.args.get("cursor")
+    )
     return FlaskResponse(
         template_renderer.render_template(
             "member/my_account.html",
             context=dict(
                 all_transactions_info=response.transactions,
                 my_balance=response.balance,
+                next_page_cursor=response.next_page,
+                previous_page_cursor=response.previous_page,
             ),
         )
     )
 
 
+@MemberRoute("/member/my_account/export")
+def export_transactions(view: ExportTransactionsView) -> Response:
+    return view.respond_to_get()
+
+
 @MemberRoute("/member/statistics")
 def statistics(
     get_statistics: use_cases.GetStatistics,
@@ -0,0 +1,247 @@
+"""Per endpoint request metrics. For every request the latency, the
+number and duration of SQL statements and the time spent rendering
+templates are recorded. The rest of the request time is spent in the
+application itself, that is in controllers, use cases and presenters.
+
+The metrics are served in the Prometheus text format at /metrics to
+clients that present METRICS_TOKEN as a bearer token. They are kept in
+the memory of each process. With several worker processes every
+response shows the totals of the worker that happened to answer.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import Flask, Response, abort, current_app, g, has_app_context, request
+from flask.logging import default_handler
+from flask.signals import before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from arbeitszeit_flask.types import Response as AnyResponse
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestMetrics:
+    """Measurements of the request that is currently handled."""
+
+    start: float
+    sql_statements: int = 0
+    sql_seconds: float = 0
+    template_seconds: float = 0
+    template_start: Optional[float] = None
+    status: Optional[int] = None
+
+
+@dataclass
+class EndpointMetrics:
+    requests: int = 0
+    latency_buckets: List[int] = field(
+        default_factory=lambda: [0] * len(LATENCY_BUCKETS)
+    )
+    latency_seconds: float = 0
+    sql_statements: int = 0
+    sql_seconds: float = 0
+    template_seconds: float = 0
+    application_seconds: float = 0
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, EndpointMetrics] = dict()
+        self._lock = Lock()
+
+    def record(
+        self, endpoint: str, latency: float, measurements: RequestMetrics
+    ) -> None:
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics()
+            metrics.requests += 1
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    metrics.latency_buckets[index] += 1
+                    break
+            metrics.latency_seconds += latency
+            metrics.sql_statements += measurements.sql_statements
+            metrics.sql_seconds += measurements.sql_seconds
+            metrics.template_seconds += measurements.template_seconds
+            metrics.application_seconds += max(
+                latency - measurements.sql_seconds - measurements.template_seconds,
+                0,
+            )
+
+    def get(self, endpoint: str) -> Optional[EndpointMetrics]:
+        return self._endpoints.get(endpoint)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = [
+                "# TYPE arbeitszeit_request_duration_seconds histogram",
+            ]
+            for endpoint, metrics in endpoints:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, metrics.latency_buckets):
+                    cumulative += count
+                    lines.append(
+                        "arbeitszeit_request_duration_seconds_bucket"
+                        f'{{endpoint="{endpoint}",le="{bound}"}} {cumulative}'
+                    )
+                lines += [
+                    "arbeitszeit_request_duration_seconds_bucket"
+                    f'{{endpoint="{endpoint}",le="+Inf"}} {metrics.requests}',
+                    "arbeitszeit_request_duration_seconds_sum"
+                    f'{{endpoint="{endpoint}"}} {metrics.latency_seconds}',
+                    "arbeitszeit_request_duration_seconds_count"
+                    f'{{endpoint="{endpoint}"}} {metrics.requests}',
+                ]
+            for name, attribute in [
+                ("sql_statements_total", "sql_statements"),
+                ("sql_seconds_total", "sql_seconds"),
+                ("template_seconds_total", "template_seconds"),
+                ("application_seconds_total", "application_seconds"),
+            ]:
+                lines.append(f"# TYPE arbeitszeit_request_{name} counter")
+                lines += [
+                    f'arbeitszeit_request_{name}{{endpoint="{endpoint}"}} '
+                    f"{getattr(metrics, attribute)}"
+                    for endpoint, metrics in endpoints
+                ]
+        return "\n".join(lines) + "\n"
+
+
+def initialize_metrics(app: Flask) -> None:
+    """Record the metrics of every request handled by the app and serve
+    them at /metrics.
+    """
+    app.extensions["metrics"] = MetricsRegistry()
+    if app.config["METRICS_LOG_REQUESTS"]:
+        # Without a handler the lines would only reach the last resort
+        # handler of the logging module, which drops INFO messages.
+        logger.setLevel(logging.INFO)
+        logger.addHandler(default_handler)
+        logger.propagate = False
+    app.before_request(_start_request)
+    app.after_request(_remember_status)
+    app.teardown_request(_finish_request)
+    before_render_template.connect(_start_template, app)
+    template_rendered.connect(_finish_template, app)
+    app.add_url_rule("/metrics", "metrics", _show_metrics)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return current_app.extensions["metrics"]
+
+
+def _current_request_metrics() -> Optional[RequestMetrics]:
+    if not has_app_context():
+        return None
+    return g.get("request_metrics")
+
+
+def _start_request() -> None:
+    g.request_metrics = RequestMetrics(start=time.perf_counter())
+
+
+def _remember_status(response: AnyResponse) -> AnyResponse:
+    measurements = _current_request_metrics()
+    if measurements is not None:
+        measurements.status = response.status_code
+    return response
+
+
+def _finish_request(exception: Any = None) -> None:
+    measurements = g.pop("request_metrics", None)
+    if measurements is None:
+        return
+    latency = time.perf_counter() - measurements.start
+    endpoint = request.endpoint or "unmatched"
+    get_metrics_registry().record(endpoint, latency, measurements)
+    if current_app.config["METRICS_LOG_REQUESTS"]:
+        logger.info(
+            json.dumps(
+                dict(
+                    endpoint=endpoint,
+                    method=request.method,
+                    status=500 if exception is not None else measurements.status,
+                    seconds=round(latency, 6),
+                    sql_statements=measurements.sql_statements,
+                    sql_seconds=round(measurements.sql_seconds, 6),
+                    template_seconds=round(measurements.template_seconds, 6),
+                )
+            )
+        )
+
+
+def _start_template(sender: Flask, **extra: Any) -> None:
+    measurements = _current_request_metrics()
+    if measurements is not None:
+        measurements.template_start = time.perf_counter()
+
+
+def _finish_template(sender: Flask, **extra: Any) -> None:
+    measurements = _current_request_metrics()
+    if measurements is not None and measurements.template_start is not None:
+        measurements.template_seconds += (
+            time.perf_counter() - measurements.template_start
+        )
+        measurements.template_start = None
+
+
+# The start of a statement is kept in its execution context, which is
+# cheaper to reach than the request metrics in flask.g.
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.metrics_statement_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _finish_statement(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "metrics_statement_start", None)
+    if start is None:
+        return
+    measurements = _current_request_metrics()
+    if measurements is not None:
+        measurements.sql_statements += 1
+        measurements.sql_seconds += time.perf_counter() - start
+
+
+def _show_metrics() -> Response:
+    token = current_app.config["METRICS_TOKEN"]
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(
+        request.headers.get("Authorization", "").encode(), f"Bearer {token}".encode()
+    ):
+        abort(401)
+    return Response(
+        get_metrics_registry().render(),
+        mimetype="text/plain; version=0.0.4",
+    )
@@ -0,0 +1,51 @@
+"""add indexes for frequent lookups
+
+Revision ID: 0f8e2b7c4d91
+Revises: a3c59e1d0f47
+Create Date: 2022-09-05 19:47:31.220614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0f8e2b7c4d91'
+down_revision = 'a3c59e1d0f47'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_account_account_owner_company', 'account', ['account_owner_company']),
+    ('ix_account_account_owner_member', 'account', ['account_owner_member']),
+    ('ix_account_account_owner_social_accounting', 'account', ['account_owner_social_accounting']),
+    ('ix_company_user_id', 'company', ['user_id']),
+    ('ix_company_work_invite_company', 'company_work_invite', ['company']),
+    ('ix_company_work_invite_member', 'company_work_invite', ['member']),
+    ('ix_cooperation_coordinator', 'cooperation', ['coordinator']),
+    ('ix_jobs_company_id', 'jobs', ['company_id']),
+    ('ix_jobs_member_id', 'jobs', ['member_id']),
+    ('ix_member_user_id', 'member', ['user_id']),
+    ('ix_payout_factor_timestamp', 'payout_factor', ['timestamp']),
+    ('ix_plan_cooperation', 'plan', ['cooperation']),
+    ('ix_plan_is_active_expired_is_public_service', 'plan', ['is_active', 'expired', 'is_public_service']),
+    ('ix_plan_planner', 'plan', ['planner']),
+    ('ix_plan_requested_cooperation', 'plan', ['requested_cooperation']),
+    ('ix_purchase_company', 'purchase', ['company']),
+    ('ix_purchase_member', 'purchase', ['member']),
+    ('ix_purchase_plan_id', 'purchase', ['plan_id']),
+    ('ix_transaction_date', 'transaction', ['date']),
+    ('ix_transaction_receiving_account_date', 'transaction', ['receiving_account', 'date']),
+    ('ix_transaction_sending_account_date', 'transaction', ['sending_account', 'date']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
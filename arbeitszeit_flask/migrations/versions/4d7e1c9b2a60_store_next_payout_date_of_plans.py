@@ -0,0 +1,56 @@
+"""store next payout date of plans and drop active_days
+
+Revision ID: 4d7e1c9b2a60
+Revises: 9c3f6a2d8e15
+Create Date: 2022-09-23 14:05:31.774190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d7e1c9b2a60'
+down_revision = '9c3f6a2d8e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('plan', sa.Column('next_payout_date', sa.DateTime(), nullable=True))
+    # Plans that were activated before the payout run set their
+    # expiration date get it from their timeframe now.
+    op.execute(
+        """
+        UPDATE plan
+        SET expiration_date = activation_date + timeframe * interval '1 day'
+        WHERE activation_date IS NOT NULL AND expiration_date IS NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE plan
+        SET next_payout_date = activation_date + payout_count * interval '1 day'
+        WHERE activation_date IS NOT NULL
+        """
+    )
+    op.create_index('ix_plan_is_active_expiration_date', 'plan', ['is_active', 'expiration_date'], unique=False)
+    op.create_index('ix_plan_is_active_next_payout_date', 'plan', ['is_active', 'next_payout_date'], unique=False)
+    op.drop_column('plan', 'active_days')
+
+
+def downgrade():
+    op.add_column('plan', sa.Column('active_days', sa.Integer(), autoincrement=False, nullable=True))
+    op.execute(
+        """
+        UPDATE plan
+        SET active_days = LEAST(
+            timeframe,
+            GREATEST(EXTRACT(DAY FROM now() - activation_date), 0)
+        )
+        WHERE activation_date IS NOT NULL
+        """
+    )
+    op.drop_index('ix_plan_is_active_next_payout_date', table_name='plan')
+    op.drop_index('ix_plan_is_active_expiration_date', table_name='plan')
+    op.drop_column('plan', 'next_payout_date')
@@ -0,0 +1,30 @@
+"""add full text search index for plans
+
+Revision ID: 5b1d9e3a7c20
+Revises: 0f8e2b7c4d91
+Create Date: 2022-09-08 20:12:45.831290
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1d9e3a7c20'
+down_revision = '0f8e2b7c4d91'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_plan_search_document',
+        'plan',
+        [sa.text("to_tsvector('simple', prd_name || ' ' || description)")],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('ix_plan_search_document', table_name='plan')
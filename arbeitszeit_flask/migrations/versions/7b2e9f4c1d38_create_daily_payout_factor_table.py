@@ -0,0 +1,52 @@
+"""create daily payout factor table
+
+Revision ID: 7b2e9f4c1d38
+Revises: 4d7e1c9b2a60
+Create Date: 2022-09-26 10:21:08.413592
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e9f4c1d38'
+down_revision = '4d7e1c9b2a60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_payout_factor',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(), nullable=False),
+    sa.Column('minimum', sa.Numeric(), nullable=False),
+    sa.Column('maximum', sa.Numeric(), nullable=False),
+    sa.Column('last', sa.Numeric(), nullable=False),
+    sa.Column('last_timestamp', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    # Summarize the payout factors stored so far. The last payout
+    # factor of a day is the first one in descending order.
+    op.execute(
+        """
+        INSERT INTO daily_payout_factor
+            (day, count, total, minimum, maximum, last, last_timestamp)
+        SELECT DISTINCT ON (CAST("timestamp" AS DATE))
+            CAST("timestamp" AS DATE),
+            count(*) OVER day_window,
+            sum(payout_factor) OVER day_window,
+            min(payout_factor) OVER day_window,
+            max(payout_factor) OVER day_window,
+            payout_factor,
+            "timestamp"
+        FROM payout_factor
+        WINDOW day_window AS (PARTITION BY CAST("timestamp" AS DATE))
+        ORDER BY CAST("timestamp" AS DATE), "timestamp" DESC
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('daily_payout_factor')
@@ -0,0 +1,53 @@
+"""add payout_day to transaction
+
+Revision ID: 9c3f6a2d8e15
+Revises: e2b8f5d1a4c6
+Create Date: 2022-09-20 09:12:44.301876
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3f6a2d8e15'
+down_revision = 'e2b8f5d1a4c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('transaction', sa.Column('payout_day', sa.Integer(), nullable=True))
+    # Wage payouts are the transactions from social accounting to the
+    # work account of the planner. They are numbered per plan in the
+    # order they were made.
+    op.execute(
+        """
+        UPDATE "transaction"
+        SET payout_day = payouts.payout_day
+        FROM (
+            SELECT "transaction".id,
+                row_number() OVER (
+                    PARTITION BY "transaction".plan_id
+                    ORDER BY "transaction".date, "transaction".id
+                ) - 1 AS payout_day
+            FROM "transaction"
+            JOIN account AS sender
+                ON sender.id = "transaction".sending_account
+            JOIN account AS receiver
+                ON receiver.id = "transaction".receiving_account
+            WHERE "transaction".plan_id IS NOT NULL
+                AND sender.account_owner_social_accounting IS NOT NULL
+                AND receiver.account_type = 'a'
+        ) AS payouts
+        WHERE "transaction".id = payouts.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_transaction_plan_id_payout_day', 'transaction', ['plan_id', 'payout_day']
+    )
+
+
+def downgrade():
+    op.drop_constraint('uq_transaction_plan_id_payout_day', 'transaction', type_='unique')
+    op.drop_column('transaction', 'payout_day')
@@ -0,0 +1,47 @@
+"""add balance column to account table
+
+Revision ID: a3c59e1d0f47
+Revises: 4444372436e2
+Create Date: 2022-09-03 14:12:08.412903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c59e1d0f47'
+down_revision = '4444372436e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The balance of every account is backfilled from the transaction
+    # table. Transactions where sending and receiving account are the
+    # same do not change the balance.
+    op.add_column('account', sa.Column('balance', sa.Numeric(), nullable=True))
+    with op.batch_alter_table('account') as batch_op:
+        batch_op.execute("""
+            UPDATE account
+            SET balance = (
+                COALESCE((
+                    SELECT SUM(t.amount_received)
+                    FROM "transaction" AS t
+                    WHERE t.receiving_account = account.id
+                    AND t.sending_account != account.id
+                ), 0)
+                - COALESCE((
+                    SELECT SUM(t.amount_sent)
+                    FROM "transaction" AS t
+                    WHERE t.sending_account = account.id
+                    AND t.receiving_account != account.id
+                ), 0)
+            )
+        """)
+        batch_op.alter_column('balance', nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('account') as batch_op:
+        batch_op.drop_column('balance')
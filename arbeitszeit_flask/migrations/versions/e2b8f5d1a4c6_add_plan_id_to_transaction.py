@@ -0,0 +1,38 @@
+"""add plan_id to transaction
+
+Revision ID: e2b8f5d1a4c6
+Revises: c7e4a2f9b813
+Create Date: 2022-09-12 18:41:09.556203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b8f5d1a4c6'
+down_revision = 'c7e4a2f9b813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('transaction', sa.Column('plan_id', sa.String(), nullable=True))
+    op.create_index(op.f('ix_transaction_plan_id'), 'transaction', ['plan_id'], unique=False)
+    op.create_foreign_key('transaction_plan_id_fkey', 'transaction', 'plan', ['plan_id'], ['id'])
+    # Transactions for plans carry the plan id in their purpose, e.g.
+    # "Plan-Id: <uuid>".
+    op.execute(
+        """
+        UPDATE "transaction"
+        SET plan_id = substring(purpose from '([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})')
+        WHERE substring(purpose from '([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})')
+            IN (SELECT id FROM plan)
+        """
+    )
+
+
+def downgrade():
+    op.drop_constraint('transaction_plan_id_fkey', 'transaction', type_='foreignkey')
+    op.drop_index(op.f('ix_transaction_plan_id'), table_name='transaction')
+    op.drop_column('transaction', 'plan_id')
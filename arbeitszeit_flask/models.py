@@ -6,6 +6,7 @@ import uuid
 from enum import Enum
 
 from flask_login import UserMixin
+from sqlalchemy import DDL, event
 
 from arbeitszeit import entities
 from arbeitszeit_flask.extensions import db
@@ -32,14 +33,14 @@ class SocialAccounting(UserMixin, db.Model):
 # Association table Company - Member
 jobs = db.Table(
     "jobs",
-    db.Column("member_id", db.String, db.ForeignKey("member.id")),
-    db.Column("company_id", db.String, db.ForeignKey("company.id")),
+    db.Column("member_id", db.String, db.ForeignKey("member.id"), index=True),
+    db.Column("company_id", db.String, db.ForeignKey("company.id"), index=True),
 )
 
 
 class Member(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    user_id = db.Column(db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.ForeignKey("user.id"), nullable=False, index=True)
     name = db.Column(db.String(1000), nullable=False)
     registered_on = db.Column(db.DateTime, nullable=False)
     confirmed_on = db.Column(db.DateTime, nullable=True)
@@ -58,14 +59,14 @@ class Member(UserMixin, db.Model):
 
 class Company(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    user_id = db.Column(db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.ForeignKey("user.id"), nullable=False, index=True)
     name = db.Column(db.String(1000), nullable=False)
     registered_on = db.Column(db.DateTime, nullable=False)
     confirmed_on = db.Column(db.DateTime, nullable=True)
 
     user = db.relationship("User", lazy=True, uselist=False, backref="company")
     plans = db.relationship("Plan", lazy="dynamic", backref="company")
-    accounts = db.relationship("Account", lazy="dynamic", backref="company")
+    accounts = db.relationship("Account", lazy=True, backref="company")
     purchases = db.relationship("Purchase", lazy="dynamic")
     drafts = db.relationship("PlanDraft", lazy="dynamic")
 
@@ -100,9 +101,24 @@ class PlanDraft(UserMixin, db.Model):
 
 
 class Plan(UserMixin, db.Model):
+    __table_args__ = (
+        db.Index(
+            "ix_plan_is_active_expired_is_public_service",
+            "is_active",
+            "expired",
+            "is_public_service",
+        ),
+        # The payout run only reads the active plans that expired or
+        # are due for their next payout.
+        db.Index("ix_plan_is_active_expiration_date", "is_active", "expiration_date"),
+        db.Index("ix_plan_is_active_next_payout_date", "is_active", "next_payout_date"),
+    )
+
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     plan_creation_date = db.Column(db.DateTime, nullable=False)
-    planner = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    planner = db.Column(
+        db.String, db.ForeignKey("company.id"), nullable=False, index=True
+    )
     costs_p = db.Column(db.Numeric(), nullable=False)
     costs_r = db.Column(db.Numeric(), nullable=False)
     costs_a = db.Column(db.Numeric(), nullable=False)
@@ -118,16 +134,53 @@ class Plan(UserMixin, db.Model):
     activation_date = db.Column(db.DateTime, nullable=True)
     expired = db.Column(db.Boolean, nullable=False, default=False)
     expiration_date = db.Column(db.DateTime, nullable=True)
-    active_days = db.Column(db.Integer, nullable=True)
     payout_count = db.Column(db.Integer, nullable=False, default=0)
+    next_payout_date = db.Column(db.DateTime, nullable=True)
     is_available = db.Column(db.Boolean, nullable=False, default=True)
     requested_cooperation = db.Column(
-        db.String, db.ForeignKey("cooperation.id"), nullable=True
+        db.String, db.ForeignKey("cooperation.id"), nullable=True, index=True
+    )
+    cooperation = db.Column(
+        db.String, db.ForeignKey("cooperation.id"), nullable=True, index=True
     )
-    cooperation = db.Column(db.String, db.ForeignKey("cooperation.id"), nullable=True)
     hidden_by_user = db.Column(db.Boolean, nullable=False, default=False)
 
 
+# Full text search over product name and description of plans, see
+# arbeitszeit_flask.database.search. PostgreSQL searches an expression
+# index. SQLite keeps an FTS5 table that triggers update together with
+# the plan table.
+PLAN_SEARCH_DDL = {
+    "postgresql": [
+        "CREATE INDEX ix_plan_search_document ON plan USING gin "
+        "(to_tsvector('simple', prd_name || ' ' || description))",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE plan_search "
+        "USING fts5(prd_name, description, content='plan')",
+        "CREATE TRIGGER plan_search_insert AFTER INSERT ON plan BEGIN "
+        "INSERT INTO plan_search(rowid, prd_name, description) "
+        "VALUES (new.rowid, new.prd_name, new.description); END",
+        "CREATE TRIGGER plan_search_delete AFTER DELETE ON plan BEGIN "
+        "INSERT INTO plan_search(plan_search, rowid, prd_name, description) "
+        "VALUES ('delete', old.rowid, old.prd_name, old.description); END",
+        "CREATE TRIGGER plan_search_update "
+        "AFTER UPDATE OF prd_name, description ON plan BEGIN "
+        "INSERT INTO plan_search(plan_search, rowid, prd_name, description) "
+        "VALUES ('delete', old.rowid, old.prd_name, old.description); "
+        "INSERT INTO plan_search(rowid, prd_name, description) "
+        "VALUES (new.rowid, new.prd_name, new.description); END",
+    ],
+}
+for dialect, statements in PLAN_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(
+            Plan.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect=dialect),
+        )
+
+
 class AccountTypes(Enum):
     p = "p"
     r = "r"
@@ -140,15 +193,18 @@ class AccountTypes(Enum):
 class Account(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     account_owner_social_accounting = db.Column(
-        db.String, db.ForeignKey("social_accounting.id"), nullable=True
+        db.String, db.ForeignKey("social_accounting.id"), nullable=True, index=True
     )
     account_owner_company = db.Column(
-        db.String, db.ForeignKey("company.id"), nullable=True
+        db.String, db.ForeignKey("company.id"), nullable=True, index=True
     )
     account_owner_member = db.Column(
-        db.String, db.ForeignKey("member.id"), nullable=True
+        db.String, db.ForeignKey("member.id"), nullable=True, index=True
     )
     account_type = db.Column(db.Enum(AccountTypes), nullable=False)
+    # Running balance of the account. It is kept in step with the
+    # transaction table by TransactionRepository.create_transaction.
+    balance = db.Column(db.Numeric(), nullable=False, default=0)
     transactions_sent = db.relationship(
         "Transaction",
         foreign_keys="Transaction.sending_account",
@@ -164,8 +220,18 @@ class Account(UserMixin, db.Model):
 
 
 class Transaction(UserMixin, db.Model):
+    __table_args__ = (
+        db.Index("ix_transaction_sending_account_date", "sending_account", "date"),
+        db.Index("ix_transaction_receiving_account_date", "receiving_account", "date"),
+        # A plan is paid out at most once per day, even if payout runs
+        # overlap or are retried.
+        db.UniqueConstraint(
+            "plan_id", "payout_day", name="uq_transaction_plan_id_payout_day"
+        ),
+    )
+
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    date = db.Column(db.DateTime, nullable=False)
+    date = db.Column(db.DateTime, nullable=False, index=True)
     sending_account = db.Column(db.String, db.ForeignKey("account.id"), nullable=False)
     receiving_account = db.Column(
         db.String, db.ForeignKey("account.id"), nullable=False
@@ -173,15 +239,21 @@ class Transaction(UserMixin, db.Model):
     amount_sent = db.Column(db.Numeric(), nullable=False)
     amount_received = db.Column(db.Numeric(), nullable=False)
     purpose = db.Column(db.String(1000), nullable=True)  # Verwendungszweck
+    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=True, index=True)
+    # Number of the active day of the plan that a wage payout pays for,
+    # counted from 0. Empty for all other transactions.
+    payout_day = db.Column(db.Integer, nullable=True)
 
 
 class Purchase(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
     purchase_date = db.Column(db.DateTime, nullable=False)
-    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=False)
+    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=False, index=True)
     type_member = db.Column(db.Boolean, nullable=False)
-    company = db.Column(db.String, db.ForeignKey("company.id"), nullable=True)
-    member = db.Column(db.String, db.ForeignKey("member.id"), nullable=True)
+    company = db.Column(
+        db.String, db.ForeignKey("company.id"), nullable=True, index=True
+    )
+    member = db.Column(db.String, db.ForeignKey("member.id"), nullable=True, index=True)
     price_per_unit = db.Column(db.Numeric(), nullable=False)
     amount = db.Column(db.Integer, nullable=False)
     purpose = db.Column(db.Enum(entities.PurposesOfPurchases), nullable=False)
@@ -189,8 +261,12 @@ class Purchase(UserMixin, db.Model):
 
 class CompanyWorkInvite(db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    company = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
-    member = db.Column(db.String, db.ForeignKey("member.id"), nullable=False)
+    company = db.Column(
+        db.String, db.ForeignKey("company.id"), nullable=False, index=True
+    )
+    member = db.Column(
+        db.String, db.ForeignKey("member.id"), nullable=False, index=True
+    )
 
 
 class Cooperation(db.Model):
@@ -198,7 +274,9 @@ class Cooperation(db.Model):
     creation_date = db.Column(db.DateTime, nullable=False)
     name = db.Column(db.String(100), nullable=False)
     definition = db.Column(db.String(5000), nullable=False)
-    coordinator = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    coordinator = db.Column(
+        db.String, db.ForeignKey("company.id"), nullable=False, index=True
+    )
 
     plans = db.relationship(
         "Plan", foreign_keys="Plan.cooperation", lazy="dynamic", backref="coop"
@@ -207,5 +285,35 @@ class Cooperation(db.Model):
 
 class PayoutFactor(UserMixin, db.Model):
     id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    timestamp = db.Column(db.DateTime, nullable=False)
+    timestamp = db.Column(db.DateTime, nullable=False, index=True)
     payout_factor = db.Column(db.Numeric(), nullable=False)
+
+
+class DailyPayoutFactor(db.Model):
+    """Rollup of the payout factors of one day. It is updated whenever
+    a payout factor is stored and outlives the hourly rows.
+    """
+
+    day = db.Column(db.Date, primary_key=True)
+    count = db.Column(db.Integer, nullable=False)
+    total = db.Column(db.Numeric(), nullable=False)
+    minimum = db.Column(db.Numeric(), nullable=False)
+    maximum = db.Column(db.Numeric(), nullable=False)
+    last = db.Column(db.Numeric(), nullable=False)
+    last_timestamp = db.Column(db.DateTime, nullable=False)
+
+
+class Statistics(UserMixin, db.Model):
+    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    timestamp = db.Column(db.DateTime, nullable=False, index=True)
+    registered_companies_count = db.Column(db.Integer, nullable=False)
+    registered_members_count = db.Column(db.Integer, nullable=False)
+    cooperations_count = db.Column(db.Integer, nullable=False)
+    certificates_count = db.Column(db.Numeric(), nullable=False)
+    available_product = db.Column(db.Numeric(), nullable=False)
+    active_plans_count = db.Column(db.Integer, nullable=False)
+    active_plans_public_count = db.Column(db.Integer, nullable=False)
+    avg_timeframe = db.Column(db.Numeric(), nullable=False)
+    planned_work = db.Column(db.Numeric(), nullable=False)
+    planned_resources = db.Column(db.Numeric(), nullable=False)
+    planned_means = db.Column(db.Numeric(), nullable=False)
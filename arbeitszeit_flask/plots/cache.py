@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from threading import Lock
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from flask import current_app
+
+from arbeitszeit_web.plotter import Plotter
+
+
+class PlotCache:
+    """Rendered plots by key. The most recently used plots are kept in
+    memory up to a total of max_memory_bytes. If a directory is given,
+    every plot is also written to disk, so that plots survive a restart
+    and are shared between worker processes. The least recently used
+    files are deleted when the directory holds more than
+    max_disk_bytes.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ) -> None:
+        self.max_memory_bytes = max_memory_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._plots: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            plot = self._plots.get(key)
+            if plot is not None:
+                self._plots.move_to_end(key)
+                return plot
+        plot = self._read_from_disk(key)
+        if plot is not None:
+            self._remember(key, plot)
+        return plot
+
+    def set(self, key: str, plot: bytes) -> None:
+        self._remember(key, plot)
+        self._write_to_disk(key, plot)
+
+    def _remember(self, key: str, plot: bytes) -> None:
+        if len(plot) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._plots.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._plots[key] = plot
+            self._memory_bytes += len(plot)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._plots.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _read_from_disk(self, key: str) -> Optional[bytes]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as plot_file:
+                plot = plot_file.read()
+            # The modification time tells which files were used last.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return plot
+
+    def _write_to_disk(self, key: str, plot: bytes) -> None:
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # Readers in other processes must never see a partial file.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as plot_file:
+                plot_file.write(plot)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self._evict_from_disk()
+
+    def _evict_from_disk(self) -> None:
+        assert self.directory is not None
+        if self.max_disk_bytes is None:
+            return
+        plots: List[Tuple[float, int, str]] = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".png"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Deleted by another process in the meantime.
+                continue
+            plots.append((stat.st_mtime, stat.st_size, entry.path))
+        disk_bytes = sum(size for _, size, _ in plots)
+        for _, size, path in sorted(plots):
+            if disk_bytes <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            disk_bytes -= size
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.png")
+
+
+def get_plot_cache() -> PlotCache:
+    """Return the plot cache of the current application. It is created
+    from the configuration on first use.
+    """
+    cache = current_app.extensions.get("plot_cache")
+    if cache is None:
+        cache = PlotCache(
+            max_memory_bytes=current_app.config["PLOT_CACHE_MAX_BYTES"],
+            directory=current_app.config["PLOT_CACHE_DIRECTORY"],
+            max_disk_bytes=current_app.config["PLOT_CACHE_MAX_DISK_BYTES"],
+        )
+        current_app.extensions["plot_cache"] = cache
+    return cache
+
+
+def plot_cache_key(plot_type: str, *arguments: Any) -> str:
+    """Hash everything that a plot is rendered from. Labels are
+    translated before plotting, so the key changes with the locale.
+    """
+    serialized = json.dumps([plot_type, *arguments], default=_serialize)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _serialize(value: Any) -> str:
+    if isinstance(value, (datetime, Decimal)):
+        return str(value)
+    raise TypeError(f"Cannot use {type(value)} in a plot cache key")
+
+
+@dataclass
+class CachingPlotter:
+    plotter: Plotter
+    cache: PlotCache
+
+    def create_line_plot(
+        self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
+    ) -> bytes:
+        return self._get_or_render(
+            plot_cache_key("line", x, y, fig_size),
+            lambda: self.plotter.create_line_plot(x=x, y=y, fig_size=fig_size),
+        )
+
+    def create_bar_plot(
+        self,
+        x_coordinates: List[Union[int, str]],
+        height_of_bars: List[Decimal],
+        colors_of_bars: List[str],
+        fig_size: Tuple[int, int],
+        y_label: Optional[str],
+    ) -> bytes:
+        return self._get_or_render(
+            plot_cache_key(
+                "bar", x_coordinates, height_of_bars, colors_of_bars, fig_size, y_label
+            ),
+            lambda: self.plotter.create_bar_plot(
+                x_coordinates=x_coordinates,
+                height_of_bars=height_of_bars,
+                colors_of_bars=colors_of_bars,
+                fig_size=fig_size,
+                y_label=y_label,
+            ),
+        )
+
+    def _get_or_render(self, key: str, render: Callable[[], bytes]) -> bytes:
+        plot = self.cache.get(key)
+        if plot is None:
+            plot = render()
+            self.cache.set(key, plot)
+        return plot
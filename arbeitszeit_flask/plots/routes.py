@@ -1,9 +1,12 @@
+import hashlib
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
 from flask import Blueprint, Response, request
 from flask_login import login_required
 
+from arbeitszeit.use_cases.get_payout_factor_history import GetPayoutFactorHistory
 from arbeitszeit.use_cases.show_a_account_details import ShowAAccountDetailsUseCase
 from arbeitszeit.use_cases.show_p_account_details import ShowPAccountDetailsUseCase
 from arbeitszeit.use_cases.show_prd_account_details import ShowPRDAccountDetailsUseCase
@@ -17,6 +20,20 @@ plots = Blueprint(
     "plots", __name__, template_folder="templates", static_folder="static"
 )
 
+PAYOUT_FACTOR_HISTORY_DAYS = 365
+
+
+def png_response(png: bytes) -> Response:
+    """Browsers have to revalidate plots and get a 304 response without
+    the image if it did not change.
+    """
+    response = Response(png, mimetype="image/png")
+    response.set_etag(hashlib.sha256(png).hexdigest())
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.make_conditional(request)
+    return response
+
 
 @plots.route("/plots/global_barplot_for_certificates")
 @with_injection()
@@ -39,7 +56,7 @@ def global_barplot_for_certificates(
         fig_size=(5, 4),
         y_label=translator.gettext("Hours"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/global_barplot_for_means_of_production")
@@ -70,7 +87,7 @@ def global_barplot_for_means_of_production(
         fig_size=(5, 4),
         y_label=translator.gettext("Hours"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/global_barplot_for_plans")
@@ -89,7 +106,7 @@ def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: C
         fig_size=(5, 4),
         y_label=translator.gettext("Amount"),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/line_plot_of_company_prd_account")
@@ -105,7 +122,7 @@ def line_plot_of_company_prd_account(
         x=use_case_response.plot.timestamps,
         y=use_case_response.plot.accumulated_volumes,
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/line_plot_of_company_r_account")
@@ -121,7 +138,7 @@ def line_plot_of_company_r_account(
         x=use_case_response.plot.timestamps,
         y=use_case_response.plot.accumulated_volumes,
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/line_plot_of_company_p_account")
@@ -137,7 +154,7 @@ def line_plot_of_company_p_account(
         x=use_case_response.plot.timestamps,
         y=use_case_response.plot.accumulated_volumes,
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
 
 
 @plots.route("/plots/line_plot_of_company_a_account")
@@ -153,4 +170,24 @@ def line_plot_of_company_a_account(
         x=use_case_response.plot.timestamps,
         y=use_case_response.plot.accumulated_volumes,
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+    return png_response(png)
+
+
+@plots.route("/plots/line_plot_of_payout_factor_history")
+@with_injection()
+@login_required
+def line_plot_of_payout_factor_history(
+    plotter: Plotter,
+    use_case: GetPayoutFactorHistory,
+):
+    use_case_response = use_case(
+        GetPayoutFactorHistory.Request(days=PAYOUT_FACTOR_HISTORY_DAYS)
+    )
+    png = plotter.create_line_plot(
+        x=[
+            datetime.combine(day.day, datetime.min.time())
+            for day in use_case_response.days
+        ],
+        y=[day.average for day in use_case_response.days],
+    )
+    return png_response(png)
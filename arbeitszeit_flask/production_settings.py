@@ -15,6 +15,7 @@ if SQLALCHEMY_DATABASE_URI.startswith("postgres://"):
 SECRET_KEY = environ.get("MY_SECRET_KEY")
 SECURITY_PASSWORD_SALT = environ.get("SECURITY_PASSWORD_SALT")
 SERVER_NAME = environ.get("ARBEITSZEIT_APP_SERVER_NAME")
+METRICS_TOKEN = environ.get("METRICS_TOKEN")
 STATIC_FOLDER = "static"
 TEMPLATES_FOLDER = "templates"
 
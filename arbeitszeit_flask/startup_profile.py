@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+STARTUP_MODULES = ["arbeitszeit_flask", "arbeitszeit_flask.commands"]
+
+_MARKER = "startup-profile"
+
+
+@dataclass
+class ImportTime:
+    module: str
+    depth: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+def measure_import_times(modules: Sequence[str] = STARTUP_MODULES) -> List[ImportTime]:
+    """Import the given modules in a fresh interpreter and return how
+    long every module took to import, in the order reported by python's
+    -X importtime.
+    """
+    code = "; ".join(
+        [f"import sys; sys.stderr.write('{_MARKER}\\n')"]
+        + [f"import {module}" for module in modules]
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = process.stderr.splitlines()
+    start = lines.index(_MARKER) + 1
+    return parse_import_times(lines[start:])
+
+
+def parse_import_times(lines: Iterable[str]) -> List[ImportTime]:
+    import_times: List[ImportTime] = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, name = line.split(":", 1)[1].split("|")
+        if not self_time.strip().isdigit():
+            # the header line
+            continue
+        import_times.append(
+            ImportTime(
+                module=name.strip(),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+                self_seconds=int(self_time) / 1e6,
+                cumulative_seconds=int(cumulative_time) / 1e6,
+            )
+        )
+    return import_times
+
+
+def get_total_import_time(import_times: Iterable[ImportTime]) -> float:
+    return sum(
+        import_time.cumulative_seconds
+        for import_time in import_times
+        if import_time.depth == 0
+    )
@@ -0,0 +1,555 @@
+"""Fill the database with a large, randomly generated but repeatable
+world of companies, members, plans, cooperations and transactions.
+Rows are written with batched inserts, bypassing the repositories, so
+that production sized datasets can be created in minutes.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam
+from sqlalchemy.sql import Executable
+from werkzeug.security import generate_password_hash
+
+from arbeitszeit.entities import PurposesOfPurchases
+from arbeitszeit_flask import models
+
+SYNTHETIC_PASSWORD = "synthetic"
+
+PLAN_TIMEFRAMES = [7, 14, 30, 30, 60, 90, 90, 180, 365]
+
+WORDS = [
+    "apple",
+    "bread",
+    "bicycle",
+    "chair",
+    "cotton",
+    "electricity",
+    "fabric",
+    "flour",
+    "furniture",
+    "glass",
+    "hammer",
+    "heating",
+    "housing",
+    "lamp",
+    "milk",
+    "paper",
+    "potato",
+    "repair",
+    "shoe",
+    "software",
+    "steel",
+    "table",
+    "timber",
+    "tomato",
+    "transport",
+    "water",
+    "wool",
+]
+
+
+@dataclass
+class SyntheticWorld:
+    companies: int = 5_000
+    members: int = 100_000
+    plans: int = 50_000
+    cooperations: int = 500
+    transactions: int = 10_000_000
+    days: int = 365
+
+
+@dataclass
+class _Company:
+    id: str
+    means_account: str
+    raw_material_account: str
+    work_account: str
+    product_account: str
+    workers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Plan:
+    id: str
+    planner: _Company
+    activation_date: datetime
+    end_date: datetime
+    price_per_unit: Decimal
+
+
+class SyntheticDataSeeder:
+    """Generate a world of the given size. The same seed always produces
+    the same rows, including their ids. Every synthetic user can log in
+    with the password "synthetic".
+
+    Plans are self approved at random days within the last world.days
+    days. They receive their approval credits and one payout per active
+    day, as `flask payout` would have done. The remaining transactions
+    are consumer purchases, purchases of means of production and wages.
+    Account balances are written at the end, followed by a payout factor
+    for every hour of the history and its daily summaries.
+    """
+
+    def __init__(
+        self,
+        db: SQLAlchemy,
+        social_accounting_account: UUID,
+        now: datetime,
+        world: SyntheticWorld,
+        seed: int = 0,
+        batch_size: int = 10_000,
+        echo: Callable[[str], None] = lambda message: None,
+    ) -> None:
+        self.db = db
+        self.social_accounting_account = str(social_accounting_account)
+        self.now = now
+        self.world = world
+        self.seed = seed
+        self.batch_size = batch_size
+        self.echo = echo
+        self.random = random.Random(seed)
+        self.password = generate_password_hash(SYNTHETIC_PASSWORD, method="sha256")
+        self.balances: DefaultDict[str, Decimal] = defaultdict(Decimal)
+        self.companies: List[_Company] = []
+        self.companies_by_id: Dict[str, _Company] = dict()
+        self.company_weights: List[float] = []
+        self.members: Dict[str, str] = dict()
+        self.plans: List[_Plan] = []
+        self.transaction_count = 0
+
+    def seed_database(self) -> None:
+        self._create_companies()
+        self._create_members()
+        cooperations = self._create_cooperations()
+        self._create_plans(cooperations)
+        self._create_purchases_and_wages()
+        self._write_balances()
+        self._create_payout_factors()
+
+    def _create_companies(self) -> None:
+        self.echo(f"Creating {self.world.companies} companies")
+        users = []
+        companies = []
+        accounts = []
+        for number in range(self.world.companies):
+            user_id = self._new_id()
+            company = _Company(
+                id=self._new_id(),
+                means_account=self._new_id(),
+                raw_material_account=self._new_id(),
+                work_account=self._new_id(),
+                product_account=self._new_id(),
+            )
+            users.append(
+                dict(
+                    id=user_id,
+                    email=f"company-{number}@seed-{self.seed}.example",
+                    password=self.password,
+                )
+            )
+            companies.append(
+                dict(
+                    id=company.id,
+                    user_id=user_id,
+                    name=f"Company {number}",
+                    registered_on=self._random_date(),
+                    confirmed_on=self.now,
+                )
+            )
+            for account_id, account_type in [
+                (company.means_account, models.AccountTypes.p),
+                (company.raw_material_account, models.AccountTypes.r),
+                (company.work_account, models.AccountTypes.a),
+                (company.product_account, models.AccountTypes.prd),
+            ]:
+                accounts.append(
+                    dict(
+                        id=account_id,
+                        account_owner_company=company.id,
+                        account_type=account_type,
+                        balance=0,
+                    )
+                )
+            self.companies.append(company)
+            self.companies_by_id[company.id] = company
+            # A few large companies and many small ones.
+            self.company_weights.append(self.random.paretovariate(1.2))
+        self._execute_in_batches(models.User.__table__.insert(), users)
+        self._execute_in_batches(models.Company.__table__.insert(), companies)
+        self._execute_in_batches(models.Account.__table__.insert(), accounts)
+        self.db.session.commit()
+
+    def _create_members(self) -> None:
+        self.echo(f"Creating {self.world.members} members")
+        employers = self.random.choices(
+            self.companies, weights=self.company_weights, k=self.world.members
+        )
+        users = []
+        members = []
+        accounts = []
+        jobs = []
+        for number, employer in enumerate(employers):
+            user_id = self._new_id()
+            member_id = self._new_id()
+            account_id = self._new_id()
+            users.append(
+                dict(
+                    id=user_id,
+                    email=f"member-{number}@seed-{self.seed}.example",
+                    password=self.password,
+                )
+            )
+            members.append(
+                dict(
+                    id=member_id,
+                    user_id=user_id,
+                    name=f"Member {number}",
+                    registered_on=self._random_date(),
+                    confirmed_on=self.now,
+                )
+            )
+            accounts.append(
+                dict(
+                    id=account_id,
+                    account_owner_member=member_id,
+                    account_type=models.AccountTypes.member,
+                    balance=0,
+                )
+            )
+            jobs.append(dict(member_id=member_id, company_id=employer.id))
+            employer.workers.append(member_id)
+            self.members[member_id] = account_id
+        self._execute_in_batches(models.User.__table__.insert(), users)
+        self._execute_in_batches(models.Member.__table__.insert(), members)
+        self._execute_in_batches(models.Account.__table__.insert(), accounts)
+        self._execute_in_batches(models.jobs.insert(), jobs)
+        self.db.session.commit()
+
+    def _create_cooperations(self) -> List[str]:
+        self.echo(f"Creating {self.world.cooperations} cooperations")
+        cooperations: List[Dict[str, Any]] = [
+            dict(
+                id=self._new_id(),
+                creation_date=self._random_date(),
+                name=f"Cooperation {number}",
+                definition=self._random_text(12),
+                coordinator=self.random.choice(self.companies).id,
+            )
+            for number in range(self.world.cooperations)
+        ]
+        self._execute_in_batches(models.Cooperation.__table__.insert(), cooperations)
+        self.db.session.commit()
+        return [cooperation["id"] for cooperation in cooperations]
+
+    def _create_plans(self, cooperations: List[str]) -> None:
+        self.echo(f"Creating {self.world.plans} plans with approvals and payouts")
+        planners = self.random.choices(
+            self.companies, weights=self.company_weights, k=self.world.plans
+        )
+        plans = []
+        for number, planner in enumerate(planners):
+            plans.append(self._create_plan(number, planner, cooperations))
+        self._execute_in_batches(models.Plan.__table__.insert(), plans)
+        self._execute_in_batches(
+            models.Transaction.__table__.insert(),
+            (
+                transaction
+                for plan in plans
+                for transaction in self._approve_and_pay_out(plan)
+            ),
+        )
+        self.db.session.commit()
+
+    def _create_plan(
+        self, number: int, planner: _Company, cooperations: List[str]
+    ) -> Dict:
+        activation_date = self._random_date()
+        timeframe = self.random.choice(PLAN_TIMEFRAMES)
+        expiration_date = activation_date + timedelta(days=timeframe)
+        active_days = min((self.now - activation_date).days, timeframe)
+        is_expired = self.now > expiration_date
+        payout_count = active_days if is_expired else active_days + 1
+        is_public_service = self.random.random() < 0.1
+        costs_p = self._random_amount(mu=5, sigma=1.5)
+        costs_r = self._random_amount(mu=5, sigma=1.5)
+        costs_a = self._random_amount(mu=6, sigma=1.5)
+        prd_amount = self.random.randint(1, 1000)
+        plan_id = self._new_id()
+        if not is_public_service:
+            self.plans.append(
+                _Plan(
+                    id=plan_id,
+                    planner=planner,
+                    activation_date=activation_date,
+                    end_date=min(expiration_date, self.now),
+                    price_per_unit=round((costs_p + costs_r + costs_a) / prd_amount, 2),
+                )
+            )
+        return dict(
+            id=plan_id,
+            plan_creation_date=activation_date,
+            planner=planner.id,
+            costs_p=costs_p,
+            costs_r=costs_r,
+            costs_a=costs_a,
+            prd_name=f"{self.random.choice(WORDS).capitalize()} {number}",
+            prd_unit=self.random.choice(["piece", "kg", "hour", "litre"]),
+            prd_amount=prd_amount,
+            description=self._random_text(20),
+            timeframe=timeframe,
+            is_public_service=is_public_service,
+            approval_date=activation_date,
+            approval_reason="approved",
+            is_active=not is_expired,
+            activation_date=activation_date,
+            expired=is_expired,
+            expiration_date=expiration_date,
+            payout_count=payout_count,
+            next_payout_date=activation_date + timedelta(days=payout_count),
+            is_available=True,
+            requested_cooperation=None,
+            cooperation=(
+                self.random.choice(cooperations)
+                if cooperations and not is_public_service and self.random.random() < 0.3
+                else None
+            ),
+            hidden_by_user=False,
+        )
+
+    def _approve_and_pay_out(self, plan: Dict) -> Iterator[Dict]:
+        planner = self.companies_by_id[plan["planner"]]
+        purpose = f"Plan-Id: {plan['id']}"
+        for account, amount in [
+            (planner.means_account, plan["costs_p"]),
+            (planner.raw_material_account, plan["costs_r"]),
+            (
+                planner.product_account,
+                -(plan["costs_p"] + plan["costs_r"] + plan["costs_a"]),
+            ),
+        ]:
+            yield self._transaction(
+                plan["activation_date"],
+                self.social_accounting_account,
+                account,
+                amount,
+                purpose,
+                plan["id"],
+            )
+        payout = round(plan["costs_a"] / plan["timeframe"], 2)
+        for day in range(plan["payout_count"]):
+            yield self._transaction(
+                plan["activation_date"] + timedelta(days=day),
+                self.social_accounting_account,
+                planner.work_account,
+                payout,
+                purpose,
+                plan["id"],
+                payout_day=day,
+            )
+
+    def _create_purchases_and_wages(self) -> None:
+        remaining = max(self.world.transactions - self.transaction_count, 0)
+        self.echo(f"Creating {remaining} purchases and wages")
+        employers = [company for company in self.companies if company.workers]
+        employer_weights = [
+            weight
+            for company, weight in zip(self.companies, self.company_weights)
+            if company.workers
+        ]
+        member_ids = list(self.members)
+        if not self.plans or not member_ids:
+            return
+        purchases: List[Dict] = []
+        transactions: List[Dict] = []
+        for _ in range(remaining):
+            kind = self.random.random()
+            if kind < 0.45:
+                member = self.random.choice(member_ids)
+                purchase, transaction = self._purchase(
+                    self.members[member],
+                    PurposesOfPurchases.consumption,
+                    dict(type_member=True, member=member, company=None),
+                )
+                purchases.append(purchase)
+                transactions.append(transaction)
+            elif kind < 0.65:
+                buyer = self.random.choices(self.companies, self.company_weights)[0]
+                is_means = self.random.random() < 0.5
+                purpose = (
+                    PurposesOfPurchases.means_of_prod
+                    if is_means
+                    else PurposesOfPurchases.raw_materials
+                )
+                purchase, transaction = self._purchase(
+                    buyer.means_account if is_means else buyer.raw_material_account,
+                    purpose,
+                    dict(type_member=False, member=None, company=buyer.id),
+                )
+                purchases.append(purchase)
+                transactions.append(transaction)
+            else:
+                employer = self.random.choices(employers, employer_weights)[0]
+                transactions.append(
+                    self._transaction(
+                        self._random_date(),
+                        employer.work_account,
+                        self.members[self.random.choice(employer.workers)],
+                        Decimal(self.random.randint(1, 40)),
+                        "Lohn",
+                        None,
+                    )
+                )
+            if len(transactions) >= self.batch_size:
+                self._execute_in_batches(models.Purchase.__table__.insert(), purchases)
+                self._execute_in_batches(
+                    models.Transaction.__table__.insert(), transactions
+                )
+                self.db.session.commit()
+                purchases, transactions = [], []
+        self._execute_in_batches(models.Purchase.__table__.insert(), purchases)
+        self._execute_in_batches(models.Transaction.__table__.insert(), transactions)
+        self.db.session.commit()
+
+    def _purchase(
+        self, buyer_account: str, purpose: PurposesOfPurchases, buyer: Dict
+    ) -> Tuple[Dict, Dict]:
+        plan = self.random.choice(self.plans)
+        amount = self.random.randint(1, 5)
+        date = (
+            plan.activation_date
+            + (plan.end_date - plan.activation_date) * self.random.random()
+        )
+        purchase = dict(
+            id=self._new_id(),
+            purchase_date=date,
+            plan_id=plan.id,
+            price_per_unit=plan.price_per_unit,
+            amount=amount,
+            purpose=purpose,
+            **buyer,
+        )
+        transaction = self._transaction(
+            date,
+            buyer_account,
+            plan.planner.product_account,
+            plan.price_per_unit * amount,
+            f"Plan-Id: {plan.id}",
+            plan.id,
+        )
+        return purchase, transaction
+
+    def _transaction(
+        self,
+        date: datetime,
+        sender: str,
+        receiver: str,
+        amount: Decimal,
+        purpose: str,
+        plan: Optional[str],
+        payout_day: Optional[int] = None,
+    ) -> Dict:
+        self.transaction_count += 1
+        self.balances[sender] -= amount
+        self.balances[receiver] += amount
+        return dict(
+            id=self._new_id(),
+            date=date,
+            sending_account=sender,
+            receiving_account=receiver,
+            amount_sent=amount,
+            amount_received=amount,
+            purpose=purpose,
+            plan_id=plan,
+            payout_day=payout_day,
+        )
+
+    def _write_balances(self) -> None:
+        self.echo(f"Writing the balances of {len(self.balances)} accounts")
+        statement = (
+            models.Account.__table__.update()
+            .where(models.Account.__table__.c.id == bindparam("account_id"))
+            .values(balance=models.Account.__table__.c.balance + bindparam("change"))
+        )
+        self._execute_in_batches(
+            statement,
+            (
+                dict(account_id=account, change=change)
+                for account, change in self.balances.items()
+            ),
+        )
+        self.db.session.commit()
+
+    def _create_payout_factors(self) -> None:
+        hours = self.world.days * 24
+        self.echo(f"Creating {hours} payout factors")
+        payout_factors = []
+        days: DefaultDict[date, List[Tuple[datetime, Decimal]]] = defaultdict(list)
+        value = 0.75
+        for hour in range(hours, 0, -1):
+            timestamp = self.now - timedelta(hours=hour)
+            value = min(max(value + self.random.gauss(0, 0.005), 0.0), 1.0)
+            payout_factor = round(Decimal(value), 4)
+            payout_factors.append(
+                dict(
+                    id=self._new_id(), timestamp=timestamp, payout_factor=payout_factor
+                )
+            )
+            days[timestamp.date()].append((timestamp, payout_factor))
+        self._execute_in_batches(models.PayoutFactor.__table__.insert(), payout_factors)
+        self._execute_in_batches(
+            models.DailyPayoutFactor.__table__.insert(),
+            (
+                dict(
+                    day=day,
+                    count=len(values),
+                    total=sum(value for _, value in values),
+                    minimum=min(value for _, value in values),
+                    maximum=max(value for _, value in values),
+                    last=values[-1][1],
+                    last_timestamp=values[-1][0],
+                )
+                for day, values in days.items()
+            ),
+        )
+        self.db.session.commit()
+
+    def _execute_in_batches(self, statement: Executable, rows: Iterable[Dict]) -> None:
+        batch: List[Dict] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self.db.session.execute(statement, batch)
+                batch = []
+        if batch:
+            self.db.session.execute(statement, batch)
+
+    def _new_id(self) -> str:
+        return str(UUID(int=self.random.getrandbits(128), version=4))
+
+    def _random_date(self) -> datetime:
+        return self.now - timedelta(days=self.world.days) * self.random.random()
+
+    def _random_amount(self, mu: float, sigma: float) -> Decimal:
+        return round(Decimal(self.random.lognormvariate(mu, sigma)), 2)
+
+    def _random_text(self, length: int) -> str:
+        return " ".join(self.random.choices(WORDS, k=length))
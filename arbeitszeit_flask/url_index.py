@@ -118,6 +118,9 @@ class GeneralUrlIndex:
             company_id=str(company_id),
         )
 
+    def get_line_plot_of_payout_factor_history(self) -> str:
+        return url_for(endpoint="plots.line_plot_of_payout_factor_history")
+
     def get_pay_means_of_production_url(self, plan_id: Optional[UUID] = None) -> str:
         return url_for(endpoint="main_company.transfer_to_company", plan_id=plan_id)
 
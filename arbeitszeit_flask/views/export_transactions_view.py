@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from flask import Response, stream_with_context
+from injector import inject
+
+from arbeitszeit.use_cases.export_transactions import ExportTransactions
+from arbeitszeit_flask.views.http_404_view import Http404View
+from arbeitszeit_web.export_transactions import (
+    ExportTransactionsController,
+    ExportTransactionsPresenter,
+)
+from arbeitszeit_web.malformed_input_data import MalformedInputData
+
+
+@inject
+@dataclass
+class ExportTransactionsView:
+    controller: ExportTransactionsController
+    export_transactions: ExportTransactions
+    presenter: ExportTransactionsPresenter
+    http_404_view: Http404View
+
+    def respond_to_get(self) -> Response:
+        export = self.controller.import_request_data()
+        if export is None:
+            return self.http_404_view.get_response()
+        if isinstance(export, MalformedInputData):
+            return Response(f"{export.field}: {export.message}", status=400)
+        response = self.export_transactions(export.request)
+        if response.is_rejected:
+            return self.http_404_view.get_response()
+        view_model = self.presenter.present(response, export.format)
+        # The transactions are read from the database while the
+        # response is sent, so the request context must stay around.
+        return Response(
+            stream_with_context(view_model.lines),
+            content_type=view_model.content_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{view_model.filename}"'
+            },
+        )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from flask import Response
+from flask import Response, request
 
 from arbeitszeit import use_cases
 from arbeitszeit_flask.forms import CompanySearchForm
@@ -22,14 +22,19 @@ class QueryCompaniesView:
     template_renderer: TemplateRenderer
 
     def respond_to_post(self) -> Response:
+        return self._respond_to_search()
+
+    def respond_to_get(self) -> Response:
+        if request.args:
+            return self._respond_to_search()
+        return self._handle_use_case_request(self.controller.import_form_data(None))
+
+    def _respond_to_search(self) -> Response:
         if not self.search_form.validate():
             return self._get_invalid_form_response()
         use_case_request = self.controller.import_form_data(self.search_form)
         return self._handle_use_case_request(use_case_request)
 
-    def respond_to_get(self) -> Response:
-        return self._handle_use_case_request(self.controller.import_form_data(None))
-
     def _get_invalid_form_response(self) -> Response:
         return Response(
             response=self._render_response_content(
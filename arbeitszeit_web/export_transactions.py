@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from io import StringIO
+from typing import Dict, FrozenSet, Iterator, Optional, Union
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.use_cases.export_transactions import (
+    ExportedTransaction,
+    ExportTransactionsRequest,
+    ExportTransactionsResponse,
+)
+from arbeitszeit_web.malformed_input_data import MalformedInputData
+from arbeitszeit_web.request import Request
+from arbeitszeit_web.session import Session
+from arbeitszeit_web.translator import Translator
+
+EXPORT_COLUMNS = [
+    "date",
+    "transaction_type",
+    "account_type",
+    "transaction_volume",
+    "purpose",
+]
+
+
+class ExportFormat(Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+def parse_account_types(
+    account_types: str,
+) -> Optional[FrozenSet[AccountTypes]]:
+    """Parse a comma separated list of account types like "a,p". Raise
+    ValueError for unknown account types.
+    """
+    names = [name.strip() for name in account_types.split(",") if name.strip()]
+    if not names:
+        return None
+    return frozenset(AccountTypes(name) for name in names)
+
+
+def start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time())
+
+
+def end_of_day(day: date) -> datetime:
+    """The first moment after the given day, to include the whole day
+    in an export.
+    """
+    return datetime.combine(day + timedelta(days=1), time())
+
+
+@dataclass
+class ExportTransactionsController:
+    @dataclass
+    class Export:
+        request: ExportTransactionsRequest
+        format: ExportFormat
+
+    session: Session
+    request: Request
+    translator: Translator
+
+    def import_request_data(self) -> Union[Export, MalformedInputData, None]:
+        current_user = self.session.get_current_user()
+        if current_user is None:
+            return None
+        query_string = self.request.query_string()
+        try:
+            export_format = ExportFormat(query_string.get("format") or "csv")
+        except ValueError:
+            return MalformedInputData(
+                "format", self.translator.gettext("Unknown export format.")
+            )
+        try:
+            account_types = parse_account_types(query_string.get("account_types") or "")
+        except ValueError:
+            return MalformedInputData(
+                "account_types", self.translator.gettext("Unknown account type.")
+            )
+        days: Dict[str, Optional[date]] = dict()
+        for field in ["since", "until"]:
+            day = query_string.get(field)
+            try:
+                days[field] = date.fromisoformat(day) if day else None
+            except ValueError:
+                return MalformedInputData(
+                    field, self.translator.gettext("Invalid date.")
+                )
+        since, until = days["since"], days["until"]
+        return self.Export(
+            request=ExportTransactionsRequest(
+                user=current_user,
+                account_types=account_types,
+                since=start_of_day(since) if since else None,
+                until=end_of_day(until) if until else None,
+            ),
+            format=export_format,
+        )
+
+
+class ExportTransactionsPresenter:
+    @dataclass
+    class ViewModel:
+        lines: Iterator[str]
+        content_type: str
+        filename: str
+
+    def present(
+        self, response: ExportTransactionsResponse, export_format: ExportFormat
+    ) -> ViewModel:
+        if export_format == ExportFormat.ndjson:
+            return self.ViewModel(
+                lines=self._render_ndjson(response.transactions),
+                content_type="application/x-ndjson",
+                filename="transactions.ndjson",
+            )
+        return self.ViewModel(
+            lines=self._render_csv(response.transactions),
+            content_type="text/csv",
+            filename="transactions.csv",
+        )
+
+    def _render_csv(self, transactions: Iterator[ExportedTransaction]) -> Iterator[str]:
+        buffer = StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+        writer.writeheader()
+        yield self._empty_buffer(buffer)
+        for transaction in transactions:
+            writer.writerow(self._format_transaction(transaction))
+            yield self._empty_buffer(buffer)
+
+    def _empty_buffer(self, buffer: StringIO) -> str:
+        content = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return content
+
+    def _render_ndjson(
+        self, transactions: Iterator[ExportedTransaction]
+    ) -> Iterator[str]:
+        for transaction in transactions:
+            yield json.dumps(self._format_transaction(transaction)) + "\n"
+
+    def _format_transaction(self, transaction: ExportedTransaction) -> Dict[str, str]:
+        return dict(
+            date=transaction.date.isoformat(),
+            transaction_type=transaction.transaction_type.name,
+            account_type=transaction.account_type.value,
+            transaction_volume=str(transaction.transaction_volume),
+            purpose=transaction.purpose,
+        )
@@ -27,10 +27,12 @@ class GetStatisticsViewModel:
     planned_means_hours: str
     payout_factor: str
     payout_factor_explanation: str
+    calculation_date: str
 
     barplot_for_certificates_url: str
     barplot_means_of_production_url: str
     barplot_plans_url: str
+    payout_factor_history_plot_url: str
 
 
 @inject
@@ -75,6 +77,7 @@ class GetStatisticsPresenter:
             payout_factor_explanation=self._format_payout_factor_explanation(
                 use_case_response.payout_factor
             ),
+            calculation_date=self._format_calculation_date(use_case_response),
             barplot_for_certificates_url=self.url_index.get_global_barplot_for_certificates_url(
                 use_case_response.certificates_count,
                 use_case_response.available_product,
@@ -91,6 +94,7 @@ class GetStatisticsPresenter:
                 ),
                 use_case_response.active_plans_public_count,
             ),
+            payout_factor_history_plot_url=self.url_index.get_line_plot_of_payout_factor_history(),
         )
 
     def _format_payout_factor(self, payout_factor: Optional[PayoutFactor]) -> str:
@@ -109,3 +113,13 @@ class GetStatisticsPresenter:
         return self.translator.gettext("Payout factor (%(timestamp)s)") % dict(
             timestamp=timestamp
         )
+
+    def _format_calculation_date(self, use_case_response: StatisticsResponse) -> str:
+        timestamp = self.datetime_service.format_datetime(
+            use_case_response.calculation_date,
+            zone="Europe/Berlin",
+            fmt="%d.%m.%Y %H:%M",
+        )
+        return self.translator.gettext("As of %(timestamp)s") % dict(
+            timestamp=timestamp
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from injector import inject
 
@@ -21,6 +21,7 @@ class ShowPRDAccountDetailsPresenter:
         date: str
         transaction_volume: str
         purpose: str
+        balance: str
 
     @dataclass
     class ViewModel:
@@ -28,6 +29,8 @@ class ShowPRDAccountDetailsPresenter:
         show_transactions: bool
         account_balance: str
         plot_url: str
+        next_page_cursor: Optional[str]
+        previous_page_cursor: Optional[str]
 
     translator: Translator
     url_index: UrlIndex
@@ -47,6 +50,8 @@ class ShowPRDAccountDetailsPresenter:
             plot_url=self.url_index.get_line_plot_of_company_prd_account(
                 use_case_response.company_id
             ),
+            next_page_cursor=use_case_response.next_page,
+            previous_page_cursor=use_case_response.previous_page,
         )
 
     def _create_info(
@@ -70,4 +75,5 @@ class ShowPRDAccountDetailsPresenter:
             ),
             str(round(transaction.transaction_volume, 2)),
             transaction.purpose,
+            str(round(transaction.balance, 2)),
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from injector import inject
 
@@ -21,12 +21,15 @@ class ShowRAccountDetailsPresenter:
         date: str
         transaction_volume: str
         purpose: str
+        balance: str
 
     @dataclass
     class ViewModel:
         transactions: List[ShowRAccountDetailsPresenter.TransactionInfo]
         account_balance: str
         plot_url: str
+        next_page_cursor: Optional[str]
+        previous_page_cursor: Optional[str]
 
     trans: Translator
     url_index: UrlIndex
@@ -45,6 +48,8 @@ class ShowRAccountDetailsPresenter:
             plot_url=self.url_index.get_line_plot_of_company_r_account(
                 use_case_response.company_id
             ),
+            next_page_cursor=use_case_response.next_page,
+            previous_page_cursor=use_case_response.previous_page,
         )
 
     def _create_info(
@@ -62,4 +67,5 @@ class ShowRAccountDetailsPresenter:
             ),
             str(round(transaction.transaction_volume, 2)),
             transaction.purpose,
+            str(round(transaction.balance, 2)),
         )
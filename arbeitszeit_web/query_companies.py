@@ -14,6 +14,8 @@ from arbeitszeit_web.url_index import UrlIndex
 
 from .notification import Notifier
 
+RESULTS_PER_PAGE = 20
+
 
 class QueryCompaniesFormData(Protocol):
     def get_query_string(self) -> str:
@@ -22,11 +24,15 @@ class QueryCompaniesFormData(Protocol):
     def get_category_string(self) -> str:
         ...
 
+    def get_cursor_string(self) -> str:
+        ...
+
 
 @dataclass
 class QueryCompaniesRequestImpl(QueryCompaniesRequest):
     query: Optional[str]
     filter_category: CompanyFilter
+    page_cursor: Optional[str] = None
 
     def get_query_string(self) -> Optional[str]:
         return self.query
@@ -34,6 +40,12 @@ class QueryCompaniesRequestImpl(QueryCompaniesRequest):
     def get_filter_category(self) -> CompanyFilter:
         return self.filter_category
 
+    def get_page_size(self) -> int:
+        return RESULTS_PER_PAGE
+
+    def get_page_cursor(self) -> Optional[str]:
+        return self.page_cursor
+
 
 class QueryCompaniesController:
     def import_form_data(
@@ -42,13 +54,17 @@ class QueryCompaniesController:
         if form is None:
             filter_category = CompanyFilter.by_name
             query = None
+            page_cursor = None
         else:
             query = form.get_query_string().strip() or None
             if form.get_category_string() == "Email":
                 filter_category = CompanyFilter.by_email
             else:
                 filter_category = CompanyFilter.by_name
-        return QueryCompaniesRequestImpl(query=query, filter_category=filter_category)
+            page_cursor = form.get_cursor_string() or None
+        return QueryCompaniesRequestImpl(
+            query=query, filter_category=filter_category, page_cursor=page_cursor
+        )
 
 
 @dataclass
@@ -68,6 +84,8 @@ class ResultsTable:
 class QueryCompaniesViewModel:
     results: ResultsTable
     show_results: bool
+    next_page_cursor: Optional[str]
+    previous_page_cursor: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -100,10 +118,14 @@ class QueryCompaniesPresenter:
                     for result in response.results
                 ],
             ),
+            next_page_cursor=response.next_page,
+            previous_page_cursor=response.previous_page,
         )
 
     def get_empty_view_model(self) -> QueryCompaniesViewModel:
         return QueryCompaniesViewModel(
             results=ResultsTable(rows=[]),
             show_results=False,
+            next_page_cursor=None,
+            previous_page_cursor=None,
         )
@@ -15,6 +15,8 @@ from arbeitszeit_web.translator import Translator
 from .notification import Notifier
 from .url_index import UrlIndex, UserUrlIndex
 
+RESULTS_PER_PAGE = 20
+
 
 class QueryPlansFormData(Protocol):
     def get_query_string(self) -> str:
@@ -26,12 +28,16 @@ class QueryPlansFormData(Protocol):
     def get_radio_string(self) -> str:
         ...
 
+    def get_cursor_string(self) -> str:
+        ...
+
 
 @dataclass
 class QueryPlansRequestImpl(QueryPlansRequest):
     query: Optional[str]
     filter_category: PlanFilter
     sorting_category: PlanSorting
+    page_cursor: Optional[str] = None
 
     def get_query_string(self) -> Optional[str]:
         return self.query
@@ -42,6 +48,12 @@ class QueryPlansRequestImpl(QueryPlansRequest):
     def get_sorting_category(self) -> PlanSorting:
         return self.sorting_category
 
+    def get_page_size(self) -> int:
+        return RESULTS_PER_PAGE
+
+    def get_page_cursor(self) -> Optional[str]:
+        return self.page_cursor
+
 
 class QueryPlansController:
     def import_form_data(self, form: Optional[QueryPlansFormData]) -> QueryPlansRequest:
@@ -49,14 +61,17 @@ class QueryPlansController:
             query = None
             filter_category = PlanFilter.by_product_name
             sorting_category = PlanSorting.by_activation
+            page_cursor = None
         else:
             query = form.get_query_string().strip() or None
             filter_category = self._import_filter_category(form)
             sorting_category = self._import_sorting_category(form)
+            page_cursor = form.get_cursor_string() or None
         return QueryPlansRequestImpl(
             query=query,
             filter_category=filter_category,
             sorting_category=sorting_category,
+            page_cursor=page_cursor,
         )
 
     def _import_filter_category(self, form: QueryPlansFormData) -> PlanFilter:
@@ -72,6 +87,8 @@ class QueryPlansController:
             sorting_category = PlanSorting.by_price
         elif sorting == "company_name":
             sorting_category = PlanSorting.by_company_name
+        elif sorting == "relevance":
+            sorting_category = PlanSorting.by_relevance
         else:
             sorting_category = PlanSorting.by_activation
         return sorting_category
@@ -99,6 +116,8 @@ class ResultsTable:
 class QueryPlansViewModel:
     results: ResultsTable
     show_results: bool
+    next_page_cursor: Optional[str]
+    previous_page_cursor: Optional[str]
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -139,10 +158,14 @@ class QueryPlansPresenter:
                     for result in response.results
                 ],
             ),
+            next_page_cursor=response.next_page,
+            previous_page_cursor=response.previous_page,
         )
 
     def get_empty_view_model(self) -> QueryPlansViewModel:
         return QueryPlansViewModel(
             results=ResultsTable(rows=[]),
             show_results=False,
+            next_page_cursor=None,
+            previous_page_cursor=None,
         )
@@ -74,6 +74,9 @@ class UrlIndex(Protocol):
     def get_line_plot_of_company_a_account(self, company_id: UUID) -> str:
         ...
 
+    def get_line_plot_of_payout_factor_history(self) -> str:
+        ...
+
     def get_pay_consumer_product_url(self, amount: int, plan_id: UUID) -> str:
         ...
 
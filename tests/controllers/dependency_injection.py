@@ -14,6 +14,7 @@ from arbeitszeit_web.controllers.show_my_accounts_controller import (
     ShowMyAccountsController,
 )
 from arbeitszeit_web.create_draft import CreateDraftController
+from arbeitszeit_web.export_transactions import ExportTransactionsController
 from arbeitszeit_web.invite_worker_to_company import InviteWorkerToCompanyController
 from arbeitszeit_web.pay_consumer_product import PayConsumerProductController
 from arbeitszeit_web.request_cooperation import RequestCooperationController
@@ -51,6 +52,16 @@ class ControllerTestsModule(Module):
             request=request,
         )
 
+    @provider
+    def provide_export_transactions_controller(
+        self, session: FakeSession, request: FakeRequest, translator: FakeTranslator
+    ) -> ExportTransactionsController:
+        return ExportTransactionsController(
+            session=session,
+            request=request,
+            translator=translator,
+        )
+
     @provider
     def provide_pay_consumer_product_controller(
         self, translator: FakeTranslator
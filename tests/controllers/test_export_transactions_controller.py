@@ -0,0 +1,80 @@
+from datetime import datetime
+from unittest import TestCase
+from uuid import uuid4
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit_web.export_transactions import (
+    ExportFormat,
+    ExportTransactionsController,
+)
+from arbeitszeit_web.malformed_input_data import MalformedInputData
+from tests.request import FakeRequest
+from tests.session import FakeSession
+
+from .dependency_injection import get_dependency_injector
+
+
+class ExportTransactionsControllerTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.session = self.injector.get(FakeSession)
+        self.request = self.injector.get(FakeRequest)
+        self.controller = self.injector.get(ExportTransactionsController)
+        self.user = uuid4()
+        self.session.set_current_user_id(self.user)
+
+    def test_no_export_without_authenticated_user(self) -> None:
+        self.session.set_current_user_id(None)
+        self.assertIsNone(self.controller.import_request_data())
+
+    def test_all_transactions_of_current_user_are_exported_as_csv_by_default(
+        self,
+    ) -> None:
+        export = self.controller.import_request_data()
+        assert isinstance(export, ExportTransactionsController.Export)
+        self.assertEqual(export.format, ExportFormat.csv)
+        self.assertEqual(export.request.user, self.user)
+        self.assertIsNone(export.request.account_types)
+        self.assertIsNone(export.request.since)
+        self.assertIsNone(export.request.until)
+
+    def test_ndjson_format_can_be_requested(self) -> None:
+        self.request.set_arg("format", "ndjson")
+        export = self.controller.import_request_data()
+        assert isinstance(export, ExportTransactionsController.Export)
+        self.assertEqual(export.format, ExportFormat.ndjson)
+
+    def test_unknown_format_is_malformed(self) -> None:
+        self.request.set_arg("format", "xml")
+        export = self.controller.import_request_data()
+        assert isinstance(export, MalformedInputData)
+        self.assertEqual(export.field, "format")
+
+    def test_account_types_are_read_from_comma_separated_list(self) -> None:
+        self.request.set_arg("account_types", "a, prd")
+        export = self.controller.import_request_data()
+        assert isinstance(export, ExportTransactionsController.Export)
+        self.assertEqual(
+            export.request.account_types, frozenset([AccountTypes.a, AccountTypes.prd])
+        )
+
+    def test_unknown_account_type_is_malformed(self) -> None:
+        self.request.set_arg("account_types", "a,x")
+        export = self.controller.import_request_data()
+        assert isinstance(export, MalformedInputData)
+        self.assertEqual(export.field, "account_types")
+
+    def test_date_range_includes_both_days(self) -> None:
+        self.request.set_arg("since", "2022-01-02")
+        self.request.set_arg("until", "2022-01-04")
+        export = self.controller.import_request_data()
+        assert isinstance(export, ExportTransactionsController.Export)
+        self.assertEqual(export.request.since, datetime(2022, 1, 2))
+        self.assertEqual(export.request.until, datetime(2022, 1, 5))
+
+    def test_invalid_until_date_is_malformed(self) -> None:
+        self.request.set_arg("since", "2022-01-02")
+        self.request.set_arg("until", "tomorrow")
+        export = self.controller.import_request_data()
+        assert isinstance(export, MalformedInputData)
+        self.assertEqual(export.field, "until")
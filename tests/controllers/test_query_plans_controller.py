@@ -92,16 +92,42 @@ class QueryPlansControllerTests(TestCase):
         )
         self.assertEqual(request.get_sorting_category(), PlanSorting.by_price)
 
+    def test_that_relevance_in_sorting_field_results_in_sorting_by_relevance(
+        self,
+    ) -> None:
+        request = self.controller.import_form_data(
+            form=make_fake_form(sorting_category="relevance")
+        )
+        self.assertEqual(request.get_sorting_category(), PlanSorting.by_relevance)
+
+    def test_that_default_request_model_starts_at_first_page(self) -> None:
+        request = self.controller.import_form_data(form=None)
+        self.assertIsNone(request.get_page_cursor())
+
+    def test_that_empty_cursor_field_results_in_first_page(self) -> None:
+        request = self.controller.import_form_data(form=make_fake_form(cursor=""))
+        self.assertIsNone(request.get_page_cursor())
+
+    def test_that_cursor_is_taken_from_form(self) -> None:
+        request = self.controller.import_form_data(form=make_fake_form(cursor="abc"))
+        self.assertEqual(request.get_page_cursor(), "abc")
+
+    def test_that_request_has_a_page_size(self) -> None:
+        request = self.controller.import_form_data(form=None)
+        self.assertGreater(request.get_page_size(), 0)
+
 
 def make_fake_form(
     query: Optional[str] = None,
     filter_category: Optional[str] = None,
     sorting_category: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> FakeQueryPlansForm:
     return FakeQueryPlansForm(
         query=query or "",
         products_filter=filter_category or "Produktname",
         sorting_category=sorting_category or "activation",
+        cursor=cursor or "",
     )
 
 
@@ -110,6 +136,7 @@ class FakeQueryPlansForm:
     query: str
     products_filter: str
     sorting_category: str
+    cursor: str
 
     def get_query_string(self) -> str:
         return self.query
@@ -119,3 +146,6 @@ class FakeQueryPlansForm:
 
     def get_radio_string(self) -> str:
         return self.sorting_category
+
+    def get_cursor_string(self) -> str:
+        return self.cursor
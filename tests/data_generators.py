@@ -343,6 +343,7 @@ class TransactionGenerator:
         amount_sent=None,
         amount_received=None,
         purpose=None,
+        plan=None,
     ) -> Transaction:
         if sending_account is None:
             sending_account = self.account_generator.create_account(
@@ -365,6 +366,7 @@ class TransactionGenerator:
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan=plan,
         )
 
 
@@ -1,3 +1,4 @@
+from datetime import datetime
 from decimal import Decimal
 from unittest import TestCase
 
@@ -22,3 +23,19 @@ class TestPlanEntity(TestCase):
             costs=ProductionCosts(Decimal(10), Decimal(5), Decimal(5)), amount=10
         )
         self.assertEqual(plan.expected_sales_value, Decimal(20))
+
+    def test_active_days_are_zero_if_plan_is_not_active(self) -> None:
+        plan = self.plan_generator.create_plan(activation_date=None)
+        self.assertEqual(plan.active_days(datetime(2021, 10, 4)), 0)
+
+    def test_active_days_count_full_days_since_activation(self) -> None:
+        plan = self.plan_generator.create_plan(
+            timeframe=5, activation_date=datetime(2021, 10, 2, 2)
+        )
+        self.assertEqual(plan.active_days(datetime(2021, 10, 4, 3)), 2)
+
+    def test_active_days_do_not_exceed_timeframe(self) -> None:
+        plan = self.plan_generator.create_plan(
+            timeframe=5, activation_date=datetime(2021, 10, 2, 2)
+        )
+        self.assertEqual(plan.active_days(datetime(2021, 10, 10, 3)), 5)
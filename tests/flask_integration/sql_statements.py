@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from arbeitszeit_flask.database.identity_map import (
+    get_cooperation_price_cache,
+    get_entity_identity_map,
+)
+
+
+@contextmanager
+def record_sql_statements(db: SQLAlchemy) -> Iterator[List[Tuple[str, Any]]]:
+    """Record every statement that is sent to the database inside of
+    the context together with its parameters. Pending changes of the
+    session are flushed beforehand so that they are not recorded.
+    """
+    statements: List[Tuple[str, Any]] = []
+    db.session.flush()
+
+    def record_statement(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record_statement)
+
+
+def forget_loaded_objects(db: SQLAlchemy) -> None:
+    """Write pending changes and forget every object loaded so far, so
+    that following statements look like those of a fresh request.
+    """
+    db.session.flush()
+    db.session.expunge_all()
+    get_entity_identity_map().clear()
+    get_cooperation_price_cache().clear()
@@ -0,0 +1,54 @@
+import re
+
+from arbeitszeit.transactions import ACCOUNT_HISTORY_PAGE_SIZE
+from tests.data_generators import TransactionGenerator
+
+from .flask import ViewTestCase
+
+
+class AccountHistoryViewTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+
+    def test_member_account_links_to_next_page_of_long_history(self) -> None:
+        member = self.login_member()
+        company = self.company_generator.create_company()
+        for _ in range(ACCOUNT_HISTORY_PAGE_SIZE + 1):
+            self.transaction_generator.create_transaction(
+                sending_account=company.work_account,
+                receiving_account=member.account,
+            )
+        response = self.client.get("/member/my_account")
+        self.assertEqual(response.status_code, 200)
+        next_page_url = self.get_next_page_url(response.get_data(as_text=True))
+        response = self.client.get("/member/my_account" + next_page_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("pagination-previous", response.get_data(as_text=True))
+        self.assertNotIn("pagination-next", response.get_data(as_text=True))
+
+    def test_company_p_account_links_to_next_page_of_long_history(self) -> None:
+        company = self.login_company()
+        for _ in range(ACCOUNT_HISTORY_PAGE_SIZE + 1):
+            self.transaction_generator.create_transaction(
+                receiving_account=company.means_account
+            )
+        response = self.client.get("/company/my_accounts/account_p")
+        self.assertEqual(response.status_code, 200)
+        next_page_url = self.get_next_page_url(response.get_data(as_text=True))
+        response = self.client.get("/company/my_accounts/account_p" + next_page_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("pagination-next", response.get_data(as_text=True))
+
+    def test_company_prd_account_without_transactions_has_no_pagination(
+        self,
+    ) -> None:
+        self.login_company()
+        response = self.client.get("/company/my_accounts/account_prd")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("pagination", response.get_data(as_text=True))
+
+    def get_next_page_url(self, html: str) -> str:
+        match = re.search(r'class="pagination-next" href="([^"]*)"', html)
+        assert match
+        return match.group(1).replace("&amp;", "&")
@@ -37,3 +37,32 @@ def test_can_get_owner_of_public_account(
 ) -> None:
     social_accounting = social_accounting_repository.get_or_create_social_accounting()
     assert repository.get_account_owner(social_accounting.account) == social_accounting
+
+
+@injection_test
+def test_can_get_owner_names_of_accounts_of_all_owner_types(
+    repository: AccountOwnerRepository,
+    social_accounting_repository: AccountingRepository,
+    member_generator: MemberGenerator,
+    company_generator: CompanyGenerator,
+) -> None:
+    member = member_generator.create_member(name="member name")
+    company = company_generator.create_company(name="company name")
+    social_accounting = social_accounting_repository.get_or_create_social_accounting()
+    owner_names = repository.get_owner_names(
+        [member.account.id, company.means_account.id, social_accounting.account.id]
+    )
+    assert owner_names == {
+        member.account.id: repository.OwnerName(member.id, "member name"),
+        company.means_account.id: repository.OwnerName(company.id, "company name"),
+        social_accounting.account.id: repository.OwnerName(
+            social_accounting.id, social_accounting.get_name()
+        ),
+    }
+
+
+@injection_test
+def test_owner_names_of_no_accounts_are_empty(
+    repository: AccountOwnerRepository,
+) -> None:
+    assert repository.get_owner_names([]) == {}
@@ -1,3 +1,7 @@
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit_flask import models
 from arbeitszeit_flask.database.repositories import AccountRepository
 from tests.data_generators import AccountGenerator, TransactionGenerator
 
@@ -71,3 +75,66 @@ def test_the_account_balance_is_zero_when_sending_and_receiving_account_of_trans
         amount_received=10,
     )
     assert repository.get_account_balance(account) == 0
+
+
+@injection_test
+def test_reconciling_balances_corrects_balances_that_are_out_of_step(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+    db: SQLAlchemy,
+) -> None:
+    account = account_generator.create_account()
+    transaction_generator.create_transaction(
+        receiving_account=account, amount_received=10
+    )
+    db.session.query(models.Account).filter(
+        models.Account.id == str(account.id)
+    ).update({models.Account.balance: 3})
+    assert repository.reconcile_account_balances() == 1
+    assert repository.get_account_balance(account) == 10
+
+
+@injection_test
+def test_reconciling_balances_does_not_touch_balances_that_are_correct(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+) -> None:
+    sender = account_generator.create_account()
+    receiver = account_generator.create_account()
+    transaction_generator.create_transaction(
+        sending_account=sender,
+        receiving_account=receiver,
+        amount_sent=5,
+        amount_received=4,
+    )
+    assert repository.reconcile_account_balances() == 0
+    assert repository.get_account_balance(sender) == -5
+    assert repository.get_account_balance(receiver) == 4
+
+
+@injection_test
+def test_the_sum_of_balances_only_includes_accounts_of_the_given_type(
+    repository: AccountRepository,
+    account_generator: AccountGenerator,
+    transaction_generator: TransactionGenerator,
+) -> None:
+    first_account = account_generator.create_account(AccountTypes.member)
+    second_account = account_generator.create_account(AccountTypes.member)
+    other_account = account_generator.create_account(AccountTypes.prd)
+    transaction_generator.create_transaction(
+        sending_account=other_account,
+        receiving_account=first_account,
+        amount_sent=3,
+        amount_received=3,
+    )
+    transaction_generator.create_transaction(
+        sending_account=other_account,
+        receiving_account=second_account,
+        amount_sent=2,
+        amount_received=2,
+    )
+    assert repository.get_sum_of_balances(AccountTypes.member) == 5
+    assert repository.get_sum_of_balances(AccountTypes.prd) == -5
+    assert repository.get_sum_of_balances(AccountTypes.a) == 0
@@ -0,0 +1,49 @@
+from arbeitszeit_flask.dependency_injection import (
+    CompanyModule,
+    MemberModule,
+    get_injector,
+    with_injection,
+)
+from arbeitszeit_flask.flask_session import FlaskSession
+from arbeitszeit_flask.token import FlaskTokenService
+
+from .flask import FlaskTestCase
+
+
+class ApplicationInjectorTests(FlaskTestCase):
+    def test_that_decorated_functions_share_the_injector_of_the_app(self) -> None:
+        self.assertIs(with_injection().injector, get_injector())
+        self.assertIs(with_injection().injector, with_injection().injector)
+
+    def test_that_child_injector_is_reused_for_same_modules(self) -> None:
+        self.assertIs(
+            with_injection([CompanyModule()]).injector,
+            with_injection([CompanyModule()]).injector,
+        )
+
+    def test_that_child_injectors_differ_for_different_modules(self) -> None:
+        self.assertIsNot(
+            with_injection([CompanyModule()]).injector,
+            with_injection([MemberModule()]).injector,
+        )
+
+    def test_that_token_service_is_shared_between_child_injectors(self) -> None:
+        company_injector = get_injector([CompanyModule()])
+        member_injector = get_injector([MemberModule()])
+        self.assertIs(
+            company_injector.get(FlaskTokenService),
+            member_injector.get(FlaskTokenService),
+        )
+
+    def test_that_session_is_shared_within_one_request(self) -> None:
+        with self.app.test_request_context():
+            self.assertIs(
+                get_injector().get(FlaskSession),
+                get_injector([CompanyModule()]).get(FlaskSession),
+            )
+
+    def test_that_every_request_gets_a_new_session(self) -> None:
+        with self.app.test_request_context():
+            session = get_injector().get(FlaskSession)
+        with self.app.test_request_context():
+            self.assertIsNot(get_injector().get(FlaskSession), session)
@@ -0,0 +1,163 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit_flask import models
+from arbeitszeit_flask.benchmarks import (
+    BenchmarkFailed,
+    BenchmarkResult,
+    dump_results,
+    find_regressions,
+    load_results,
+    run_benchmark,
+)
+from arbeitszeit_flask.database.repositories import AccountingRepository
+from arbeitszeit_flask.synthetic_data import SyntheticDataSeeder, SyntheticWorld
+
+from .flask import FlaskTestCase
+
+
+def result(
+    seconds: float = 1, sql_statements: int = 10, peak_memory_bytes: int = 1000
+) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="benchmark",
+        seconds=seconds,
+        sql_statements=sql_statements,
+        peak_memory_bytes=peak_memory_bytes,
+    )
+
+
+class FindRegressionsTests(TestCase):
+    def test_equal_runs_have_no_regressions(self) -> None:
+        self.assertFalse(find_regressions([result()], [result()], threshold=0.25))
+
+    def test_slower_run_within_threshold_is_no_regression(self) -> None:
+        self.assertFalse(
+            find_regressions([result()], [result(seconds=1.2)], threshold=0.25)
+        )
+
+    def test_slower_run_beyond_threshold_is_regression(self) -> None:
+        regressions = find_regressions(
+            [result()], [result(seconds=1.3)], threshold=0.25
+        )
+        self.assertEqual([regression.metric for regression in regressions], ["seconds"])
+
+    def test_higher_peak_memory_beyond_threshold_is_regression(self) -> None:
+        regressions = find_regressions(
+            [result()], [result(peak_memory_bytes=2000)], threshold=0.25
+        )
+        self.assertEqual(
+            [regression.metric for regression in regressions], ["peak_memory_bytes"]
+        )
+
+    def test_any_additional_sql_statement_is_regression(self) -> None:
+        regressions = find_regressions(
+            [result()], [result(sql_statements=11)], threshold=0.25
+        )
+        self.assertEqual(
+            [regression.metric for regression in regressions], ["sql_statements"]
+        )
+
+    def test_benchmarks_missing_from_previous_run_are_ignored(self) -> None:
+        self.assertFalse(find_regressions([], [result(seconds=10)], threshold=0.25))
+
+    def test_results_survive_serialization(self) -> None:
+        results = [result(), result(seconds=2)]
+        self.assertEqual(
+            load_results(dump_results(results, created=datetime(2022, 6, 1))),
+            results,
+        )
+
+
+class BenchmarkCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_command_fails_on_empty_database(self) -> None:
+        result = self.app.test_cli_runner().invoke(args=["benchmark"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("seed-synthetic", result.output)
+
+    def test_command_rejects_less_than_one_run(self) -> None:
+        result = self.app.test_cli_runner().invoke(args=["benchmark", "--repeat=0"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("--repeat", result.output)
+
+    def test_all_benchmarks_are_written_to_output(self) -> None:
+        self.seed()
+        output = Path(self.directory.name) / "results.json"
+        result = self.invoke_benchmark("--output", str(output))
+        self.assertEqual(result.exit_code, 0, result.output)
+        names = [result["name"] for result in json.loads(output.read_text())["results"]]
+        self.assertIn("UpdatePlansAndPayout", names)
+        self.assertIn("QueryPlans[by_product_name,by_price]", names)
+        self.assertIn("GET /plots/line_plot_of_company_a_account", names)
+
+    def test_benchmarks_leave_database_unchanged(self) -> None:
+        self.seed()
+        transactions_before = models.Transaction.query.count()
+        result = self.invoke_benchmark()
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(models.Transaction.query.count(), transactions_before)
+
+    def test_failing_benchmark_is_reported_by_name(self) -> None:
+        def fail() -> None:
+            raise ValueError("broken")
+
+        with self.assertRaises(BenchmarkFailed) as context:
+            run_benchmark(self.db, "Broken", fail, repeat=1)
+        self.assertIn("Broken", str(context.exception))
+        self.assertIn("broken", str(context.exception))
+
+    def test_command_fails_on_regression(self) -> None:
+        self.seed()
+        previous = Path(self.directory.name) / "previous.json"
+        previous.write_text(
+            dump_results(
+                [
+                    BenchmarkResult(
+                        name="GetStatistics",
+                        seconds=0,
+                        sql_statements=0,
+                        peak_memory_bytes=0,
+                    )
+                ],
+                created=datetime(2022, 6, 1),
+            )
+        )
+        result = self.invoke_benchmark(
+            "--only=GetStatistics", "--compare", str(previous)
+        )
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Regression: GetStatistics", result.output)
+
+    def invoke_benchmark(self, *args: str):
+        return self.app.test_cli_runner().invoke(
+            args=["benchmark", "--repeat=1", *args]
+        )
+
+    def seed(self) -> None:
+        accounting_repository = self.injector.get(AccountingRepository)
+        SyntheticDataSeeder(
+            db=self.db,
+            social_accounting_account=accounting_repository.get_social_accounting_account_id(),
+            now=datetime(2022, 6, 1, 12),
+            world=SyntheticWorld(
+                companies=3,
+                members=10,
+                plans=6,
+                cooperations=1,
+                transactions=300,
+                days=30,
+            ),
+            seed=0,
+            batch_size=100,
+        ).seed_database()
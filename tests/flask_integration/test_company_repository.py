@@ -139,6 +139,44 @@ def test_that_get_all_companies_returns_all_companies(
     assert company_in_companies(expected_company2, all_companies)
 
 
+@injection_test
+def test_that_page_of_companies_is_ordered_by_name_ignoring_case(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+):
+    for name in ["c_name", "a_name", "B_name"]:
+        generator.create_company(name=name)
+    page = repository.get_page_of_companies(limit=3)
+    assert [company.name for company in page] == ["a_name", "B_name", "c_name"]
+
+
+@injection_test
+def test_that_page_of_companies_continues_after_and_before_a_company(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+):
+    companies = [generator.create_company(name=name) for name in "abcde"]
+    assert repository.get_page_of_companies(limit=2, after=companies[1].id) == [
+        companies[2],
+        companies[3],
+    ]
+    assert repository.get_page_of_companies(limit=2, before=companies[3].id) == [
+        companies[1],
+        companies[2],
+    ]
+
+
+@injection_test
+def test_that_page_of_companies_can_be_filtered_by_email(
+    repository: CompanyRepository,
+    generator: CompanyGenerator,
+):
+    expected_company = generator.create_company(email="company1@provider.de")
+    generator.create_company(email="company2@provider.de")
+    page = repository.get_page_of_companies(limit=2, email="COMPANY1")
+    assert page == [expected_company]
+
+
 @injection_test
 def test_query_companies_by_name_matching_exactly(
     repository: CompanyRepository,
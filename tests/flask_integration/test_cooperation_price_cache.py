@@ -0,0 +1,75 @@
+from datetime import datetime
+from decimal import Decimal
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.cooperation_price import CooperationPriceCache, CooperationPriceService
+from arbeitszeit.entities import Plan, ProductionCosts
+from arbeitszeit_flask.database.repositories import (
+    PlanCooperationRepository,
+    PlanRepository,
+)
+from tests.data_generators import CooperationGenerator, PlanGenerator
+
+from .flask import FlaskTestCase
+
+
+class CooperationPriceCacheTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.plan_repository = self.injector.get(PlanRepository)
+        self.plan_cooperation_repository = self.injector.get(PlanCooperationRepository)
+        self.service = self.injector.get(CooperationPriceService)
+
+    def test_that_price_is_cached_for_the_current_request(self) -> None:
+        plan = self.create_plan(costs=10)
+        cooperation = self.cooperation_generator.create_cooperation(plans=[plan])
+        self.service.get_price_per_unit(self.get_plan(plan))
+        cache = self.injector.get(CooperationPriceCache)
+        assert cache.get(cooperation.id) == Decimal(1)
+
+    def test_that_price_changes_when_plan_joins_cooperation(self) -> None:
+        first_plan = self.create_plan(costs=10)
+        cooperation = self.cooperation_generator.create_cooperation(plans=[first_plan])
+        assert self.service.get_price_per_unit(self.get_plan(first_plan)) == 1
+        second_plan = self.create_plan(costs=20)
+        self.plan_cooperation_repository.add_plan_to_cooperation(
+            second_plan.id, cooperation.id
+        )
+        assert self.service.get_price_per_unit(self.get_plan(first_plan)) == Decimal(
+            "1.5"
+        )
+
+    def test_that_price_changes_when_plan_leaves_cooperation(self) -> None:
+        first_plan = self.create_plan(costs=10)
+        second_plan = self.create_plan(costs=20)
+        self.cooperation_generator.create_cooperation(plans=[first_plan, second_plan])
+        assert self.service.get_price_per_unit(self.get_plan(first_plan)) == Decimal(
+            "1.5"
+        )
+        self.plan_cooperation_repository.remove_plan_from_cooperation(second_plan.id)
+        assert self.service.get_price_per_unit(self.get_plan(first_plan)) == 1
+
+    def test_that_cache_is_cleared_on_rollback(self) -> None:
+        plan = self.create_plan(costs=10)
+        cooperation = self.cooperation_generator.create_cooperation(plans=[plan])
+        self.service.get_price_per_unit(self.get_plan(plan))
+        self.db.session.rollback()
+        cache = self.injector.get(CooperationPriceCache)
+        assert cache.get(cooperation.id) is None
+
+    def create_plan(self, costs: int) -> Plan:
+        return self.plan_generator.create_plan(
+            activation_date=datetime.now(),
+            costs=ProductionCosts(Decimal(costs), Decimal(0), Decimal(0)),
+            amount=10,
+            timeframe=5,
+        )
+
+    def get_plan(self, plan: Plan) -> Plan:
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        return updated_plan
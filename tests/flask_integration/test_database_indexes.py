@@ -0,0 +1,139 @@
+"""Check with the sqlite query planner that the hot repository queries
+are answered with the help of an index instead of a full table scan.
+"""
+
+from datetime import datetime
+from typing import Any, List, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.payout_partition import PayoutPartition
+from arbeitszeit_flask.database.repositories import (
+    CompanyRepository,
+    PlanCooperationRepository,
+    PlanRepository,
+    PurchaseRepository,
+    TransactionRepository,
+    WorkerInviteRepository,
+)
+from tests.data_generators import (
+    AccountGenerator,
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    PlanGenerator,
+)
+
+from .flask import FlaskTestCase
+from .sql_statements import forget_loaded_objects, record_sql_statements
+
+
+class DatabaseIndexTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.account_generator = self.injector.get(AccountGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.member_generator = self.injector.get(MemberGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+
+    def test_transactions_received_by_account_are_found_by_index(self) -> None:
+        repository = self.injector.get(TransactionRepository)
+        account = self.account_generator.create_account()
+        with record_sql_statements(self.db) as statements:
+            repository.all_transactions_received_by_account(account)
+        self.assertIndexUsed(
+            statements, "transaction", "ix_transaction_receiving_account_date"
+        )
+
+    def test_transactions_sent_by_account_are_found_by_index(self) -> None:
+        repository = self.injector.get(TransactionRepository)
+        account = self.account_generator.create_account()
+        with record_sql_statements(self.db) as statements:
+            repository.all_transactions_sent_by_account(account)
+        self.assertIndexUsed(
+            statements, "transaction", "ix_transaction_sending_account_date"
+        )
+
+    def test_accounts_of_company_are_found_by_index(self) -> None:
+        repository = self.injector.get(CompanyRepository)
+        company = self.company_generator.create_company()
+        forget_loaded_objects(self.db)
+        with record_sql_statements(self.db) as statements:
+            repository.get_by_id(company.id)
+        self.assertIndexUsed(statements, "account", "ix_account_account_owner_company")
+
+    def test_active_plans_of_company_are_found_by_index(self) -> None:
+        repository = self.injector.get(PlanRepository)
+        company = self.company_generator.create_company()
+        with record_sql_statements(self.db) as statements:
+            list(repository.get_all_active_plans_for_company(company.id))
+        self.assertIndexUsed(statements, "plan")
+
+    def test_costs_of_active_plans_are_summed_by_index(self) -> None:
+        repository = self.injector.get(PlanRepository)
+        with record_sql_statements(self.db) as statements:
+            repository.get_costs_per_day_of_active_plans()
+        self.assertIndexUsed(
+            statements, "plan", "ix_plan_is_active_expired_is_public_service"
+        )
+
+    def test_plans_due_for_payout_are_found_by_index(self) -> None:
+        repository = self.injector.get(PlanRepository)
+        with record_sql_statements(self.db) as statements:
+            list(
+                repository.get_plans_due_for_payout(
+                    PayoutPartition.all_plans(), datetime(2021, 10, 2)
+                )
+            )
+        self.assertIndexUsed(statements, "plan")
+
+    def test_plans_in_cooperation_are_found_by_index(self) -> None:
+        repository = self.injector.get(PlanCooperationRepository)
+        cooperation = self.cooperation_generator.create_cooperation()
+        with record_sql_statements(self.db) as statements:
+            repository.count_plans_in_cooperation(cooperation.id)
+        self.assertIndexUsed(statements, "plan", "ix_plan_cooperation")
+
+    def test_purchases_of_company_are_found_by_index(self) -> None:
+        repository = self.injector.get(PurchaseRepository)
+        company = self.company_generator.create_company()
+        with record_sql_statements(self.db) as statements:
+            list(repository.get_purchases_of_company(company.id))
+        self.assertIndexUsed(statements, "purchase", "ix_purchase_company")
+
+    def test_invites_of_member_are_found_by_index(self) -> None:
+        repository = self.injector.get(WorkerInviteRepository)
+        member = self.member_generator.create_member()
+        with record_sql_statements(self.db) as statements:
+            list(repository.get_companies_worker_is_invited_to(member.id))
+        self.assertIndexUsed(
+            statements, "company_work_invite", "ix_company_work_invite_member"
+        )
+
+    def assertIndexUsed(
+        self, statements: List[Tuple[str, Any]], table: str, index: str = ""
+    ) -> None:
+        plans = [
+            self._explain(statement, parameters)
+            for statement, parameters in statements
+            if statement.lstrip().upper().startswith("SELECT")
+        ]
+        plans_for_table = [
+            detail
+            for plan in plans
+            for detail in plan
+            if detail.split(" ")[1:2] == [table]
+        ]
+        self.assertTrue(plans_for_table, f"No query touched table {table}")
+        for detail in plans_for_table:
+            self.assertNotIn("SCAN", detail.split(" ")[0], detail)
+            self.assertIn(f"INDEX {index}", detail)
+
+    def _explain(self, statement: str, parameters: Any) -> List[str]:
+        connection = self.db.session.connection()
+        rows = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        ).fetchall()
+        return [row[-1] for row in rows]
@@ -0,0 +1,120 @@
+from datetime import datetime
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit import entities
+from arbeitszeit.repositories import PlanRepository as PlanRepositoryInterface
+from arbeitszeit_flask.database.identity_map import (
+    EntityIdentityMap,
+    get_entity_identity_map,
+)
+from arbeitszeit_flask.database.repositories import (
+    CompanyRepository,
+    PlanCooperationRepository,
+    PlanRepository,
+)
+from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
+
+from .flask import FlaskTestCase
+from .sql_statements import forget_loaded_objects, record_sql_statements
+
+
+class EntityIdentityMapTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.company_repository = self.injector.get(CompanyRepository)
+        self.plan_repository = self.injector.get(PlanRepository)
+        self.plan_cooperation_repository = self.injector.get(PlanCooperationRepository)
+
+    def test_same_company_object_is_returned_without_querying_again(self) -> None:
+        company = self.company_generator.create_company()
+        forget_loaded_objects(self.db)
+        first = self.company_repository.get_by_id(company.id)
+        with record_sql_statements(self.db) as statements:
+            second = self.company_repository.get_by_id(company.id)
+        assert first is second
+        assert not statements
+
+    def test_plans_share_the_object_of_their_planner(self) -> None:
+        planner = self.company_generator.create_company()
+        self.plan_generator.create_plan(planner=planner)
+        self.plan_generator.create_plan(planner=planner)
+        forget_loaded_objects(self.db)
+        first, second = self.plan_repository.get_all_plans_for_company_descending(
+            planner.id
+        )
+        assert first.planner is second.planner
+
+    def test_listed_plans_are_looked_up_without_querying_again(self) -> None:
+        plan = self.plan_generator.create_plan(activation_date=datetime.now())
+        forget_loaded_objects(self.db)
+        (listed_plan,) = self.plan_repository.get_active_plans()
+        with record_sql_statements(self.db) as statements:
+            cooperating_plans = self.plan_cooperation_repository.get_cooperating_plans(
+                plan.id
+            )
+        assert cooperating_plans == [listed_plan]
+        assert cooperating_plans[0] is listed_plan
+        assert not statements
+
+    def test_hiding_a_plan_is_visible_on_next_lookup(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.plan_repository.get_plan_by_id(plan.id)
+        self.plan_repository.hide_plan(plan.id)
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        assert updated_plan.hidden_by_user
+
+    def test_joining_a_cooperation_is_visible_on_next_lookup(self) -> None:
+        plan = self.plan_generator.create_plan()
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_repository.get_plan_by_id(plan.id)
+        self.plan_cooperation_repository.add_plan_to_cooperation(
+            plan.id, cooperation.id
+        )
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        assert updated_plan.cooperation == cooperation.id
+
+    def test_payout_updates_are_visible_on_next_lookup(self) -> None:
+        plan = self.plan_generator.create_plan(activation_date=datetime.now())
+        self.plan_repository.get_plan_by_id(plan.id)
+        self.plan_repository.apply_payout_updates(
+            [
+                PlanRepositoryInterface.PayoutUpdate(
+                    plan=plan.id,
+                    payout_count=2,
+                    next_payout_date=datetime.now(),
+                    is_expired=False,
+                )
+            ]
+        )
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        assert updated_plan.payout_count == 2
+
+    def test_confirming_a_company_is_visible_on_next_lookup(self) -> None:
+        company = self.company_generator.create_company()
+        self.company_repository.get_by_id(company.id)
+        self.company_repository.confirm_company(company.id, datetime(2022, 1, 1))
+        updated_company = self.company_repository.get_by_id(company.id)
+        assert updated_company
+        assert updated_company.confirmed_on == datetime(2022, 1, 1)
+
+    def test_identity_map_is_cleared_on_rollback(self) -> None:
+        company = self.company_generator.create_company()
+        self.company_repository.get_by_id(company.id)
+        self.db.session.rollback()
+        assert get_entity_identity_map().get(entities.Company, company.id) is None
+
+    def test_every_application_context_has_its_own_identity_map(self) -> None:
+        company = self.company_generator.create_company()
+        self.company_repository.get_by_id(company.id)
+        with self.injector.get(Flask).app_context():
+            identity_map = self.injector.get(EntityIdentityMap)
+            assert identity_map.get(entities.Company, company.id) is None
@@ -0,0 +1,92 @@
+import csv
+import json
+from io import StringIO
+from uuid import uuid4
+
+from tests.data_generators import TransactionGenerator
+
+from .flask import ViewTestCase
+
+
+class ExportTransactionsViewTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+
+    def test_company_can_download_csv_export(self) -> None:
+        company = self.login_company()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.means_account, purpose="credit"
+        )
+        response = self.client.get("/company/my_accounts/export")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/csv"))
+        self.assertIn("attachment", response.headers["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(response.get_data(as_text=True))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["purpose"], "credit")
+        self.assertEqual(rows[0]["account_type"], "p")
+
+    def test_member_can_download_ndjson_export(self) -> None:
+        member = self.login_member()
+        company = self.company_generator.create_company()
+        for _ in range(2):
+            self.transaction_generator.create_transaction(
+                sending_account=company.work_account,
+                receiving_account=member.account,
+            )
+        response = self.client.get("/member/my_account/export?format=ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content_type, "application/x-ndjson")
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["transaction_type"], "incoming_wages")
+
+    def test_invalid_date_is_rejected(self) -> None:
+        self.login_member()
+        response = self.client.get("/member/my_account/export?since=yesterday")
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_account_type_is_rejected(self) -> None:
+        self.login_company()
+        response = self.client.get("/company/my_accounts/export?account_types=x")
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportTransactionsCommandTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.runner = self.app.test_cli_runner()
+
+    def test_command_prints_csv_export_of_company(self) -> None:
+        company = self.company_generator.create_company()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.raw_material_account
+        )
+        result = self.runner.invoke(args=["export-transactions", str(company.id)])
+        self.assertEqual(result.exit_code, 0, result.output)
+        rows = list(csv.DictReader(StringIO(result.output)))
+        self.assertEqual([row["account_type"] for row in rows], ["r"])
+
+    def test_command_can_restrict_account_types(self) -> None:
+        company = self.company_generator.create_company()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.raw_material_account
+        )
+        result = self.runner.invoke(
+            args=[
+                "export-transactions",
+                str(company.id),
+                "--format",
+                "ndjson",
+                "--account-types",
+                "p",
+            ]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output, "")
+
+    def test_command_fails_for_unknown_user(self) -> None:
+        result = self.runner.invoke(args=["export-transactions", str(uuid4())])
+        self.assertNotEqual(result.exit_code, 0)
@@ -0,0 +1,115 @@
+from io import StringIO
+from typing import List
+from unittest import TestCase
+
+from injector import Module, provider
+
+from arbeitszeit_flask.metrics import (
+    LATENCY_BUCKETS,
+    MetricsRegistry,
+    RequestMetrics,
+    get_metrics_registry,
+)
+
+from .dependency_injection import FlaskConfiguration
+from .flask import ViewTestCase
+
+
+class MetricsRegistryTests(TestCase):
+    def test_latency_is_counted_in_first_matching_bucket(self) -> None:
+        registry = MetricsRegistry()
+        registry.record("endpoint", LATENCY_BUCKETS[1], RequestMetrics(start=0))
+        metrics = registry.get("endpoint")
+        assert metrics
+        self.assertEqual(metrics.latency_buckets[1], 1)
+        self.assertEqual(sum(metrics.latency_buckets), 1)
+
+    def test_application_time_excludes_sql_and_templates(self) -> None:
+        registry = MetricsRegistry()
+        registry.record(
+            "endpoint",
+            1.0,
+            RequestMetrics(start=0, sql_seconds=0.25, template_seconds=0.5),
+        )
+        metrics = registry.get("endpoint")
+        assert metrics
+        self.assertAlmostEqual(metrics.application_seconds, 0.25)
+
+    def test_rendered_histogram_is_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        registry.record("endpoint", 0.001, RequestMetrics(start=0))
+        registry.record("endpoint", 100, RequestMetrics(start=0))
+        rendered = registry.render()
+        self.assertIn(
+            'arbeitszeit_request_duration_seconds_bucket{endpoint="endpoint",le="10.0"} 1',
+            rendered,
+        )
+        self.assertIn(
+            'arbeitszeit_request_duration_seconds_bucket{endpoint="endpoint",le="+Inf"} 2',
+            rendered,
+        )
+
+
+class RequestMetricsTests(ViewTestCase):
+    def test_sql_and_template_time_of_request_are_recorded(self) -> None:
+        self.login_member()
+        response = self.client.get("/member/query_plans")
+        self.assertEqual(response.status_code, 200)
+        with self.app.app_context():
+            metrics = get_metrics_registry().get("main_member.query_plans")
+        assert metrics
+        self.assertEqual(metrics.requests, 1)
+        self.assertGreater(metrics.sql_statements, 0)
+        self.assertGreater(metrics.sql_seconds, 0)
+        self.assertGreater(metrics.template_seconds, 0)
+
+
+class RequestLogTests(ViewTestCase):
+    def get_injection_modules(self) -> List[Module]:
+        class _Module(Module):
+            @provider
+            def provide_flask_configuration(self) -> FlaskConfiguration:
+                configuration = FlaskConfiguration.default()
+                configuration["METRICS_LOG_REQUESTS"] = True
+                return configuration
+
+        modules = super().get_injection_modules()
+        modules.append(_Module())
+        return modules
+
+    def test_requests_are_written_to_error_stream_if_configured(self) -> None:
+        errors = StringIO()
+        self.client.get("/", errors_stream=errors)
+        self.assertIn('"sql_statements": ', errors.getvalue())
+
+
+class MetricsEndpointTests(ViewTestCase):
+    def test_endpoint_is_not_found_without_configured_token(self) -> None:
+        self.app.config["METRICS_TOKEN"] = None
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 404)
+
+    def test_request_without_token_is_unauthorized(self) -> None:
+        self.app.config["METRICS_TOKEN"] = "secret"
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 401)
+
+    def test_request_with_wrong_token_is_unauthorized(self) -> None:
+        self.app.config["METRICS_TOKEN"] = "secret"
+        response = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer wrong"}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_metrics_of_earlier_requests_are_shown_with_token(self) -> None:
+        self.app.config["METRICS_TOKEN"] = "secret"
+        self.client.get("/")
+        response = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer secret"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn(
+            'arbeitszeit_request_sql_statements_total{endpoint="auth.start"}',
+            response.get_data(as_text=True),
+        )
@@ -0,0 +1,166 @@
+"""Listing use cases must not issue additional queries for every entity
+that they show. The bounds below are independent of the number of rows
+that are listed.
+"""
+
+from datetime import datetime
+from typing import Any, ContextManager, List, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.use_cases import GetCompanyTransactions
+from arbeitszeit.use_cases.get_member_account import GetMemberAccount
+from arbeitszeit.use_cases.query_plans import PlanFilter, PlanSorting, QueryPlans
+from arbeitszeit.use_cases.show_my_plans import ShowMyPlansRequest, ShowMyPlansUseCase
+from arbeitszeit.use_cases.show_prd_account_details import ShowPRDAccountDetailsUseCase
+from tests.data_generators import (
+    AccountGenerator,
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    PlanGenerator,
+    TransactionGenerator,
+)
+from tests.datetime_service import FakeDatetimeService
+from tests.use_cases.test_query_plans import make_request
+
+from .flask import FlaskTestCase
+from .sql_statements import forget_loaded_objects, record_sql_statements
+
+NUMBER_OF_ROWS = 20
+
+
+class NumberOfQueriesTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(datetime(2021, 10, 2, 10))
+        self.account_generator = self.injector.get(AccountGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.member_generator = self.injector.get(MemberGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+
+    def test_querying_plans_uses_a_bounded_number_of_queries(self) -> None:
+        for _ in range(NUMBER_OF_ROWS):
+            self.plan_generator.create_plan(activation_date=self.datetime_service.now())
+        use_case = self.injector.get(QueryPlans)
+        with self.record_statements() as statements:
+            response = use_case(
+                make_request(
+                    query=None,
+                    category=PlanFilter.by_product_name,
+                    sorting=PlanSorting.by_price,
+                    page_size=NUMBER_OF_ROWS,
+                )
+            )
+        self.assertEqual(len(response.results), NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 2)
+
+    def test_querying_plans_in_cooperations_uses_a_bounded_number_of_queries(
+        self,
+    ) -> None:
+        for _ in range(NUMBER_OF_ROWS // 2):
+            self.cooperation_generator.create_cooperation(
+                plans=[
+                    self.plan_generator.create_plan(
+                        activation_date=self.datetime_service.now()
+                    ),
+                    self.plan_generator.create_plan(
+                        activation_date=self.datetime_service.now()
+                    ),
+                ]
+            )
+        use_case = self.injector.get(QueryPlans)
+        with self.record_statements() as statements:
+            response = use_case(
+                make_request(
+                    query=None,
+                    category=PlanFilter.by_product_name,
+                    sorting=PlanSorting.by_price,
+                    page_size=NUMBER_OF_ROWS,
+                )
+            )
+        self.assertEqual(len(response.results), NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 4)
+
+    def test_listing_company_transactions_uses_a_bounded_number_of_queries(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company()
+        for _ in range(NUMBER_OF_ROWS):
+            self.transaction_generator.create_transaction(
+                sending_account=self.account_generator.create_account(
+                    AccountTypes.member
+                ),
+                receiving_account=company.product_account,
+            )
+            self.transaction_generator.create_transaction(
+                sending_account=company.means_account,
+                receiving_account=self.account_generator.create_account(),
+            )
+        use_case = self.injector.get(GetCompanyTransactions)
+        with self.record_statements() as statements:
+            response = use_case(company.id)
+        self.assertEqual(len(response.transactions), 2 * NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 10)
+
+    def test_showing_plans_of_company_uses_a_bounded_number_of_queries(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company()
+        for _ in range(NUMBER_OF_ROWS):
+            self.plan_generator.create_plan(
+                planner=company, activation_date=self.datetime_service.now()
+            )
+            self.plan_generator.draft_plan(planner=company)
+        use_case = self.injector.get(ShowMyPlansUseCase)
+        with self.record_statements() as statements:
+            response = use_case.show_company_plans(ShowMyPlansRequest(company.id))
+        self.assertEqual(response.count_all_plans, 2 * NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 3)
+
+    def test_showing_member_account_uses_a_bounded_number_of_queries(
+        self,
+    ) -> None:
+        member = self.member_generator.create_member()
+        for _ in range(NUMBER_OF_ROWS):
+            self.transaction_generator.create_transaction(
+                sending_account=member.account,
+                receiving_account=self.company_generator.create_company().product_account,
+            )
+            self.transaction_generator.create_transaction(
+                sending_account=self.company_generator.create_company().work_account,
+                receiving_account=member.account,
+            )
+        use_case = self.injector.get(GetMemberAccount)
+        with self.record_statements() as statements:
+            response = use_case(member.id)
+        self.assertEqual(len(response.transactions), 2 * NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 8)
+
+    def test_showing_product_account_uses_a_bounded_number_of_queries(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company()
+        for _ in range(NUMBER_OF_ROWS):
+            self.transaction_generator.create_transaction(
+                sending_account=self.member_generator.create_member().account,
+                receiving_account=company.product_account,
+            )
+            self.transaction_generator.create_transaction(
+                sending_account=self.company_generator.create_company().means_account,
+                receiving_account=company.product_account,
+            )
+        use_case = self.injector.get(ShowPRDAccountDetailsUseCase)
+        with self.record_statements() as statements:
+            response = use_case(company.id)
+        self.assertEqual(len(response.transactions), 2 * NUMBER_OF_ROWS)
+        self.assertLessEqual(len(statements), 8)
+
+    def record_statements(self) -> ContextManager[List[Tuple[str, Any]]]:
+        forget_loaded_objects(self.db)
+        return record_sql_statements(self.db)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from unittest import TestCase
 
@@ -37,3 +37,46 @@ class PayoutFactorRepositoryTests(TestCase):
         payout_factor = self.repository.get_latest_payout_factor()
         assert payout_factor.value == expected_payout_factor
         assert payout_factor.calculation_date == datetime(2020, 3, 1, 10)
+
+    def test_payout_factors_of_a_day_are_summarized(self):
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 9), Decimal("0.5"))
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 11), Decimal("0.7"))
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 10), Decimal("0.9"))
+        self.repository.store_payout_factor(datetime(2020, 1, 2, 10), Decimal("1.5"))
+        first_day, second_day = self.repository.get_daily_payout_factors(
+            date(2020, 1, 1)
+        )
+        assert first_day.day == date(2020, 1, 1)
+        assert first_day.minimum == Decimal("0.5")
+        assert first_day.maximum == Decimal("0.9")
+        assert first_day.average == Decimal("0.7")
+        assert first_day.last == Decimal("0.7")
+        assert second_day.day == date(2020, 1, 2)
+        assert second_day.last == Decimal("1.5")
+
+    def test_days_before_since_are_not_returned(self):
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 10), Decimal("0.5"))
+        self.repository.store_payout_factor(datetime(2020, 1, 2, 10), Decimal("0.6"))
+        days = self.repository.get_daily_payout_factors(date(2020, 1, 2))
+        assert [day.day for day in days] == [date(2020, 1, 2)]
+
+    def test_old_payout_factors_are_deleted_but_their_days_are_kept(self):
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 10), Decimal("0.5"))
+        self.repository.store_payout_factor(datetime(2020, 1, 2, 10), Decimal("0.6"))
+        self.repository.store_payout_factor(datetime(2020, 1, 3, 10), Decimal("0.7"))
+        deleted = self.repository.delete_payout_factors_before(datetime(2020, 1, 3))
+        assert deleted == 2
+        days = self.repository.get_daily_payout_factors(date(2020, 1, 1))
+        assert [day.last for day in days] == [
+            Decimal("0.5"),
+            Decimal("0.6"),
+            Decimal("0.7"),
+        ]
+
+    def test_latest_payout_factor_is_never_deleted(self):
+        self.repository.store_payout_factor(datetime(2020, 1, 1, 10), Decimal("0.5"))
+        deleted = self.repository.delete_payout_factors_before(datetime(2020, 2, 1))
+        assert deleted == 0
+        latest = self.repository.get_latest_payout_factor()
+        assert latest is not None
+        assert latest.value == Decimal("0.5")
@@ -107,9 +107,10 @@ def test_correct_inbound_requests_are_returned(
     )
     plan_generator.create_plan(activation_date=datetime.min, requested_cooperation=None)
     inbound_requests = list(repository.get_inbound_requests(coop.coordinator.id))
-    assert len(inbound_requests) == 2
-    assert plan_in_list(requesting_plan1, inbound_requests)
-    assert plan_in_list(requesting_plan2, inbound_requests)
+    assert {request.plan_id for request in inbound_requests} == {
+        requesting_plan1.id,
+        requesting_plan2.id,
+    }
 
 
 @injection_test
@@ -136,9 +137,95 @@ def test_correct_outbound_requests_are_returned(
         activation_date=datetime.min, requested_cooperation=None, planner=planner
     )
     outbound_requests = list(repository.get_outbound_requests(planner.id))
-    assert len(outbound_requests) == 2
-    assert plan_in_list(requesting_plan1, outbound_requests)
-    assert plan_in_list(requesting_plan2, outbound_requests)
+    assert {request.plan_id for request in outbound_requests} == {
+        requesting_plan1.id,
+        requesting_plan2.id,
+    }
+
+
+@injection_test
+def test_inbound_requests_show_names_of_cooperation_plan_and_planner(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+):
+    coop = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="coop name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    planner = company_generator.create_company(name="planner name")
+    plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        requested_cooperation=coop,
+        planner=planner,
+        product_name="plan name",
+    )
+    (inbound_request,) = repository.get_inbound_requests(coop.coordinator.id)
+    assert inbound_request.coop_id == coop.id
+    assert inbound_request.coop_name == "coop name"
+    assert inbound_request.plan_id == plan.id
+    assert inbound_request.plan_name == "plan name"
+    assert inbound_request.planner_name == "planner name"
+
+
+@injection_test
+def test_inbound_requests_exclude_inactive_plans_and_other_coordinators(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+    plan_repository: PlanRepository,
+):
+    coop = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="test name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    other_coop = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="other name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    inactive_plan = plan_generator.create_plan(
+        activation_date=datetime.min, requested_cooperation=coop
+    )
+    plan_repository.set_plan_as_expired(inactive_plan)
+    plan_generator.create_plan(
+        activation_date=datetime.min, requested_cooperation=other_coop
+    )
+    assert not repository.get_inbound_requests(coop.coordinator.id)
+
+
+@injection_test
+def test_outbound_requests_show_names_of_cooperation_and_plan(
+    repository: PlanCooperationRepository,
+    plan_generator: PlanGenerator,
+    cooperation_repository: CooperationRepository,
+    company_generator: CompanyGenerator,
+):
+    planner = company_generator.create_company()
+    coop = cooperation_repository.create_cooperation(
+        creation_timestamp=datetime.now(),
+        name="coop name",
+        definition="test description",
+        coordinator=company_generator.create_company(),
+    )
+    plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        requested_cooperation=coop,
+        planner=planner,
+        product_name="plan name",
+    )
+    (outbound_request,) = repository.get_outbound_requests(planner.id)
+    assert outbound_request.plan_id == plan.id
+    assert outbound_request.plan_name == "plan name"
+    assert outbound_request.coop_id == coop.id
+    assert outbound_request.coop_name == "coop name"
 
 
 @injection_test
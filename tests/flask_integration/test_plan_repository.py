@@ -3,11 +3,13 @@ from decimal import Decimal
 from typing import Union
 from uuid import uuid4
 
+from arbeitszeit.cooperation_price import CooperationPriceService
 from arbeitszeit.entities import ProductionCosts
+from arbeitszeit.payout_partition import PayoutPartition
 from arbeitszeit_flask.database.repositories import PlanRepository
 from tests.datetime_service import FakeDatetimeService
 
-from ..data_generators import CompanyGenerator, PlanGenerator
+from ..data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
 from .dependency_injection import injection_test
 
 Number = Union[int, Decimal]
@@ -21,6 +23,16 @@ def production_costs(a: Number, r: Number, p: Number) -> ProductionCosts:
     )
 
 
+def assert_costs_almost_equal(
+    actual: ProductionCosts, expected: ProductionCosts
+) -> None:
+    # SQLite divides in floating point, which is exact to about 15 digits.
+    precision = Decimal("1e-9")
+    assert abs(actual.labour_cost - expected.labour_cost) < precision
+    assert abs(actual.resource_cost - expected.resource_cost) < precision
+    assert abs(actual.means_cost - expected.means_cost) < precision
+
+
 @injection_test
 def test_active_plans_are_counted_correctly(
     plan_repository: PlanRepository,
@@ -254,18 +266,87 @@ def test_that_query_active_plans_by_exact_product_name_returns_plan(
 
 
 @injection_test
-def test_that_query_active_plans_by_substring_of_product_name_returns_plan(
+def test_that_query_active_plans_by_beginnings_of_words_in_product_name_returns_plan(
     repository: PlanRepository,
     plan_generator: PlanGenerator,
 ) -> None:
     expected_plan = plan_generator.create_plan(
         activation_date=datetime.min, product_name="Delivery of goods"
     )
-    returned_plan = list(repository.query_active_plans_by_product_name("very of go"))
+    returned_plan = list(repository.query_active_plans_by_product_name("deliv GO"))
     assert returned_plan
     assert returned_plan[0] == expected_plan
 
 
+@injection_test
+def test_that_query_active_plans_by_product_name_requires_every_search_word(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(
+        activation_date=datetime.min, product_name="Delivery of goods"
+    )
+    assert not list(repository.query_active_plans_by_product_name("delivery bread"))
+
+
+@injection_test
+def test_that_query_active_plans_by_product_name_searches_description(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        product_name="Bread",
+        description="Baked from whole grain rye",
+    )
+    returned_plan = list(repository.query_active_plans_by_product_name("rye"))
+    assert returned_plan == [expected_plan]
+
+
+@injection_test
+def test_that_query_active_plans_by_product_name_puts_better_matches_first(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    weak_match = plan_generator.create_plan(
+        activation_date=datetime.min,
+        product_name="Bread",
+        description="Goes well with apple jam and cheese and butter and ham",
+    )
+    strong_match = plan_generator.create_plan(
+        activation_date=datetime.min,
+        product_name="Apples",
+        description="Apple harvest, apples sold by the kilogram",
+    )
+    returned_plans = list(repository.query_active_plans_by_product_name("apple"))
+    assert returned_plans == [strong_match, weak_match]
+
+
+@injection_test
+def test_that_query_active_plans_by_product_name_ignores_expired_plans(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan(
+        activation_date=datetime.min, product_name="Delivery of goods"
+    )
+    repository.set_plan_as_expired(plan)
+    assert not list(repository.query_active_plans_by_product_name("delivery"))
+
+
+@injection_test
+def test_that_query_active_plans_by_complete_plan_id_returns_plan(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(activation_date=datetime.min)
+    plan_generator.create_plan(activation_date=datetime.min)
+    returned_plan = list(
+        repository.query_active_plans_by_plan_id(str(expected_plan.id))
+    )
+    assert returned_plan == [expected_plan]
+
+
 @injection_test
 def test_that_query_active_plans_by_substring_of_plan_id_returns_plan(
     repository: PlanRepository,
@@ -280,16 +361,217 @@ def test_that_query_active_plans_by_substring_of_plan_id_returns_plan(
 
 
 @injection_test
-def test_that_active_days_are_set(
+def test_that_page_of_plans_ordered_by_price_uses_cooperation_prices(
     repository: PlanRepository,
     plan_generator: PlanGenerator,
+    cooperation_generator: CooperationGenerator,
+    price_service: CooperationPriceService,
 ) -> None:
-    plan = plan_generator.create_plan(activation_date=datetime.min)
-    assert plan.active_days is None
-    repository.set_active_days(plan, 3)
+    plans = [
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            costs=production_costs(costs, 1, 0),
+            amount=amount,
+            timeframe=timeframe,
+        )
+        for costs, amount, timeframe in [
+            (3, 2, 1),
+            (20, 10, 7),
+            (1, 1, 1),
+            (12, 5, 3),
+            (7, 3, 2),
+        ]
+    ]
+    plans.append(
+        plan_generator.create_plan(activation_date=datetime.min, is_public_service=True)
+    )
+    cooperation_generator.create_cooperation(plans=plans[:2])
+    cooperation_generator.create_cooperation(plans=plans[2:4])
+    page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.price, limit=len(plans)
+    )
+    prices = price_service.get_prices_per_unit(page)
+    assert len(page) == len(plans)
+    assert [prices[plan.id] for plan in page] == sorted(prices.values())
+
+
+@injection_test
+def test_that_following_pages_of_plans_in_both_directions_lists_all_plans_once(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+    company_generator: CompanyGenerator,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    for index in range(7):
+        plan_generator.create_plan(
+            activation_date=datetime_service.now() - timedelta(days=index % 3),
+            planner=company_generator.create_company(name=f"Company {index % 2}"),
+            costs=production_costs(index % 4, 0, 0),
+        )
+    for ordering in PlanRepository.Ordering:
+        all_plans = repository.get_page_of_active_plans(ordering, limit=10)
+        pages = [repository.get_page_of_active_plans(ordering, limit=3)]
+        while len(pages[-1]) == 3:
+            pages.append(
+                repository.get_page_of_active_plans(
+                    ordering, limit=3, after=pages[-1][-1].id
+                )
+            )
+        assert [plan for page in pages for plan in page] == all_plans
+        assert (
+            repository.get_page_of_active_plans(
+                ordering, limit=3, before=pages[1][0].id
+            )
+            == pages[0]
+        )
+
+
+@injection_test
+def test_that_paging_by_price_lists_plans_without_amount_once(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    for amount in [3, 0, 1, 0, 2]:
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            amount=amount,
+            costs=production_costs(6, 0, 0),
+        )
+    all_plans = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.price, limit=10
+    )
+    pages = [
+        repository.get_page_of_active_plans(PlanRepository.Ordering.price, limit=2)
+    ]
+    while len(pages[-1]) == 2:
+        pages.append(
+            repository.get_page_of_active_plans(
+                PlanRepository.Ordering.price, limit=2, after=pages[-1][-1].id
+            )
+        )
+    assert len(all_plans) == 5
+    assert [plan for page in pages for plan in page] == all_plans
+
+
+@injection_test
+def test_that_page_of_plans_is_ordered_by_newest_plan_first(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    old_plan = plan_generator.create_plan(
+        activation_date=datetime_service.now_minus_two_days()
+    )
+    new_plan = plan_generator.create_plan(activation_date=datetime_service.now())
+    page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.newest_first, limit=2
+    )
+    assert page == [new_plan, old_plan]
+
+
+@injection_test
+def test_that_page_of_plans_can_be_filtered_by_product_name(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    expected_plan = plan_generator.create_plan(
+        activation_date=datetime.min, product_name="Delivery of goods"
+    )
+    plan_generator.create_plan(activation_date=datetime.min, product_name="Other")
+    page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.company_name, limit=2, search_text="deliv go"
+    )
+    assert page == [expected_plan]
+
+
+@injection_test
+def test_that_page_of_plans_ordered_by_relevance_can_be_continued(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plans = [
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            product_name="Apples",
+            description=" ".join(["apple"] * matches),
+        )
+        for matches in (1, 8, 3, 5)
+    ]
+    plan_generator.create_plan(activation_date=datetime.min, product_name="Other")
+    first_page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.relevance, limit=2, search_text="apple"
+    )
+    second_page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.relevance,
+        limit=2,
+        after=first_page[-1].id,
+        search_text="apple",
+    )
+    assert first_page == [plans[1], plans[3]]
+    assert second_page == [plans[2], plans[0]]
+
+
+@injection_test
+def test_that_page_of_plans_ordered_by_relevance_without_search_text_shows_newest_first(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+    datetime_service: FakeDatetimeService,
+) -> None:
+    old_plan = plan_generator.create_plan(
+        activation_date=datetime_service.now_minus_two_days()
+    )
+    new_plan = plan_generator.create_plan(activation_date=datetime_service.now())
+    page = repository.get_page_of_active_plans(
+        PlanRepository.Ordering.relevance, limit=2
+    )
+    assert page == [new_plan, old_plan]
+
+
+@injection_test
+def test_that_expiration_date_is_set_on_activation(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan(activation_date=None, timeframe=3)
+    repository.activate_plan(plan, datetime(2021, 10, 2))
     plan_from_repo = repository.get_plan_by_id(plan.id)
     assert plan_from_repo
-    assert plan_from_repo.active_days == 3
+    assert plan_from_repo.expiration_date == datetime(2021, 10, 5)
+
+
+@injection_test
+def test_that_plan_is_due_for_payout_once_per_day(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan(activation_date=datetime(2021, 10, 2, 10))
+    partition = PayoutPartition.all_plans()
+    assert list(
+        repository.get_plans_due_for_payout(partition, datetime(2021, 10, 2, 11))
+    ) == [plan]
+    repository.increase_payout_count_by_one(plan)
+    assert not list(
+        repository.get_plans_due_for_payout(partition, datetime(2021, 10, 3, 9))
+    )
+    assert list(
+        repository.get_plans_due_for_payout(partition, datetime(2021, 10, 3, 11))
+    ) == [plan]
+
+
+@injection_test
+def test_that_expired_plan_is_due_for_payout(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan(
+        activation_date=datetime(2021, 10, 2, 10), timeframe=1
+    )
+    for _ in range(5):
+        repository.increase_payout_count_by_one(plan)
+    due_plans = repository.get_plans_due_for_payout(
+        PayoutPartition.all_plans(), datetime(2021, 10, 3, 11)
+    )
+    assert list(due_plans) == [plan]
 
 
 @injection_test
@@ -331,20 +613,6 @@ def test_that_availability_is_toggled_to_true(
     assert plan_from_repo.is_available == True
 
 
-@injection_test
-def test_that_all_productive_plans_approved_active_and_not_expired_returns_no_plans_with_empty_db(
-    repository: PlanRepository,
-) -> None:
-    assert not list(repository.all_productive_plans_approved_active_and_not_expired())
-
-
-@injection_test
-def test_all_public_plans_approved_active_and_not_expired_returns_no_plans_with_empty_db(
-    repository: PlanRepository,
-) -> None:
-    assert not list(repository.all_public_plans_approved_active_and_not_expired())
-
-
 @injection_test
 def test_all_plans_approved_active_and_not_expired_returns_no_plans_with_empty_db(
     repository: PlanRepository,
@@ -385,3 +653,46 @@ def test_that_correct_id_of_planning_company_gets_returned(
     expected_plan = plan_generator.create_plan()
     plan_id = repository.get_planner_id(expected_plan.id)
     assert plan_id == expected_plan.planner.id
+
+
+@injection_test
+def test_costs_per_day_are_zero_without_active_plans(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan()
+    repository.set_plan_as_expired(plan)
+    costs = repository.get_costs_per_day_of_active_plans()
+    assert costs.productive == production_costs(0, 0, 0)
+    assert costs.public == production_costs(0, 0, 0)
+
+
+@injection_test
+def test_costs_per_day_agree_with_sum_over_active_plans(
+    repository: PlanRepository,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan_generator.create_plan(
+        activation_date=datetime.min, costs=production_costs(10, 5, 3), timeframe=3
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(Decimal("7.5"), 2, 1),
+        timeframe=7,
+    )
+    plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=production_costs(6, 3, 9),
+        timeframe=11,
+        is_public_service=True,
+    )
+    expired_plan = plan_generator.create_plan(
+        activation_date=datetime.min, costs=production_costs(100, 100, 100), timeframe=1
+    )
+    repository.set_plan_as_expired(expired_plan)
+    costs = repository.get_costs_per_day_of_active_plans()
+    assert_costs_almost_equal(
+        costs.productive,
+        production_costs(10, 5, 3) / 3 + production_costs(Decimal("7.5"), 2, 1) / 7,
+    )
+    assert_costs_almost_equal(costs.public, production_costs(6, 3, 9) / 11)
@@ -0,0 +1,159 @@
+import os
+from datetime import datetime
+from decimal import Decimal
+from tempfile import TemporaryDirectory
+from typing import List, Optional, Tuple, Union
+from unittest import TestCase
+
+from arbeitszeit_flask.plots.cache import CachingPlotter, PlotCache
+from arbeitszeit_flask.url_index import GeneralUrlIndex
+
+from .flask import ViewTestCase
+
+
+class PlotCacheTests(TestCase):
+    def test_that_stored_plot_is_returned(self) -> None:
+        cache = PlotCache(max_memory_bytes=100)
+        cache.set("key", b"plot")
+        self.assertEqual(cache.get("key"), b"plot")
+
+    def test_that_unknown_key_returns_none(self) -> None:
+        cache = PlotCache(max_memory_bytes=100)
+        self.assertIsNone(cache.get("key"))
+
+    def test_that_least_recently_used_plot_is_evicted_when_memory_is_full(
+        self,
+    ) -> None:
+        cache = PlotCache(max_memory_bytes=10)
+        cache.set("first", b"aaaa")
+        cache.set("second", b"bbbb")
+        cache.get("first")
+        cache.set("third", b"cccc")
+        self.assertEqual(cache.get("first"), b"aaaa")
+        self.assertIsNone(cache.get("second"))
+        self.assertEqual(cache.get("third"), b"cccc")
+
+    def test_that_plots_are_read_from_disk_after_eviction_from_memory(
+        self,
+    ) -> None:
+        with TemporaryDirectory() as directory:
+            cache = PlotCache(max_memory_bytes=4, directory=directory)
+            cache.set("first", b"aaaa")
+            cache.set("second", b"bbbb")
+            self.assertEqual(cache.get("first"), b"aaaa")
+
+    def test_that_plots_on_disk_are_shared_between_caches(self) -> None:
+        with TemporaryDirectory() as directory:
+            PlotCache(max_memory_bytes=100, directory=directory).set("key", b"plot")
+            cache = PlotCache(max_memory_bytes=100, directory=directory)
+            self.assertEqual(cache.get("key"), b"plot")
+
+    def test_that_least_recently_used_plot_is_deleted_when_disk_is_full(
+        self,
+    ) -> None:
+        with TemporaryDirectory() as directory:
+            cache = PlotCache(max_memory_bytes=0, directory=directory, max_disk_bytes=8)
+            cache.set("first", b"aaaa")
+            cache.set("second", b"bbbb")
+            os.utime(os.path.join(directory, "first.png"), (0, 0))
+            cache.set("third", b"cccc")
+            self.assertIsNone(cache.get("first"))
+            self.assertEqual(cache.get("second"), b"bbbb")
+            self.assertEqual(cache.get("third"), b"cccc")
+
+    def test_that_no_temporary_file_is_left_when_writing_fails(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = PlotCache(max_memory_bytes=100, directory=directory)
+            # A directory in place of the plot file makes the rename fail.
+            os.mkdir(os.path.join(directory, "key.png"))
+            with self.assertRaises(OSError):
+                cache.set("key", b"plot")
+            self.assertEqual(os.listdir(directory), ["key.png"])
+
+
+class CountingPlotter:
+    def __init__(self) -> None:
+        self.renderings = 0
+
+    def create_line_plot(
+        self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
+    ) -> bytes:
+        self.renderings += 1
+        return f"line plot {self.renderings}".encode()
+
+    def create_bar_plot(
+        self,
+        x_coordinates: List[Union[int, str]],
+        height_of_bars: List[Decimal],
+        colors_of_bars: List[str],
+        fig_size: Tuple[int, int],
+        y_label: Optional[str],
+    ) -> bytes:
+        self.renderings += 1
+        return f"bar plot {self.renderings}".encode()
+
+
+class CachingPlotterTests(TestCase):
+    def setUp(self) -> None:
+        self.plotter = CountingPlotter()
+        self.caching_plotter = CachingPlotter(
+            plotter=self.plotter, cache=PlotCache(max_memory_bytes=1000)
+        )
+
+    def test_that_same_bar_plot_is_rendered_only_once(self) -> None:
+        first = self.create_bar_plot()
+        second = self.create_bar_plot()
+        self.assertEqual(first, second)
+        self.assertEqual(self.plotter.renderings, 1)
+
+    def test_that_bar_plot_is_rendered_again_for_different_labels(self) -> None:
+        self.create_bar_plot(y_label="Hours")
+        self.create_bar_plot(y_label="Stunden")
+        self.assertEqual(self.plotter.renderings, 2)
+
+    def test_that_bar_plot_is_rendered_again_for_different_colors(self) -> None:
+        self.create_bar_plot(colors=["red", "blue"])
+        self.create_bar_plot(colors=["blue", "red"])
+        self.assertEqual(self.plotter.renderings, 2)
+
+    def test_that_line_plot_is_rendered_again_for_different_series(self) -> None:
+        x = [datetime(2022, 1, 1), datetime(2022, 1, 2)]
+        self.caching_plotter.create_line_plot(x=x, y=[Decimal(1), Decimal(2)])
+        self.caching_plotter.create_line_plot(x=x, y=[Decimal(1), Decimal(2)])
+        self.caching_plotter.create_line_plot(x=x, y=[Decimal(1), Decimal(3)])
+        self.assertEqual(self.plotter.renderings, 2)
+
+    def create_bar_plot(
+        self, y_label: str = "Hours", colors: Optional[List[str]] = None
+    ) -> bytes:
+        return self.caching_plotter.create_bar_plot(
+            x_coordinates=["a", "b"],
+            height_of_bars=[Decimal(1), Decimal(2)],
+            colors_of_bars=colors or ["red", "blue"],
+            fig_size=(5, 4),
+            y_label=y_label,
+        )
+
+
+class PlotResponseTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_company()
+        self.url = GeneralUrlIndex().get_global_barplot_for_plans_url(
+            productive_plans=3, public_plans=1
+        )
+
+    def test_that_plot_has_etag_and_must_be_revalidated(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.get_etag()[0])
+        self.assertTrue(response.cache_control.no_cache)
+        self.assertTrue(response.cache_control.private)
+
+    def test_that_revalidation_with_matching_etag_returns_not_modified(
+        self,
+    ) -> None:
+        etag, _ = self.client.get(self.url).get_etag()
+        response = self.client.get(self.url, headers={"If-None-Match": f'"{etag}"'})
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.data)
@@ -1,3 +1,5 @@
+from arbeitszeit_web.query_companies import RESULTS_PER_PAGE
+
 from .flask import ViewTestCase
 
 
@@ -6,3 +8,17 @@ class CompanyViewTests(ViewTestCase):
         self.company = self.login_company()
         response = self.client.get("/company/query_companies")
         self.assertEqual(response.status_code, 200)
+
+    def test_that_searching_with_get_parameters_is_valid(self) -> None:
+        self.company = self.login_company()
+        response = self.client.get(
+            "/company/query_companies", query_string=dict(select="Name", search="")
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_that_next_page_link_is_shown_when_there_are_more_results(self) -> None:
+        self.company = self.login_company()
+        for _ in range(RESULTS_PER_PAGE):
+            self.company_generator.create_company()
+        response = self.client.get("/company/query_companies")
+        self.assertIn("pagination-next", response.get_data(as_text=True))
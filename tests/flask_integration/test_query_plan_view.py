@@ -1,3 +1,10 @@
+import html
+import re
+from datetime import datetime
+
+from arbeitszeit_web.query_plans import RESULTS_PER_PAGE
+from tests.data_generators import PlanGenerator
+
 from .flask import ViewTestCase
 
 
@@ -8,6 +15,7 @@ class AuthenticatedMemberTests(ViewTestCase):
         self.company_url = "/company/query_plans"
         self.default_data = dict(select="Produktname", search="", radio="activation")
         self.member = self.login_member()
+        self.plan_generator = self.injector.get(PlanGenerator)
 
     def test_authenticated_users_get_200(self):
         response = self.client.get(self.url)
@@ -28,6 +36,34 @@ class AuthenticatedMemberTests(ViewTestCase):
         response = self.client.post(self.url, data=self.default_data)
         self.assertEqual(response.status_code, 400)
 
+    def test_searching_with_get_parameters_is_valid(self):
+        response = self.client.get(self.url, query_string=self.default_data)
+        self.assertEqual(response.status_code, 200)
+
+    def test_searching_with_get_parameters_without_sorting_category_is_invalid(self):
+        self.default_data.pop("radio")
+        response = self.client.get(self.url, query_string=self.default_data)
+        self.assertEqual(response.status_code, 400)
+
+    def test_next_page_link_is_shown_when_there_are_more_results(self):
+        for _ in range(RESULTS_PER_PAGE + 1):
+            self.plan_generator.create_plan(activation_date=datetime.min)
+        response = self.client.get(self.url)
+        self.assertIn("cursor=", response.get_data(as_text=True))
+
+    def test_next_page_link_leads_to_remaining_results(self):
+        for _ in range(RESULTS_PER_PAGE + 1):
+            self.plan_generator.create_plan(activation_date=datetime.min)
+        first_page = self.client.get(self.url).get_data(as_text=True)
+        next_page_link = re.search(
+            r'class="pagination-next" href="([^"]*)"', first_page
+        )
+        assert next_page_link
+        response = self.client.get(self.url + html.unescape(next_page_link.group(1)))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("pagination-previous", response.get_data(as_text=True))
+        self.assertNotIn("pagination-next", response.get_data(as_text=True))
+
     def test_get_redirected_when_trying_to_access_query_plans_for_company(self):
         response = self.client.get(self.company_url)
         self.assertEqual(response.status_code, 302)
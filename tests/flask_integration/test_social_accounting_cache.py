@@ -0,0 +1,67 @@
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.entities import SocialAccounting
+from arbeitszeit_flask.database.repositories import AccountingRepository
+from arbeitszeit_flask.database.social_accounting_cache import (
+    get_social_accounting_cache,
+    invalidate_social_accounting_cache,
+)
+
+from .flask import FlaskTestCase
+from .sql_statements import forget_loaded_objects, record_sql_statements
+
+
+class SocialAccountingCacheTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.repository = self.injector.get(AccountingRepository)
+
+    def test_that_social_accounting_is_read_only_once(self) -> None:
+        social_accounting = self.repository.get_or_create_social_accounting()
+        self.db.session.commit()
+        forget_loaded_objects(self.db)
+        with record_sql_statements(self.db) as statements:
+            self.assertEqual(self.injector.get(SocialAccounting), social_accounting)
+            self.assertEqual(
+                self.repository.get_by_id(social_accounting.id), social_accounting
+            )
+        self.assertFalse(statements)
+
+    def test_that_social_accounting_is_read_again_after_invalidation(self) -> None:
+        social_accounting = self.repository.get_or_create_social_accounting()
+        self.db.session.commit()
+        invalidate_social_accounting_cache()
+        with record_sql_statements(self.db) as statements:
+            self.assertEqual(
+                self.repository.get_or_create_social_accounting(), social_accounting
+            )
+        self.assertTrue(statements)
+
+    def test_that_social_accounting_is_forgotten_when_its_creation_is_rolled_back(
+        self,
+    ) -> None:
+        social_accounting = self.repository.get_or_create_social_accounting()
+        self.db.session.rollback()
+        self.assertNotEqual(
+            self.repository.get_or_create_social_accounting().id,
+            social_accounting.id,
+        )
+
+    def test_that_social_accounting_is_shared_only_after_its_creation_is_committed(
+        self,
+    ) -> None:
+        social_accounting = self.repository.get_or_create_social_accounting()
+        self.assertIsNone(get_social_accounting_cache().get())
+        self.assertEqual(
+            self.repository.get_or_create_social_accounting(), social_accounting
+        )
+        self.db.session.commit()
+        self.assertEqual(get_social_accounting_cache().get(), social_accounting)
+
+    def test_that_account_id_of_social_accounting_is_available(self) -> None:
+        social_accounting = self.repository.get_or_create_social_accounting()
+        self.assertEqual(
+            self.repository.get_social_accounting_account_id(),
+            social_accounting.account.id,
+        )
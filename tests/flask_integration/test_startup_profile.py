@@ -0,0 +1,77 @@
+from typing import List
+
+from arbeitszeit_flask.startup_profile import (
+    ImportTime,
+    get_total_import_time,
+    measure_import_times,
+    parse_import_times,
+)
+
+from .flask import FlaskTestCase
+
+
+class StartupImportTimeTests(FlaskTestCase):
+    import_times: List[ImportTime]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # Every measurement imports the application in a new interpreter.
+        cls.import_times = measure_import_times()
+
+    def test_that_cold_import_of_application_is_within_budget(self) -> None:
+        self.assertLessEqual(
+            get_total_import_time(self.import_times),
+            self.app.config["STARTUP_IMPORT_BUDGET_SECONDS"],
+        )
+
+    def test_that_matplotlib_is_not_imported_on_startup(self) -> None:
+        self.assertFalse(
+            [
+                import_time.module
+                for import_time in self.import_times
+                if import_time.module.startswith("matplotlib")
+            ]
+        )
+
+    def test_that_blueprints_are_not_imported_on_startup(self) -> None:
+        self.assertFalse(
+            [
+                import_time.module
+                for import_time in self.import_times
+                if import_time.module.endswith(".routes")
+            ]
+        )
+
+
+class ParseImportTimesTests(FlaskTestCase):
+    def test_that_header_is_skipped_and_depth_is_read_from_indentation(
+        self,
+    ) -> None:
+        import_times = parse_import_times(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 |   flask.json",
+                "import time:       200 |        300 | flask",
+            ]
+        )
+        self.assertEqual(
+            [(t.module, t.depth) for t in import_times],
+            [("flask.json", 1), ("flask", 0)],
+        )
+        self.assertAlmostEqual(get_total_import_time(import_times), 0.0003)
+
+
+class StartupProfileCommandTests(FlaskTestCase):
+    def test_that_command_lists_modules_and_total(self) -> None:
+        result = self.app.test_cli_runner().invoke(
+            args=["startup-profile", "--limit", "3"]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("arbeitszeit_flask", result.output)
+        self.assertIn("Importing the application took", result.output)
+
+    def test_that_command_fails_over_budget(self) -> None:
+        self.app.config["STARTUP_IMPORT_BUDGET_SECONDS"] = 0
+        result = self.app.test_cli_runner().invoke(args=["startup-profile"])
+        self.assertNotEqual(result.exit_code, 0)
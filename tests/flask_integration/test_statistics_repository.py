@@ -0,0 +1,47 @@
+from datetime import datetime
+from decimal import Decimal
+from unittest import TestCase
+
+from arbeitszeit.entities import Statistics
+from arbeitszeit.repositories import StatisticsRepository
+
+from .dependency_injection import get_dependency_injector
+
+
+class StatisticsRepositoryTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.repository = self.injector.get(StatisticsRepository)
+
+    def test_return_none_when_no_statistics_are_stored_in_database(self) -> None:
+        assert self.repository.get_latest_statistics() is None
+
+    def test_can_store_and_retrieve_statistics(self) -> None:
+        statistics = make_statistics(datetime(2020, 1, 1, 10))
+        self.repository.store_statistics(statistics)
+        assert self.repository.get_latest_statistics() == statistics
+
+    def test_latest_statistics_are_retrieved(self) -> None:
+        self.repository.store_statistics(make_statistics(datetime(2020, 1, 1, 10)))
+        self.repository.store_statistics(make_statistics(datetime(2020, 3, 1, 10)))
+        self.repository.store_statistics(make_statistics(datetime(2020, 2, 1, 10)))
+        statistics = self.repository.get_latest_statistics()
+        assert statistics
+        assert statistics.calculation_date == datetime(2020, 3, 1, 10)
+
+
+def make_statistics(calculation_date: datetime) -> Statistics:
+    return Statistics(
+        calculation_date=calculation_date,
+        registered_companies_count=3,
+        registered_members_count=12,
+        cooperations_count=1,
+        certificates_count=Decimal("120.5"),
+        available_product=Decimal("80.25"),
+        active_plans_count=4,
+        active_plans_public_count=1,
+        avg_timeframe=Decimal("7.5"),
+        planned_work=Decimal("40"),
+        planned_resources=Decimal("22.5"),
+        planned_means=Decimal("10"),
+    )
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+
+from arbeitszeit.use_cases import UpdatePlansAndPayout
+from arbeitszeit_flask import models
+from arbeitszeit_flask.database.repositories import (
+    AccountingRepository,
+    AccountRepository,
+)
+from arbeitszeit_flask.synthetic_data import SyntheticDataSeeder, SyntheticWorld
+from tests.datetime_service import FakeDatetimeService
+
+from .flask import FlaskTestCase
+
+NOW = datetime(2022, 6, 1, 12)
+
+WORLD = SyntheticWorld(
+    companies=5, members=20, plans=15, cooperations=2, transactions=2000, days=60
+)
+
+
+class SyntheticDataTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(NOW)
+
+    def test_world_of_requested_size_is_created(self) -> None:
+        self.seed()
+        self.assertEqual(models.Company.query.count(), WORLD.companies)
+        self.assertEqual(models.Member.query.count(), WORLD.members)
+        self.assertEqual(models.Plan.query.count(), WORLD.plans)
+        self.assertEqual(models.Cooperation.query.count(), WORLD.cooperations)
+        self.assertEqual(models.Transaction.query.count(), WORLD.transactions)
+        self.assertTrue(models.Purchase.query.count())
+
+    def test_stored_balances_match_transactions(self) -> None:
+        self.seed()
+        account_repository = self.injector.get(AccountRepository)
+        self.assertEqual(account_repository.reconcile_account_balances(), 0)
+
+    def test_no_payouts_are_due_right_after_seeding(self) -> None:
+        self.seed()
+        self.injector.get(UpdatePlansAndPayout)()
+        self.assertEqual(models.Transaction.query.count(), WORLD.transactions)
+
+    def test_same_seed_creates_same_rows(self) -> None:
+        self.assertEqual(self.seed_and_read_plans(), self.seed_and_read_plans())
+
+    def test_different_seeds_create_different_rows(self) -> None:
+        self.assertNotEqual(
+            self.seed_and_read_plans(seed=1), self.seed_and_read_plans(seed=2)
+        )
+
+    def seed_and_read_plans(self, seed: int = 0):
+        self.setUp()
+        self.seed(seed)
+        return sorted(
+            (plan.id, plan.prd_name, plan.costs_a) for plan in models.Plan.query
+        )
+
+    def seed(self, seed: int = 0) -> None:
+        accounting_repository = self.injector.get(AccountingRepository)
+        SyntheticDataSeeder(
+            db=self.db,
+            social_accounting_account=accounting_repository.get_social_accounting_account_id(),
+            now=NOW,
+            world=WORLD,
+            seed=seed,
+            batch_size=100,
+        ).seed_database()
+
+
+class SeedSyntheticCommandTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.injector.get(SQLAlchemy)
+
+    def test_command_seeds_database(self) -> None:
+        result = self.app.test_cli_runner().invoke(
+            args=[
+                "seed-synthetic",
+                "--companies=3",
+                "--members=10",
+                "--plans=4",
+                "--cooperations=1",
+                "--transactions=500",
+                "--days=30",
+            ]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(models.Member.query.count(), 10)
+        self.assertEqual(models.Transaction.query.count(), 500)
@@ -1,8 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
 
+from arbeitszeit.entities import Plan
 from arbeitszeit_flask.database.repositories import TransactionRepository
-from tests.data_generators import AccountGenerator, PlanGenerator
+from tests.data_generators import AccountGenerator, CompanyGenerator, PlanGenerator
 from tests.datetime_service import FakeDatetimeService
 
 from .dependency_injection import injection_test
@@ -46,6 +47,27 @@ def test_created_transactions_show_up_in_all_sent_received_by_account(
     assert repository.all_transactions_sent_by_account(sender_account) == [transaction]
 
 
+@injection_test
+def test_created_transactions_remember_their_plan(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    plan_generator: PlanGenerator,
+) -> None:
+    plan = plan_generator.create_plan()
+    receiver_account = account_generator.create_account()
+    repository.create_transaction(
+        datetime.now(),
+        sending_account=account_generator.create_account(),
+        receiving_account=receiver_account,
+        amount_sent=Decimal(1),
+        amount_received=Decimal(1),
+        purpose="test purpose",
+        plan=plan.id,
+    )
+    [transaction] = repository.all_transactions_received_by_account(receiver_account)
+    assert transaction.plan == plan.id
+
+
 @injection_test
 def test_correct_sales_balance_of_plan_gets_returned_after_one_transaction(
     repository: TransactionRepository,
@@ -56,17 +78,18 @@ def test_correct_sales_balance_of_plan_gets_returned_after_one_transaction(
     plan = plan_generator.create_plan()
     sender_account = account_generator.create_account()
     receiver_account = plan.planner.product_account
-    account_balance_before_transaction = repository.get_sales_balance_of_plan(plan)
+    account_balance_before_transaction = get_sales_balance(repository, plan)
     repository.create_transaction(
         datetime_service.now(),
         sending_account=sender_account,
         receiving_account=receiver_account,
         amount_sent=Decimal(12),
         amount_received=Decimal(10),
-        purpose=f"test {plan.id} test",
+        purpose="test purpose",
+        plan=plan.id,
     )
-    assert repository.get_sales_balance_of_plan(
-        plan
+    assert get_sales_balance(
+        repository, plan
     ) == account_balance_before_transaction + Decimal(10)
 
 
@@ -80,14 +103,15 @@ def test_correct_sales_balance_of_plan_gets_returned_after_two_transactions(
     sender_account_1 = account_generator.create_account()
     sender_account_2 = account_generator.create_account()
     receiver_account = plan.planner.product_account
-    sales_balance_before_transactions = repository.get_sales_balance_of_plan(plan)
+    sales_balance_before_transactions = get_sales_balance(repository, plan)
     repository.create_transaction(
         datetime.now(),
         sending_account=sender_account_1,
         receiving_account=receiver_account,
         amount_sent=Decimal(12),
         amount_received=Decimal(10),
-        purpose=f"test {plan.id} test",
+        purpose="test purpose",
+        plan=plan.id,
     )
     repository.create_transaction(
         datetime.now(),
@@ -95,8 +119,238 @@ def test_correct_sales_balance_of_plan_gets_returned_after_two_transactions(
         receiving_account=receiver_account,
         amount_sent=Decimal(12),
         amount_received=Decimal(15),
-        purpose=f"test2 {plan.id} test2",
+        purpose="test purpose 2",
+        plan=plan.id,
     )
-    assert repository.get_sales_balance_of_plan(
-        plan
+    assert get_sales_balance(
+        repository, plan
     ) == sales_balance_before_transactions + Decimal(25)
+
+
+@injection_test
+def test_sales_balances_are_returned_for_every_plan_of_company(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    plan_generator: PlanGenerator,
+    company_generator: CompanyGenerator,
+) -> None:
+    company = company_generator.create_company()
+    first_plan = plan_generator.create_plan(planner=company)
+    second_plan = plan_generator.create_plan(planner=company)
+    balances_before = repository.get_sales_balances_of_plans_of_company(company)
+    for plan, amount in [(first_plan, 3), (second_plan, 4), (second_plan, 5)]:
+        repository.create_transaction(
+            datetime.now(),
+            sending_account=account_generator.create_account(),
+            receiving_account=company.product_account,
+            amount_sent=Decimal(amount),
+            amount_received=Decimal(amount),
+            purpose="test purpose",
+            plan=plan.id,
+        )
+    balances = repository.get_sales_balances_of_plans_of_company(company)
+    assert balances.keys() == {first_plan.id, second_plan.id}
+    assert balances[first_plan.id] - balances_before[first_plan.id] == 3
+    assert balances[second_plan.id] - balances_before[second_plan.id] == 9
+
+
+@injection_test
+def test_transactions_without_plan_do_not_count_as_sales(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+    company_generator: CompanyGenerator,
+) -> None:
+    company = company_generator.create_company()
+    repository.create_transaction(
+        datetime.now(),
+        sending_account=account_generator.create_account(),
+        receiving_account=company.product_account,
+        amount_sent=Decimal(3),
+        amount_received=Decimal(3),
+        purpose="test purpose",
+    )
+    assert repository.get_sales_balances_of_plans_of_company(company) == {}
+
+
+@injection_test
+def test_account_history_is_ordered_newest_first_with_running_balance(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    received = repository.create_transaction(
+        datetime(2022, 1, 1),
+        sending_account=account_generator.create_account(),
+        receiving_account=account,
+        amount_sent=Decimal(12),
+        amount_received=Decimal(10),
+        purpose="test purpose",
+    )
+    sent = repository.create_transaction(
+        datetime(2022, 1, 2),
+        sending_account=account,
+        receiving_account=account_generator.create_account(),
+        amount_sent=Decimal(3),
+        amount_received=Decimal(2),
+        purpose="test purpose",
+    )
+    history = repository.get_page_of_account_history(account, limit=10)
+    assert [(entry.transaction, entry.balance) for entry in history] == [
+        (sent, Decimal(7)),
+        (received, Decimal(10)),
+    ]
+
+
+@injection_test
+def test_account_history_pages_continue_after_and_before_a_transaction(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    transactions = [
+        repository.create_transaction(
+            datetime(2022, 1, day),
+            sending_account=account_generator.create_account(),
+            receiving_account=account,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+        for day in range(1, 6)
+    ]
+    newest_first = list(reversed(transactions))
+    page = repository.get_page_of_account_history(
+        account, limit=2, after=newest_first[1].id
+    )
+    assert [entry.transaction for entry in page] == newest_first[2:4]
+    assert [entry.balance for entry in page] == [Decimal(3), Decimal(2)]
+    page = repository.get_page_of_account_history(
+        account, limit=2, before=newest_first[3].id
+    )
+    assert [entry.transaction for entry in page] == newest_first[1:3]
+
+
+@injection_test
+def test_account_history_breaks_ties_in_date_by_id(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    for _ in range(3):
+        repository.create_transaction(
+            datetime(2022, 1, 1),
+            sending_account=account_generator.create_account(),
+            receiving_account=account,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+    history = repository.get_page_of_account_history(account, limit=3)
+    assert [entry.transaction.id for entry in history] == sorted(
+        (entry.transaction.id for entry in history), reverse=True
+    )
+    assert [entry.balance for entry in history] == [3, 2, 1]
+    page = repository.get_page_of_account_history(
+        account, limit=3, after=history[0].transaction.id
+    )
+    assert page == history[1:]
+
+
+@injection_test
+def test_account_balance_history_is_ordered_oldest_first(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    repository.create_transaction(
+        datetime(2022, 1, 2),
+        sending_account=account,
+        receiving_account=account_generator.create_account(),
+        amount_sent=Decimal(3),
+        amount_received=Decimal(3),
+        purpose="test purpose",
+    )
+    repository.create_transaction(
+        datetime(2022, 1, 1),
+        sending_account=account_generator.create_account(),
+        receiving_account=account,
+        amount_sent=Decimal(5),
+        amount_received=Decimal(5),
+        purpose="test purpose",
+    )
+    assert repository.get_account_balance_history(account) == [
+        (datetime(2022, 1, 1), Decimal(5)),
+        (datetime(2022, 1, 2), Decimal(2)),
+    ]
+
+
+@injection_test
+def test_transactions_of_accounts_are_sent_or_received_and_ordered_oldest_first(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    first_account = account_generator.create_account()
+    second_account = account_generator.create_account()
+    other_account = account_generator.create_account()
+    dates = [datetime(2022, 1, 3), datetime(2022, 1, 1), datetime(2022, 1, 2)]
+    transactions = [
+        repository.create_transaction(
+            date,
+            sending_account=sender,
+            receiving_account=receiver,
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+        for date, (sender, receiver) in zip(
+            dates,
+            [
+                (first_account, other_account),
+                (other_account, second_account),
+                (other_account, account_generator.create_account()),
+            ],
+        )
+    ]
+    assert list(
+        repository.get_transactions_of_accounts([first_account, second_account])
+    ) == [transactions[1], transactions[0]]
+
+
+@injection_test
+def test_transactions_of_accounts_can_be_limited_to_a_date_range(
+    repository: TransactionRepository,
+    account_generator: AccountGenerator,
+) -> None:
+    account = account_generator.create_account()
+    transactions = [
+        repository.create_transaction(
+            datetime(2022, 1, day),
+            sending_account=account,
+            receiving_account=account_generator.create_account(),
+            amount_sent=Decimal(1),
+            amount_received=Decimal(1),
+            purpose="test purpose",
+        )
+        for day in range(1, 5)
+    ]
+    assert (
+        list(
+            repository.get_transactions_of_accounts(
+                [account], since=datetime(2022, 1, 2), until=datetime(2022, 1, 4)
+            )
+        )
+        == transactions[1:3]
+    )
+
+
+@injection_test
+def test_no_transactions_of_no_accounts(
+    repository: TransactionRepository,
+) -> None:
+    assert not list(repository.get_transactions_of_accounts([]))
+
+
+def get_sales_balance(repository: TransactionRepository, plan: Plan) -> Decimal:
+    return repository.get_sales_balances_of_plans_of_company(plan.planner).get(
+        plan.id, Decimal(0)
+    )
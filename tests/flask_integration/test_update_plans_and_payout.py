@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import TestCase
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import IntegrityError
+
+from arbeitszeit.entities import ProductionCosts, SocialAccounting
+from arbeitszeit.payout_partition import PayoutPartition
+from arbeitszeit.use_cases import UpdatePlansAndPayout
+from arbeitszeit_flask.database.repositories import (
+    AccountRepository,
+    PayoutLockRepository,
+    PlanRepository,
+    TransactionRepository,
+)
+from tests.data_generators import CooperationGenerator, PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+
+from .flask import FlaskTestCase
+from .sql_statements import record_sql_statements
+
+
+class UpdatePlansAndPayoutTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db = self.injector.get(SQLAlchemy)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.plan_repository = self.injector.get(PlanRepository)
+        self.account_repository = self.injector.get(AccountRepository)
+        self.datetime_service.freeze_time(datetime(2021, 10, 2, 10))
+        self.payout = self.injector.get(UpdatePlansAndPayout)
+
+    def test_number_of_sql_statements_does_not_depend_on_number_of_plans(
+        self,
+    ) -> None:
+        self.create_plans(2)
+        with record_sql_statements(self.db) as statements_for_two_plans:
+            self.payout()
+        self.create_plans(8)
+        self.datetime_service.freeze_time(datetime(2021, 10, 3, 11))
+        with record_sql_statements(self.db) as statements_for_ten_plans:
+            self.payout()
+        self.assertEqual(len(statements_for_two_plans), len(statements_for_ten_plans))
+
+    def test_that_overdue_wages_are_paid_out_to_work_account(self) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now(),
+            timeframe=5,
+            costs=ProductionCosts(Decimal(10), Decimal(1), Decimal(1)),
+        )
+        self.datetime_service.freeze_time(datetime(2021, 10, 4, 11))
+        self.payout()
+        assert self.account_repository.get_account_balance(
+            plan.planner.work_account
+        ) == Decimal(6)
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        assert updated_plan.payout_count == 3
+        assert updated_plan.active_days(self.datetime_service.now()) == 2
+
+    def test_that_expired_plans_are_deactivated_and_leave_their_cooperation(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now() - timedelta(days=10),
+            timeframe=5,
+            cooperation=self.cooperation_generator.create_cooperation(),
+        )
+        self.payout()
+        updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+        assert updated_plan
+        assert updated_plan.expired
+        assert not updated_plan.is_active
+        assert updated_plan.cooperation is None
+        assert updated_plan.payout_count == 5
+
+    def test_that_running_payout_twice_does_not_pay_twice(self) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now(),
+            timeframe=5,
+            costs=ProductionCosts(Decimal(10), Decimal(1), Decimal(1)),
+        )
+        self.payout()
+        self.payout()
+        assert self.account_repository.get_account_balance(
+            plan.planner.work_account
+        ) == Decimal(2)
+
+    def test_that_paying_out_all_partitions_pays_every_plan_once(self) -> None:
+        plans = [
+            self.plan_generator.create_plan(
+                activation_date=self.datetime_service.now(),
+                timeframe=5,
+                costs=ProductionCosts(Decimal(10), Decimal(1), Decimal(1)),
+            )
+            for _ in range(6)
+        ]
+        for partition in PayoutPartition.split(4):
+            assert self.payout.pay_out_partition(partition, Decimal(1))
+        for plan in plans:
+            updated_plan = self.plan_repository.get_plan_by_id(plan.id)
+            assert updated_plan
+            assert updated_plan.payout_count == 1
+            assert self.account_repository.get_account_balance(
+                plan.planner.work_account
+            ) == Decimal(2)
+
+    def test_that_a_plan_cannot_be_paid_twice_for_the_same_day(self) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now(), timeframe=5
+        )
+        self.payout()
+        social_accounting = self.injector.get(SocialAccounting)
+        transaction_repository = self.injector.get(TransactionRepository)
+        with self.assertRaises(IntegrityError):
+            transaction_repository.create_transactions(
+                [
+                    TransactionRepository.NewTransaction(
+                        date=self.datetime_service.now(),
+                        sending_account=social_accounting.account,
+                        receiving_account=plan.planner.work_account,
+                        amount_sent=Decimal(1),
+                        amount_received=Decimal(1),
+                        purpose=f"Plan-Id: {plan.id}",
+                        plan=plan.id,
+                        payout_day=0,
+                    )
+                ]
+            )
+        self.db.session.rollback()
+
+    def test_command_skips_partition_with_plans_paid_out_concurrently(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now(),
+            timeframe=5,
+            costs=ProductionCosts(Decimal(10), Decimal(1), Decimal(1)),
+        )
+        social_accounting = self.injector.get(SocialAccounting)
+        self.injector.get(TransactionRepository).create_transactions(
+            [
+                TransactionRepository.NewTransaction(
+                    date=self.datetime_service.now(),
+                    sending_account=social_accounting.account,
+                    receiving_account=plan.planner.work_account,
+                    amount_sent=Decimal(1),
+                    amount_received=Decimal(1),
+                    purpose=f"Plan-Id: {plan.id}",
+                    plan=plan.id,
+                    payout_day=0,
+                )
+            ]
+        )
+        self.db.session.commit()
+        result = self.app.test_cli_runner().invoke(args=["payout"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Skipped partition 1 of 1", result.output)
+        assert self.account_repository.get_account_balance(
+            plan.planner.work_account
+        ) == Decimal(1)
+
+    def create_plans(self, count: int) -> None:
+        for _ in range(count):
+            self.plan_generator.create_plan(
+                activation_date=self.datetime_service.now(), timeframe=5
+            )
+
+
+class PayoutLockRepositoryTests(TestCase):
+    def test_partitions_of_different_counts_have_different_lock_keys(
+        self,
+    ) -> None:
+        keys = [
+            PayoutLockRepository._advisory_lock_key(partition)
+            for count in range(1, 20)
+            for partition in PayoutPartition.split(count)
+        ]
+        self.assertEqual(len(keys), len(set(keys)))
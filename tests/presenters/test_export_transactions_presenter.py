@@ -0,0 +1,97 @@
+import csv
+import json
+from datetime import datetime
+from decimal import Decimal
+from io import StringIO
+from typing import List
+from unittest import TestCase
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.use_cases.export_transactions import (
+    ExportedTransaction,
+    ExportTransactionsResponse,
+)
+from arbeitszeit_web.export_transactions import (
+    EXPORT_COLUMNS,
+    ExportFormat,
+    ExportTransactionsPresenter,
+)
+
+from .dependency_injection import get_dependency_injector
+
+TRANSACTION = ExportedTransaction(
+    date=datetime(2022, 1, 2, 10, 30),
+    transaction_type=TransactionTypes.payment_of_wages,
+    account_type=AccountTypes.a,
+    transaction_volume=Decimal("-3.5"),
+    purpose='wages, "January"',
+)
+
+
+class ExportTransactionsPresenterTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.presenter = self.injector.get(ExportTransactionsPresenter)
+
+    def test_csv_export_without_transactions_only_has_header(self) -> None:
+        view_model = self.presenter.present(self._response([]), ExportFormat.csv)
+        self.assertEqual(
+            list(csv.reader(StringIO("".join(view_model.lines)))), [EXPORT_COLUMNS]
+        )
+
+    def test_csv_export_has_one_row_per_transaction(self) -> None:
+        view_model = self.presenter.present(
+            self._response([TRANSACTION, TRANSACTION]), ExportFormat.csv
+        )
+        rows = list(csv.DictReader(StringIO("".join(view_model.lines))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(
+            rows[0],
+            dict(
+                date="2022-01-02T10:30:00",
+                transaction_type="payment_of_wages",
+                account_type="a",
+                transaction_volume="-3.5",
+                purpose='wages, "January"',
+            ),
+        )
+
+    def test_csv_export_is_offered_as_csv_file(self) -> None:
+        view_model = self.presenter.present(self._response([]), ExportFormat.csv)
+        self.assertEqual(view_model.content_type, "text/csv")
+        self.assertEqual(view_model.filename, "transactions.csv")
+
+    def test_ndjson_export_has_one_json_object_per_line(self) -> None:
+        view_model = self.presenter.present(
+            self._response([TRANSACTION]), ExportFormat.ndjson
+        )
+        lines = list(view_model.lines)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("\n"))
+        self.assertEqual(json.loads(lines[0])["transaction_volume"], "-3.5")
+        self.assertEqual(view_model.content_type, "application/x-ndjson")
+
+    def test_transactions_are_consumed_lazily(self) -> None:
+        consumed: List[ExportedTransaction] = []
+
+        def transactions():
+            for transaction in [TRANSACTION, TRANSACTION]:
+                consumed.append(transaction)
+                yield transaction
+
+        view_model = self.presenter.present(
+            ExportTransactionsResponse(
+                rejection_reason=None, transactions=transactions()
+            ),
+            ExportFormat.ndjson,
+        )
+        next(view_model.lines)
+        self.assertEqual(len(consumed), 1)
+
+    def _response(
+        self, transactions: List[ExportedTransaction]
+    ) -> ExportTransactionsResponse:
+        return ExportTransactionsResponse(
+            rejection_reason=None, transactions=iter(transactions)
+        )
@@ -26,6 +26,7 @@ TESTING_RESPONSE_MODEL = StatisticsResponse(
     payout_factor=PayoutFactor(
         calculation_date=datetime(2020, 1, 1, 10), value=Decimal("0.74516")
     ),
+    calculation_date=datetime(2020, 1, 1, 10),
 )
 
 
@@ -197,6 +198,13 @@ class GetStatisticsPresenterTests(TestCase):
             view_model.barplot_plans_url,
         )
 
+    def test_that_plot_url_for_payout_factor_history_is_returned(self):
+        view_model = self.presenter.present(TESTING_RESPONSE_MODEL)
+        self.assertEqual(
+            view_model.payout_factor_history_plot_url,
+            "line plot of payout factor history",
+        )
+
     def test_that_payout_factor_is_correctly_shown_when_it_exists(self):
         assert TESTING_RESPONSE_MODEL.payout_factor is not None
         view_model = self.presenter.present(TESTING_RESPONSE_MODEL)
@@ -238,3 +246,19 @@ class GetStatisticsPresenterTests(TestCase):
             view_model.payout_factor_explanation,
             self.translator.gettext("Not found."),
         )
+
+    def test_that_calculation_date_of_statistics_is_shown(self):
+        response = replace(
+            TESTING_RESPONSE_MODEL, calculation_date=datetime(2022, 3, 4, 5, 6)
+        )
+        expected_timestamp = self.datetime_service.format_datetime(
+            response.calculation_date,
+            zone="Europe/Berlin",
+            fmt="%d.%m.%Y %H:%M",
+        )
+        view_model = self.presenter.present(response)
+        self.assertEqual(
+            view_model.calculation_date,
+            self.translator.gettext("As of %(timestamp)s")
+            % dict(timestamp=expected_timestamp),
+        )
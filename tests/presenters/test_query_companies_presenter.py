@@ -40,3 +40,13 @@ class QueryCompaniesPresenterTests(TestCase):
     def test_dont_show_notifications_when_results_are_found(self):
         self.presenter.present(RESPONSE_WITH_ONE_RESULT)
         self.assertFalse(self.notifier.warnings)
+
+    def test_that_page_cursors_are_passed_on_to_view_model(self):
+        response = CompanyQueryResponse(
+            results=RESPONSE_WITH_ONE_RESULT.results,
+            next_page="next",
+            previous_page="previous",
+        )
+        presentation = self.presenter.present(response)
+        self.assertEqual(presentation.next_page_cursor, "next")
+        self.assertEqual(presentation.previous_page_cursor, "previous")
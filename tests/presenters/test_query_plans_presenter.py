@@ -120,6 +120,21 @@ class QueryPlansPresenterTests(TestCase):
         self.assertIn(expected_substring, table_row.description)
         self.assertNotIn(unexpected_substring, table_row.description)
 
+    def test_that_page_cursors_are_passed_on_to_view_model(self) -> None:
+        response = PlanQueryResponse(
+            results=[self._get_queried_plan()],
+            next_page="next",
+            previous_page="previous",
+        )
+        presentation = self.presenter.present(response)
+        self.assertEqual(presentation.next_page_cursor, "next")
+        self.assertEqual(presentation.previous_page_cursor, "previous")
+
+    def test_that_empty_view_model_has_no_page_cursors(self) -> None:
+        presentation = self.presenter.get_empty_view_model()
+        self.assertIsNone(presentation.next_page_cursor)
+        self.assertIsNone(presentation.previous_page_cursor)
+
     def _get_queried_plan(
         self,
         plan_id: UUID = None,
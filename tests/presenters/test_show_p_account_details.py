@@ -19,6 +19,7 @@ DEFAULT_INFO1 = ShowPAccountDetailsUseCase.TransactionInfo(
     date=datetime.now(),
     transaction_volume=Decimal(10.002),
     purpose="Test purpose",
+    balance=Decimal(10),
 )
 
 DEFAULT_INFO2 = ShowPAccountDetailsUseCase.TransactionInfo(
@@ -26,6 +27,7 @@ DEFAULT_INFO2 = ShowPAccountDetailsUseCase.TransactionInfo(
     date=datetime.now(),
     transaction_volume=Decimal(20),
     purpose="Test purpose",
+    balance=Decimal(10),
 )
 
 
@@ -69,6 +71,26 @@ class CompanyTransactionsPresenterTests(TestCase):
         view_model = self.presenter.present(response)
         self.assertTrue(len(view_model.transactions), 2)
 
+    def test_balance_after_transaction_is_rounded_to_two_digits(self):
+        response = self._use_case_response(transactions=[DEFAULT_INFO1])
+        view_model = self.presenter.present(response)
+        self.assertEqual(
+            view_model.transactions[0].balance, str(round(DEFAULT_INFO1.balance, 2))
+        )
+
+    def test_page_cursors_are_passed_to_view_model(self):
+        response = ShowPAccountDetailsUseCase.Response(
+            company_id=uuid4(),
+            transactions=[DEFAULT_INFO1],
+            account_balance=Decimal(0),
+            plot=ShowPAccountDetailsUseCase.PlotDetails([], []),
+            next_page="next cursor",
+            previous_page="previous cursor",
+        )
+        view_model = self.presenter.present(response)
+        self.assertEqual(view_model.next_page_cursor, "next cursor")
+        self.assertEqual(view_model.previous_page_cursor, "previous cursor")
+
     def test_presenter_returns_a_plot_url_with_company_id_as_parameter(self):
         response = self._use_case_response()
         view_model = self.presenter.present(response)
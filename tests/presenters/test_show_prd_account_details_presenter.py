@@ -20,6 +20,7 @@ DEFAULT_INFO1 = ShowPRDAccountDetailsUseCase.TransactionInfo(
     transaction_volume=Decimal(10.007),
     purpose="Test purpose",
     buyer=None,
+    balance=Decimal(10),
 )
 
 DEFAULT_INFO2 = ShowPRDAccountDetailsUseCase.TransactionInfo(
@@ -30,6 +31,7 @@ DEFAULT_INFO2 = ShowPRDAccountDetailsUseCase.TransactionInfo(
     buyer=ShowPRDAccountDetailsUseCase.Buyer(
         buyer_is_member=True, buyer_id=uuid4(), buyer_name="member name"
     ),
+    balance=Decimal(10),
 )
 
 
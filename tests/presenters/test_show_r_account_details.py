@@ -19,6 +19,7 @@ DEFAULT_INFO1 = ShowRAccountDetailsUseCase.TransactionInfo(
     date=datetime.now(),
     transaction_volume=Decimal(10.007),
     purpose="Test purpose",
+    balance=Decimal(10),
 )
 
 DEFAULT_INFO2 = ShowRAccountDetailsUseCase.TransactionInfo(
@@ -26,6 +27,7 @@ DEFAULT_INFO2 = ShowRAccountDetailsUseCase.TransactionInfo(
     date=datetime.now(),
     transaction_volume=Decimal(20.103),
     purpose="Test purpose",
+    balance=Decimal(10),
 )
 
 
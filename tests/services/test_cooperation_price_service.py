@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import TestCase
+
+from arbeitszeit.cooperation_price import CooperationPriceService
+from arbeitszeit.entities import ProductionCosts
+from arbeitszeit.price_calculator import calculate_price
+from arbeitszeit.use_cases.update_plans_and_payout import UpdatePlansAndPayout
+from tests.data_generators import CooperationGenerator, PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+from tests.use_cases.dependency_injection import get_dependency_injector
+from tests.use_cases.repositories import PlanCooperationRepository
+
+
+class CooperationPriceServiceTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.service = self.injector.get(CooperationPriceService)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.coop_generator = self.injector.get(CooperationGenerator)
+        self.plan_cooperation_repository = self.injector.get(PlanCooperationRepository)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+
+    def test_that_price_of_plan_without_cooperation_is_its_individual_price(
+        self,
+    ) -> None:
+        plan = self.create_plan(costs=10)
+        self.assertEqual(self.service.get_price_per_unit(plan), Decimal(1))
+
+    def test_that_plans_in_cooperation_have_the_cooperation_price(self) -> None:
+        first_plan = self.create_plan(costs=10)
+        second_plan = self.create_plan(costs=20)
+        self.coop_generator.create_cooperation(plans=[first_plan, second_plan])
+        prices = self.service.get_prices_per_unit([first_plan, second_plan])
+        self.assertEqual(prices[first_plan.id], Decimal("1.5"))
+        self.assertEqual(prices[second_plan.id], Decimal("1.5"))
+
+    def test_that_prices_are_returned_for_every_requested_plan(self) -> None:
+        plans = [self.create_plan(costs=costs) for costs in (10, 20, 30)]
+        self.coop_generator.create_cooperation(plans=plans[:2])
+        prices = self.service.get_prices_per_unit(plans)
+        self.assertEqual(set(prices), {plan.id for plan in plans})
+        self.assertEqual(prices[plans[2].id], calculate_price([plans[2]]))
+
+    def test_that_price_changes_when_plan_joins_cooperation(self) -> None:
+        first_plan = self.create_plan(costs=10)
+        cooperation = self.coop_generator.create_cooperation(plans=[first_plan])
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal(1))
+        second_plan = self.create_plan(costs=20)
+        self.plan_cooperation_repository.add_plan_to_cooperation(
+            second_plan.id, cooperation.id
+        )
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal("1.5"))
+
+    def test_that_price_changes_when_plan_leaves_cooperation(self) -> None:
+        first_plan = self.create_plan(costs=10)
+        second_plan = self.create_plan(costs=20)
+        self.coop_generator.create_cooperation(plans=[first_plan, second_plan])
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal("1.5"))
+        self.plan_cooperation_repository.remove_plan_from_cooperation(second_plan.id)
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal(1))
+
+    def test_that_price_changes_when_plan_in_cooperation_expires(self) -> None:
+        self.datetime_service.freeze_time(datetime(2021, 10, 2, 10))
+        first_plan = self.create_plan(
+            costs=10, activation_date=self.datetime_service.now()
+        )
+        second_plan = self.create_plan(
+            costs=20,
+            activation_date=self.datetime_service.now() - timedelta(days=10),
+        )
+        self.coop_generator.create_cooperation(plans=[first_plan, second_plan])
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal("1.5"))
+        self.injector.get(UpdatePlansAndPayout)()
+        self.assertEqual(self.service.get_price_per_unit(first_plan), Decimal(1))
+
+    def create_plan(self, costs: int, activation_date: datetime = datetime.min):
+        return self.plan_generator.create_plan(
+            activation_date=activation_date,
+            costs=ProductionCosts(Decimal(costs), Decimal(0), Decimal(0)),
+            amount=10,
+            timeframe=5,
+        )
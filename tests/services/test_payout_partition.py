@@ -0,0 +1,35 @@
+from unittest import TestCase
+from uuid import UUID, uuid4
+
+from arbeitszeit.payout_partition import PayoutPartition
+
+
+class PayoutPartitionTests(TestCase):
+    def test_that_every_planner_is_in_exactly_one_partition(self) -> None:
+        partitions = PayoutPartition.split(7)
+        for _ in range(100):
+            planner = uuid4()
+            self.assertEqual(
+                len([p for p in partitions if p.contains(planner)]),
+                1,
+            )
+
+    def test_that_smallest_and_largest_ids_are_in_first_and_last_partition(
+        self,
+    ) -> None:
+        first, *_, last = PayoutPartition.split(4)
+        self.assertTrue(first.contains(UUID(int=0)))
+        self.assertTrue(last.contains(UUID(int=2**128 - 1)))
+
+    def test_that_single_partition_contains_all_planners(self) -> None:
+        partition = PayoutPartition.all_plans()
+        self.assertEqual(partition.planner_id_range(), ("00000000", None))
+
+    def test_that_bounds_of_neighbouring_partitions_match(self) -> None:
+        first, second = PayoutPartition.split(2)
+        self.assertEqual(first.planner_id_range(), ("00000000", "80000000"))
+        self.assertEqual(second.planner_id_range(), ("80000000", None))
+
+    def test_that_index_out_of_range_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            PayoutPartition(index=2, count=2)
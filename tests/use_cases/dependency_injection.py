@@ -2,6 +2,7 @@ from injector import Injector, Module, inject, provider, singleton
 
 import arbeitszeit.repositories as interfaces
 from arbeitszeit import entities
+from arbeitszeit.cooperation_price import CooperationPriceCache, CooperationPriceService
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.token import InvitationTokenValidator, TokenDeliverer, TokenService
 from arbeitszeit.use_cases import GetCompanySummary
@@ -181,6 +182,11 @@ class InMemoryModule(Module):
     ) -> interfaces.PlanCooperationRepository:
         return repo
 
+    @singleton
+    @provider
+    def provide_cooperation_price_cache(self) -> CooperationPriceCache:
+        return CooperationPriceCache()
+
     @singleton
     @provider
     def provide_payout_factor_repository(
@@ -188,6 +194,19 @@ class InMemoryModule(Module):
     ) -> interfaces.PayoutFactorRepository:
         return repo
 
+    @provider
+    def provide_payout_lock_repository(
+        self, repo: repositories.FakePayoutLockRepository
+    ) -> interfaces.PayoutLockRepository:
+        return repo
+
+    @singleton
+    @provider
+    def provide_statistics_repository(
+        self, repo: repositories.FakeStatisticsRepository
+    ) -> interfaces.StatisticsRepository:
+        return repo
+
     @provider
     def provide_token_service(self, token_service: FakeTokenService) -> TokenService:
         return token_service
@@ -257,7 +276,7 @@ class InMemoryModule(Module):
         datetime_service: DatetimeService,
         purchase_repository: interfaces.PurchaseRepository,
         transaction_repository: interfaces.TransactionRepository,
-        plan_cooperation_repository: interfaces.PlanCooperationRepository,
+        price_service: CooperationPriceService,
         account_repository: interfaces.AccountRepository,
         control_thresholds: ControlThresholdsTestImpl,
     ) -> ConsumerProductTransactionFactory:
@@ -265,7 +284,7 @@ class InMemoryModule(Module):
             datetime_service=datetime_service,
             purchase_repository=purchase_repository,
             transaction_repository=transaction_repository,
-            plan_cooperation_repository=plan_cooperation_repository,
+            price_service=price_service,
             account_repository=account_repository,
             control_thresholds=control_thresholds,
         )
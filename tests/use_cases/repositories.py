@@ -1,19 +1,33 @@
 from __future__ import annotations
 
+import re
 from bisect import insort
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from itertools import islice
 from operator import attrgetter
 from statistics import StatisticsError, mean
-from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 from injector import inject, singleton
 
 import arbeitszeit.repositories as interfaces
+from arbeitszeit.cooperation_price import CooperationPriceCache
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.decimal import decimal_sum
 from arbeitszeit.entities import (
@@ -23,6 +37,7 @@ from arbeitszeit.entities import (
     Company,
     CompanyWorkInvite,
     Cooperation,
+    DailyPayoutFactor,
     Member,
     PayoutFactor,
     Plan,
@@ -31,8 +46,11 @@ from arbeitszeit.entities import (
     Purchase,
     PurposesOfPurchases,
     SocialAccounting,
+    Statistics,
     Transaction,
 )
+from arbeitszeit.payout_partition import PayoutPartition
+from arbeitszeit.price_calculator import calculate_price
 
 
 @singleton
@@ -112,6 +130,7 @@ class TransactionRepository(interfaces.TransactionRepository):
         amount_sent: Decimal,
         amount_received: Decimal,
         purpose: str,
+        plan: Optional[UUID] = None,
     ) -> Transaction:
         transaction = Transaction(
             id=uuid4(),
@@ -121,10 +140,25 @@ class TransactionRepository(interfaces.TransactionRepository):
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
+            plan=plan,
         )
         self.transactions.append(transaction)
         return transaction
 
+    def create_transactions(
+        self, transactions: List[interfaces.TransactionRepository.NewTransaction]
+    ) -> None:
+        for transaction in transactions:
+            self.create_transaction(
+                date=transaction.date,
+                sending_account=transaction.sending_account,
+                receiving_account=transaction.receiving_account,
+                amount_sent=transaction.amount_sent,
+                amount_received=transaction.amount_received,
+                purpose=transaction.purpose,
+                plan=transaction.plan,
+            )
+
     def all_transactions_sent_by_account(self, account: Account) -> List[Transaction]:
         all_sent = []
         for transaction in self.transactions:
@@ -141,14 +175,93 @@ class TransactionRepository(interfaces.TransactionRepository):
                 all_received.append(transaction)
         return all_received
 
-    def get_sales_balance_of_plan(self, plan: Plan) -> Decimal:
-        balance = Decimal(0)
+    def get_sales_balances_of_plans_of_company(
+        self, company: Company
+    ) -> Dict[UUID, Decimal]:
+        balances: Dict[UUID, Decimal] = defaultdict(Decimal)
         for transaction in self.transactions:
-            if (transaction.receiving_account == plan.planner.product_account) and (
-                str(plan.id) in transaction.purpose
+            if (
+                transaction.receiving_account == company.product_account
+                and transaction.plan is not None
             ):
+                balances[transaction.plan] += transaction.amount_received
+        return dict(balances)
+
+    def get_page_of_account_history(
+        self,
+        account: Account,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+    ) -> List[interfaces.TransactionRepository.AccountHistoryEntry]:
+        history = self._get_account_history(account)
+        boundary_id = before or after
+        return get_keyset_page(
+            history,
+            lambda entry: (entry.transaction.date, str(entry.transaction.id)),
+            next(
+                (entry for entry in history if entry.transaction.id == boundary_id),
+                None,
+            ),
+            limit,
+            is_backward=before is not None,
+            descending=True,
+        )
+
+    def get_account_balance_history(
+        self, account: Account
+    ) -> List[Tuple[datetime, Decimal]]:
+        return [
+            (entry.transaction.date, entry.balance)
+            for entry in self._get_account_history(account)
+        ]
+
+    def get_transactions_of_accounts(
+        self,
+        accounts: Iterable[Account],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Transaction]:
+        account_ids = {account.id for account in accounts}
+        return iter(
+            sorted(
+                (
+                    transaction
+                    for transaction in self.transactions
+                    if (
+                        transaction.sending_account.id in account_ids
+                        or transaction.receiving_account.id in account_ids
+                    )
+                    and (since is None or transaction.date >= since)
+                    and (until is None or transaction.date < until)
+                ),
+                key=lambda transaction: (transaction.date, str(transaction.id)),
+            )
+        )
+
+    def _get_account_history(
+        self, account: Account
+    ) -> List[interfaces.TransactionRepository.AccountHistoryEntry]:
+        transactions = sorted(
+            (
+                transaction
+                for transaction in self.transactions
+                if account
+                in (transaction.sending_account, transaction.receiving_account)
+            ),
+            key=lambda transaction: (transaction.date, str(transaction.id)),
+        )
+        history = []
+        balance = Decimal(0)
+        for transaction in transactions:
+            if transaction.sending_account == transaction.receiving_account:
+                pass
+            elif transaction.receiving_account == account:
                 balance += transaction.amount_received
-        return balance
+            else:
+                balance -= transaction.amount_sent
+            history.append(self.AccountHistoryEntry(transaction, balance))
+        return history
 
 
 @singleton
@@ -211,6 +324,13 @@ class AccountRepository(interfaces.AccountRepository):
             transaction.amount_received for transaction in received_transactions
         ) - decimal_sum(transaction.amount_sent for transaction in sent_transactions)
 
+    def get_sum_of_balances(self, account_type: AccountTypes) -> Decimal:
+        return decimal_sum(
+            self.get_account_balance(account)
+            for account in self.accounts
+            if account.account_type == account_type
+        )
+
     @classmethod
     def _remove_intersection(
         cls,
@@ -256,6 +376,28 @@ class AccountOwnerRepository(interfaces.AccountOwnerRepository):
         for company in self.company_repository.companies.values():
             if account in company.accounts():
                 return company
+        raise Exception("Account owner not found")
+
+    def get_owner_names(
+        self, accounts: Iterable[UUID]
+    ) -> Dict[UUID, interfaces.AccountOwnerRepository.OwnerName]:
+        owner_names = {
+            self.social_accounting.account.id: self.OwnerName(
+                self.social_accounting.id, self.social_accounting.get_name()
+            )
+        }
+        owners: List[Union[Member, Company]] = [
+            *self.member_repository.members.values(),
+            *self.company_repository.companies.values(),
+        ]
+        for owner in owners:
+            for account in owner.accounts():
+                owner_names[account.id] = self.OwnerName(owner.id, owner.get_name())
+        return {
+            account: owner_names[account]
+            for account in accounts
+            if account in owner_names
+        }
         # This exception is not meant to be caught. That's why we
         # raise a base exception
         raise Exception("Owner not found")
@@ -393,6 +535,29 @@ class CompanyRepository(interfaces.CompanyRepository):
     def get_all_companies(self) -> Iterator[Company]:
         yield from self.companies.values()
 
+    def get_page_of_companies(
+        self,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        name: Optional[str] = None,
+        email: Optional[str] = None,
+    ) -> List[Company]:
+        companies = [
+            company
+            for company in self.companies.values()
+            if (name is None or name.lower() in company.name.lower())
+            and (email is None or email.lower() in company.email.lower())
+        ]
+        boundary_id = before or after
+        return get_keyset_page(
+            companies,
+            lambda company: (company.name.lower(), str(company.id)),
+            self.get_by_id(boundary_id) if boundary_id else None,
+            limit,
+            is_backward=before is not None,
+        )
+
     def validate_credentials(self, email_address: str, password: str) -> Optional[UUID]:
         if company := self.companies.get(email_address):
             if correct_password := self.passwords.get(company.id):
@@ -407,9 +572,11 @@ class PlanRepository(interfaces.PlanRepository):
     def __init__(
         self,
         company_repository: CompanyRepository,
+        price_cache: CooperationPriceCache,
     ) -> None:
         self.plans: Dict[UUID, Plan] = {}
         self.company_repository = company_repository
+        self.price_cache = price_cache
 
     def get_plan_by_id(self, id: UUID) -> Optional[Plan]:
         return self.plans.get(id)
@@ -441,25 +608,48 @@ class PlanRepository(interfaces.PlanRepository):
     def activate_plan(self, plan: Plan, activation_date: datetime) -> None:
         plan.is_active = True
         plan.activation_date = activation_date
+        plan.expiration_date = activation_date + timedelta(days=plan.timeframe)
 
     def set_plan_as_expired(self, plan: Plan) -> None:
+        if plan.cooperation:
+            self.price_cache.forget(plan.cooperation)
         plan.expired = True
         plan.is_active = False
 
-    def set_expiration_date(self, plan: Plan, expiration_date: datetime) -> None:
-        plan.expiration_date = expiration_date
-
-    def set_active_days(self, plan: Plan, full_active_days: int) -> None:
-        plan.active_days = full_active_days
-
     def increase_payout_count_by_one(self, plan: Plan) -> None:
         plan.payout_count += 1
 
+    def apply_payout_updates(
+        self, updates: List[interfaces.PlanRepository.PayoutUpdate]
+    ) -> None:
+        for update in updates:
+            plan = self.plans[update.plan]
+            plan.payout_count = update.payout_count
+            if update.is_expired:
+                if plan.cooperation:
+                    self.price_cache.forget(plan.cooperation)
+                plan.expired = True
+                plan.is_active = False
+                plan.cooperation = None
+                plan.requested_cooperation = None
+
     def get_active_plans(self) -> Iterator[Plan]:
         for plan in self.plans.values():
             if plan.is_active:
                 yield plan
 
+    def get_plans_due_for_payout(
+        self, partition: PayoutPartition, now: datetime
+    ) -> Iterator[Plan]:
+        for plan in self.get_active_plans():
+            if not partition.contains(plan.planner.id):
+                continue
+            assert plan.activation_date
+            assert plan.expiration_date
+            next_payout_date = plan.activation_date + timedelta(days=plan.payout_count)
+            if plan.expiration_date < now or next_payout_date <= now:
+                yield plan
+
     def get_three_latest_active_plans_ordered_by_activation_date(
         self,
     ) -> Iterator[Plan]:
@@ -530,25 +720,18 @@ class PlanRepository(interfaces.PlanRepository):
             if plan.is_approved and plan.is_active and not plan.expired:
                 yield plan
 
-    def all_productive_plans_approved_active_and_not_expired(self) -> Iterator[Plan]:
-        for plan in self.plans.values():
-            if (
-                not plan.is_public_service
-                and plan.is_active
-                and plan.is_approved
-                and not plan.expired
-            ):
-                yield plan
-
-    def all_public_plans_approved_active_and_not_expired(self) -> Iterator[Plan]:
-        for plan in self.plans.values():
-            if (
-                plan.is_public_service
-                and plan.is_active
-                and plan.is_approved
-                and not plan.expired
-            ):
-                yield plan
+    def get_costs_per_day_of_active_plans(
+        self,
+    ) -> interfaces.PlanRepository.CostsPerDay:
+        costs = {
+            is_public_service: ProductionCosts(Decimal(0), Decimal(0), Decimal(0))
+            for is_public_service in (False, True)
+        }
+        for plan in self.all_plans_approved_active_and_not_expired():
+            costs[plan.is_public_service] += plan.production_costs / plan.timeframe
+        return interfaces.PlanRepository.CostsPerDay(
+            productive=costs[False], public=costs[True]
+        )
 
     def hide_plan(self, plan_id: UUID) -> None:
         plan = self.plans.get(plan_id)
@@ -597,7 +780,6 @@ class PlanRepository(interfaces.PlanRepository):
             approval_reason=None,
             expired=False,
             expiration_date=None,
-            active_days=None,
             payout_count=0,
             requested_cooperation=None,
             cooperation=None,
@@ -608,15 +790,91 @@ class PlanRepository(interfaces.PlanRepository):
         return plan
 
     def query_active_plans_by_product_name(self, query: str) -> Iterator[Plan]:
-        for plan in self.plans.values():
-            if plan.is_active and (query.lower() in plan.prd_name.lower()):
-                yield plan
+        plans = [
+            plan
+            for plan in self.plans.values()
+            if plan.is_active and self._get_search_rank(plan, query) is not None
+        ]
+        plans.sort(key=lambda plan: (self._get_search_rank(plan, query), str(plan.id)))
+        yield from plans
 
     def query_active_plans_by_plan_id(self, query: str) -> Iterator[Plan]:
         for plan in self.plans.values():
             if plan.is_active and (query in str(plan.id)):
                 yield plan
 
+    def get_page_of_active_plans(
+        self,
+        ordering: interfaces.PlanRepository.Ordering,
+        limit: int,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        search_text: Optional[str] = None,
+        plan_id: Optional[str] = None,
+    ) -> List[Plan]:
+        plans = [
+            plan
+            for plan in self.plans.values()
+            if plan.is_active
+            and (
+                search_text is None
+                or self._get_search_rank(plan, search_text) is not None
+            )
+            and (plan_id is None or plan_id in str(plan.id))
+        ]
+        if ordering == self.Ordering.relevance and search_text is None:
+            ordering = self.Ordering.newest_first
+
+        def key(plan: Plan) -> Tuple[Any, str]:
+            if ordering == self.Ordering.newest_first:
+                return plan.activation_date, str(plan.id)
+            elif ordering == self.Ordering.relevance:
+                assert search_text is not None
+                return self._get_search_rank(plan, search_text), str(plan.id)
+            elif ordering == self.Ordering.company_name:
+                return plan.planner.name.lower(), str(plan.id)
+            else:
+                return self._get_price_per_unit(plan), str(plan.id)
+
+        boundary_id = before or after
+        return get_keyset_page(
+            plans,
+            key,
+            self.plans.get(boundary_id) if boundary_id else None,
+            limit,
+            is_backward=before is not None,
+            descending=ordering == self.Ordering.newest_first,
+        )
+
+    def _get_search_rank(self, plan: Plan, search_text: str) -> Optional[int]:
+        """Return None if a word of the search text does not start any
+        word of the product name or description. Otherwise the rank is
+        lower the more words of the plan match.
+        """
+        plan_words = re.findall(
+            r"[^\W_]+", f"{plan.prd_name} {plan.description}".lower()
+        )
+        search_words = re.findall(r"[^\W_]+", search_text.lower())
+        for search_word in search_words:
+            if not any(word.startswith(search_word) for word in plan_words):
+                return None
+        return -sum(
+            1
+            for word in plan_words
+            if any(word.startswith(search_word) for search_word in search_words)
+        )
+
+    def _get_price_per_unit(self, plan: Plan) -> Decimal:
+        if plan.cooperation is None:
+            return calculate_price([plan])
+        return calculate_price(
+            [
+                cooperating_plan
+                for cooperating_plan in self.plans.values()
+                if cooperating_plan.cooperation == plan.cooperation
+            ]
+        )
+
     def toggle_product_availability(self, plan: Plan) -> None:
         plan.is_available = True if (plan.is_available == False) else False
 
@@ -839,27 +1097,66 @@ class PlanCooperationRepository(interfaces.PlanCooperationRepository):
         self,
         plan_repository: PlanRepository,
         cooperation_repository: CooperationRepository,
+        price_cache: CooperationPriceCache,
     ) -> None:
         self.plan_repository = plan_repository
         self.cooperation_repository = cooperation_repository
-
-    def get_inbound_requests(self, coordinator_id: UUID) -> Iterator[Plan]:
-        coops_of_company = list(
-            self.cooperation_repository.get_cooperations_coordinated_by_company(
+        self.price_cache = price_cache
+
+    def get_inbound_requests(
+        self, coordinator_id: UUID
+    ) -> List[interfaces.PlanCooperationRepository.InboundRequest]:
+        coops_of_company = {
+            coop.id: coop
+            for coop in self.cooperation_repository.get_cooperations_coordinated_by_company(
                 coordinator_id
             )
+        }
+        plans = sorted(
+            self.plan_repository.plans.values(),
+            key=attrgetter("plan_creation_date"),
+            reverse=True,
         )
-        for plan in self.plan_repository.plans.values():
-            if plan.requested_cooperation in [coop.id for coop in coops_of_company]:
-                yield plan
+        requests = []
+        for plan in plans:
+            if not plan.is_active or plan.requested_cooperation is None:
+                continue
+            coop = coops_of_company.get(plan.requested_cooperation)
+            if coop is None:
+                continue
+            requests.append(
+                interfaces.PlanCooperationRepository.InboundRequest(
+                    coop_id=coop.id,
+                    coop_name=coop.name,
+                    plan_id=plan.id,
+                    plan_name=plan.prd_name,
+                    planner_name=plan.planner.name,
+                )
+            )
+        return requests
 
-    def get_outbound_requests(self, requester_id: UUID) -> Iterator[Plan]:
-        plans_of_company = self.plan_repository.get_all_plans_for_company_descending(
+    def get_outbound_requests(
+        self, requester_id: UUID
+    ) -> List[interfaces.PlanCooperationRepository.OutboundRequest]:
+        requests = []
+        for plan in self.plan_repository.get_all_plans_for_company_descending(
             requester_id
-        )
-        for plan in plans_of_company:
-            if plan.requested_cooperation:
-                yield plan
+        ):
+            if plan.requested_cooperation is None:
+                continue
+            coop_name = self.cooperation_repository.get_cooperation_name(
+                plan.requested_cooperation
+            )
+            assert coop_name is not None
+            requests.append(
+                interfaces.PlanCooperationRepository.OutboundRequest(
+                    plan_id=plan.id,
+                    plan_name=plan.prd_name,
+                    coop_id=plan.requested_cooperation,
+                    coop_name=coop_name,
+                )
+            )
+        return requests
 
     def get_cooperating_plans(self, plan_id: UUID) -> List[Plan]:
         cooperating_plans = []
@@ -877,11 +1174,16 @@ class PlanCooperationRepository(interfaces.PlanCooperationRepository):
     def add_plan_to_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
         plan = self.plan_repository.get_plan_by_id(plan_id)
         assert plan
+        if plan.cooperation:
+            self.price_cache.forget(plan.cooperation)
+        self.price_cache.forget(cooperation_id)
         plan.cooperation = cooperation_id
 
     def remove_plan_from_cooperation(self, plan_id: UUID) -> None:
         plan = self.plan_repository.get_plan_by_id(plan_id)
         assert plan
+        if plan.cooperation:
+            self.price_cache.forget(plan.cooperation)
         plan.cooperation = None
 
     def set_requested_cooperation(self, plan_id: UUID, cooperation_id: UUID) -> None:
@@ -907,6 +1209,14 @@ class PlanCooperationRepository(interfaces.PlanCooperationRepository):
             if plan.cooperation == cooperation_id:
                 yield plan
 
+    def get_plans_in_cooperations(
+        self, cooperation_ids: Iterable[UUID]
+    ) -> Iterable[Plan]:
+        cooperations = set(cooperation_ids)
+        for plan in self.plan_repository.plans.values():
+            if plan.cooperation in cooperations:
+                yield plan
+
 
 class AccountantRepositoryTestImpl:
     @dataclass
@@ -965,10 +1275,16 @@ class FakePayoutFactorRepository:
     @inject
     def __init__(self) -> None:
         self._payout_factors: List[PayoutFactor] = []
+        self._daily_payout_factors: Dict[date, List[PayoutFactor]] = defaultdict(list)
 
     def store_payout_factor(self, timestamp: datetime, payout_factor: Decimal) -> None:
         key = attrgetter("calculation_date")
         insort(self._payout_factors, PayoutFactor(timestamp, payout_factor), key=key)
+        insort(
+            self._daily_payout_factors[timestamp.date()],
+            PayoutFactor(timestamp, payout_factor),
+            key=key,
+        )
 
     def get_latest_payout_factor(
         self,
@@ -976,3 +1292,82 @@ class FakePayoutFactorRepository:
         if not self._payout_factors:
             return None
         return self._payout_factors[-1]
+
+    def get_daily_payout_factors(self, since: date) -> List[DailyPayoutFactor]:
+        return [
+            self._summarize_day(day, payout_factors)
+            for day, payout_factors in sorted(self._daily_payout_factors.items())
+            if day >= since
+        ]
+
+    def _summarize_day(
+        self, day: date, payout_factors: List[PayoutFactor]
+    ) -> DailyPayoutFactor:
+        values = [payout_factor.value for payout_factor in payout_factors]
+        return DailyPayoutFactor(
+            day=day,
+            minimum=min(values),
+            maximum=max(values),
+            average=decimal_sum(values) / len(values),
+            last=values[-1],
+        )
+
+    def delete_payout_factors_before(self, timestamp: datetime) -> int:
+        kept = [
+            payout_factor
+            for payout_factor in self._payout_factors[:-1]
+            if payout_factor.calculation_date >= timestamp
+        ] + self._payout_factors[-1:]
+        deleted = len(self._payout_factors) - len(kept)
+        self._payout_factors = kept
+        return deleted
+
+
+@singleton
+class FakePayoutLockRepository:
+    @inject
+    def __init__(self) -> None:
+        self._partitions_locked_by_other_runs: Set[PayoutPartition] = set()
+
+    def lock_partition_for_other_run(self, partition: PayoutPartition) -> None:
+        self._partitions_locked_by_other_runs.add(partition)
+
+    def try_to_lock_partition(self, partition: PayoutPartition) -> bool:
+        return partition not in self._partitions_locked_by_other_runs
+
+
+@singleton
+class FakeStatisticsRepository:
+    @inject
+    def __init__(self) -> None:
+        self._statistics: List[Statistics] = []
+
+    def store_statistics(self, statistics: Statistics) -> None:
+        insort(self._statistics, statistics, key=attrgetter("calculation_date"))
+
+    def get_latest_statistics(self) -> Optional[Statistics]:
+        if not self._statistics:
+            return None
+        return self._statistics[-1]
+
+
+T = TypeVar("T")
+
+
+def get_keyset_page(
+    items: Iterable[T],
+    key: Callable[[T], Any],
+    boundary: Optional[T],
+    limit: int,
+    is_backward: bool,
+    descending: bool = False,
+) -> List[T]:
+    ordered = sorted(items, key=key, reverse=descending)
+    if boundary is None:
+        return ordered[:limit]
+    boundary_key = key(boundary)
+    if is_backward == descending:
+        following = [item for item in ordered if key(item) > boundary_key]
+    else:
+        following = [item for item in ordered if key(item) < boundary_key]
+    return following[-limit:] if is_backward else following[:limit]
@@ -0,0 +1,151 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from arbeitszeit.entities import AccountTypes
+from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.use_cases.export_transactions import (
+    ExportTransactions,
+    ExportTransactionsRequest,
+)
+from tests.data_generators import (
+    CompanyGenerator,
+    MemberGenerator,
+    SocialAccountingGenerator,
+    TransactionGenerator,
+)
+from tests.datetime_service import FakeDatetimeService
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_that_export_is_rejected_for_unknown_user(
+    export_transactions: ExportTransactions,
+):
+    response = export_transactions(ExportTransactionsRequest(user=uuid4()))
+    assert response.is_rejected
+    assert not list(response.transactions)
+
+
+@injection_test
+def test_that_export_of_company_without_transactions_is_empty(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+):
+    company = company_generator.create_company()
+    response = export_transactions(ExportTransactionsRequest(user=company.id))
+    assert not response.is_rejected
+    assert not list(response.transactions)
+
+
+@injection_test
+def test_that_company_transactions_are_exported_oldest_first_from_company_perspective(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+    member_generator: MemberGenerator,
+    accounting_generator: SocialAccountingGenerator,
+    transaction_generator: TransactionGenerator,
+    datetime_service: FakeDatetimeService,
+):
+    company = company_generator.create_company()
+    member = member_generator.create_member()
+    social_accounting = accounting_generator.create_social_accounting()
+    datetime_service.freeze_time(datetime(2022, 1, 2))
+    transaction_generator.create_transaction(
+        sending_account=social_accounting.account,
+        receiving_account=company.means_account,
+        amount_received=Decimal(7),
+        purpose="credit",
+    )
+    datetime_service.freeze_time(datetime(2022, 1, 3))
+    transaction_generator.create_transaction(
+        sending_account=company.work_account,
+        receiving_account=member.account,
+        amount_sent=Decimal(3),
+        purpose="wages",
+    )
+    response = export_transactions(ExportTransactionsRequest(user=company.id))
+    credit, wages = list(response.transactions)
+    assert credit.date == datetime(2022, 1, 1)
+    assert credit.transaction_type == TransactionTypes.credit_for_fixed_means
+    assert credit.account_type == AccountTypes.p
+    assert credit.transaction_volume == Decimal(7)
+    assert credit.purpose == "credit"
+    assert wages.date == datetime(2022, 1, 2)
+    assert wages.transaction_type == TransactionTypes.payment_of_wages
+    assert wages.account_type == AccountTypes.a
+    assert wages.transaction_volume == Decimal(-3)
+
+
+@injection_test
+def test_that_wages_are_exported_as_incoming_wages_for_members(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+    member_generator: MemberGenerator,
+    transaction_generator: TransactionGenerator,
+):
+    company = company_generator.create_company()
+    member = member_generator.create_member()
+    transaction_generator.create_transaction(
+        sending_account=company.work_account,
+        receiving_account=member.account,
+        amount_received=Decimal(3),
+    )
+    response = export_transactions(ExportTransactionsRequest(user=member.id))
+    (wages,) = list(response.transactions)
+    assert wages.transaction_type == TransactionTypes.incoming_wages
+    assert wages.account_type == AccountTypes.member
+    assert wages.transaction_volume == Decimal(3)
+
+
+@injection_test
+def test_that_export_can_be_restricted_to_account_types(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+    accounting_generator: SocialAccountingGenerator,
+    transaction_generator: TransactionGenerator,
+):
+    company = company_generator.create_company()
+    social_accounting = accounting_generator.create_social_accounting()
+    for account in [company.means_account, company.raw_material_account]:
+        transaction_generator.create_transaction(
+            sending_account=social_accounting.account, receiving_account=account
+        )
+    response = export_transactions(
+        ExportTransactionsRequest(
+            user=company.id, account_types=frozenset([AccountTypes.r])
+        )
+    )
+    assert [transaction.account_type for transaction in response.transactions] == [
+        AccountTypes.r
+    ]
+
+
+@injection_test
+def test_that_export_can_be_restricted_to_a_date_range(
+    export_transactions: ExportTransactions,
+    company_generator: CompanyGenerator,
+    accounting_generator: SocialAccountingGenerator,
+    transaction_generator: TransactionGenerator,
+    datetime_service: FakeDatetimeService,
+):
+    company = company_generator.create_company()
+    social_accounting = accounting_generator.create_social_accounting()
+    for day in range(2, 6):
+        datetime_service.freeze_time(datetime(2022, 1, day))
+        transaction_generator.create_transaction(
+            sending_account=social_accounting.account,
+            receiving_account=company.means_account,
+        )
+    response = export_transactions(
+        ExportTransactionsRequest(
+            user=company.id,
+            since=datetime(2022, 1, 2),
+            until=datetime(2022, 1, 4),
+        )
+    )
+    assert [transaction.date for transaction in response.transactions] == [
+        datetime(2022, 1, 2),
+        datetime(2022, 1, 3),
+    ]
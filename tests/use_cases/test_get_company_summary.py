@@ -495,7 +495,7 @@ def test_returns_correct_sales_balance_if_plan_is_productive_and_one_transaction
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(15),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -517,7 +517,7 @@ def test_returns_correct_infinite_sales_deviation_if_plan_is_productive_with_cos
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(1),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -539,7 +539,7 @@ def test_returns_correct_sales_deviation_of_100_if_plan_is_productive_with_costs
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(20),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -578,7 +578,7 @@ def test_returns_correct_sales_deviation_of_0_if_plan_is_productive_with_costs_o
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(10),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -601,7 +601,7 @@ def test_returns_correct_sales_deviation_of_infinite_if_plan_is_public_but_recei
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(10),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -624,7 +624,7 @@ def test_returns_correct_sales_deviation_of_0_if_plan_is_public_with_balance_of_
     transaction_generator.create_transaction(
         receiving_account=company.product_account,
         amount_received=Decimal(0),
-        purpose=f"Plan ID: {plan.id}",
+        plan=plan.id,
     )
     response = get_company_summary(company.id)
     assert response
@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+from arbeitszeit.transactions import ACCOUNT_HISTORY_PAGE_SIZE
 from arbeitszeit.use_cases import GetMemberAccount
 from tests.data_generators import (
     CompanyGenerator,
@@ -144,3 +145,57 @@ def test_that_correct_info_for_company_is_generated_in_correct_order_after_sever
     trans3 = response.transactions.pop()
     assert trans3.peer_name == company2.name
     assert trans3.transaction_volume == Decimal(2)
+
+
+@injection_test
+def test_that_transactions_show_balance_of_member_account_after_them(
+    use_case: GetMemberAccount,
+    company_generator: CompanyGenerator,
+    transaction_generator: TransactionGenerator,
+    member_generator: MemberGenerator,
+):
+    member = member_generator.create_member()
+    company = company_generator.create_company()
+    transaction_generator.create_transaction(
+        sending_account=company.work_account,
+        receiving_account=member.account,
+        amount_received=Decimal(12),
+    )
+    transaction_generator.create_transaction(
+        sending_account=member.account,
+        receiving_account=company.product_account,
+        amount_sent=Decimal(5),
+    )
+    response = use_case(member.id)
+    assert [transaction.balance for transaction in response.transactions] == [
+        Decimal(7),
+        Decimal(12),
+    ]
+
+
+@injection_test
+def test_that_transactions_are_split_into_pages(
+    use_case: GetMemberAccount,
+    company_generator: CompanyGenerator,
+    transaction_generator: TransactionGenerator,
+    member_generator: MemberGenerator,
+):
+    member = member_generator.create_member()
+    company = company_generator.create_company()
+    for _ in range(ACCOUNT_HISTORY_PAGE_SIZE + 1):
+        transaction_generator.create_transaction(
+            sending_account=company.work_account,
+            receiving_account=member.account,
+            amount_received=Decimal(1),
+        )
+    first_page = use_case(member.id)
+    assert len(first_page.transactions) == ACCOUNT_HISTORY_PAGE_SIZE
+    assert first_page.transactions[0].balance == ACCOUNT_HISTORY_PAGE_SIZE + 1
+    assert first_page.next_page
+    assert not first_page.previous_page
+    second_page = use_case(member.id, page_cursor=first_page.next_page)
+    assert len(second_page.transactions) == 1
+    assert second_page.transactions[0].balance == 1
+    assert not second_page.next_page
+    assert second_page.previous_page
+    assert use_case(member.id, page_cursor=second_page.previous_page) == first_page
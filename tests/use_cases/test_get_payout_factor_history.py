@@ -0,0 +1,77 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from arbeitszeit.repositories import PayoutFactorRepository
+from arbeitszeit.use_cases.get_payout_factor_history import GetPayoutFactorHistory
+from tests.datetime_service import FakeDatetimeService
+
+from .dependency_injection import injection_test
+
+
+@injection_test
+def test_that_history_is_empty_without_payout_factors(
+    use_case: GetPayoutFactorHistory,
+):
+    response = use_case(GetPayoutFactorHistory.Request(days=365))
+    assert not response.days
+
+
+@injection_test
+def test_that_payout_factors_of_one_day_are_summarized(
+    use_case: GetPayoutFactorHistory,
+    repository: PayoutFactorRepository,
+    datetime_service: FakeDatetimeService,
+):
+    datetime_service.freeze_time(datetime(2022, 9, 1, 12))
+    repository.store_payout_factor(datetime(2022, 9, 1, 9), Decimal("0.5"))
+    repository.store_payout_factor(datetime(2022, 9, 1, 11), Decimal("0.7"))
+    repository.store_payout_factor(datetime(2022, 9, 1, 10), Decimal("0.9"))
+    response = use_case(GetPayoutFactorHistory.Request(days=365))
+    assert len(response.days) == 1
+    day = response.days[0]
+    assert day.day == date(2022, 9, 1)
+    assert day.minimum == Decimal("0.5")
+    assert day.maximum == Decimal("0.9")
+    assert day.average == Decimal("0.7")
+    assert day.last == Decimal("0.7")
+
+
+@injection_test
+def test_that_days_are_returned_oldest_first(
+    use_case: GetPayoutFactorHistory,
+    repository: PayoutFactorRepository,
+    datetime_service: FakeDatetimeService,
+):
+    datetime_service.freeze_time(datetime(2022, 9, 3, 12))
+    repository.store_payout_factor(datetime(2022, 9, 2, 10), Decimal("0.6"))
+    repository.store_payout_factor(datetime(2022, 9, 1, 10), Decimal("0.5"))
+    response = use_case(GetPayoutFactorHistory.Request(days=365))
+    assert [day.day for day in response.days] == [date(2022, 9, 1), date(2022, 9, 2)]
+
+
+@injection_test
+def test_that_only_requested_number_of_days_up_to_today_is_returned(
+    use_case: GetPayoutFactorHistory,
+    repository: PayoutFactorRepository,
+    datetime_service: FakeDatetimeService,
+):
+    datetime_service.freeze_time(datetime(2022, 9, 3, 12))
+    repository.store_payout_factor(datetime(2022, 9, 1, 10), Decimal("0.5"))
+    repository.store_payout_factor(datetime(2022, 9, 2, 10), Decimal("0.6"))
+    repository.store_payout_factor(datetime(2022, 9, 3, 10), Decimal("0.7"))
+    response = use_case(GetPayoutFactorHistory.Request(days=2))
+    assert [day.day for day in response.days] == [date(2022, 9, 2), date(2022, 9, 3)]
+
+
+@injection_test
+def test_that_daily_summaries_are_kept_when_payout_factors_are_deleted(
+    use_case: GetPayoutFactorHistory,
+    repository: PayoutFactorRepository,
+    datetime_service: FakeDatetimeService,
+):
+    datetime_service.freeze_time(datetime(2022, 9, 3, 12))
+    repository.store_payout_factor(datetime(2022, 9, 1, 10), Decimal("0.5"))
+    repository.store_payout_factor(datetime(2022, 9, 2, 10), Decimal("0.6"))
+    repository.delete_payout_factors_before(datetime(2022, 9, 3))
+    response = use_case(GetPayoutFactorHistory.Request(days=365))
+    assert [day.last for day in response.days] == [Decimal("0.5"), Decimal("0.6")]
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Union
 
@@ -279,3 +280,39 @@ def test_that_use_case_shows_payout_factor_if_it_has_been_calculated(
     update_plans_and_payout()
     stats = get_statistics()
     assert stats.payout_factor is not None
+
+
+@injection_test
+def test_that_statistics_stored_by_payout_are_shown_until_next_payout(
+    get_statistics: GetStatistics,
+    update_plans_and_payout: UpdatePlansAndPayout,
+    company_generator: CompanyGenerator,
+):
+    company_generator.create_company()
+    update_plans_and_payout()
+    company_generator.create_company()
+    assert get_statistics().registered_companies_count == 1
+    update_plans_and_payout()
+    assert get_statistics().registered_companies_count == 2
+
+
+@injection_test
+def test_that_statistics_show_when_they_were_calculated(
+    get_statistics: GetStatistics,
+    update_plans_and_payout: UpdatePlansAndPayout,
+    datetime_service: FakeDatetimeService,
+):
+    calculation_date = datetime(2022, 5, 1, 12)
+    datetime_service.freeze_time(calculation_date)
+    update_plans_and_payout()
+    datetime_service.freeze_time(calculation_date + timedelta(hours=1))
+    assert get_statistics().calculation_date == calculation_date
+
+
+@injection_test
+def test_that_statistics_are_calculated_on_the_spot_before_first_payout(
+    get_statistics: GetStatistics,
+    datetime_service: FakeDatetimeService,
+):
+    datetime_service.freeze_time(datetime(2022, 5, 1, 12))
+    assert get_statistics().calculation_date == datetime(2022, 5, 1, 12)
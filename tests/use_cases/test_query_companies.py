@@ -135,10 +135,17 @@ def test_that_capitalization_is_ignored_in_email(
     assert company_in_results(expected_company, response)
 
 
-def make_request(query: Optional[str], category: CompanyFilter):
+def make_request(
+    query: Optional[str],
+    category: CompanyFilter,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+):
     return QueryCompaniesRequestTestImpl(
         query=query,
         filter_category=category,
+        page_size=page_size,
+        cursor=cursor,
     )
 
 
@@ -146,9 +153,17 @@ def make_request(query: Optional[str], category: CompanyFilter):
 class QueryCompaniesRequestTestImpl(QueryCompaniesRequest):
     query: Optional[str]
     filter_category: CompanyFilter
+    page_size: int
+    cursor: Optional[str]
 
     def get_query_string(self) -> Optional[str]:
         return self.query
 
     def get_filter_category(self) -> CompanyFilter:
         return self.filter_category
+
+    def get_page_size(self) -> int:
+        return self.page_size
+
+    def get_page_cursor(self) -> Optional[str]:
+        return self.cursor
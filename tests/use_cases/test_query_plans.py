@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 
 from arbeitszeit.entities import Plan, ProductionCosts
 from arbeitszeit.use_cases import (
@@ -11,7 +12,7 @@ from arbeitszeit.use_cases import (
     QueryPlansRequest,
 )
 from arbeitszeit.use_cases.query_plans import PlanSorting
-from tests.data_generators import CompanyGenerator, PlanGenerator
+from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
 from tests.datetime_service import FakeDatetimeService
 
 from .dependency_injection import injection_test
@@ -75,14 +76,14 @@ def test_that_plans_where_product_name_is_exact_match_are_returned(
 
 
 @injection_test
-def test_query_with_substring_of_product_name_returns_correct_result(
+def test_query_with_beginnings_of_words_in_product_name_returns_correct_result(
     query_plans: QueryPlans,
     plan_generator: PlanGenerator,
 ):
     expected_plan = plan_generator.create_plan(
         product_name="Name XYZ", activation_date=datetime.min
     )
-    query = "me X"
+    query = "Na X"
     response = query_plans(make_request(query, PlanFilter.by_product_name))
     assert plan_in_results(expected_plan, response)
 
@@ -100,6 +101,44 @@ def test_query_with_substring_of_product_is_case_insensitive(
     assert plan_in_results(expected_plan, response)
 
 
+@injection_test
+def test_query_for_product_name_also_searches_description(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    expected_plan = plan_generator.create_plan(
+        product_name="Bread",
+        description="Baked from whole grain rye",
+        activation_date=datetime.min,
+    )
+    response = query_plans(make_request("rye", PlanFilter.by_product_name))
+    assert plan_in_results(expected_plan, response)
+
+
+@injection_test
+def test_that_plans_are_returned_with_best_match_first_when_sorted_by_relevance(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    weak_match = plan_generator.create_plan(
+        product_name="Bread",
+        description="Goes well with apple jam",
+        activation_date=datetime.min,
+    )
+    strong_match = plan_generator.create_plan(
+        product_name="Apples",
+        description="Apple harvest",
+        activation_date=datetime.min,
+    )
+    response = query_plans(
+        make_request("apple", PlanFilter.by_product_name, PlanSorting.by_relevance)
+    )
+    assert [result.plan_id for result in response.results] == [
+        strong_match.id,
+        weak_match.id,
+    ]
+
+
 @injection_test
 def test_that_plans_are_returned_in_order_of_activation_when_requested_with_newest_plan_first(
     query_plans: QueryPlans,
@@ -171,11 +210,11 @@ def test_that_filtered_plans_by_name_are_returned_in_order_of_activation(
         activation_date=datetime_service.now_minus_20_hours(), product_name="abcde"
     )
     expected_first = plan_generator.create_plan(
-        activation_date=datetime_service.now(), product_name="xyabc"
+        activation_date=datetime_service.now(), product_name="xy abc"
     )
     # unexpected plan
     plan_generator.create_plan(
-        activation_date=datetime_service.now_minus_two_days(), product_name="cba"
+        activation_date=datetime_service.now_minus_two_days(), product_name="xyabc"
     )
     response = query_plans(
         make_request(
@@ -199,15 +238,133 @@ def test_that_correct_price_per_unit_of_zero_is_displayed_for_a_public_plan(
     assert response.results[0].price_per_unit == 0
 
 
+@injection_test
+def test_that_only_one_page_of_plans_is_returned(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    for _ in range(3):
+        plan_generator.create_plan(activation_date=datetime.min)
+    response = query_plans(make_request(page_size=2))
+    assert len(response.results) == 2
+    assert response.next_page
+    assert not response.previous_page
+
+
+@injection_test
+def test_that_all_plans_are_listed_once_when_following_next_pages(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    expected_plan_ids = sorted(
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            costs=ProductionCosts(Decimal(1), Decimal(1), Decimal(1)),
+        ).id
+        for _ in range(5)
+    )
+    for sorting in PlanSorting:
+        listed_plan_ids: List[UUID] = []
+        cursor = None
+        for _ in range(3):
+            response = query_plans(
+                make_request(sorting=sorting, page_size=2, cursor=cursor)
+            )
+            listed_plan_ids += [result.plan_id for result in response.results]
+            cursor = response.next_page
+        assert not cursor
+        assert sorted(listed_plan_ids) == expected_plan_ids
+
+
+@injection_test
+def test_that_next_page_continues_in_order_of_activation(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+    datetime_service: FakeDatetimeService,
+):
+    expected_third = plan_generator.create_plan(
+        activation_date=datetime_service.now_minus_two_days()
+    )
+    plan_generator.create_plan(activation_date=datetime_service.now())
+    plan_generator.create_plan(activation_date=datetime_service.now_minus_20_hours())
+    first_page = query_plans(
+        make_request(sorting=PlanSorting.by_activation, page_size=2)
+    )
+    second_page = query_plans(
+        make_request(
+            sorting=PlanSorting.by_activation,
+            page_size=2,
+            cursor=first_page.next_page,
+        )
+    )
+    assert [result.plan_id for result in second_page.results] == [expected_third.id]
+
+
+@injection_test
+def test_that_previous_page_returns_to_first_page_of_plans(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+):
+    for costs in range(3):
+        plan_generator.create_plan(
+            activation_date=datetime.min,
+            costs=ProductionCosts(Decimal(costs), Decimal(0), Decimal(0)),
+        )
+    first_page = query_plans(make_request(sorting=PlanSorting.by_price, page_size=2))
+    second_page = query_plans(
+        make_request(
+            sorting=PlanSorting.by_price, page_size=2, cursor=first_page.next_page
+        )
+    )
+    previous_page = query_plans(
+        make_request(
+            sorting=PlanSorting.by_price, page_size=2, cursor=second_page.previous_page
+        )
+    )
+    assert previous_page.results == first_page.results
+    assert not previous_page.previous_page
+
+
+@injection_test
+def test_that_cooperating_plans_are_ordered_by_cooperation_price(
+    query_plans: QueryPlans,
+    plan_generator: PlanGenerator,
+    cooperation_generator: CooperationGenerator,
+):
+    cheap_plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=ProductionCosts(Decimal(1), Decimal(0), Decimal(0)),
+    )
+    expensive_plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=ProductionCosts(Decimal(9), Decimal(0), Decimal(0)),
+    )
+    medium_plan = plan_generator.create_plan(
+        activation_date=datetime.min,
+        costs=ProductionCosts(Decimal(4), Decimal(0), Decimal(0)),
+    )
+    cooperation_generator.create_cooperation(plans=[cheap_plan, expensive_plan])
+    response = query_plans(make_request(sorting=PlanSorting.by_price))
+    assert response.results[0].plan_id == medium_plan.id
+    assert {response.results[1].plan_id, response.results[2].plan_id} == {
+        cheap_plan.id,
+        expensive_plan.id,
+    }
+
+
 def make_request(
     query: Optional[str] = None,
     category: PlanFilter = None,
     sorting: PlanSorting = None,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
 ):
     return QueryPlansRequestTestImpl(
         query=query or "",
         filter_category=category or PlanFilter.by_product_name,
         sorting_category=sorting or PlanSorting.by_activation,
+        page_size=page_size,
+        cursor=cursor,
     )
 
 
@@ -216,6 +373,8 @@ class QueryPlansRequestTestImpl(QueryPlansRequest):
     query: Optional[str]
     filter_category: PlanFilter
     sorting_category: PlanSorting
+    page_size: int
+    cursor: Optional[str]
 
     def get_query_string(self) -> Optional[str]:
         return self.query
@@ -225,3 +384,9 @@ class QueryPlansRequestTestImpl(QueryPlansRequest):
 
     def get_sorting_category(self) -> PlanSorting:
         return self.sorting_category
+
+    def get_page_size(self) -> int:
+        return self.page_size
+
+    def get_page_cursor(self) -> Optional[str]:
+        return self.cursor
@@ -3,6 +3,7 @@ from decimal import Decimal
 from unittest import TestCase
 
 from arbeitszeit.entities import AccountTypes, Company, ProductionCosts
+from arbeitszeit.payout_partition import PayoutPartition
 from arbeitszeit.use_cases import UpdatePlansAndPayout
 from arbeitszeit.use_cases.show_my_accounts import ShowMyAccounts, ShowMyAccountsRequest
 from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
@@ -12,6 +13,7 @@ from .dependency_injection import get_dependency_injector
 from .repositories import (
     AccountRepository,
     FakePayoutFactorRepository,
+    FakePayoutLockRepository,
     TransactionRepository,
 )
 
@@ -26,6 +28,7 @@ class UseCaseTests(TestCase):
         self.account_repository = self.injector.get(AccountRepository)
         self.transaction_repository = self.injector.get(TransactionRepository)
         self.payout_factor_repository = self.injector.get(FakePayoutFactorRepository)
+        self.payout_lock_repository = self.injector.get(FakePayoutLockRepository)
         self.show_my_accounts = self.injector.get(ShowMyAccounts)
         self.company_generator = self.injector.get(CompanyGenerator)
 
@@ -34,41 +37,28 @@ class UseCaseTests(TestCase):
         self.payout()
         self.assertFalse(plan.expired)
 
-    def test_that_expiration_time_is_set_if_plan_is_active(self) -> None:
+    def test_that_expiration_date_is_set_when_plan_is_activated(self) -> None:
+        activation_date = datetime.datetime(2021, 10, 2, 2)
+        self.datetime_service.freeze_time(activation_date)
         plan = self.plan_generator.create_plan(
             timeframe=2, activation_date=self.datetime_service.now()
         )
-        self.assertIsNone(plan.expiration_date)
-        self.payout()
-        self.assertIsNotNone(plan.expiration_date)
-
-    def test_that_active_days_is_set_if_plan_is_active(self) -> None:
-        plan = self.plan_generator.create_plan(
-            timeframe=2, activation_date=self.datetime_service.now()
+        self.assertEqual(
+            plan.expiration_date,
+            activation_date + datetime.timedelta(days=2),
         )
-        self.assertIsNone(plan.active_days)
-        self.payout()
-        self.assertIsNotNone(plan.active_days)
 
-    def test_that_active_days_is_set_correctly(self) -> None:
+    def test_that_plans_that_are_not_due_for_payout_are_not_changed(self) -> None:
         self.datetime_service.freeze_time(datetime.datetime(2021, 10, 2, 2))
         plan = self.plan_generator.create_plan(
             timeframe=5, activation_date=self.datetime_service.now()
         )
-        self.datetime_service.freeze_time(datetime.datetime(2021, 10, 4, 3))
         self.payout()
-        assert plan.active_days == 2
-
-    def test_that_active_days_is_set_correctly_if_current_time_exceeds_timeframe(
-        self,
-    ) -> None:
-        self.datetime_service.freeze_time(datetime.datetime(2021, 10, 2, 2))
-        plan = self.plan_generator.create_plan(
-            timeframe=5, activation_date=self.datetime_service.now()
-        )
-        self.datetime_service.freeze_time(datetime.datetime(2021, 10, 10, 3))
+        self.datetime_service.freeze_time(datetime.datetime(2021, 10, 3, 1))
+        payout_count = plan.payout_count
         self.payout()
-        assert plan.active_days == 5
+        self.assertEqual(plan.payout_count, payout_count)
+        self.assertEqual(self.count_transactions_of_type_a(), 1)
 
     def test_that_plan_is_set_expired_and_deactivated_if_expired(self) -> None:
         plan = self.plan_generator.create_plan(
@@ -371,6 +361,42 @@ class UseCaseTests(TestCase):
         self.payout()
         assert self.payout_factor_repository.get_latest_payout_factor() is not None
 
+    def test_that_only_plans_of_the_partition_are_paid_out(self) -> None:
+        plans = [
+            self.plan_generator.create_plan(
+                activation_date=self.datetime_service.now(), timeframe=5
+            )
+            for _ in range(10)
+        ]
+        partition = PayoutPartition(index=0, count=2)
+        self.payout.pay_out_partition(partition, Decimal(1))
+        for plan in plans:
+            self.assertEqual(
+                plan.payout_count, 1 if partition.contains(plan.planner.id) else 0
+            )
+
+    def test_that_paying_out_all_partitions_pays_out_every_plan_once(self) -> None:
+        plans = [
+            self.plan_generator.create_plan(
+                activation_date=self.datetime_service.now(), timeframe=5
+            )
+            for _ in range(10)
+        ]
+        for partition in PayoutPartition.split(3):
+            self.payout.pay_out_partition(partition, Decimal(1))
+        for plan in plans:
+            self.assertEqual(plan.payout_count, 1)
+        self.assertEqual(self.count_transactions_of_type_a(), 10)
+
+    def test_that_partition_locked_by_other_run_is_skipped(self) -> None:
+        plan = self.plan_generator.create_plan(
+            activation_date=self.datetime_service.now(), timeframe=5
+        )
+        partition = PayoutPartition.all_plans()
+        self.payout_lock_repository.lock_partition_for_other_run(partition)
+        self.assertFalse(self.payout.pay_out_partition(partition, Decimal(1)))
+        self.assertEqual(plan.payout_count, 0)
+
     def get_company_work_account_balance(self, company: Company) -> Decimal:
         show_my_accounts_response = self.show_my_accounts(
             ShowMyAccountsRequest(company.id)